@@ -1,6 +1,7 @@
 from choroq.bhe.aptexture import APTexture
 from choroq.bhe.pbl_model import PBLModel
 from choroq.bhe.bhe_cpk import CPK
+from choroq.game_source import IsoSource, open_entry, is_iso_path
 
 import sys
 import os
@@ -23,7 +24,8 @@ def show_help():
     print("Textures are exported in PNG format")
     print("Models will be exported as OBJ by default")
     print("")
-    print("Currently this will only work when given the path to a single CPK file")
+    print("Currently this will only work when given the path to a single CPK file,")
+    print("or the game's iso, which extracts every CPK file within it (into a folder for each)")
     print("Textures and objs are not linked, this is manual currently")
     print("")
     print("Options: <REQUIRED> [OPTIONAL]")
@@ -41,7 +43,7 @@ def show_help():
 
 
 def cpk_decode(path, out_path, output_formats, save_all_textures=True):
-    with open(path, "rb") as f:
+    with open_entry(path) as f:
         cpk = CPK.read_cpk(f, 0)
         cpk.read_subfiles(f)
 
@@ -230,7 +232,8 @@ def cpk_decode(path, out_path, output_formats, save_all_textures=True):
                             writer.writerow(row)
                             total_writer.writerow(row)
             elif sf_type == "FONT":  # Font data
-                sf.save_font_data(f"{out_path}/font{index}/", str(index))
+                # One image of every character, with a json of where each is (save_font_data saves each separately)
+                sf.save_font_atlas(f"{out_path}/font{index}/", str(index))
             elif sf_type == "MPC":  # Model format
                 # Exports all model's and all referenced textures (if found)
                 # continue
@@ -620,7 +623,18 @@ if __name__ == '__main__':
         output_formats.append("ply")
         print("Warning, PLY files are broken, they can be manually fixed, but for now please use OBJ/OBJ+Colours")
 
-    if os.path.isfile(cpk_file_in):
+    if is_iso_path(cpk_file_in):
+        # Read each cpk directly from the iso
+        source = IsoSource(cpk_file_in)
+        for entry in source.list_all_files():
+            if not entry.name.upper().endswith(".CPK"):
+                continue
+            print(f"Reading {entry.path} from {cpk_file_in}")
+            cpk_out = f"{folder_out}/{entry.path[0: entry.path.rfind('.')]}"
+            os.makedirs(cpk_out, exist_ok=True)
+            cpk_decode(entry, cpk_out, output_formats)
+        source.close()
+    elif os.path.isfile(cpk_file_in):
         print(f"Reading from {cpk_file_in}")
         # cProfile.runctx('cpk_decode(a, b, c)', {'a': cpk_file_in, 'b': folder_out, 'c': output_formats, 'cpk_decode': cpk_decode}, {})
         cpk_decode(cpk_file_in, folder_out, output_formats)
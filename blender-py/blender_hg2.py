@@ -1,15 +1,62 @@
 import bpy
 import bmesh
-import struct
+import numpy as np
 
-from pyffi.utils.trianglemesh import Mesh
-from pyffi.utils.trianglestripifier import TriangleStrip, TriangleStripifier
+try:
+    # Needs the repo folder on blender's python path
+    from choroq.tristrip import build_strips, MAX_STRIP_LENGTH
+except ImportError:
+    # pyffi does not limit the strip length, so long strips may fail to export
+    build_strips = None
+    from pyffi.utils.trianglemesh import Mesh
+    from pyffi.utils.trianglestripifier import TriangleStripifier
 
 from bpy_extras.io_utils import ExportHelper
 
 EXEC_ADDR_NORMAL = 32
 EXEC_ADDR_TRANSPARENT = 80
 
+# Layout of each vertex sent to the VU1 programs, 48 bytes
+# x/z/y, nx/ny/nz (adjusted by normal type), r/g/b, u/v, smoothness
+VERTEX_DTYPE = np.dtype([
+    ("position", "<f4", 3),
+    ("normal", "<f4", 3),
+    ("colour", "<f4", 3),
+    ("uv", "<f4", 2),
+    ("smoothness", "<f4"),
+])
+
+# Colours that are snapped to, if all r/g/b are within the tolerance
+RGBA_ALLOWED = [10, 30, 50, 60, 80, 128, 200, 230, 256]
+RGBA_TOLERANCE = 1
+
+DMA_TAG_SUFFIX = bytes([0x00, 0x10])
+STCYCL_VIF_TAG = bytes([0x01, 0x01, 0x00, 0x01])
+END_DMA_TAG = bytes([00, 00, 00, 0x60, 00, 00, 00, 00, 00, 00, 00, 00, 00, 00, 00, 00])
+EXEC_VIF_TAGS = {
+    EXEC_ADDR_NORMAL: bytes([0x04, 0x00, 0x00, 0x15]),
+    EXEC_ADDR_TRANSPARENT: bytes([0x0A, 0x00, 0x00, 0x15]),
+}
+
+# Tags written before each strip's vertices, the marked bytes are filled in per strip
+STRIP_TAGS_TEMPLATE = bytes([
+    # VIF V4-32 tag, this just copies the GIF tag to the VIF for later use, so is always this
+    0x00, 0x80, 0x01, 0x6C,
+    # GIF tag (to say what we are sending) (always same for cars AFAIK)
+    # e.g 3 verts = 03 80 00 00 00 40 36 31 12 04 00 00 00 00 00 00
+    0x00, 0x80, 0x00, 0x00,  # vert count
+    0x00, 0x40, 0x00, 0x31,  # texture marker (changes 0 or 1 or 2 ?), prim
+    0x12, 0x04, 0x00, 0x00,
+    0x00, 0x00, 0x00, 0x00,  # colour group, sets the colour block I think, 0=texture, 1=colour1, 2=colour2
+    # VIF expand tag
+    0x01, 0x80, 0x00, 0x68,  # expand count
+])
+STRIP_TAGS_VERT_COUNT = 4
+STRIP_TAGS_TEXTURE_MARKER = 8
+STRIP_TAGS_PRIM = 10
+STRIP_TAGS_COLOUR_GROUP = 16
+STRIP_TAGS_EXPAND_COUNT = 22
+
 unique_rbga = set()
 
 def dump(obj):
@@ -246,60 +293,79 @@ def export_hg2(context, filepath, options):
         if not mesh.uv_layers or len(mesh.uv_layers) == 0:
             mesh.uv_layers.active = mesh.uv_layers.new()
 
-        # Convert mesh into tristrips
-        # Create pyffi mesh to convert to tristrips
-        # One mesh for textured/untextured per colour index
-        pyffi_mesh_0 = [[Mesh(), Mesh()], [Mesh(), Mesh()], [Mesh(), Mesh()]]
-        pyffi_mesh_1 = [[Mesh(), Mesh()], [Mesh(), Mesh()], [Mesh(), Mesh()]]
-        pyffi_mesh_2 = [[Mesh(), Mesh()], [Mesh(), Mesh()], [Mesh(), Mesh()]]
-        pyffi_meshes = [pyffi_mesh_0, pyffi_mesh_1, pyffi_mesh_2]
+        # Read everything needed from the mesh in one go (foreach_get), rather than per vertex/loop
+        vert_count = len(mesh.vertices)
+        loop_count = len(mesh.loops)
+        face_count = len(mesh.polygons)
+
+        # capture world position/rotation
+        co = np.empty(vert_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        world = np.array(obj.matrix_world, dtype=np.float64)
+        world_co = co.reshape(-1, 3) @ world[:3, :3].T + world[:3, 3]
+
+        vert_normals = np.empty(vert_count * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("normal", vert_normals)
+        # nx, nz, ny = normal
+        vert_normals = vert_normals.reshape(-1, 3)[:, [0, 2, 1]]
+
+        loop_verts = np.empty(loop_count, dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        loop_starts = np.empty(face_count, dtype=np.int32)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        # We know they are triangles, as it's been force converted
+        face_loops = loop_starts[:, None] + np.arange(3, dtype=np.int32)
+        face_verts = loop_verts[face_loops]
+
+        loop_uvs = np.empty(loop_count * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", loop_uvs)
+        loop_uvs = loop_uvs.reshape(-1, 2)
+
+        # Get which object each face is for
+        object_index_values = get_face_attribute(mesh, 'ObjectIndex', np.int32)
+        if np.any((object_index_values < 0) | (object_index_values > 2)):
+            raise Exception("Invalid object index attribute, must be 0/1/2")
+        colour_index_values = get_face_attribute(mesh, 'ColourIndex', np.int32)
+        if np.any((colour_index_values < 0) | (colour_index_values > 2)):
+            raise Exception("Invalid colour index attribute, must be 0/1/2")
+        smoothness_values = get_face_attribute(mesh, 'SmoothnessHG2', np.float32)
+
+        # Vertex -> (last) loop/face using it, the uvs and smoothness are taken from here
+        vert_loops = np.zeros(vert_count, dtype=np.int32)
+        vert_loops[face_verts.ravel()] = face_loops.ravel()
+        vert_faces = np.zeros(vert_count, dtype=np.int32)
+        vert_faces[face_verts.ravel()] = np.repeat(np.arange(face_count, dtype=np.int32), 3)
+
+        if mesh.attributes.active_color is not None:
+            colour_attribute = mesh.attributes.active_color
+            vert_colours = np.empty(len(colour_attribute.data) * 4, dtype=np.float32)
+            colour_attribute.data.foreach_get("color_srgb", vert_colours)
+            vert_colours = vert_colours.reshape(-1, 4)
+            if colour_attribute.domain == 'CORNER':
+                vert_colours = vert_colours[vert_loops]
+        else:
+            vert_colours = np.full((vert_count, 4), 128.0, dtype=np.float32)
+        unique_rbga.update(map(tuple, np.unique(vert_colours * 256.0, axis=0).tolist()))
+
+        # Check to see if any are textured, as we want to draw theses in a different strip from untextured
+        # Basically if 0, 0 or all three points are the same value, we say its untextured
+        face_uvs = loop_uvs[face_loops]
+        textured_faces = np.any(face_uvs != 0, axis=(1, 2)) & ~np.all(face_uvs == face_uvs[:, :1], axis=(1, 2))
+        for object_index in [0, 1, 2]:
+            in_object = object_index_values == object_index
+            ever_textured[object_index] |= bool(np.any(textured_faces & in_object))
+            ever_untextured[object_index] |= bool(np.any(~textured_faces & in_object))
 
-        # Bad but possibly needed vertex -> face table. Probably bad, it does work tho :-)
-        face_dict = {}
+        # Convert mesh into tristrips
+        # One list of triangles for textured/untextured per colour index
+        triangles = [[[[], []] for colour_index in [0, 1, 2]] for object_index in [0, 1, 2]]
 
-        # We know they are triangles, as it's been force converted
-        for face in mesh.polygons:
-            # print('face')
-            # print(face.vertices)
-            # dump(face.vertices)
-
-            # Get which object this face is for
-            object_index = mesh.attributes['ObjectIndex'].data[face.index].value
-            if object_index not in [0, 1, 2]:
-                raise Exception("Invalid object index attribute, must be 0/1/2")
-            colour_index = mesh.attributes['ColourIndex'].data[face.index].value
-            if colour_index not in [0, 1, 2]:
-                raise Exception("Invalid colour index attribute, must be 0/1/2")
-            # Build up all faces into our temporary mesh, for tristripping
-
-            # Check to see if any are textured, as we want to draw theses in a different strip from untextured
-            v0_uv = mesh.uv_layers.active.data[face.loop_indices[0]].uv
-            v1_uv = mesh.uv_layers.active.data[face.loop_indices[1]].uv
-            v2_uv = mesh.uv_layers.active.data[face.loop_indices[2]].uv
-
-            # print(f"v0_uv {v0_uv}")
-            # print(f"v1_uv {v1_uv}")
-            # print(f"v2_uv {v2_uv}")
-
-            v0_textured = v0_uv[0] != 0 or v0_uv[1] != 0
-            v1_textured = v1_uv[0] != 0 or v1_uv[1] != 0
-            v2_textured = v2_uv[0] != 0 or v2_uv[1] != 0
-
-            textured = 0
-            # Basically if 0, 0 or all three points are the same value, we say its untextured
-            if ((
-                    v0_textured or v1_textured or v2_textured)
-                    and
-                    (v0_uv != v1_uv or v0_uv != v2_uv or v1_uv != v2_uv)):
-                textured = 1
-                ever_textured[object_index] = True
-            else:
-                ever_untextured[object_index] = True
-
-            pyffi_meshes[object_index][colour_index][textured].add_face(face.vertices[0], face.vertices[1], face.vertices[2])
-            face_dict[face.vertices[0]] = (face, face.loop_indices[0])
-            face_dict[face.vertices[1]] = (face, face.loop_indices[1])
-            face_dict[face.vertices[2]] = (face, face.loop_indices[2])
+        # Build up all faces into our temporary mesh, for tristripping
+        for (v0, v1, v2), object_index, colour_index, textured in zip(face_verts.tolist(),
+                                                                      object_index_values.tolist(),
+                                                                      colour_index_values.tolist(),
+                                                                      textured_faces.tolist()):
+            triangles[object_index][colour_index][int(textured)].append((v0, v1, v2))
 
         print(f"Ever textured? {ever_textured[0]} {ever_textured[1]} {ever_textured[2]}")
         print(f"Ever untextured? {ever_untextured[0]} {ever_untextured[1]} {ever_untextured[2]}")
@@ -309,45 +375,20 @@ def export_hg2(context, filepath, options):
             print(f"Tristripping {obj} for subj_obj [{sub_obj_index}]")
             for colour_index in [0, 1, 2]:
                 for textured_index in [0, 1]:
-                    pyffi_meshes[sub_obj_index][colour_index][textured_index].lock()
-                    pyffi_stripper = TriangleStripifier(pyffi_meshes[sub_obj_index][colour_index][textured_index])
-
-                    strips = pyffi_stripper.find_all_strips()
+                    strips = make_strips(triangles[sub_obj_index][colour_index][textured_index])
 
                     # Add the converted values to our lists
                     # strips_x = [[index,], [index,]], # sub list for each strip for obj x
                     for strip in strips:
-                        new_verts = []
-                        new_normals = []
-                        new_colours = []
-                        new_uv = []
-                        new_colour_index = [colour_index]
+                        strip = np.asarray(strip, dtype=np.int32)
+                        vertices[sub_obj_index][textured_index].append(world_co[strip])
+                        normals[sub_obj_index][textured_index].append(vert_normals[strip])
+                        colours[sub_obj_index][textured_index].append(vert_colours[strip])
+                        # Have to access uvs via loop index
+                        uvs[sub_obj_index][textured_index].append(loop_uvs[vert_loops[strip]])
+                        colour_indices[sub_obj_index][textured_index].append([colour_index])
                         # Get the smoothness set for this face, from the first vertex in the triangle
-                        new_smoothness = [mesh.attributes['SmoothnessHG2'].data[face_dict[strip[0]][0].index].value]
-
-                        for vert_index in strip:
-                            # capture world position/rotation
-                            x, y, z = obj.matrix_world @ mesh.vertices[vert_index].co
-                            new_verts.append((x, y, z))
-                            nx, nz, ny = mesh.vertices[vert_index].normal
-                            new_normals.append((nx, ny, nz))
-                            if mesh.attributes.active_color is not None:
-                                r, g, b, a = mesh.attributes.active_color.data[vert_index].color_srgb
-                            else:
-                                r, g, b, a = 128.0, 128.0, 128.0, 128.0
-                            new_colours.append((r, g, b, a))
-                            unique_rbga.add((r * 256.0, g * 256.0, b * 256.0, a * 256.0))
-
-                            # Have to access uvs via loop index
-                            u, v = mesh.uv_layers.active.data[face_dict[vert_index][1]].uv
-                            new_uv.append((u, v))
-
-                        vertices[sub_obj_index][textured_index].append(new_verts)
-                        normals[sub_obj_index][textured_index].append(new_normals)
-                        colours[sub_obj_index][textured_index].append(new_colours)
-                        uvs[sub_obj_index][textured_index].append(new_uv)
-                        colour_indices[sub_obj_index][textured_index].append(new_colour_index)
-                        smoothness[sub_obj_index][textured_index].append(new_smoothness)
+                        smoothness[sub_obj_index][textured_index].append([smoothness_values[vert_faces[strip[0]]]])
         # for i in [0, 1, 2]:
         #     for textured_index in [0, 1]:
         #         print(f"For sub obj [{i}]")
@@ -382,6 +423,60 @@ def export_hg2(context, filepath, options):
     return save_mesh(filepath, vertices, normals, colours, uvs, colour_indices, smoothness, options)
 
 
+# Converts the triangles (vertex indices) into tristrips
+def make_strips(triangles):
+    if build_strips is not None:
+        return build_strips(triangles, MAX_STRIP_LENGTH)
+    pyffi_mesh = Mesh()
+    for v0, v1, v2 in triangles:
+        pyffi_mesh.add_face(v0, v1, v2)
+    pyffi_mesh.lock()
+    return TriangleStripifier(pyffi_mesh).find_all_strips()
+
+
+# Reads a per face attribute (ObjectIndex etc) into an array
+def get_face_attribute(mesh, name, dtype):
+    values = np.empty(len(mesh.polygons), dtype=dtype)
+    mesh.attributes[name].data.foreach_get("value", values)
+    return values
+
+
+# Converts the strips' data into the vertex layout used by the VU1 programs (both exec calls use the same)
+# returns all the vertices of all the strips, in order
+def pack_vertices(strip_vertices, strip_normals, strip_colours, strip_uvs, strip_smoothness, normal_type):
+    strip_lengths = [len(strip) for strip in strip_vertices]
+    vertices = np.concatenate(strip_vertices)
+    nx, ny, nz = np.concatenate(strip_normals).T
+    colours = np.concatenate(strip_colours)
+    uvs = np.concatenate(strip_uvs)
+
+    packed = np.empty(len(vertices), dtype=VERTEX_DTYPE)
+    # Tested this is correct (x , z, y)
+    packed["position"] = vertices[:, [0, 2, 1]]
+
+    if normal_type == "OPT_NORMALS_REGULAR":
+        # Tested next closest result (-nx, ny, nz)
+        packed["normal"] = np.stack((-nx, ny, -nz), axis=1)
+    elif normal_type == "OPT_NORMALS_ALT":
+        # this one works best for reimported HG2 cars; oddly
+        # -nx, nz, ny,
+        packed["normal"] = np.stack((-nx, nz, ny), axis=1)
+    else:
+        packed["normal"] = np.stack((nx, ny, nz), axis=1)
+
+    # round numbers to be the closest whole number, as the game seems to have an int in float
+    rgb = np.round(colours[:, :3].astype(np.float64) * 256.0)
+    # Only do this for numbers which are all the same. like 128/128/128 30/30/30
+    for close in RGBA_ALLOWED:
+        rgb[np.all(np.abs(rgb - close) < RGBA_TOLERANCE, axis=1)] = close
+    packed["colour"] = rgb
+
+    packed["uv"][:, 0] = uvs[:, 0]
+    packed["uv"][:, 1] = 1 - uvs[:, 1]
+    packed["smoothness"] = np.repeat(np.asarray(strip_smoothness, dtype=np.float32), strip_lengths)
+    return packed
+
+
 def save_mesh(filepath, vertices, normals, colours, uvs, colour_indices, smoothness, options):
     mesh_type_0, mesh_type_1, mesh_type_2, normal_type = options
 
@@ -494,171 +589,78 @@ def save_mesh(filepath, vertices, normals, colours, uvs, colour_indices, smoothn
                 raise Exception("Miscalculated size of object, bug in code, no solution in blender")
 
             # Write DMA tag
-            dma_tag_suffix = [0x00, 0x10]
-            # size_padding = 16 - ((sizes[obj_index + 1]) % 16)
-            # if size_padding == 16:
-            #     size_padding = 0
             # Take out length of the dma tag at the start, and end
             dma_tag_size = int((sizes[obj_index + 1] - 32) / 16)
-            # print(sizes[part_index+1])
-            # print(size_padding)
-            # print(dma_tag_size)
             file.write(dma_tag_size.to_bytes(2, 'little'))
-            file.write(bytes(dma_tag_suffix))
+            file.write(DMA_TAG_SUFFIX)
 
             # Write zero word
-            file.write(bytes([0x00, 0x00, 0x00, 0x00]))
+            file.write(bytes(4))
 
             # Write STCYCL VIF tag
-            file.write(bytes([0x01, 0x01, 0x00, 0x01]))
+            file.write(STCYCL_VIF_TAG)
 
             exec_call = exec_call_per_object[obj_index]
+            exec_tag = EXEC_VIF_TAGS[exec_call]
             for textured_index in [0, 1]:
-                # Write mesh data
-                # Loop over all strips and write out the data
-                for strip_index in range(len(vertices[obj_index][textured_index])):
-                    # Write VIF V4-32 tag, this just copies the GIF tag to the VIF for later use, so is always this
-                    file.write(bytes([0x00, 0x80, 0x01, 0x6C]))
+                strips = vertices[obj_index][textured_index]
+                if len(strips) == 0:
+                    continue
+                # Pack every vertex of every strip in one go, then write them out strip by strip between the tags
+                strip_smoothness = [smoothness[obj_index][textured_index][i][0] for i in range(len(strips))]
+                vertex_data = pack_vertices(strips, normals[obj_index][textured_index],
+                                            colours[obj_index][textured_index], uvs[obj_index][textured_index],
+                                            strip_smoothness, normal_type).tobytes()
+
+                # check for texturing required primitive
+                textured = textured_index == 1
+                # 0x32 Tristrip flat shaded; not sure what this is used on
+                # 0x36 Tristrip Gouraud shaded
+                # 0x3A Tristrip flat shaded + textured; used on all textured surfaces afaik
+                # 0x3C Tristrip Gouraud shaded + textured; doesn't work
+                texture_marker = 0
+                if textured:
+                    if exec_call == EXEC_ADDR_TRANSPARENT:
+                        prim = 0x3E
+                        # Unsure what 2 means, but it is what is in the game
+                        texture_marker = 0x02
+                    else:
+                        prim = 0x3A
+                else:
+                    prim = 0x36
 
-                    # Write GIF tag (to say what we are sending) (always same for cars AFAIK)
-                    # e.g 3 verts = 03 80 00 00 00 40 36 31 12 04 00 00 00 00 00 00
-                    vert_count = len(vertices[obj_index][textured_index][strip_index])
+                # Loop over all strips and write out the data
+                data_start = 0
+                for strip_index in range(len(strips)):
+                    vert_count = len(strips[strip_index])
                     if vert_count > 255:
                         raise Exception(f"Strip too long, vert_count: {vert_count} max is 255 per strip.\n"
                                         f"No current fix sorry")
                     colour_group = colour_indices[obj_index][textured_index][strip_index][0]
-                    smoothness_value = smoothness[obj_index][textured_index][strip_index][0]
-                    texture_marker = 0
-
-                    # check for texturing required primitive
-                    textured = textured_index == 1
-
-                    # # Check to see if any have texture coords
-                    # for vertex_index in range(vert_count):
-                    #     u, v = uvs[obj_index][textured_index][strip_index][vertex_index]
-                    #     if u != 0 or v != 0:
-
-                    #         # There might be other values, needs investigating
-                    #         texture_marker = 0x00
-                    #         textured = True
-                    # 0x32 Tristrip flat shaded; not sure what this is used on
-                    # 0x36 Tristrip Gouraud shaded
-                    # 0x3A Tristrip flat shaded + textured; used on all textured surfaces afaik
-                    # 0x3C Tristrip Gouraud shaded + textured; doesn't work
-                    if textured:
-                        if exec_call == EXEC_ADDR_TRANSPARENT:
-                            prim = 0x3E
-                            # Unsure what 2 means, but it is what is in the game
-                            texture_marker = 0x02
-                        else:
-                            prim = 0x3A
-                    else:
-                        prim = 0x36
-
-                    gif_tag = [vert_count, 0x80, 0x00, 0x00,
-                               texture_marker, 0x40, prim, 0x31,  # First byte on this row, changes 0 or 1 or 2 ?
-                               0x12, 0x04, 0x00, 0x00,
-                               # First byte on this row v, sets the colour block I think, 0=texture, 1=colour1, 2=colour2
-                               colour_group, 0x00, 0x00, 0x00]
-                    file.write(bytes(gif_tag))
 
-                    # Write VIF expand tag
-                    vif_expand_count = vert_count * 4
-                    vif_tag = [0x01, 0x80, vif_expand_count, 0x68]
-                    file.write(bytes(vif_tag))
+                    strip_tags = bytearray(STRIP_TAGS_TEMPLATE)
+                    strip_tags[STRIP_TAGS_VERT_COUNT] = vert_count
+                    strip_tags[STRIP_TAGS_TEXTURE_MARKER] = texture_marker
+                    strip_tags[STRIP_TAGS_PRIM] = prim
+                    strip_tags[STRIP_TAGS_COLOUR_GROUP] = colour_group
+                    strip_tags[STRIP_TAGS_EXPAND_COUNT] = vert_count * 4
+                    file.write(strip_tags)
 
                     # Write out each vertex
-                    for vertex_index in range(vert_count):
-                        x, y, z = vertices[obj_index][textured_index][strip_index][vertex_index]
-                        r, g, b, a = colours[obj_index][textured_index][strip_index][vertex_index]
-                        u, v = uvs[obj_index][textured_index][strip_index][vertex_index]
-                        # dump(mesh.vertices[vert_index])
-
-                        v = 1 - v
-
-                        # print(f"x {x} y {y} z {z}")
-                        # print(f"nx {nx} ny {ny} nz {nz}")
-                        # print(f"r {r} g {g} b {b} a {a}")
-                        # print(f"u {u} v {v}")
-
-                        # round numbers to be the closest whole number, as the game seems to have an int in float
-                        r = round(r * 256.0, 0)
-                        g = round(g * 256.0, 0)
-                        b = round(b * 256.0, 0)
-                        rgba_allowed = [10, 30, 50, 60, 80, 128, 200, 230, 256]
-                        tolerance = 1
-                        # Only do this for numbers which are all the same. like 128/128/128 30/30/30
-                        for close in rgba_allowed:
-                            if abs(r - close) < tolerance:
-                                if abs(g - close) < tolerance:
-                                    if abs(b - close) < tolerance:
-                                        r = close
-                                        g = close
-                                        b = close
-
-                        # # Guess smoothness
-                        # if textured:
-                        #     smoothness = 51.0
-                        #     if exec_call == EXEC_ADDR_TRANSPARENT:
-                        #         smoothness = 1.0
-                        # else:
-                        #     if colour_group == 0:
-                        #         smoothness = 1.0
-                        #     if colour_group == 1:
-                        #         smoothness = 280.5
-                        #
-                        #     if 9 <= r <= 12 and 14 <= g <= 16 and 19 <= b <= 21:
-                        #         # Windscreen og colour
-                        #         # approx 0A0F14
-                        #         smoothness = 357.0
-                        #     elif 59 <= r <= 61 and 59 <= g <= 61 and 59 <= b <= 61:
-                        #         # window trim
-                        #         # approx 3C3C3C
-                        #         smoothness = 0.0
-                        #     # elif 0.0020 <= r <= 0.0039 and 0.0020 <= g <= 0.0039 and 0.0020 <= b <= 0.0039:
-                        #     #     smoothness = 0
-                        #     #elif body panels gaps:
-                        #         # body panel gaps: #1E1E1E
-                        #     #elif body:
-                        #         # body E5E5E5
-
-                        if exec_call == EXEC_ADDR_NORMAL or exec_call == EXEC_ADDR_TRANSPARENT:
-                            nx, ny, nz = normals[obj_index][textured_index][strip_index][vertex_index]
-
-                            normals_adjusted = [nx, ny, nz]
-                            if normal_type == "OPT_NORMALS_REGULAR":
-                                # Tested next closest result (-nx, ny, nz)
-                                normals_adjusted = [-nx, ny, -nz]
-                            elif normal_type == "OPT_NORMALS_ALT":
-                                # this one works best for reimported HG2 cars; oddly
-                                # -nx, nz, ny,
-                                normals_adjusted = [-nx, nz, ny]
-
-                            vert_out = struct.pack('ffffffffffff',
-                                                   x, z, y,  # Tested this is correct (x , z, y)
-                                                   normals_adjusted[0], normals_adjusted[1], normals_adjusted[2],
-
-                                                   r, g, b,
-                                                   u, v, smoothness_value)
-                        file.write(vert_out)
+                    data_end = data_start + vert_count * VERTEX_DTYPE.itemsize
+                    file.write(vertex_data[data_start:data_end])
+                    data_start = data_end
+
                     # Write Exec VIF tag
-                    if exec_call == EXEC_ADDR_NORMAL:
-                        exec_call_value = [0x04, 0x00, 0x00, 0x15]
-                    elif exec_call == EXEC_ADDR_TRANSPARENT:
-                        exec_call_value = [0x0A, 0x00, 0x00, 0x15]
-                    else:
-                        raise Exception("Invalid exec call, this is a bug")
-                    file.write(bytes(exec_call_value))
+                    file.write(exec_tag)
 
             # Pad file so end dma is 16 aligned
             print(f"Padding required for obj {obj_index}: {paddings[obj_index]}")
             print(paddings)
-            for i in range(paddings[obj_index]):
-                file.write(bytes([0x00]))
+            file.write(bytes(paddings[obj_index]))
 
             # Write end dma tag, for this part
-            end_dma_tag = bytes([00, 00, 00, 0x60, 00, 00, 00, 00, 00, 00, 00, 00, 00, 00, 00, 00])
-            file.write(end_dma_tag)
+            file.write(END_DMA_TAG)
 
     print(unique_rbga)
     return {"FINISHED"}
@@ -21,6 +21,13 @@ from bpy.types import Operator
 import bpy
 from array import array
 from mathutils import Vector
+import numpy as np
+
+# Binary comb format, see choroq/egame/comb_binary.py (this script is used on its own in blender so they are repeated here)
+COMB_BINARY_MAGIC = b"COMB"
+COMB_BINARY_VERSION = 1
+COMB_BINARY_HEADER = struct.Struct("<4sHHII")
+COMB_BINARY_MESH_HEADER = struct.Struct("<IIi")
 
 class ChoroQCombImporter(Operator, ImportHelper):
     """This appears in the tooltip of the operator and in the generated docs"""
@@ -101,6 +108,70 @@ class ChoroQCombImporter(Operator, ImportHelper):
         # texture texturex
         # end_header
 
+        if ChoroQCombImporter.is_binary_comb(filepath):
+            ChoroQCombImporter.read_comb_binary(filepath, mesh1, base, MeshMat)
+        else:
+            ChoroQCombImporter.read_comb_text(filepath, filename, mesh1, base, MeshMat)
+
+        localXOffset = 0
+        localZOffset = 0
+        if posc != None:
+            localXOffset = posb * 3200 + (posa % 2) * 1600
+            localZOffset = posc * 3200
+
+            if posa > 1:
+                localXOffset = localXOffset + 800
+                localZOffset = localZOffset + 1600
+        obj = bpy.data.objects.new("Mesh", mesh1)
+        obj.location = (localXOffset, localZOffset, 0)
+        obj.data.materials.append(MeshMat)
+#        bpy.context.scene.collection.children.link(CurCollection)
+        CurCollection.objects.link(obj)
+        bpy.context.view_layer.objects.active = obj
+        obj.select_set(True)
+#            if not single_mesh:
+#                bm.free()
+#                mesh1.normals_split_custom_set(Normals)
+
+#            if len(obj.data.materials)>0:
+#                obj.data.materials[0]=MeshMat
+#            else:
+#                obj.data.materials.append(MeshMat)
+            
+
+#        if single_mesh:
+#            bm.to_mesh(mesh)
+#            bm.free()
+#            mesh1.normals_split_custom_set(Normals)
+
+        return {'FINISHED'}
+
+    def is_binary_comb(filepath):
+        with open(filepath, 'rb') as f:
+            return f.read(4) == COMB_BINARY_MAGIC
+
+    def setup_material(mat, base, textureName):
+        # Returns True once the material has its texture
+        try:
+            texPath = str(base / textureName)
+            img = bpy.data.images.load(texPath, check_existing=True)
+            #img = bpy.data.images.load(f"//{textureName}", check_existing=False)
+            mat.use_nodes=True 
+            material_output = mat.node_tree.nodes.get('Material Output')
+            principled_BSDF = mat.node_tree.nodes.get('Principled BSDF')
+
+            tex_node = mat.node_tree.nodes.new('ShaderNodeTexImage')
+            tex_node.image = img
+            mat.node_tree.links.new(tex_node.outputs[0], principled_BSDF.inputs[0])
+            return True
+
+        except RuntimeError as e:
+            print(f"Failed to load texture {e}")
+        except Exception as e:
+            raise e
+        return False
+
+    def read_comb_text(filepath, filename, mesh1, base, mat):
         simple_format = False
         f = open(filepath, 'r', encoding='utf-8')
         magic = f.readline()
@@ -168,23 +239,7 @@ class ChoroQCombImporter(Operator, ImportHelper):
             
             # Setup material info
             if not hasMaterialSetup:
-                try:
-                    texPath = str(base / textureName)
-                    img = bpy.data.images.load(texPath, check_existing=True)
-                    #img = bpy.data.images.load(f"//{textureName}", check_existing=False)
-                    mat.use_nodes=True 
-                    material_output = mat.node_tree.nodes.get('Material Output')
-                    principled_BSDF = mat.node_tree.nodes.get('Principled BSDF')
-
-                    tex_node = mat.node_tree.nodes.new('ShaderNodeTexImage')
-                    tex_node.image = img
-                    mat.node_tree.links.new(tex_node.outputs[0], principled_BSDF.inputs[0])
-                    hasMaterialSetup = True
-                
-                except RuntimeError as e:
-                    print(f"Failed to load texture {e}")
-                except Exception as e:
-                    raise e
+                hasMaterialSetup = ChoroQCombImporter.setup_material(mat, base, textureName)
 
             #print(f"verts {vert_count} faces {faceCount}")
             f.readline() # End header
@@ -275,40 +330,89 @@ class ChoroQCombImporter(Operator, ImportHelper):
 #        bm.to_mesh(mesh)    
 #        bm.free()
 #        mesh1.normals_split_custom_set(Normals)
+        f.close()
 
-        localXOffset = 0
-        localZOffset = 0
-        if posc != None:
-            localXOffset = posb * 3200 + (posa % 2) * 1600
-            localZOffset = posc * 3200
+    def read_comb_binary(filepath, mesh1, base, mat):
+        # Binary comb (see choroq/egame/comb_binary.py), each attribute is a flat block
+        # so is used as is with numpy and given to blender with foreach_set
+        with open(filepath, 'rb') as f:
+            data = f.read()
+
+        magic, version, combType, meshCount, textureCount = COMB_BINARY_HEADER.unpack_from(data, 0)
+        if version > COMB_BINARY_VERSION:
+            print(f"Binary comb version {version} is newer than this importer supports ({COMB_BINARY_VERSION})")
+            return
+        print(f"meshCount {meshCount} combType #{combType}# (binary)")
+        offset = COMB_BINARY_HEADER.size
+
+        textures = []
+        for t in range(textureCount):
+            length, = struct.unpack_from("<H", data, offset)
+            textures.append(data[offset + 2:offset + 2 + length].decode("utf-8"))
+            offset += 2 + length
+            offset += -offset % 4
 
-            if posa > 1:
-                localXOffset = localXOffset + 800
-                localZOffset = localZOffset + 1600
-        obj = bpy.data.objects.new("Mesh", mesh1)
-        obj.location = (localXOffset, localZOffset, 0)
-        obj.data.materials.append(MeshMat)
-#        bpy.context.scene.collection.children.link(CurCollection)
-        CurCollection.objects.link(obj)
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-#            if not single_mesh:
-#                bm.free()
-#                mesh1.normals_split_custom_set(Normals)
+        vertList = []
+        normalList = []
+        uvList = []
+        colorList = []
+        ncolorList = [] # night colors
+        faceList = []
+        vertsRead = 0
+        hasMaterialSetup = False
+        for i in range(meshCount):
+            vertCount, faceCount, textureIndex = COMB_BINARY_MESH_HEADER.unpack_from(data, offset)
+            offset += COMB_BINARY_MESH_HEADER.size
+            blocks = []
+            for width in (3, 3, 2, 4, 4):
+                blocks.append(np.frombuffer(data, dtype='<f4', count=vertCount * width, offset=offset))
+                offset += vertCount * width * 4
+            faces = np.frombuffer(data, dtype='<u4', count=faceCount * 3, offset=offset)
+            offset += faceCount * 3 * 4
+
+            v, n, uv, c, nightc = blocks
+            vertList.append(v)
+            normalList.append(n)
+            uvList.append(uv)
+            colorList.append(c)
+            ncolorList.append(nightc)
+            faceList.append(faces.astype(np.int32) + vertsRead)
+            vertsRead += vertCount
 
-#            if len(obj.data.materials)>0:
-#                obj.data.materials[0]=MeshMat
-#            else:
-#                obj.data.materials.append(MeshMat)
-            
+            if not hasMaterialSetup and 0 <= textureIndex < len(textures):
+                hasMaterialSetup = ChoroQCombImporter.setup_material(mat, base, textures[textureIndex])
+
+        if meshCount == 0:
+            return
+        # Swap y/z, as is done for the text format
+        verts = np.concatenate(vertList).reshape(-1, 3)[:, [0, 2, 1]]
+        faces = np.concatenate(faceList)
+        uvs = np.concatenate(uvList).reshape(-1, 2)
+        loopCount = len(faces)
+        faceCount = loopCount // 3
+
+        mesh1.vertices.add(len(verts))
+        mesh1.vertices.foreach_set("co", verts.ravel())
+        mesh1.loops.add(loopCount)
+        mesh1.loops.foreach_set("vertex_index", faces)
+        mesh1.polygons.add(faceCount)
+        mesh1.polygons.foreach_set("loop_start", np.arange(0, loopCount, 3, dtype=np.int32))
+        if bpy.app.version < (4, 0, 0):
+            # Read only (calculated from loop_start) from 4.0
+            mesh1.polygons.foreach_set("loop_total", np.full(faceCount, 3, dtype=np.int32))
 
-#        if single_mesh:
-#            bm.to_mesh(mesh)
-#            bm.free()
-#            mesh1.normals_split_custom_set(Normals)
-        f.close()
+        color_attri = mesh1.color_attributes.new('day', 'FLOAT_COLOR', 'POINT')
+        night_color_attri = mesh1.color_attributes.new('night', 'FLOAT_COLOR', 'POINT')
+        color_attri.data.foreach_set("color", np.concatenate(colorList) / np.float32(255.0))
+        night_color_attri.data.foreach_set("color", np.concatenate(ncolorList) / np.float32(255.0))
 
-        return {'FINISHED'}
+        # UVs are per loop, so look them up by each loop's vertex
+        uv_layer = mesh1.uv_layers.new()
+        mesh1.uv_layers.active = uv_layer
+        uv_layer.data.foreach_set("uv", uvs[faces].ravel())
+
+        mesh1.update(calc_edges=True)
+        mesh1.validate()
 
     def read_point(file, combType):
         line = file.readline().split(' ')
@@ -0,0 +1,229 @@
+from choroq.egame.car import CarModel, CarMesh
+from choroq.game_source import open_source
+from egame_converter import EGameConverter
+
+import io
+import os
+import sys
+import contextlib
+import posixpath
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import colorama
+from colorama import Fore, Style
+
+CAR_FOLDERS = ["CAR0", "CAR1", "CAR2", "CAR3", "CAR4", "CARS"]
+# Only the cars (Qxx.BIN, as matched by the modding ui), the other files in the car folders (TIRE, PARTS, WHEEL,
+# FASHION, STICKER etc) are textures or other objects, without the car subfile layout
+CAR_PATTERN = re.compile(r"Q[0-9]+\.BIN", re.IGNORECASE)
+
+# Meshes (subfile, mesh index) that are copied as they are (no scaling), so should match after conversion
+# input -> output, per direction. HG3 lights are scaled/duplicated so are not compared
+VERIFIED_MESHES = {
+    "2to3": [((0, 0), (0, 0)), ((1, 0), (1, 0)), ((2, 0), (2, 0)), ((3, 0), (3, 0))],
+    "3to2": [((0, 0), (0, 0)), ((1, 0), (1, 0)), ((2, 0), (2, 0)), ((3, 0), (3, 0))],
+}
+# Allowed difference in the bounds, relative to the size of the mesh
+BOUNDS_TOLERANCE = 0.001
+
+# Opened once per worker process (an opened iso cannot be sent between processes)
+worker_source = None
+
+
+def show_help():
+    print("##############################################################################################")
+    print("ChoroQ car converter by Matthew Holey")
+    print("##############################################################################################")
+    print("")
+    print("Converts cars between ChoroQ HG 2 and ChoroQ HG 3 (Qxx.BIN files)")
+    print("Every car in the CAR0-4/CARS folders are converted in parallel, and then")
+    print("checked by reading the converted car back in, and comparing it to the original")
+    print("")
+    print("Options: <REQUIRED> [OPTIONAL]")
+    print("<input>                   : the game's iso, disc folder, a car folder (e.g CAR0) or a single car .BIN")
+    print("<output folder>")
+    print("<direction>               : 2to3 = HG 2 cars to HG 3")
+    print("                            3to2 = HG 3 cars to HG 2")
+    print("[workers]                 : number of processes to use (default is the number of cpus)")
+    print("--no-verify               : skip checking the converted cars")
+
+
+# Returns [(path within source, output path)] for each car to convert
+def find_cars(path_in, folder_out):
+    if os.path.isfile(path_in) and not path_in.lower().endswith(".iso"):
+        name = os.path.basename(path_in)
+        return [(name, os.path.join(folder_out, name))]
+
+    source = open_source(path_in)
+    try:
+        folders = [folder for folder in CAR_FOLDERS if source.is_dir(folder)]
+        if len(folders) == 0:
+            # Given a single car folder
+            folders = [""]
+
+        cars = []
+        for folder in folders:
+            for entry in source.list_files(folder):
+                if not CAR_PATTERN.fullmatch(entry.name):
+                    continue
+                cars.append((posixpath.join(folder, entry.name), os.path.join(folder_out, folder, entry.name)))
+        return cars
+    finally:
+        source.close()
+
+
+def init_worker(path_in):
+    global worker_source
+    if os.path.isfile(path_in) and not path_in.lower().endswith(".iso"):
+        path_in = os.path.dirname(os.path.abspath(path_in))
+    worker_source = open_source(path_in)
+
+
+def convert_car(path, out_path, direction, verify):
+    with worker_source.open(path) as car_in:
+        in_bytes = car_in.read()
+
+    # Both converters print a lot, keep the output to one line per car
+    with contextlib.redirect_stdout(io.StringIO()):
+        if direction == "2to3":
+            out_bytes = EGameConverter.convert_hg2_to_hg3_stream(in_bytes)
+        else:
+            out_bytes = EGameConverter.convert_hg3_to_hg2_stream(in_bytes)
+
+        problems = []
+        if verify:
+            problems = verify_car(in_bytes, out_bytes, direction)
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "wb") as car_out:
+        car_out.write(out_bytes)
+    return len(in_bytes), len(out_bytes), problems
+
+
+# Reads the original and converted car, returns a list of differences found
+# Only the compared meshes are read (the same way as CarModel.read_car), as some HG3 meshes
+# (lights without normals) cannot be read yet, which would stop the whole car from being read
+def verify_car(in_bytes, out_bytes, direction):
+    problems = []
+    for (in_sub, in_mesh), (out_sub, out_mesh) in VERIFIED_MESHES[direction]:
+        try:
+            mesh_in = read_mesh(in_bytes, in_sub, in_mesh)
+        except Exception as e:
+            # Nothing to compare to, not a problem with the conversion
+            print(f"Failed to read input mesh {in_sub}:{in_mesh} {e}")
+            continue
+        if mesh_in is None:
+            continue
+        try:
+            mesh_out = read_mesh(out_bytes, out_sub, out_mesh)
+        except Exception as e:
+            problems.append(f"failed to read converted mesh {out_sub}:{out_mesh}: {e}")
+            continue
+        if mesh_out is None:
+            problems.append(f"mesh {out_sub}:{out_mesh} missing")
+            continue
+        if len(mesh_in.mesh_verts) != len(mesh_out.mesh_verts):
+            problems.append(f"mesh {out_sub}:{out_mesh} has {len(mesh_out.mesh_verts)} vertices "
+                            f"expected {len(mesh_in.mesh_verts)}")
+            continue
+        bounds_in = get_bounds(mesh_in)
+        bounds_out = get_bounds(mesh_out)
+        if bounds_in is None or bounds_out is None:
+            continue
+        size = max(max(b - a for a, b in zip(bounds_in[0], bounds_in[1])), 1)
+        difference = max(abs(a - b) for a, b in zip(bounds_in[0] + bounds_in[1], bounds_out[0] + bounds_out[1]))
+        if difference > size * BOUNDS_TOLERANCE:
+            problems.append(f"mesh {out_sub}:{out_mesh} bounds {bounds_out} expected {bounds_in}")
+    return problems
+
+
+# Reads a single mesh from a car, or None if the car does not have it
+def read_mesh(car_bytes, subfile_index, mesh_index):
+    file = io.BytesIO(car_bytes)
+    # Last two are the texture and eof
+    subfile_offsets = CarModel._parse_offsets(file, 0, len(car_bytes))[:-2]
+    if subfile_index >= len(subfile_offsets):
+        return None
+    subfile_offset = subfile_offsets[subfile_index]
+    mesh_offsets = CarMesh._parse_offsets(file, subfile_offset)
+    hg3 = 1 <= mesh_offsets[1] <= 5
+    if hg3:
+        counts, mesh_offsets = CarMesh._parse_hg3_offsets(file, subfile_offset)
+    if mesh_index >= len(mesh_offsets) or mesh_offsets[mesh_index] < 16:
+        return None
+    return CarMesh.read_car_part(file, subfile_offset + mesh_offsets[mesh_index], hg3)
+
+
+def get_bounds(mesh):
+    verts = mesh.mesh_verts
+    if len(verts) == 0:
+        return None
+    low = list(verts[0])
+    high = list(verts[0])
+    for vert in verts:
+        for i in range(3):
+            low[i] = min(low[i], vert[i])
+            high[i] = max(high[i], vert[i])
+    return tuple(low), tuple(high)
+
+
+def convert_all(path_in, folder_out, direction, workers=None, verify=True):
+    cars = find_cars(path_in, folder_out)
+    print(f"Converting {len(cars)} cars ({direction}) using {workers or os.cpu_count()} processes")
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(path_in,)) as pool:
+        futures = {}
+        for path, out_path in cars:
+            futures[pool.submit(convert_car, path, out_path, direction, verify)] = path
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                in_size, out_size, problems = future.result()
+            except Exception as e:
+                failed.append(path)
+                print(Fore.RED + "FAILED: " + Style.RESET_ALL + f"{path} {e}")
+                continue
+            if len(problems) > 0:
+                failed.append(path)
+                print(Fore.YELLOW + "CHECK FAILED: " + Style.RESET_ALL + f"{path} " + ", ".join(problems))
+            else:
+                print(f"Converted {path} {in_size} -> {out_size} bytes")
+
+    print(f"Converted {len(cars) - len(failed)}/{len(cars)} cars")
+    return failed
+
+
+if __name__ == '__main__':
+    colorama.init()
+    verify = True
+    if "--no-verify" in sys.argv:
+        sys.argv.remove("--no-verify")
+        verify = False
+
+    if len(sys.argv) < 4:
+        show_help()
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Not enough args")
+        exit(1)
+    elif len(sys.argv) > 5:
+        show_help()
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Too many args")
+        exit(1)
+
+    path_in = sys.argv[1]
+    folder_out = sys.argv[2]
+    direction = sys.argv[3]
+    workers = int(sys.argv[4]) if len(sys.argv) == 5 else None
+
+    if direction not in VERIFIED_MESHES:
+        show_help()
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Unknown direction, \"2to3\" or \"3to2\"")
+        exit(1)
+    if not os.path.exists(path_in):
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Failed to read file/folder " + path_in)
+        exit(1)
+
+    os.makedirs(folder_out, exist_ok=True)
+    failed = convert_all(path_in, folder_out, direction, workers, verify)
+    if len(failed) > 0:
+        exit(1)
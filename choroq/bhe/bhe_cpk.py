@@ -3,6 +3,7 @@ from math import ceil
 
 import choroq.read_utils as U
 from choroq.bhe.aptexture import APTexture
+from choroq.bhe.font_data import FontData
 from choroq.bhe.hpd_model import HPDModel
 from choroq.bhe.lzs_data import LZSContainer
 from choroq.bhe.mpd_model import MPDModel
@@ -80,8 +81,8 @@ class CPK:
             pass
         elif self.subfile_types[i] == b'FONT':
             # Font data/array/texture
-            # font_data = FontData.read_font(read_from, position)
-            # self.subfiles[i] = ("FONT", font_data)
+            font_data = FontData.read_font(read_from, position)
+            self.subfiles[i] = ("FONT", font_data)
             pass
         elif self.subfile_types[i] == b'MPC\x00':
             # Model format
@@ -1,6 +1,9 @@
+import json
 import os
+from math import ceil, sqrt
 from pathlib import Path
 
+import numpy as np
 from PIL import Image
 import choroq.read_utils as U
 
@@ -14,7 +17,7 @@ class FontData:
         self.char_height = char_height
         self.characters = characters
         self.character_data = character_data
-        self.character_images = character_images
+        self.character_images = character_images  # (characters, pixels) array of 8bpp pixels, a row per character
 
     @staticmethod
     def read_font(file, offset):
@@ -32,11 +35,9 @@ class FontData:
         val3 = U.readLong(file)  # Usually small, and often same as val2 e.g 0x14
 
         # file.seek(offset + font_table_value1, os.SEEK_SET)
-        characters = []
-        for i in range(int(characters_size/2)):
-            char = U.readShort(file)  # Character code/value I think
-            if char != 0xFFFF:
-                characters.append(char)
+        # Character code/value I think, 0xFFFF is unused
+        codes = np.frombuffer(U.read(file, int(characters_size/2) * 2), dtype="<u2")
+        characters = codes[codes != 0xFFFF].tolist()
         if FontData.PRINT_DEBUG:
             print(f"FONT| End of char table at {file.tell()}")
         # Padding
@@ -46,28 +47,25 @@ class FontData:
         font_characters = {}
         if FontData.PRINT_DEBUG:
             print(f"FONT| Start of char values? at {file.tell()}")
-        for i in range(int(font_ref_size/8)):
-        # while file.tell() < offset + header_size:
-            character = U.readShort(file)
-            val1 = U.readShort(file)  # Might be draw width
-            val2 = U.readShort(file)  # Might be draw height
-            ffffs = U.readShort(file)
+        # Each is character, val1 (might be draw width), val2 (might be draw height), ffffs
+        refs = np.frombuffer(U.read(file, int(font_ref_size/8) * 8), dtype="<u2").reshape(-1, 4)
+        for character, val1, val2, ffffs in refs.tolist():
             font_characters[character] = (character, val1, val2, ffffs)
 
         file.seek(offset + header_size, os.SEEK_SET)
         if FontData.PRINT_DEBUG:
             print(f"FONT| Start of char texture at {file.tell()}")
-        font_textures = {}
-        for ci, char in enumerate(characters):
-            data = bytes()
-            # Have to read byte at a time, as need to split into nibbles
-            for b in range(int(char_size_bytes)):
-                byte = U.readByte(file)
-                nibble_l = ((byte & 0xF) << 4).to_bytes(1, byteorder='little')
-                nibble_u = (((byte & 0xF0) >> 4) << 4).to_bytes(1, byteorder='little')
-                data += nibble_l
-                data += nibble_u
-            font_textures[ci] = data
+        # Read all the characters at once, then split each byte into its nibbles (lower first) 4bpp -> 8bpp
+        char_size_bytes = int(char_size_bytes)
+        data = U.read(file, len(characters) * char_size_bytes)
+        if len(data) < len(characters) * char_size_bytes:
+            print(f"FONT| Texture data ends early, only has {len(data) // char_size_bytes} of {len(characters)} characters")
+            characters = characters[:len(data) // char_size_bytes]
+        packed = np.frombuffer(data, dtype=np.uint8, count=len(characters) * char_size_bytes)
+        packed = packed.reshape(len(characters), char_size_bytes)
+        font_textures = np.empty((len(characters), char_size_bytes * 2), dtype=np.uint8)
+        font_textures[:, 0::2] = (packed & 0xF) << 4
+        font_textures[:, 1::2] = packed & 0xF0
         if FontData.PRINT_DEBUG:
             print(f"FONT| Finished char texture at {file.tell()}")
 
@@ -87,6 +85,32 @@ class FontData:
 
         for ci, char in enumerate(self.characters):
             image_dest = f"{path}\\character-{extra_name}-{ci}.png"
-            image = Image.frombytes('L', (self.char_width, self.char_height), self.character_images[ci], 'raw')
+            image = Image.frombytes('L', (self.char_width, self.char_height), self.character_images[ci].tobytes(), 'raw')
             image.save(image_dest, "PNG")
 
+    # Saves every character into one image (a grid, in the order of self.characters), and a json file with where
+    # each character is in the image, its code, and its values from the character table
+    def save_font_atlas(self, path, extra_name=""):
+        Path(f"{path}").mkdir(parents=True, exist_ok=True)
+        count = len(self.characters)
+        columns = max(1, ceil(sqrt(count)))
+        rows = max(1, ceil(count / columns))
+        width = self.char_width
+        height = min(self.char_height, self.character_images.shape[1] // width)
+
+        # (rows, columns, height, width) -> (rows * height, columns * width)
+        glyphs = np.zeros((rows * columns, height, width), dtype=np.uint8)
+        glyphs[:count] = self.character_images[:, :height * width].reshape(count, height, width)
+        atlas = glyphs.reshape(rows, columns, height, width).transpose(0, 2, 1, 3).reshape(rows * height, columns * width)
+        Image.fromarray(atlas, 'L').save(f"{path}/font-{extra_name}.png", "PNG")
+
+        metrics = {"char_width": width, "char_height": height, "columns": columns, "rows": rows, "characters": []}
+        for ci, char in enumerate(self.characters):
+            character = {"index": ci, "code": char, "x": (ci % columns) * width, "y": (ci // columns) * height}
+            if char in self.character_data:
+                _, val1, val2, ffffs = self.character_data[char]
+                character.update({"val1": val1, "val2": val2, "ff": ffffs})
+            metrics["characters"].append(character)
+        with open(f"{path}/font-{extra_name}.json", "w") as file:
+            json.dump(metrics, file, indent=1)
+
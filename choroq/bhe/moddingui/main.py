@@ -1,8 +1,8 @@
 import os
 import functools
 
-import re
-from io import BytesIO
+import mmap
+from io import BytesIO, BufferedReader
 from pathlib import Path
 
 import pycdlib
@@ -24,6 +24,9 @@ from choroq.bhe.moddingui.entries.pbl_entry import PblEntry
 from choroq.bhe.moddingui.modules.apt_option_handler import AptOptionHandler
 from choroq.bhe.moddingui.modules.pbl_option_handler import PblOptionHandler
 from choroq.bhe.moddingui.modules.preview_handler import APTPreviewFrame
+from choroq.game_source import MappedFileView
+from choroq.iso_index import IsoIndex, DEFAULT_INDEX_PATH
+from choroq.iso_patch import IsoPatchSession
 
 from modules.message_box import MessageBox
 
@@ -182,6 +185,13 @@ class ModdingUi(customtkinter.CTk):
             return
 
     def check_and_load_iso(self) -> bool:
+        # Put back the original data, if a replacement was stopped part way through writing
+        try:
+            IsoPatchSession.recover(self.iso_path)
+        except Exception as e:
+            print("failed to recover iso from its patch journal")
+            print(e)
+
         # Open iso using cdlib, and check what the disk is
         self.iso = pycdlib.PyCdlib()
         try:
@@ -273,7 +283,6 @@ class ModdingUi(customtkinter.CTk):
 
         matches = []
         self.entries = {}
-        facade = self.iso.get_iso9660_facade()
 
         # if self.game_version == GameVersion.CHOROQ_HG_1:
         #     matches = [
@@ -286,117 +295,129 @@ class ModdingUi(customtkinter.CTk):
         # el
         if self.game_version == GameVersion.CHOROQ_WORKS:
             matches = [
-                re.compile("/DATA/[A-Z_0-9]{0,10}\\.CPK"),
+                "/DATA/[A-Z_0-9]{0,10}\\.CPK",
             ]
         if self.game_version == GameVersion.CHOROQ_HG_1:
             matches = [
-                re.compile("/DATA/[A-Z_0-9]{0,10}\\.CPK"),
+                "/DATA/[A-Z_0-9]{0,10}\\.CPK",
             ]
         if self.game_version == GameVersion.CHOROQ_HG_4:
             matches = [
-                re.compile("/DATA/[A-Z_0-9]{0,10}\\.CPK"),
+                "/DATA/[A-Z_0-9]{0,10}\\.CPK",
             ]
         if self.game_version == GameVersion.SHIN_COMBAT_Q:
             matches = [
-                re.compile("/DATA/[A-Z_0-9]{0,10}\\.CPK"),
+                "/DATA/[A-Z_0-9]{0,10}\\.CPK",
             ]
+        if len(matches) == 0:
+            return
+
+        # Walks the iso once (or uses the saved index, if this iso has not changed since)
+        index = IsoIndex.open(self.iso, self.iso_path, matches)
         cpk_files_in_iso = {}
-        for dirname, dirlist, filelist in self.iso.walk(iso_path='/'):
-            for matcher in matches:
-                for filename in filelist:
-                    path = f"{dirname}/{filename}"
-                    if matcher.match(path):
-                        path = f"{dirname}/{filename}"
-                        record = facade.get_record(path)
-
-                        cpk_files_in_iso[filename] = (dirname, path, record)
+        for dirname, files in index.folders.items():
+            for filename, pattern_index, extent, size in files:
+                path = f"{dirname}/{filename}"
+                record = index.get_record(self.iso, dirname, filename)
+
+                cpk_files_in_iso[filename] = (dirname, path, record)
         image_count = 0
 
-        for cpk_filename in cpk_files_in_iso:
-            dirname, path, record = cpk_files_in_iso[cpk_filename]
-            # Read each cpk, and build entries from their subfiles
-            cpk_sector = record.orig_extent_loc
-            cpk_data = BytesIO()
-            self.iso.get_file_from_iso_fp(cpk_data, iso_path=path)
-            cpk = CPK.read_cpk(cpk_data, 0)
-            print(cpk.entry_count)
-
-            subfiles = []
-
-            for index, sub_type in enumerate(cpk.subfile_types):
-                print(sub_type)
-                entry_position = cpk.entry_positions[index]
-                if index < len(cpk.subfile_types) - 1:
-                    entry_size = cpk.entry_positions[index+1] - entry_position
+        # CPKs are read through a memory-mapped view of the iso, rather than copying each one out
+        with open(self.iso_path, "rb") as iso_in, mmap.mmap(iso_in.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for cpk_filename in cpk_files_in_iso:
+                dirname, path, record = cpk_files_in_iso[cpk_filename]
+                # Read each cpk, and build entries from their subfiles
+                cpk_sector = record.orig_extent_loc
+                cpk_data = BufferedReader(MappedFileView(mapped, cpk_sector * 2048, record.data_length))
+                # The subfile table is kept in the index, so the cpk's header only needs reading once
+                cpk_table = index.cpks.get(path)
+                if cpk_table is None:
+                    cpk = CPK.read_cpk(cpk_data, 0)
+                    index.cpks[path] = [cpk.entry_count, cpk.entry_positions, cpk.eof_position,
+                                        [sub_type.hex() for sub_type in cpk.subfile_types]]
                 else:
-                    # "Guess" at the distance from start of this to end
-                    entry_size = len(cpk_data.read()) - entry_position
-                subfile = CpkSubfileEntry(dirname, path, self.game_version, self.game_variant, record, sub_type, index, entry_position, entry_size)
-
-                if sub_type not in [b"MPC\0", b"APT\0"]:
-                    continue
-
-                if sub_type == b"APT\0":
-                    # Has multiple textures
-                    # needs to be read/parsed first so do that
-                    cpk.read_subfile(cpk_data, index)
-                    textures = cpk.subfiles[index][1]
-                    texture_entries = []
-                    for texture_index, texture in enumerate(textures):
-                        image_count += 1
-                        #if "kanban" in texture.name or "ban" in texture.name or "kan" in texture.name:
-                        texture_entries.append(AptEntry(texture, dirname, path, self.game_version, self.game_variant, record, sub_type, texture_index, texture.data_offset))
-                    subfile.children = texture_entries
-
-                if sub_type == b"PBL\0":
-                    # needs to be read/parsed first so do that
-                    cpk.read_subfile(cpk_data, index)
-                    pbls = cpk.subfiles[index][1]
-                    pbl_entries = []
-                    for pbl_index, pbl in enumerate(pbls):
-                        pbl_entries.append(PblEntry(pbl, dirname, path, self.game_version, self.game_variant, record, sub_type, pbl_index, pbl.offset))
-                    subfile.children = pbl_entries
-
-                if sub_type == b"LZS\0":
-                    # Has a file within, which has been compressed
-                    # needs to be read/parsed first so do that
-                    cpk.read_subfile(cpk_data, index)
-                    lzs = cpk.subfiles[index][1]
-                    textures = lzs.contained_file
-                    texture_entries = []
-                    for texture_index, texture in enumerate(textures):
-                        entry = AptEntry(texture, dirname, path, self.game_version, self.game_variant, record, sub_type, texture_index, texture.data_offset)
-                        entry.can_write = False
-                        texture_entries.append(entry)
-                        image_count += 1
-                    subfile.children = texture_entries
-
-                if sub_type == b"MPC\0":
-                    # needs to be read/parsed first so do that
-                    cpk.read_subfile(cpk_data, index)
-                    mpcs = cpk.subfiles[index][1]
-                    mpc_entries = []
-                    for mpc_index, mpc in enumerate(mpcs):
-                        mpc_entries.append(MpcEntry(mpc, dirname, path, self.game_version, self.game_variant, record, sub_type, mpc_index, mpc.offset))
-                    subfile.children = mpc_entries
-                if sub_type == b"MPD\0":
-                    # needs to be read/parsed first so do that
-                    cpk.read_subfile(cpk_data, index)
-                    mpds = cpk.subfiles[index][1]
-                    mpd_entries = []
-                    for mpd_index, mpd in enumerate(mpds):
-                        mpd_entries.append(MpcEntry(mpd, dirname, path, self.game_version, self.game_variant, record, sub_type, mpd_index, mpd.offset))
-                    subfile.children = mpd_entries
-
-                # TODO: proper filter, and refresh?
-                # if sub_type not in [b"PBL\0", b"APT\0", b"LZS\0"]:
-                #     continue
-
-                subfiles.append(subfile)
-
-            # Skip any cpks that we do not have any files that match the filter
-            if len(subfiles) > 0:
-                self.entries[(cpk_filename, cpk_sector)] = subfiles
+                    entry_count, entry_positions, eof_position, subfile_types = cpk_table
+                    cpk = CPK(entry_count, entry_positions, eof_position, [bytes.fromhex(t) for t in subfile_types])
+                print(cpk.entry_count)
+
+                subfiles = []
+
+                for subfile_index, sub_type in enumerate(cpk.subfile_types):
+                    print(sub_type)
+                    entry_position = cpk.entry_positions[subfile_index]
+                    if subfile_index < len(cpk.subfile_types) - 1:
+                        entry_size = cpk.entry_positions[subfile_index+1] - entry_position
+                    else:
+                        # "Guess" at the distance from start of this to end
+                        entry_size = record.data_length - entry_position
+                    subfile = CpkSubfileEntry(dirname, path, self.game_version, self.game_variant, record, sub_type, subfile_index, entry_position, entry_size)
+
+                    if sub_type not in [b"MPC\0", b"APT\0"]:
+                        continue
+
+                    if sub_type == b"APT\0":
+                        # Has multiple textures
+                        # needs to be read/parsed first so do that
+                        cpk.read_subfile(cpk_data, subfile_index)
+                        textures = cpk.subfiles[subfile_index][1]
+                        texture_entries = []
+                        for texture_index, texture in enumerate(textures):
+                            image_count += 1
+                            #if "kanban" in texture.name or "ban" in texture.name or "kan" in texture.name:
+                            texture_entries.append(AptEntry(texture, dirname, path, self.game_version, self.game_variant, record, sub_type, texture_index, texture.data_offset))
+                        subfile.children = texture_entries
+
+                    if sub_type == b"PBL\0":
+                        # needs to be read/parsed first so do that
+                        cpk.read_subfile(cpk_data, subfile_index)
+                        pbls = cpk.subfiles[subfile_index][1]
+                        pbl_entries = []
+                        for pbl_index, pbl in enumerate(pbls):
+                            pbl_entries.append(PblEntry(pbl, dirname, path, self.game_version, self.game_variant, record, sub_type, pbl_index, pbl.offset))
+                        subfile.children = pbl_entries
+
+                    if sub_type == b"LZS\0":
+                        # Has a file within, which has been compressed
+                        # needs to be read/parsed first so do that
+                        cpk.read_subfile(cpk_data, subfile_index)
+                        lzs = cpk.subfiles[subfile_index][1]
+                        textures = lzs.contained_file
+                        texture_entries = []
+                        for texture_index, texture in enumerate(textures):
+                            entry = AptEntry(texture, dirname, path, self.game_version, self.game_variant, record, sub_type, texture_index, texture.data_offset)
+                            entry.can_write = False
+                            texture_entries.append(entry)
+                            image_count += 1
+                        subfile.children = texture_entries
+
+                    if sub_type == b"MPC\0":
+                        # needs to be read/parsed first so do that
+                        cpk.read_subfile(cpk_data, subfile_index)
+                        mpcs = cpk.subfiles[subfile_index][1]
+                        mpc_entries = []
+                        for mpc_index, mpc in enumerate(mpcs):
+                            mpc_entries.append(MpcEntry(mpc, dirname, path, self.game_version, self.game_variant, record, sub_type, mpc_index, mpc.offset))
+                        subfile.children = mpc_entries
+                    if sub_type == b"MPD\0":
+                        # needs to be read/parsed first so do that
+                        cpk.read_subfile(cpk_data, subfile_index)
+                        mpds = cpk.subfiles[subfile_index][1]
+                        mpd_entries = []
+                        for mpd_index, mpd in enumerate(mpds):
+                            mpd_entries.append(MpcEntry(mpd, dirname, path, self.game_version, self.game_variant, record, sub_type, mpd_index, mpd.offset))
+                        subfile.children = mpd_entries
+
+                    # TODO: proper filter, and refresh?
+                    # if sub_type not in [b"PBL\0", b"APT\0", b"LZS\0"]:
+                    #     continue
+
+                    subfiles.append(subfile)
+
+                # Skip any cpks that we do not have any files that match the filter
+                if len(subfiles) > 0:
+                    self.entries[(cpk_filename, cpk_sector)] = subfiles
+        index.save(DEFAULT_INDEX_PATH, self.iso_path)
         print(f"Total image count is {image_count}")
 
 
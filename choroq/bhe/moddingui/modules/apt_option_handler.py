@@ -16,6 +16,7 @@ from PIL import Image
 from customtkinter import CTkFrame
 
 from choroq.bhe.moddingui.modules.message_box import MessageBox
+from choroq.iso_patch import IsoPatchSession
 from choroq.texture_utils import TextureUtil
 
 
@@ -69,9 +70,9 @@ class AptOptionHandler:
             return False
 
         # Reopen the iso as read and write
+        patch_session = IsoPatchSession(entry.record.data_fp.name)
         try:
-            write_test = open(entry.record.data_fp.name, "r+b")
-            write_test.close()
+            patch_session.check_writable()
         except Exception as e:
             print("failed to write to iso (test)")
             print(e)
@@ -131,17 +132,12 @@ class AptOptionHandler:
                                warn=True)
                 else:
                     try:
-                        # Dirty, open file again then write where it should be,
+                        # Write into the iso file where it should be (not through pycdlib),
                         # without doing this the data positions change
                         print(f"Replacing texture {entry.basename} in {entry.record.data_fp.name}")
-                        with open(entry.record.data_fp.name, "r+b") as edited_out:
-                            # Move to the iso's file position, and move to the start of the part
-                            edited_out.seek(writing_offset, os.SEEK_SET)
-
-                            amount_written = edited_out.write(replacement_bytes.read())
-                            if amount_written < clut_size + texture_size:
-                                raise Exception(
-                                    f"Failed to replace, did not write full size {amount_written} != {clut_size + texture_size}")
+                        # +16 to move past this APT entry's header/descriptor
+                        patch_session.add_entry(entry, replacement_bytes.read(), 16)
+                        patch_session.commit()
 
                         # Do not use this function, it changes LBA and file positions
                         # This is here to remind me to not do this
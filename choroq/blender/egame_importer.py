@@ -2,6 +2,7 @@ import bpy
 import bmesh
 import os
 import struct
+import numpy as np
 
 from pyffi.utils.trianglemesh import Mesh
 from pyffi.utils.trianglestripifier import TriangleStrip, TriangleStripifier
@@ -14,10 +15,75 @@ from bpy.types import Operator
 from choroq.egame.car import CarModel
 from choroq.egame.course import CourseModel
 
-from mathutils import Vector
-
 from pathlib import Path
 
+# Returns the MeshBuffer's data as a numpy array (without copying)
+def buffer_array(mesh_buffer):
+    return np.frombuffer(mesh_buffer.data, dtype=mesh_buffer.data.typecode)
+
+
+# Joins the meshes into flat arrays, with the faces made 0 based and offset to match
+# returns verts (x,y,z...), faces (3 vertex indices per face), uvs (u,v per vertex), {name: colours (r,g,b,a per vertex)}
+def merge_mesh_arrays(meshes, colour_names):
+    verts = []
+    faces = []
+    uvs = []
+    colours = {name: [] for name in colour_names}
+    vert_count = 0
+    for mesh in meshes:
+        mesh_vert_count = len(mesh.mesh_verts)
+        verts.append(buffer_array(mesh.mesh_verts))
+        faces.append(buffer_array(mesh.mesh_faces).astype(np.int32) - 1 + vert_count)
+        uvs.append(buffer_array(mesh.mesh_uvs).reshape(-1, 3)[:, :2])
+        for name in colour_names:
+            mesh_colours = getattr(mesh, name)
+            if len(mesh_colours) == mesh_vert_count:
+                colours[name].append(buffer_array(mesh_colours))
+            else:
+                # Missing colours, use white
+                colours[name].append(np.full(mesh_vert_count * 4, 255.0))
+        vert_count += mesh_vert_count
+
+    if vert_count == 0:
+        return np.zeros(0), np.zeros(0, dtype=np.int32), np.zeros((0, 2)), {name: np.zeros(0) for name in colour_names}
+    return (np.concatenate(verts), np.concatenate(faces), np.concatenate(uvs),
+            {name: np.concatenate(values) for name, values in colours.items()})
+
+
+# Creates a blender mesh from flat arrays, using foreach_set rather than per vertex/loop python objects
+def create_blender_mesh(name, verts, faces, uvs, colours):
+    blen_mesh = bpy.data.meshes.new(name)
+    vert_count = len(verts) // 3
+    loop_count = len(faces)
+    face_count = loop_count // 3
+
+    blen_mesh.vertices.add(vert_count)
+    blen_mesh.vertices.foreach_set("co", verts.astype(np.float32))
+    blen_mesh.loops.add(loop_count)
+    blen_mesh.loops.foreach_set("vertex_index", faces.astype(np.int32))
+    blen_mesh.polygons.add(face_count)
+    blen_mesh.polygons.foreach_set("loop_start", np.arange(0, loop_count, 3, dtype=np.int32))
+    if bpy.app.version < (4, 0, 0):
+        # Read only (calculated from loop_start) from 4.0
+        blen_mesh.polygons.foreach_set("loop_total", np.full(face_count, 3, dtype=np.int32))
+
+    # UVs are per loop, so look them up by each loop's vertex
+    uv_layer = blen_mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", uvs[faces].astype(np.float32).ravel())
+
+    for colour_name, values in colours.items():
+        colour_layer = blen_mesh.color_attributes.new(
+            name=colour_name,
+            type='BYTE_COLOR',
+            domain='POINT'
+        )
+        colour_layer.data.foreach_set("color", np.clip(values / 255.0, 0.0, 1.0).astype(np.float32))
+
+    blen_mesh.update(calc_edges=True)
+    blen_mesh.validate()
+    return blen_mesh
+
+
 class HG2FieldImporter(Operator, ImportHelper):
     bl_idname = "choroq_hg2.field_importer"
     bl_label = "Import Field (Choro Q HG2/HG3)"
@@ -34,14 +100,48 @@ class HG2FieldImporter(Operator, ImportHelper):
 
     def execute(self, context):
         issue = False
-        with open(self.file, "rb") as f:
+        path = Path(self.filepath)
+        course_name = path.stem
+        with open(self.filepath, "rb") as f:
             course = CourseModel.read_course(f)
             # Convert course to blender data
+            collection = bpy.data.collections.new(course_name)
+            bpy.context.scene.collection.children.link(collection)
+
+            # One object per material, as is done when extracting
+            HG2FieldImporter.import_meshes(course.meshes, course_name, collection)
+            if len(course.extra_fields) > 0:
+                HG2FieldImporter.import_meshes(course.extra_fields, f"{course_name}-E", collection)
 
         if issue:
             return {"CANCELLED"}
         return {"FINISHED"}
 
+    @staticmethod
+    def import_meshes(levels, name, collection):
+        # Sort all meshes into meshes by (clut, texture)
+        mesh_by_material = {}
+        for level in levels:
+            for z_row in level.chunks:
+                for meshes_by_data in z_row:
+                    for data_key, meshes in meshes_by_data.items():
+                        if data_key not in mesh_by_material:
+                            mesh_by_material[data_key] = []
+                        mesh_by_material[data_key] += meshes
+
+        for mat_index, (key, meshes) in enumerate(mesh_by_material.items()):
+            verts, faces, uvs, colours = merge_mesh_arrays(meshes, ["mesh_day_colours", "mesh_night_colours"])
+            if len(faces) == 0:
+                continue
+            # Rename to match, as the colours are day and night lighting
+            colours = {"day_colours": colours["mesh_day_colours"], "night_colours": colours["mesh_night_colours"]}
+            mesh_name = f"{name}-{mat_index}"
+            blen_mesh = create_blender_mesh(mesh_name, verts, faces, uvs, colours)
+            blen_mesh.materials.append(bpy.data.materials.new(mesh_name))
+            blen_obj = bpy.data.objects.new(mesh_name, blen_mesh)
+            collection.objects.link(blen_obj)
+
+
 class HG2CarImporter(Operator, ImportHelper):
     bl_idname = "choroq_hg2.car_importer"
     bl_label = "Import Car (Choro Q HG2/HG3)"
@@ -86,43 +186,15 @@ class HG2CarImporter(Operator, ImportHelper):
             unknown_mat = bpy.data.materials.new(f"{car_name}")
 
             for i, subfile in enumerate(car.meshes):
-                vertList = []
-
                 for mi, mesh in enumerate(subfile):
                     if i < len(part_names) and mi < len(part_names[i]):
                         mesh_path = part_names[i][mi]
                     else:
                         mesh_path = f"{i}-{mi}"
-                    blen_mesh = bpy.data.meshes.new(mesh_path)
-
-                    for vi in range(mesh.mesh_vert_count):
-                        vertList.append(Vector(mesh.mesh_verts[vi]))
-
-                    face_list = []
-                    for face in mesh.mesh_faces:
-                        face_list.append([face[0]-1, face[1]-1, face[2]-1])
-
-                    blen_mesh.from_pydata(vertList, [], face_list)
-                    blen_mesh.update()
-
-                    uv_layer = blen_mesh.uv_layers.new(name="UVMap")
-                    colour_layer = blen_mesh.color_attributes.new(
-                        name="vert_colours",
-                        type='BYTE_COLOR',
-                        domain='CORNER'
-                    )
-
-                    for face in blen_mesh.polygons:
-                        for v_index, loop_idx in zip(face.vertices, face.loop_indices):
-                            #        for v in mesh1.verts:
-                            r, g, b, a = mesh.mesh_colours[v_index]
-                            uv = mesh.mesh_uvs[v_index]
-                            colour_layer.data[v_index].color = [int(r) & 0xFF, int(g) & 0xFF, int(b) & 0xFF, int(a) & 0xFF]
-                            uv_layer.data[loop_idx].uv = [uv[0], uv[1]]
-
-                    blen_mesh.update()
+
+                    verts, faces, uvs, colours = merge_mesh_arrays([mesh], ["mesh_colours"])
+                    blen_mesh = create_blender_mesh(mesh_path, verts, faces, uvs, {"vert_colours": colours["mesh_colours"]})
                     blen_obj = bpy.data.objects.new(mesh_path, blen_mesh)
-                    bpy.context.scene.collection.objects.link(blen_obj)
                     collection.objects.link(blen_obj)
 
                     if i == 0 or i == 1:
@@ -187,15 +187,10 @@ class HG3CarModel(CarModel):
 
 
 class HG3CarMesh(CarMesh):
+    __slots__ = ()
 
     def __init__(self, mesh_vert_count, mesh_verts, mesh_normals, mesh_uvs, mesh_faces, mesh_colours):
         super().__init__(mesh_vert_count, mesh_verts, mesh_normals, mesh_uvs, mesh_faces, mesh_colours)
-        self.mesh_vert_count = mesh_vert_count
-        self.mesh_verts = mesh_verts
-        self.mesh_normals = mesh_normals
-        self.mesh_uvs = mesh_uvs
-        self.mesh_faces = mesh_faces
-        self.mesh_colours = mesh_colours
 
     @staticmethod
     def _parse_offsets(file, offset):
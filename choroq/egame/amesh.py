@@ -1,7 +1,93 @@
 from abc import ABC, abstractmethod
+from array import array
+from itertools import chain
+
+
+# Holds one per vertex (or per face) attribute as a single flat array, e.g x,y,z,x,y,z...
+# rather than a list of tuples, which needs over 100 bytes per vertex for each attribute.
+# It still acts as a list of tuples, so mesh.mesh_verts[i][0] and len(mesh.mesh_verts) work as before,
+# and the flat data can be handed to anything that takes a buffer via .data or .view()
+class MeshBuffer:
+    __slots__ = ("width", "data")
+
+    def __init__(self, width, values=None, typecode='f'):
+        self.width = width
+        self.data = array(typecode)
+        if values is not None:
+            self.extend(values)
+
+    # Returns values as a MeshBuffer, without copying if it already is one
+    @staticmethod
+    def of(width, values, typecode='f'):
+        if isinstance(values, MeshBuffer) and values.width == width and values.data.typecode == typecode:
+            return values
+        return MeshBuffer(width, values, typecode)
+
+    def __len__(self):
+        return len(self.data) // self.width
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("MeshBuffer index out of range")
+        start = index * self.width
+        return tuple(self.data[start:start + self.width])
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("MeshBuffer index out of range")
+        if len(value) != self.width:
+            raise ValueError(f"Expected {self.width} values got {len(value)}")
+        start = index * self.width
+        self.data[start:start + self.width] = array(self.data.typecode, value)
+
+    # A tuple per row, zip takes width values at a time from the one iterator, rather than slicing each row
+    def __iter__(self):
+        return zip(*[iter(self.data)] * self.width)
+
+    # Like iterating, with value added to each component, e.g to shift face indices
+    def offset(self, value):
+        return zip(*[map(value.__add__, self.data)] * self.width)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __repr__(self):
+        return f"MeshBuffer({self.width}, {list(self)})"
+
+    def append(self, value):
+        if len(value) != self.width:
+            raise ValueError(f"Expected {self.width} values got {len(value)}")
+        self.data.extend(value)
+
+    def extend(self, values):
+        if isinstance(values, MeshBuffer):
+            if values.width != self.width:
+                raise ValueError(f"Cannot extend width {self.width} buffer with width {values.width}")
+            if values.data.typecode == self.data.typecode:
+                self.data.extend(values.data)
+            else:
+                self.data.fromlist(values.data.tolist())
+            return
+        length = len(self.data)
+        self.data.extend(chain.from_iterable(values))
+        if len(self.data) % self.width != 0:
+            del self.data[length:]
+            raise ValueError(f"Values do not all have {self.width} components")
+
+    # Flat view of the values, without copying
+    def view(self):
+        return memoryview(self.data)
 
 
 class AMesh(ABC):
+    __slots__ = ()
 
     # Creates OBJ file, of the meshes
     # The format includes Vertices, Vertex Normals,
@@ -41,6 +127,9 @@ class AMesh(ABC):
             return self.write_mesh_to_obj(fout, start_index, material, output_type == "obj+colour")
         elif output_type == "comb":
             return self.write_mesh_to_comb(fout, start_index, material)
+        elif output_type == "combb":
+            # Binary, needs a file opened with "wb" and a header, see write_comb_binary_header
+            raise Exception("combb meshes are written with write_mesh_to_comb_binary, not write_mesh_to_type")
         else:
             # Default to ply
             return self.write_mesh_to_ply(fout, start_index)
@@ -68,7 +68,8 @@
 import io
 import os
 import math
-from choroq.egame.amesh import AMesh
+from choroq.egame.amesh import AMesh, MeshBuffer
+from choroq.egame.comb_binary import write_comb_binary_mesh
 from choroq.egame.texture import Texture
 import choroq.read_utils as U
 import choroq.ps2_utils as PS2
@@ -138,15 +139,18 @@ class CarModel:
 
 
 class CarMesh(AMesh):
+    __slots__ = ("mesh_vert_count", "mesh_verts", "mesh_normals", "mesh_uvs", "mesh_faces", "mesh_colours", "mesh_extra",
+                 "__weakref__")
 
-    def __init__(self, mesh_vert_count, mesh_verts, mesh_normals, mesh_uvs, mesh_faces, mesh_colours, mesh_extra):
+    def __init__(self, mesh_vert_count, mesh_verts, mesh_normals, mesh_uvs, mesh_faces, mesh_colours, mesh_extra=None):
+        # Stored as flat arrays (see MeshBuffer), these can still be used as lists of tuples
         self.mesh_vert_count = mesh_vert_count
-        self.mesh_verts = mesh_verts
-        self.mesh_normals = mesh_normals
-        self.mesh_uvs = mesh_uvs
-        self.mesh_faces = mesh_faces
-        self.mesh_colours = mesh_colours
-        self.mesh_extra = mesh_extra
+        self.mesh_verts = MeshBuffer.of(3, mesh_verts, 'd')
+        self.mesh_normals = MeshBuffer.of(3, mesh_normals, 'd')
+        self.mesh_uvs = MeshBuffer.of(3, mesh_uvs, 'd')
+        self.mesh_faces = MeshBuffer.of(3, mesh_faces, 'I')
+        self.mesh_colours = MeshBuffer.of(4, mesh_colours, 'd')
+        self.mesh_extra = MeshBuffer.of(3, mesh_extra or [], 'd')
 
     @staticmethod
     def _parse_offsets(file, offset):
@@ -427,101 +431,76 @@ class CarMesh(AMesh):
     def write_mesh_to_dbg(self, fout, start_index=0, material=None):
         self.write_mesh_to_obj(fout, start_index, material, False)
         fout.write("#" + str(len(self.mesh_colours)) + " colours R/G/B/A\n")
-        for i in range(0, len(self.mesh_faces)):
-            cr = '{:d}'.format(math.trunc(self.mesh_colours[i][0]))
-            cg = '{:d}'.format(math.trunc(self.mesh_colours[i][1]))
-            cb = '{:d}'.format(math.trunc(self.mesh_colours[i][2]))
-            ca = '{:d}'.format(math.trunc(self.mesh_colours[i][3]))
-            
-            fout.write(f"c {cr} {cg} {cb} {ca}\n")
+        fout.write("".join(f"c {math.trunc(cr):d} {math.trunc(cg):d} {math.trunc(cb):d} {math.trunc(ca):d}\n"
+                           for _, (cr, cg, cb, ca) in zip(range(0, len(self.mesh_faces)), self.mesh_colours)))
         
         return len(self.mesh_verts)
 
+    # Each attribute (MeshBuffer) is walked once, a row at a time, rather than indexing it per component,
+    # and each block of lines is joined and written at once
     def write_mesh_to_obj(self, fout, start_index=0, material=None, with_colours=False):
         fout.write(f"usemtl {material}\n")
         fout.write("s off\n")
         # Write vertices
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-            if with_colours:
-                # Some programs support additional data, e.g colors after x/y/z
-                # the following section can be used to export with colors (blender supports first set)
-                r = '{:.20f}'.format(self.mesh_colours[i][0] / 256.0)
-                g = '{:.20f}'.format(self.mesh_colours[i][1] / 256.0)
-                b = '{:.20f}'.format(self.mesh_colours[i][2] / 256.0)
-
-                # r = '{:.20f}'.format(self.mesh_extra[i][0] / 10.0)
-                # g = 0#'{:.20f}'.format(self.mesh_extra[i][1] / 100.0)
-                # b = 0
-                # s = self.mesh_extra[i][2]
-                # if s == 0:
-                #     r = 0
-                #     g = 0
-                #     b = 0
-                # if s == 1:
-                #     r = 1
-                #     g = 1
-                #     b = 1
-                # if s == 51:
-                #     r = 1
-                #     g = 0
-                #     b = 0
-                # if s == 255:
-                #     r = 1
-                #     g = 0
-                #     b = 1
-                # if s == 280.5:
-                #     r = 0
-                #     g = 1
-                #     b = 0
-                # if s == 357:
-                #     r = 0
-                #     g = 0
-                #     b = 1
-
-
-                #b = '{:.20f}'.format(self.mesh_extra[i][2] / 1000.0)
-                # fout.write(f"# s {e_colour_select} {e_exec_addr} {e_smoothness} \n")
-
-
-                fout.write(f"v {vx} {vy} {vz} {r} {g} {b}\n")
-            else:
-                fout.write(f"v {vx} {vy} {vz}\n")
+        if with_colours:
+            # Some programs support additional data, e.g colors after x/y/z
+            # the following section can be used to export with colors (blender supports first set)
+            fout.write("".join(f"v {vx:.20f} {vy:.20f} {vz:.20f} {r / 256.0:.20f} {g / 256.0:.20f} {b / 256.0:.20f}\n"
+                               for (vx, vy, vz), (r, g, b, a) in zip(self.mesh_verts, self.mesh_colours)))
+
+            # r = '{:.20f}'.format(self.mesh_extra[i][0] / 10.0)
+            # g = 0#'{:.20f}'.format(self.mesh_extra[i][1] / 100.0)
+            # b = 0
+            # s = self.mesh_extra[i][2]
+            # if s == 0:
+            #     r = 0
+            #     g = 0
+            #     b = 0
+            # if s == 1:
+            #     r = 1
+            #     g = 1
+            #     b = 1
+            # if s == 51:
+            #     r = 1
+            #     g = 0
+            #     b = 0
+            # if s == 255:
+            #     r = 1
+            #     g = 0
+            #     b = 1
+            # if s == 280.5:
+            #     r = 0
+            #     g = 1
+            #     b = 0
+            # if s == 357:
+            #     r = 0
+            #     g = 0
+            #     b = 1
+
+
+            #b = '{:.20f}'.format(self.mesh_extra[i][2] / 1000.0)
+            # fout.write(f"# s {e_colour_select} {e_exec_addr} {e_smoothness} \n")
+        else:
+            fout.write("".join(f"v {vx:.20f} {vy:.20f} {vz:.20f}\n" for vx, vy, vz in self.mesh_verts))
         fout.write("#" + str(len(self.mesh_verts)) + " vertices\n")
             
         # Write normals
-        for i in range(0, len(self.mesh_normals)):
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-            fout.write("vn " + nx + " " + ny + " " + nz + "\n")
+        fout.write("".join(f"vn {nx:.20f} {ny:.20f} {nz:.20f}\n" for nx, ny, nz in self.mesh_normals))
         fout.write("#" + str(len(self.mesh_normals)) + " vertex normals\n")
         
         # Write texture coordinates (uv)
-        for i in range(0, len(self.mesh_uvs)):
-            tu = '{:.20f}'.format(self.mesh_uvs[i][0])
-            tv = '{:.20f}'.format(self.mesh_uvs[i][1])
-            fout.write("vt " + tu + " " + tv + "\n")
+        fout.write("".join(f"vt {tu:.20f} {tv:.20f}\n" for tu, tv, tw in self.mesh_uvs))
 
         fout.write("#" + str(len(self.mesh_uvs)) + " texture vertices\n")
 
         # Write extra info (debug)
-        for i in range(0, len(self.mesh_extra)):
-            e_colour_select = '{:.20f}'.format(self.mesh_extra[i][0])
-            e_exec_addr = '{:.20f}'.format(self.mesh_extra[i][1])
-            e_smoothness = '{:.20f}'.format(self.mesh_extra[i][2])
-            fout.write(f"# s {e_colour_select} {e_exec_addr} {e_smoothness} \n")
+        fout.write("".join(f"# s {e_colour_select:.20f} {e_exec_addr:.20f} {e_smoothness:.20f} \n"
+                           for e_colour_select, e_exec_addr, e_smoothness in self.mesh_extra))
         fout.write("#" + str(len(self.mesh_extra)) + " debug extras \n")
 
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] + start_index
-            fy = self.mesh_faces[i][1] + start_index
-            fz = self.mesh_faces[i][2] + start_index
-            
-            fout.write(f"f {fx}/{fx}/{fx} {fy}/{fy}/{fy} {fz}/{fz}/{fz}\n")
+        fout.write("".join(f"f {fx}/{fx}/{fx} {fy}/{fy}/{fy} {fz}/{fz}/{fz}\n"
+                           for fx, fy, fz in self.mesh_faces.offset(start_index)))
         fout.write("#" + str(len(self.mesh_faces)) + " faces\n")
     
         return len(self.mesh_verts)
@@ -538,37 +517,21 @@ class CarMesh(AMesh):
         fout.write("end_header\n")
 
         # Write verticies, colours, normals
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-
-            cr = '{:d}'.format(math.trunc(self.mesh_colours[i][0]))
-            cg = '{:d}'.format(math.trunc(self.mesh_colours[i][1]))
-            cb = '{:d}'.format(math.trunc(self.mesh_colours[i][2]))
-            ca = '{:d}'.format(math.trunc(self.mesh_colours[i][3]))
-
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-
-            tu = '{:.10f}'.format(self.mesh_uvs[i][0])
-            tv = '{:.10f}'.format(self.mesh_uvs[i][1])
-
-            fout.write(f"{vx} {vy} {vz} {nx} {ny} {nz} {cr} {cg} {cb} {ca} {tu} {tv}\n")
+        self._write_vertex_rows(fout)
         
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] - 1 + start_index
-            fy = self.mesh_faces[i][1] - 1 + start_index
-            fz = self.mesh_faces[i][2] - 1 + start_index
-            
-            fout.write(f"4 {fx} {fy} {fz}\n")
+        self._write_face_rows(fout, start_index)
 
         fout.write(f"e 1\n")  # End of a mesh
         
         return len(self.mesh_verts)
 
+    # Binary version of the comb format, see comb_binary.py. Cars only have one set of colours
+    def write_mesh_to_comb_binary(self, fout, texture_index=0):
+        write_comb_binary_mesh(fout, texture_index, self.mesh_verts, self.mesh_normals, self.mesh_uvs,
+                               self.mesh_colours, self.mesh_colours, self.mesh_faces)
+        return len(self.mesh_verts)
+
     def write_mesh_to_ply(self, fout, start_index=0):
         # Write header
         fout.write("ply\n")
@@ -593,32 +556,21 @@ class CarMesh(AMesh):
         fout.write("end_header\n")
 
         # Write verticies, colours, normals
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-
-            cr = '{:d}'.format(math.trunc(self.mesh_colours[i][0]))
-            cg = '{:d}'.format(math.trunc(self.mesh_colours[i][1]))
-            cb = '{:d}'.format(math.trunc(self.mesh_colours[i][2]))
-            ca = '{:d}'.format(math.trunc(self.mesh_colours[i][3]))
-
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-
-            tu = '{:.10f}'.format(self.mesh_uvs[i][0])
-            tv = '{:.10f}'.format(self.mesh_uvs[i][1])
-
-            fout.write(f"{vx} {vy} {vz} {nx} {ny} {nz} {cr} {cg} {cb} {ca} {tu} {tv}\n")
+        self._write_vertex_rows(fout)
         
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] - 1 + start_index
-            fy = self.mesh_faces[i][1] - 1 + start_index
-            fz = self.mesh_faces[i][2] - 1 + start_index
-            
-            fout.write(f"4 {fx} {fy} {fz}\n")
+        self._write_face_rows(fout, start_index)
 
         return len(self.mesh_verts)
+
+    # Vertex lines shared by comb and ply, x y z nx ny nz r g b a u v
+    def _write_vertex_rows(self, fout):
+        fout.write("".join(f"{vx:.20f} {vy:.20f} {vz:.20f} {nx:.20f} {ny:.20f} {nz:.20f} "
+                           f"{math.trunc(cr):d} {math.trunc(cg):d} {math.trunc(cb):d} {math.trunc(ca):d} {tu:.10f} {tv:.10f}\n"
+                           for (vx, vy, vz), (nx, ny, nz), (cr, cg, cb, ca), (tu, tv, tw)
+                           in zip(self.mesh_verts, self.mesh_normals, self.mesh_colours, self.mesh_uvs)))
+
+    # Face lines shared by comb and ply, 0 based
+    def _write_face_rows(self, fout, start_index):
+        fout.write("".join(f"4 {fx} {fy} {fz}\n" for fx, fy, fz in self.mesh_faces.offset(start_index - 1)))
         
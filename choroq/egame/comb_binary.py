@@ -0,0 +1,91 @@
+
+# Binary variant of the custom comb format (see write_mesh_to_comb), output type "combb"
+#
+# The text comb format is one line per vertex, which is slow to write and very slow to read back in
+# (see blender-py/comb_importer_blender.py). This holds the same data as blocks of flat arrays, so
+# a reader can take each attribute in one go (e.g numpy.frombuffer) without parsing.
+#
+# All values are little endian, and every block is a multiple of 4 bytes so the arrays stay aligned
+#   Header:
+#     4s  magic "COMB" (the text format starts with "comb")
+#     u16 version (COMB_BINARY_VERSION)
+#     u16 type (COMB_TYPE_*)
+#     u32 mesh count
+#     u32 texture count
+#   Textures, texture count times:
+#     u16 length, then the utf-8 path (relative to the file), padded with 0s to 4 bytes
+#   Meshes, mesh count times:
+#     u32 vertex count (n)
+#     u32 face count (f)
+#     i32 texture index, into the textures above (-1 for none)
+#     f32 verts[n * 3]          x, y, z
+#     f32 normals[n * 3]        x, y, z (0s if the mesh has none)
+#     f32 uvs[n * 2]            u, v
+#     f32 day_colours[n * 4]    r, g, b, a 0-255
+#     f32 night_colours[n * 4]  r, g, b, a 0-255 (same as day for cars)
+#     u32 faces[f * 3]          0 based, within this mesh
+
+import struct
+import sys
+from array import array
+
+COMB_BINARY_MAGIC = b"COMB"
+COMB_BINARY_VERSION = 1
+
+COMB_TYPE_CAR = 1
+COMB_TYPE_FIELD = 3
+
+COMB_HEADER = struct.Struct("<4sHHII")
+COMB_MESH_HEADER = struct.Struct("<IIi")
+# Offset of the mesh count within the header, for updating it once all meshes are written
+COMB_MESH_COUNT_OFFSET = 8
+
+
+def write_comb_binary_header(fout, comb_type, mesh_count, textures):
+    fout.write(COMB_HEADER.pack(COMB_BINARY_MAGIC, COMB_BINARY_VERSION, comb_type, mesh_count, len(textures)))
+    for texture in textures:
+        path = str(texture).encode("utf-8")
+        fout.write(struct.pack("<H", len(path)))
+        fout.write(path)
+        fout.write(bytes(-(2 + len(path)) % 4))
+
+
+# Updates the mesh count of a file started with write_comb_binary_header, for when it is not known up front
+def update_comb_binary_mesh_count(fout, mesh_count, header_start=0):
+    position = fout.tell()
+    fout.seek(header_start + COMB_MESH_COUNT_OFFSET)
+    fout.write(struct.pack("<I", mesh_count))
+    fout.seek(position)
+
+
+# Writes a single mesh, the attributes are MeshBuffers (see amesh.py) with the faces 1 based as stored in the meshes
+def write_comb_binary_mesh(fout, texture_index, verts, normals, uvs, day_colours, night_colours, faces):
+    vert_count = len(verts)
+    fout.write(COMB_MESH_HEADER.pack(vert_count, len(faces), texture_index))
+
+    _write_array(fout, array('f', verts.data))
+    if len(normals) == vert_count:
+        _write_array(fout, array('f', normals.data))
+    else:
+        _write_array(fout, array('f', bytes(vert_count * 3 * 4)))
+
+    # Only u, v are kept
+    flat_uvs = array('f', uvs.data)
+    del flat_uvs[uvs.width - 1::uvs.width]
+    if len(flat_uvs) != vert_count * 2:
+        flat_uvs = array('f', bytes(vert_count * 2 * 4))
+    _write_array(fout, flat_uvs)
+
+    for colours in (day_colours, night_colours):
+        if len(colours) == vert_count:
+            _write_array(fout, array('f', colours.data))
+        else:
+            _write_array(fout, array('f', [255.0]) * (vert_count * 4))
+
+    _write_array(fout, array('I', (index - 1 for index in faces.data)))
+
+
+def _write_array(fout, values):
+    if sys.byteorder != "little":
+        values.byteswap()
+    values.tofile(fout)
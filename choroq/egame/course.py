@@ -107,7 +107,9 @@
 import io
 import os
 import math
-from choroq.egame.amesh import AMesh
+from itertools import repeat
+from choroq.egame.amesh import AMesh, MeshBuffer
+from choroq.egame.comb_binary import write_comb_binary_mesh
 from choroq.egame.texture import Texture
 from choroq.egame.car import CarModel, CarMesh
 import choroq.read_utils as U
@@ -117,7 +119,7 @@ import choroq.ps2_utils as PS2
 class CourseModel:
 
     def __init__(self, name, meshes=None, textures=None, colliders=None, colliders_by_mat=None, post_colliders=None, map_meshes=None,
-                 extras=None, extra_fields=None, extra_field_colliders=None):
+                 extras=None, extra_fields=None, extra_field_colliders=None, mesh_offsets=None, extra_field_offsets=None):
         if meshes is None:
             meshes = []
         if textures is None:
@@ -136,6 +138,10 @@ class CourseModel:
             extra_fields = []
         if extra_field_colliders is None:
             extra_field_colliders = []
+        if mesh_offsets is None:
+            mesh_offsets = []
+        if extra_field_offsets is None:
+            extra_field_offsets = []
         self.name = name
         self.meshes = meshes
         self.colliders = colliders
@@ -146,9 +152,14 @@ class CourseModel:
         self.extras = extras
         self.extra_fields = extra_fields
         self.extra_field_colliders = extra_field_colliders
+        # Where the mesh/extra field mesh tables are, for use with Course.iter_course_meshes
+        self.mesh_offsets = mesh_offsets
+        self.extra_field_offsets = extra_field_offsets
 
+    # If read_meshes is False, meshes and extra_fields are left empty, and can be read
+    # afterwards (one at a time) using Course.iter_course_meshes with mesh_offsets/extra_field_offsets
     @staticmethod
-    def read_course(file):
+    def read_course(file, read_meshes=True):
         print("Reading course")
         textures_offset = U.readLong(file)
         mesh_offset = U.readLong(file)
@@ -168,8 +179,10 @@ class CourseModel:
 
         print("Reading course: Textures")
         textures = CourseModel.read_course_textures(file, textures_offset, mesh_offset - textures_offset)
-        print("Reading course: Meshes")
-        meshes = Course.read_course_meshes(file, mesh_offset)
+        meshes = []
+        if read_meshes:
+            print("Reading course: Meshes")
+            meshes = Course.read_course_meshes(file, mesh_offset)
 
         print("Reading course: Colliders")
         # 4 point colliders, used for things like walls and fence posts
@@ -180,6 +193,7 @@ class CourseModel:
         extras = []
         extra_fields = []
         extra_field_colliders = []
+        extra_field_offsets = []
 
         if len(other_offsets) > 0:
             other_offsets.append(eof_offset)
@@ -197,7 +211,9 @@ class CourseModel:
                 elif 400 <= peek < 1000:
                     # Probably a field mesh table
                     print("Reading course: Field meshes")
-                    extra_fields += Course.read_course_meshes(file, o)
+                    extra_field_offsets.append(o)
+                    if read_meshes:
+                        extra_fields += Course.read_course_meshes(file, o)
                 elif 48 > peek >= 16:
                     # Has whole car model style data
                     extras.append(CarModel.read_car(file, o, other_offsets[oi + 1]))
@@ -205,7 +221,8 @@ class CourseModel:
                     # Only has a mesh
                     maps += CarMesh.from_file(file, o)
 
-        return CourseModel("", meshes, textures, colliders, colliders_by_mat, post_colliders, maps, extras, extra_fields, extra_field_colliders)
+        return CourseModel("", meshes, textures, colliders, colliders_by_mat, post_colliders, maps, extras, extra_fields,
+                           extra_field_colliders, [mesh_offset], extra_field_offsets)
     
     @staticmethod
     def read_course_textures(file, offset, length):
@@ -249,16 +266,27 @@ class Course:
 
     @staticmethod
     def read_course_meshes(file, offset):
+        x_max, z_max, chunk_offsets, shorts, extra_offset, extra_short, choroq3_test = Course.read_chunk_table(file, offset)
+
+        # Has x_max by z_max, z rows, and a final row for the extra chunk if there is one
+        chunks = [[] for z in range(0, z_max)]
+        for z, meshes_by_texture in Course.iter_course_meshes(file, offset):
+            if z == len(chunks):
+                chunks.append([])
+            chunks[z].append(meshes_by_texture)
+
+        return [Course(chunks, chunk_offsets, shorts)]
+
+    @staticmethod
+    def read_chunk_table(file, offset):
         # This starts off with a chunk offset table,
         # and a table with counts for how many meshes
         # each chunk contains.
         file.seek(offset, os.SEEK_SET)
         first_offset = U.readLong(file)
         file.seek(offset, os.SEEK_SET)
-        chunks = []  # Has x_max by z_max, z rows
         x_max = 8
         z_max = 8
-        min_offset = 390
 
         choroq3_test = False
         if first_offset > 400:
@@ -282,6 +310,7 @@ class Course:
             for x in range(0, x_max):
                 chunk_offsets.append(U.readLong(file))
 
+        extra_offset = 0
         if not choroq3_test:
             extra_offset = U.readLong(file)
 
@@ -290,40 +319,63 @@ class Course:
         shorts = []
         for j in range(shorts_max):
             shorts.append(U.readShort(file))
+        extra_short = 0
         if not choroq3_test:
             extra_short = U.readShort(file)
 
-        print("Reading course: Meshes: Chunk sizes")
+        return x_max, z_max, chunk_offsets, shorts, extra_offset, extra_short, choroq3_test
 
+    # Yields (z, {(clut, texture): [CourseMesh]}) for each part of each chunk, as it is read.
+    # This allows the meshes to be used/saved without holding the whole course in memory.
+    # The extra chunk (if any) is given last with z = z_max
+    # Note: file must not be moved between each item, as reading continues from the current position
+    @staticmethod
+    def iter_course_meshes(file, offset):
+        x_max, z_max, hg3, chunks = Course.list_chunks(file, offset)
         gs_state = PS2.GsState()
+        for x, z, chunk_offset, count in chunks:
+            for meshes_by_texture in Course.read_course_chunk(file, chunk_offset, count, gs_state, hg3):
+                yield z, meshes_by_texture
+
+    # Returns x_max, z_max, hg3, [(x, z, offset, mesh count)] for each chunk that has meshes
+    # The extra chunk (if any) is last with x = 0, z = z_max
+    # Each chunk can be read on its own with read_chunk, e.g to only read the chunks near a point
+    @staticmethod
+    def list_chunks(file, offset):
+        x_max, z_max, chunk_offsets, shorts, extra_offset, extra_short, choroq3_test = Course.read_chunk_table(file, offset)
+        min_offset = 390
 
+        print("Reading course: Meshes: Chunk sizes")
+
+        chunks = []
         for z in range(0, z_max):
-            z_row = []
             for x in range(0, x_max):
                 index = x + z * x_max
-                print(f"Reading chunk {index} z{z} x{x}")
                 if chunk_offsets[index] < min_offset:
                     # Must be empty or invalid chunk as offset table is within this region
                     print(f"Skipping chunk offset too low {chunk_offsets[index]}")
-                    # z_row.append({})
                     continue
                 if choroq3_test and index == z_max * x_max - 1:
                     print("Skipping as last for CHQ HG 3")
                     continue
-                # print(f"Reading course: Meshes: Chunk[{index}] @ {chunk_offsets[index]} size: {shorts[index]} - ABS {offset+chunk_offsets[index]}")
-                chunk = Course.read_course_chunk(file, offset + chunk_offsets[index], shorts[index], gs_state, choroq3_test)
-                z_row += chunk
-            chunks.append(z_row)
+                chunks.append((x, z, offset + chunk_offsets[index], shorts[index]))
 
-        # Process the extra part of the course
+        # The extra part of the course
         # This is usually used in fields to hold the windows/trees
         # Ensure offset is after the offset table
         if not choroq3_test and extra_offset > min_offset:
-            print(f"extra_offset {offset + extra_offset} {extra_offset} {extra_short} but at @ {file.tell()}")
-            extra_chunk = Course.read_course_chunk(file, offset + extra_offset, extra_short, gs_state, choroq3_test)
-            chunks.append(extra_chunk)
+            print(f"extra_offset {offset + extra_offset} {extra_offset} {extra_short}")
+            chunks.append((0, z_max, offset + extra_offset, extra_short))
+        return x_max, z_max, choroq3_test, chunks
 
-        return [Course(chunks, chunk_offsets, shorts)]
+    # Returns {(clut, texture): [CourseMesh]} for all the meshes of one chunk (see list_chunks)
+    @staticmethod
+    def read_chunk(file, offset, count, hg3=False):
+        meshes_by_texture = {}
+        for part in Course.read_course_chunk(file, offset, count, PS2.GsState(), hg3):
+            for key, meshes in part.items():
+                meshes_by_texture.setdefault(key, []).extend(meshes)
+        return meshes_by_texture
 
     @staticmethod
     def read_course_chunk(file, offset, count, gs_state, hg3=False):
@@ -333,8 +385,6 @@ class Course:
         vif_state = PS2.VifState()
         gs_state = PS2.GsState()
 
-        chunk_meshes = []
-
         # Follows this pattern:
         # 1 DMA tag
         # multiple:
@@ -378,7 +428,7 @@ class Course:
                     vif_processed_bytes.seek(0, os.SEEK_SET)
                     chunk, counts = Course.parse_chunk_mesh(vif_processed_bytes, processed_size, gs_state, vif_state.ExecAddr, hg3)
                     gif_count += counts
-                    chunk_meshes.append(chunk)
+                    yield chunk
                     extracted_data = True
                     data_count += 1
                     vif_processed_bytes.seek(0, os.SEEK_SET)
@@ -433,8 +483,6 @@ class Course:
             # Extract data at this point as it was missed somehow
             print("No data")
 
-        return chunk_meshes
-
     @staticmethod
     def parse_chunk_mesh(file, length, gs_state, exec_type, hg3=False):
         context = gs_state.PRIM["CTXT"]
@@ -696,80 +744,52 @@ class Course:
 
 
 class CourseMesh(AMesh):
+    __slots__ = ("mesh_vert_count", "mesh_verts", "mesh_normals", "mesh_uvs", "mesh_faces",
+                 "mesh_day_colours", "mesh_night_colours", "mesh_extras", "__weakref__")
 
     def __init__(self, mesh_vert_count=None, mesh_verts=None, mesh_normals=None, mesh_uvs=None, mesh_faces=None,
                  mesh_day_colours=None, mesh_night_colours=None, mesh_extras=None):
-        if mesh_verts is None:
-            mesh_verts = []
-        if mesh_normals is None:
-            mesh_normals = []
-        if mesh_uvs is None:
-            mesh_uvs = []
-        if mesh_faces is None:
-            mesh_faces = []
-        if mesh_day_colours is None:
-            mesh_day_colours = []
-        if mesh_night_colours is None:
-            mesh_night_colours = []
-        if mesh_extras is None:
-            mesh_extras = []
+        # Stored as flat arrays (see MeshBuffer), these can still be used as lists of tuples
         self.mesh_vert_count    = mesh_vert_count
-        self.mesh_verts         = mesh_verts
-        self.mesh_normals       = mesh_normals
-        self.mesh_uvs           = mesh_uvs
-        self.mesh_faces         = mesh_faces
-        self.mesh_day_colours   = mesh_day_colours
-        self.mesh_night_colours = mesh_night_colours
-        self.mesh_extras        = mesh_extras
-
+        self.mesh_verts         = MeshBuffer.of(3, mesh_verts or [], 'd')
+        self.mesh_normals       = MeshBuffer.of(3, mesh_normals or [], 'd')
+        self.mesh_uvs           = MeshBuffer.of(3, mesh_uvs or [], 'd')
+        self.mesh_faces         = MeshBuffer.of(3, mesh_faces or [], 'I')
+        self.mesh_day_colours   = MeshBuffer.of(4, mesh_day_colours or [], 'd')
+        self.mesh_night_colours = MeshBuffer.of(4, mesh_night_colours or [], 'd')
+        self.mesh_extras        = MeshBuffer.of(3, mesh_extras or [], 'd')
+
+    # Each attribute (MeshBuffer) is walked once, a row at a time, rather than indexing it per component,
+    # and each block of lines is joined and written at once
     def write_mesh_to_obj(self, fout, start_index=0, material=None, with_colours=False):
         # Write vertices
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-            if with_colours:
-                # Some programs support additional data, e.g colors after x/y/z
-                # the following section can be used to export with colors (blender supports first set)
-                dr = '{:.20f}'.format(self.mesh_day_colours[i][0] / 255.0)
-                dg = '{:.20f}'.format(self.mesh_day_colours[i][1] / 255.0)
-                db = '{:.20f}'.format(self.mesh_day_colours[i][2] / 255.0)
-                nr = '{:.20f}'.format(self.mesh_night_colours[i][0] / 255.0)
-                ng = '{:.20f}'.format(self.mesh_night_colours[i][1] / 255.0)
-                nb = '{:.20f}'.format(self.mesh_night_colours[i][2] / 255.0)
-                fout.write(f"v {vx} {vy} {vz} {dr} {dg} {db} {nr} {ng} {nb}\n")
-            else:
-                fout.write(f"v {vx} {vy} {vz}\n")
+        if with_colours:
+            # Some programs support additional data, e.g colors after x/y/z
+            # the following section can be used to export with colors (blender supports first set)
+            fout.write("".join(f"v {vx:.20f} {vy:.20f} {vz:.20f} {dr / 255.0:.20f} {dg / 255.0:.20f} {db / 255.0:.20f} "
+                               f"{nr / 255.0:.20f} {ng / 255.0:.20f} {nb / 255.0:.20f}\n"
+                               for (vx, vy, vz), (dr, dg, db, da), (nr, ng, nb, na)
+                               in zip(self.mesh_verts, self.mesh_day_colours, self.mesh_night_colours)))
+        else:
+            fout.write("".join(f"v {vx:.20f} {vy:.20f} {vz:.20f}\n" for vx, vy, vz in self.mesh_verts))
         fout.write("#" + str(len(self.mesh_verts)) + " vertices\n")
             
         # Course meshes have no normals, but swapped with other data
         # Write normals
-        # for i in range(0, len(self.mesh_normals)):
-        #     nx = '{:.20f}'.format(self.mesh_normals[i][0])
-        #     ny = '{:.20f}'.format(self.mesh_normals[i][1])
-        #     nz = '{:.20f}'.format(self.mesh_normals[i][2])
-        #     fout.write("vn " + nx + " " + ny + " " + nz + "\n")
+        # fout.write("".join(f"vn {nx:.20f} {ny:.20f} {nz:.20f}\n" for nx, ny, nz in self.mesh_normals))
         # fout.write("#" + str(len(self.mesh_normals)) + " vertex normals\n")
-        for i in range(0, len(self.mesh_normals)):
-            fout.write("vn 0 0 0\n")
+        fout.write("vn 0 0 0\n" * len(self.mesh_normals))
         fout.write("#" + str(len(self.mesh_normals)) + " vertex normals\n")
         # Write texture coordinates (uv)
-        for i in range(0, len(self.mesh_uvs)):
-            tu = '{:.20f}'.format(self.mesh_uvs[i][0])
-            tv = '{:.20f}'.format(self.mesh_uvs[i][1])
-            fout.write("vt " + tu + " " + tv + "\n")
+        fout.write("".join(f"vt {tu:.20f} {tv:.20f}\n" for tu, tv, tw in self.mesh_uvs))
         fout.write("#" + str(len(self.mesh_uvs)) + " texture vertices\n")
         
         fout.write(f"usemtl {material}\n")
         fout.write("s off\n")
 
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] + start_index
-            fy = self.mesh_faces[i][1] + start_index
-            fz = self.mesh_faces[i][2] + start_index
-            
-            fout.write(f"f {fx}/{fx}/{fx} {fy}/{fy}/{fy} {fz}/{fz}/{fz}\n")
+        fout.write("".join(f"f {fx}/{fx}/{fx} {fy}/{fy}/{fy} {fz}/{fz}/{fz}\n"
+                           for fx, fy, fz in self.mesh_faces.offset(start_index)))
         fout.write("#" + str(len(self.mesh_faces)) + " faces\n")
 
         return len(self.mesh_verts)
@@ -779,51 +799,39 @@ class CourseMesh(AMesh):
         fout.write(f"face_count {len(self.mesh_faces)}\n")
         fout.write(f"texture {material}\n")
         fout.write("end_header\n")
-        # Write vertices, colours, normals
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-
-            dr = '{:d}'.format(math.trunc(self.mesh_day_colours[i][0]))
-            dg = '{:d}'.format(math.trunc(self.mesh_day_colours[i][1]))
-            db = '{:d}'.format(math.trunc(self.mesh_day_colours[i][2]))
-            da = '{:d}'.format(math.trunc(self.mesh_day_colours[i][3]))
-
-            nr = '{:d}'.format(math.trunc(self.mesh_day_colours[i][0]))
-            ng = '{:d}'.format(math.trunc(self.mesh_day_colours[i][1]))
-            nb = '{:d}'.format(math.trunc(self.mesh_day_colours[i][2]))
-            na = '{:d}'.format(math.trunc(self.mesh_day_colours[i][3]))
 
-            if len(self.mesh_extras) != 0:
-                ex = '{:.20f}'.format(self.mesh_extras[i][0])
-                ey = '{:.20f}'.format(self.mesh_extras[i][1])
-                ez = '{:.20f}'.format(self.mesh_extras[i][2])
-            else:
-                ex, ey, ez = 0, 0, 0
-
-            if len(self.mesh_normals) != 0:
-                nx = '{:.20f}'.format(self.mesh_normals[i][0])
-                ny = '{:.20f}'.format(self.mesh_normals[i][1])
-                nz = '{:.20f}'.format(self.mesh_normals[i][2])
-            else:
-                nx, ny, nz = 0, 0, 0
-
-            tu = '{:.10f}'.format(self.mesh_uvs[i][0])
-            tv = '{:.10f}'.format(self.mesh_uvs[i][1])
+        # Extras and normals are written as 0s if there are none
+        if len(self.mesh_extras) != 0:
+            extras = (f"{ex:.20f} {ey:.20f} {ez:.20f}" for ex, ey, ez in self.mesh_extras)
+        else:
+            extras = repeat("0 0 0")
+        if len(self.mesh_normals) != 0:
+            normals = (f"{nx:.20f} {ny:.20f} {nz:.20f}" for nx, ny, nz in self.mesh_normals)
+        else:
+            normals = repeat("0 0 0")
 
-            fout.write(f"{vx} {vy} {vz} {ex} {ey} {ez} {nx} {ny} {nz} {dr} {dg} {db} {da} {nr} {ng} {nb} {na} {tu} {tv}\n")
+        # Write vertices, colours, normals
+        # The night colours are written from the day colours
+        fout.write("".join(f"{vx:.20f} {vy:.20f} {vz:.20f} {extra} {normal} {day} {day} {tu:.10f} {tv:.10f}\n"
+                           for (vx, vy, vz), extra, normal, day, (tu, tv, tw)
+                           in zip(self.mesh_verts, extras, normals, self._truncated_day_colours(), self.mesh_uvs)))
         
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] - 1 + start_index
-            fz = self.mesh_faces[i][2] - 1 + start_index
-            fy = self.mesh_faces[i][1] - 1 + start_index
-            
-            fout.write(f"4 {fx} {fy} {fz}\n")
+        fout.write("".join(f"4 {fx} {fy} {fz}\n" for fx, fy, fz in self.mesh_faces.offset(start_index - 1)))
         
         return len(self.mesh_verts)
 
+    # The day colours as whole numbers, "r g b a" for each vertex
+    def _truncated_day_colours(self):
+        return (f"{math.trunc(cr):d} {math.trunc(cg):d} {math.trunc(cb):d} {math.trunc(ca):d}"
+                for cr, cg, cb, ca in self.mesh_day_colours)
+
+    # Binary version of the comb format, see comb_binary.py
+    def write_mesh_to_comb_binary(self, fout, texture_index=0):
+        write_comb_binary_mesh(fout, texture_index, self.mesh_verts, self.mesh_normals, self.mesh_uvs,
+                               self.mesh_day_colours, self.mesh_night_colours, self.mesh_faces)
+        return len(self.mesh_verts)
+
     def write_mesh_to_ply(self, fout, start_index=0):
         # Write header
         if start_index == 0:
@@ -847,11 +855,7 @@ class CourseMesh(AMesh):
 
             # Write out the "extra" data sets
             fout.write("comment extra data:\n")
-            for i in range(0, len(self.mesh_verts)):
-                fx = '{:.20f}'.format(self.mesh_verts[i][0])
-                fy = '{:.20f}'.format(self.mesh_verts[i][1])
-                fz = '{:.20f}'.format(self.mesh_verts[i][2])
-                fout.write(f"comment {fx} {fy} {fz}\n")
+            fout.write("".join(f"comment {fx:.20f} {fy:.20f} {fz:.20f}\n" for fx, fy, fz in self.mesh_verts))
             fout.write("comment extra end\n")
 
             #fout.write(f"element texture {len(self.mesh_uvs)}\n")
@@ -859,66 +863,26 @@ class CourseMesh(AMesh):
             fout.write("end_header\n")
 
         # Write vertices, colours, normals
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-
-            cr = '{:d}'.format(math.trunc(self.mesh_day_colours[i][0]))
-            cg = '{:d}'.format(math.trunc(self.mesh_day_colours[i][1]))
-            cb = '{:d}'.format(math.trunc(self.mesh_day_colours[i][2]))
-            ca = '{:d}'.format(math.trunc(self.mesh_day_colours[i][3]))
-
-            # Normals are not here, this is different data
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-
-            tu = '{:.10f}'.format(self.mesh_uvs[i][0])
-            tv = '{:.10f}'.format(self.mesh_uvs[i][1])
-
-            fout.write(f"{vx} {vy} {vz} {nx} {ny} {nz} {cr} {cg} {cb} {ca} {tu} {tv}\n")
+        # Normals are not here, this is different data
+        fout.write("".join(f"{vx:.20f} {vy:.20f} {vz:.20f} {nx:.20f} {ny:.20f} {nz:.20f} {colour} {tu:.10f} {tv:.10f}\n"
+                           for (vx, vy, vz), (nx, ny, nz), colour, (tu, tv, tw)
+                           in zip(self.mesh_verts, self.mesh_normals, self._truncated_day_colours(), self.mesh_uvs)))
         
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] - 1 + start_index
-            fz = self.mesh_faces[i][2] - 1 + start_index
-            fy = self.mesh_faces[i][1] - 1 + start_index
-            
-            fout.write(f"4 {fx} {fy} {fz}\n")
+        fout.write("".join(f"4 {fx} {fy} {fz}\n" for fx, fy, fz in self.mesh_faces.offset(start_index - 1)))
         
         return len(self.mesh_verts)
         
     def write_mesh_to_dbg(self, fout, start_index=0, material=None):
-        for i in range(0, len(self.mesh_verts)):
-            
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-            fout.write("v " + vx + " " + vy + " " + vz + "\n")
-            # Normals are not here, this is different data
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-            cr = '{:.20f}'.format(self.mesh_day_colours[i][0])
-            cg = '{:.20f}'.format(self.mesh_day_colours[i][1])
-            cb = '{:.20f}'.format(self.mesh_day_colours[i][2])
-            ca = '{:.20f}'.format(self.mesh_day_colours[i][3])
-            ex = self.mesh_extras[i][0]
-            ey = self.mesh_extras[i][1]
-            ez = self.mesh_extras[i][2]
-            fout.write(f"# {ex} {ey} {ez} {nx} {ny} {nz} {cr} {cg} {cb}\n")
-
-            tu = '{:.20f}'.format(self.mesh_uvs[i][0])
-            tv = '{:.20f}'.format(self.mesh_uvs[i][1])
-            tw = '{:.20f}'.format(self.mesh_uvs[i][2])
-            fout.write(f"vt {tu} {tv} {tw}\n")
-
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] + start_index
-            fy = self.mesh_faces[i][1] + start_index
-            fz = self.mesh_faces[i][2] + start_index
-            fout.write(f"f {fx} {fy} {fz}\n")
+        # Normals are not here, this is different data
+        fout.write("".join(f"v {vx:.20f} {vy:.20f} {vz:.20f}\n"
+                           f"# {ex} {ey} {ez} {nx:.20f} {ny:.20f} {nz:.20f} {cr:.20f} {cg:.20f} {cb:.20f}\n"
+                           f"vt {tu:.20f} {tv:.20f} {tw:.20f}\n"
+                           for (vx, vy, vz), (nx, ny, nz), (cr, cg, cb, ca), (ex, ey, ez), (tu, tv, tw)
+                           in zip(self.mesh_verts, self.mesh_normals, self.mesh_day_colours, self.mesh_extras,
+                                  self.mesh_uvs)))
+
+        fout.write("".join(f"f {fx} {fy} {fz}\n" for fx, fy, fz in self.mesh_faces.offset(start_index)))
 
         fout.write("#" + str(len(self.mesh_verts)) + " vertices\n")
         fout.write("#" + str(len(self.mesh_normals)) + " vertex normals\n")
@@ -934,20 +898,15 @@ class CourseMesh(AMesh):
 # If the first offset is 1536 it will print "Old style PMP format" (untested)
 # If the first offset is 1544 it will load, otherwise an error "PMP Format Error!"
 class CourseCollider(AMesh):
+    __slots__ = ("mesh_vert_count", "mesh_verts", "mesh_normals", "mesh_faces", "properties", "__weakref__")
 
     def __init__(self, mesh_vert_count=None, mesh_verts=None, mesh_normals=None, mesh_faces=None, collider_properties=None):
         if mesh_vert_count is None:
             mesh_vert_count = []
-        if mesh_verts is None:
-            mesh_verts = []
-        if mesh_normals is None:
-            mesh_normals = []
-        if mesh_faces is None:
-            mesh_faces = []
         self.mesh_vert_count = mesh_vert_count
-        self.mesh_verts      = mesh_verts
-        self.mesh_normals    = mesh_normals
-        self.mesh_faces      = mesh_faces
+        self.mesh_verts      = MeshBuffer.of(3, mesh_verts or [], 'd')
+        self.mesh_normals    = MeshBuffer.of(3, mesh_normals or [], 'd')
+        self.mesh_faces      = MeshBuffer.of(3, mesh_faces or [], 'I')
         self.properties      = collider_properties
 
     @staticmethod
@@ -1136,34 +1095,22 @@ class CourseCollider(AMesh):
         faces = CourseCollider.create_face_list(vert_count, 3)
         return verts, normals, faces
 
+    # Written a block at a time, as for CourseMesh
     def write_mesh_to_obj(self, fout, start_index=0, material=None, with_colours=False):
         # Write vertices
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-            fout.write("v " + vx + " " + vy + " " + vz + "\n")
+        fout.write("".join(f"v {vx:.20f} {vy:.20f} {vz:.20f}\n" for vx, vy, vz in self.mesh_verts))
         fout.write("#" + str(len(self.mesh_verts)) + " vertices\n")
             
         # Write normals
-        for i in range(0, len(self.mesh_normals)):
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-            fout.write("vn " + nx + " " + ny + " " + nz + "\n")
+        fout.write("".join(f"vn {nx:.20f} {ny:.20f} {nz:.20f}\n" for nx, ny, nz in self.mesh_normals))
         fout.write("#" + str(len(self.mesh_normals)) + " vertex normals\n")
         
         # Write empty uvs
-        for i in range(0, len(self.mesh_verts)):
-            fout.write("vt 0 0\n")
+        fout.write("vt 0 0\n" * len(self.mesh_verts))
 
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] + start_index
-            fy = self.mesh_faces[i][1] + start_index
-            fz = self.mesh_faces[i][2] + start_index
-            
-            fout.write(f"f {fx}/{fx}/{fx} {fy}/{fy}/{fy} {fz}/{fz}/{fz}\n")
+        fout.write("".join(f"f {fx}/{fx}/{fx} {fy}/{fy}/{fy} {fz}/{fz}/{fz}\n"
+                           for fx, fy, fz in self.mesh_faces.offset(start_index)))
         fout.write("#" + str(len(self.mesh_faces)) + " faces\n")
 
         fout.write(f"usemtl {material}\n")
@@ -1185,24 +1132,10 @@ class CourseCollider(AMesh):
                 self.mesh_normals.append((0.0, 0.0, 0.0))
 
         # Write vertices, normals
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-
-            fout.write(f"{vx} {vy} {vz} {nx} {ny} {nz}\n")
+        self._write_vertex_normal_rows(fout)
         
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] - 1 + start_index
-            fy = self.mesh_faces[i][1] - 1 + start_index
-            fz = self.mesh_faces[i][2] - 1 + start_index
-            
-            fout.write(f"4 {fx} {fy} {fz}\n")
+        self._write_face_rows(fout, start_index)
 
         return len(self.mesh_verts)
 
@@ -1221,12 +1154,7 @@ class CourseCollider(AMesh):
             fout.write("property list uint8 int vertex_index\n")
             fout.write("end_header\n")
 
-            for i in range(0, len(self.mesh_verts)):
-                vx = '{:.20f}'.format(self.mesh_verts[i][0])
-                vy = '{:.20f}'.format(self.mesh_verts[i][1])
-                vz = '{:.20f}'.format(self.mesh_verts[i][2])
-
-                fout.write(f"{vx} {vy} {vz}\n")
+            fout.write("".join(f"{vx:.20f} {vy:.20f} {vz:.20f}\n" for vx, vy, vz in self.mesh_verts))
         else:
             # Write header
             fout.write("ply\n")
@@ -1243,53 +1171,32 @@ class CourseCollider(AMesh):
             fout.write("end_header\n")
 
             # Write vertices, normals
-            for i in range(0, len(self.mesh_verts)):
-                vx = '{:.20f}'.format(self.mesh_verts[i][0])
-                vy = '{:.20f}'.format(self.mesh_verts[i][1])
-                vz = '{:.20f}'.format(self.mesh_verts[i][2])
-
-                nx = '{:.20f}'.format(self.mesh_normals[i][0])
-                ny = '{:.20f}'.format(self.mesh_normals[i][1])
-                nz = '{:.20f}'.format(self.mesh_normals[i][2])
-
-                fout.write(f"{vx} {vy} {vz} {nx} {ny} {nz}\n")
+            self._write_vertex_normal_rows(fout)
 
         # print(f"v {len(self.mesh_verts)}")
         # print(f"n {len(self.mesh_normals)}")
         
         # Write mesh face order/list
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] - 1 + start_index
-            fy = self.mesh_faces[i][1] - 1 + start_index
-            fz = self.mesh_faces[i][2] - 1 + start_index
-            
-            fout.write(f"4 {fx} {fy} {fz}\n")
+        self._write_face_rows(fout, start_index)
 
         return len(self.mesh_verts)
+
+    # "x y z nx ny nz" for each vertex, used by comb and ply
+    def _write_vertex_normal_rows(self, fout):
+        fout.write("".join(f"{vx:.20f} {vy:.20f} {vz:.20f} {nx:.20f} {ny:.20f} {nz:.20f}\n"
+                           for (vx, vy, vz), (nx, ny, nz) in zip(self.mesh_verts, self.mesh_normals)))
+
+    # "4 a b c" for each face, with indices from 0, used by comb and ply
+    def _write_face_rows(self, fout, start_index):
+        fout.write("".join(f"4 {fx} {fy} {fz}\n" for fx, fy, fz in self.mesh_faces.offset(start_index - 1)))
         
     def write_mesh_to_dbg(self, fout, start_index=0, material=None):
-        for i in range(0, len(self.mesh_verts)):
-            vx = '{:.20f}'.format(self.mesh_verts[i][0])
-            vy = '{:.20f}'.format(self.mesh_verts[i][1])
-            vz = '{:.20f}'.format(self.mesh_verts[i][2])
-            fout.write("v " + vx + " " + vy + " " + vz + "\n")
+        fout.write("".join(f"v {vx:.20f} {vy:.20f} {vz:.20f}\n" for vx, vy, vz in self.mesh_verts))
 
-        for i in range(0, len(self.mesh_normals)):
-            nx = '{:.20f}'.format(self.mesh_normals[i][0])
-            ny = '{:.20f}'.format(self.mesh_normals[i][1])
-            nz = '{:.20f}'.format(self.mesh_normals[i][2])
-            fout.write("vn " + nx + " " + ny + " " + nz + "\n")
-            
-            # ex = self.mesh_extras[i][0]
-            # ey = self.mesh_extras[i][1]
-            # ez = self.mesh_extras[i][2]
-            # fout.write(f"e {ex} {ey} {ez}\n")
-
-        for i in range(0, len(self.mesh_faces)):
-            fx = self.mesh_faces[i][0] + start_index
-            fy = self.mesh_faces[i][1] + start_index
-            fz = self.mesh_faces[i][2] + start_index
-            fout.write(f"f {fx} {fy} {fz}\n")
+        fout.write("".join(f"vn {nx:.20f} {ny:.20f} {nz:.20f}\n" for nx, ny, nz in self.mesh_normals))
+        # fout.write("".join(f"e {ex} {ey} {ez}\n" for ex, ey, ez in self.mesh_extras))
+
+        fout.write("".join(f"f {fx} {fy} {fz}\n" for fx, fy, fz in self.mesh_faces.offset(start_index)))
 
         fout.write("#" + str(len(self.mesh_verts)) + " vertices\n")
         fout.write("#" + str(len(self.mesh_normals)) + " texture vertices\n")
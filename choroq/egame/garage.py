@@ -10,57 +10,144 @@
 # - - The textures may hold info after the last DMAtag, the one that causes the list to end?
 # - - As sometimes it is followed by a palette, after a long set of the same number?
 # - - This could be the method used to replace the flooring with a new palette/style?
+#
+# Entries after the first start at a sector, unless one directly follows the last. Rather than seeking through
+# the file to find them, the first long of every sector is checked at once (with numpy over the memory-mapped
+# file), then the offset tables of those that could be an entry are read, giving an index of (offset, length) for
+# each entry. The index is built once per GarageModel, entries are only read when first used (GarageModel is a
+# sequence of GarageEntry), or all at once by load_entries, which can spread them over processes.
 
 
+import io
 import os
-import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 from choroq.egame.texture import Texture
 from choroq.egame.car import CarMesh
+from choroq.egame.texture_index import init_worker
+from choroq.game_source import map_file
 import choroq.read_utils as U
 
+SECTOR_SIZE = 2048
+# The first offset in an entry's table (of its model) is always less than this
+MAX_FIRST_OFFSET = 32
+MAX_OFFSETS = 32
+# Fewer entries than this are read in this process, as starting the workers would take longer
+PARALLEL_MIN_ENTRIES = 4
+
 
 class GarageModel:
-    def __init__(self, entries):
-        self.entries = entries
+    def __init__(self, file, index):
+        self.file = file
+        self.index = index  # [(offset, length)] of each entry
+        self.loaded = {}  # entry number -> GarageEntry, for those read so far
 
+    # The file must be kept open while entries are read from the model
     @staticmethod
     def from_file(file, offset):
-        entries = []
-        position = offset
-        file.seek(0, os.SEEK_END)
-        end = file.tell()
-        file.seek(offset, os.SEEK_SET)
+        index = GarageModel.build_index(map_file(file), offset)
+        print(f"Found {len(index)} garage entries {index}")
+        return GarageModel(file, index)
 
-        while position < end:
-            entry, end_position = GarageEntry.from_file(file, position)
-            print(f"Read garage entry up to {end_position + position}")
-            GarageModel.read_until_next(file, end, end_position + position)
-            position = file.tell()
-            entries.append(entry)
-            # break
+    # Returns [(offset, length)] of the entries from offset
+    @staticmethod
+    def build_index(buffer, offset=0):
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        # The first long of every sector, those that may start an entry
+        firsts = np.frombuffer(buffer, dtype="<u4", count=len(data) // 4)[::SECTOR_SIZE // 4]
+        candidates = np.flatnonzero((firsts > 0) & (firsts < MAX_FIRST_OFFSET)) * SECTOR_SIZE
 
-        return GarageModel(entries)
+        index = []
+        position = offset
+        while position < len(data):
+            position, length = GarageModel.find_next(data, candidates, position)
+            if position is None:
+                break
+            index.append((position, length))
+            position += length
+        return index
 
+    # Returns (offset, length) of the entry at position, or if there isn't one, the next entry at the start of a sector
+    # (None, None) if there are no more
+    @staticmethod
+    def find_next(data, candidates, position):
+        length = GarageModel.get_entry_length(data, position)
+        if length is not None:
+            return position, length
+        if position + SECTOR_SIZE >= len(data):
+            return None, None
+        for candidate in candidates[np.searchsorted(candidates, position, side="right"):]:
+            length = GarageModel.get_entry_length(data, int(candidate))
+            if length is not None:
+                return int(candidate), length
+        return None, None
+
+    # Returns the length of the entry at position, from the last offset of its offset table (see
+    # GarageEntry.from_file), or None if there is not a valid table there
     @staticmethod
-    def read_until_next(file, end, last_position):
-        file.seek(last_position, os.SEEK_SET)
-        current = file.tell()
-        if current + 2048 >= end:
+    def get_entry_length(data, position):
+        if position + 8 > len(data):
+            return None
+        offsets = [read_long(data, position)]
+        if not 0 < offsets[0] < MAX_FIRST_OFFSET:
+            return None
+        table_position = position + 4
+        while len(offsets) < MAX_OFFSETS and table_position + 4 <= len(data):
+            o = read_long(data, table_position)
+            table_position += 4
+            if o == 0 or o < offsets[-1]:
+                break
+            offsets.append(o)
+        if len(offsets) < 2 or position + offsets[-1] > len(data):
+            return None
+        return offsets[-1]
+
+    def __len__(self):
+        return len(self.index)
+
+    # Reads the entry the first time it is used
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        offset, length = self.index[i]
+        i = i % len(self)
+        if i not in self.loaded:
+            self.loaded[i], end = GarageEntry.from_file(self.file, offset)
+        return self.loaded[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def entries(self):
+        return list(self)
+
+    # Reads every entry not yet read, using up to workers processes (all cpus if None, 1 reads them in this process)
+    def load_entries(self, workers=1):
+        missing = [i for i in range(len(self)) if i not in self.loaded]
+        if workers is not None and workers <= 1 or len(missing) < PARALLEL_MIN_ENTRIES:
+            for i in missing:
+                self[i]
             return
-        # Check if we are already at the correct location
-        test_valid = False
-        next_try = current
 
-        # Seek to next sector aligned area
-        while not test_valid and file.tell() != end:
-            file.seek(next_try, os.SEEK_SET)
-            test = U.readLong(file)
-            file.seek(-4, os.SEEK_CUR)
-            test_valid = 0 < test < 32
-            next_try = (math.floor(current / 2048) + 1) * 2048
-            current = file.tell()
-        print(f"Skipped until {file.tell()}")
+        buffer = map_file(self.file)
+        chunks = [bytes(buffer[offset:offset + length]) for offset, length in [self.index[i] for i in missing]]
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            for i, entry in zip(missing, pool.map(read_entry, chunks)):
+                self.loaded[i] = entry
+
+
+def read_long(data, position):
+    return int.from_bytes(data[position:position + 4].tobytes(), "little")
+
+
+# Reads an entry from just its bytes, for the worker processes
+def read_entry(entry_bytes):
+    entry, end = GarageEntry.from_file(io.BytesIO(entry_bytes), 0)
+    return entry
 
 
 class GarageEntry:
@@ -106,8 +193,3 @@ class GarageEntry:
         file.seek(offsets[-1] + offset - 6)  # -6 to ensure other code works for finding next, no matter where we end reading
 
         return GarageEntry(meshes, textures), offsets[-1]
-
-
-
-
-
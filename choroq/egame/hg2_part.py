@@ -0,0 +1,215 @@
+
+# Reads and writes HG2 car parts (partial .BIN, as made by blender-py/blender_hg2.py), and shrinks them to fit a size
+#
+# Replacement parts are written in place over the original, so they have to fit in the original's space.
+# fit_part_to_size simplifies the part's meshes (see mesh_decimate.py) and rebuilds its strips
+# (see tristrip.py), until the packed part fits.
+#
+# Part layout:
+#   long offset of object 1, long offset of object 2, long strip count of object 1, long strip count of object 2
+#   Then for each of the 3 objects (0 = Body, 1 = Lights, 2 = Brake lights):
+#     DMA tag (2 byte qwc, 0x00, 0x10), zero word, VIF STCYCL tag
+#     For each strip:
+#       VIF tag, copying the GIF tag
+#       GIF tag (vertex count in the first byte), 16 bytes
+#       VIF expand tag (vertex count * 4 in the third byte)
+#       vertices, 48 bytes each (x/z/y, normal, r/g/b, u/v, smoothness floats)
+#       VIF exec tag, to run the VU1 program
+#     Padding to 16 bytes, then the end DMA tag
+
+import math
+import struct
+
+from choroq.mesh_decimate import decimate
+from choroq.tristrip import build_strips, MAX_STRIP_LENGTH
+
+PART_HEADER_SIZE = 16
+OBJECT_HEADER_SIZE = 12
+STRIP_TAGS_SIZE = 24
+EXEC_TAG_SIZE = 4
+END_DMA_TAG_SIZE = 16
+VERTEX_SIZE = 48
+
+VIF_COPY_GIF_TAG = bytes([0x00, 0x80, 0x01, 0x6C])
+VIF_EXPAND_COMMAND = 0x68
+OBJECT_HEADER = bytes([0x00, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x01, 0x01, 0x00, 0x01])
+END_DMA_TAG = bytes([0x00, 0x00, 0x00, 0x60]) + bytes(12)
+
+VERTEX = struct.Struct("<12f")
+
+
+class HG2PartStrip:
+
+    def __init__(self, gif_tag, exec_tag, vertices):
+        self.gif_tag = gif_tag  # 16 bytes, as read (vertex count is set when writing)
+        self.exec_tag = exec_tag
+        self.vertices = vertices  # 48 byte records
+
+    # Strips with the same key can be merged/rebuilt together
+    def get_key(self):
+        return self.gif_tag[1:], self.exec_tag
+
+    def write(self, out):
+        vert_count = len(self.vertices)
+        out += VIF_COPY_GIF_TAG
+        out += bytes([vert_count])
+        out += self.gif_tag[1:]
+        out += bytes([0x01, 0x80, vert_count * 4, VIF_EXPAND_COMMAND])
+        for vertex in self.vertices:
+            out += vertex
+        out += self.exec_tag
+
+
+class HG2Part:
+
+    def __init__(self, objects):
+        self.objects = objects  # [[HG2PartStrip]] per object
+
+    @staticmethod
+    def read(data):
+        if len(data) < PART_HEADER_SIZE:
+            raise ValueError("Part is too small")
+        offset1, offset2, count1, count2 = struct.unpack_from("<IIII", data, 0)
+        positions = [PART_HEADER_SIZE, offset1, offset2, len(data)]
+        if not (positions[0] <= positions[1] <= positions[2] <= positions[3]):
+            raise ValueError(f"Part offsets are not valid {positions}")
+
+        objects = []
+        for obj_index in range(3):
+            start = positions[obj_index]
+            end = positions[obj_index + 1]
+            strips = []
+            position = start + OBJECT_HEADER_SIZE
+            while position + STRIP_TAGS_SIZE <= end and data[position:position + 4] == VIF_COPY_GIF_TAG:
+                gif_tag = data[position + 4:position + 20]
+                expand_tag = data[position + 20:position + 24]
+                vert_count = gif_tag[0]
+                if expand_tag[3] != VIF_EXPAND_COMMAND or expand_tag[2] != (vert_count * 4) & 0xFF:
+                    raise ValueError(f"Unsupported strip in object {obj_index} at {position}")
+                position += STRIP_TAGS_SIZE
+                vertices = [data[p:p + VERTEX_SIZE] for p in range(position, position + vert_count * VERTEX_SIZE, VERTEX_SIZE)]
+                position += vert_count * VERTEX_SIZE
+                exec_tag = data[position:position + EXEC_TAG_SIZE]
+                position += EXEC_TAG_SIZE
+                if position > end:
+                    raise ValueError(f"Strip runs past the end of object {obj_index}")
+                strips.append(HG2PartStrip(bytes(gif_tag), bytes(exec_tag), vertices))
+            objects.append(strips)
+
+        if len(objects[1]) != count1 or len(objects[2]) != count2:
+            print(f"Part strip counts do not match the header {count1}/{count2} read {len(objects[1])}/{len(objects[2])}")
+        return HG2Part(objects)
+
+    @staticmethod
+    def get_object_size(strips):
+        size = OBJECT_HEADER_SIZE
+        for strip in strips:
+            size += STRIP_TAGS_SIZE + len(strip.vertices) * VERTEX_SIZE + EXEC_TAG_SIZE
+        # Padded so the end DMA tag is 16 byte aligned
+        size += -size % 16
+        return size + END_DMA_TAG_SIZE
+
+    def get_size(self):
+        return PART_HEADER_SIZE + sum(HG2Part.get_object_size(strips) for strips in self.objects)
+
+    def get_triangle_count(self):
+        return sum(len(strip.vertices) - 2 for strips in self.objects for strip in strips)
+
+    def to_bytes(self):
+        sizes = [HG2Part.get_object_size(strips) for strips in self.objects]
+        out = bytearray()
+        out += struct.pack("<IIII", PART_HEADER_SIZE + sizes[0], PART_HEADER_SIZE + sizes[0] + sizes[1],
+                           len(self.objects[1]), len(self.objects[2]))
+        for strips, size in zip(self.objects, sizes):
+            start = len(out)
+            # Take out length of the dma tag at the start, and end
+            out += ((size - 32) // 16).to_bytes(2, "little")
+            out += OBJECT_HEADER[2:]
+            for strip in strips:
+                strip.write(out)
+            out += bytes(start + size - END_DMA_TAG_SIZE - len(out))
+            out += END_DMA_TAG
+        return bytes(out)
+
+    # Returns (HG2Part, error) with about ratio of the triangles in each group of strips
+    def decimated(self, ratio):
+        objects = []
+        max_error = 0.0
+        for strips in self.objects:
+            groups = {}
+            for strip in strips:
+                groups.setdefault(strip.get_key(), []).append(strip)
+
+            new_strips = []
+            for group in groups.values():
+                new_group, error = HG2Part._decimate_group(group, ratio)
+                new_strips += new_group
+                max_error = max(max_error, error)
+            objects.append(new_strips)
+        return HG2Part(objects), max_error
+
+    @staticmethod
+    def _decimate_group(strips, ratio):
+        # Join up the strips' vertices, so they can be treated as one mesh
+        vertex_indices = {}
+        vertices = []
+        triangles = []
+        for strip in strips:
+            indices = []
+            for vertex in strip.vertices:
+                if vertex not in vertex_indices:
+                    vertex_indices[vertex] = len(vertices)
+                    vertices.append(vertex)
+                indices.append(vertex_indices[vertex])
+            for i in range(len(indices) - 2):
+                if i % 2 == 0:
+                    triangles.append((indices[i], indices[i + 1], indices[i + 2]))
+                else:
+                    triangles.append((indices[i + 1], indices[i], indices[i + 2]))
+
+        values = [VERTEX.unpack(vertex) for vertex in vertices]
+        positions = [v[0:3] for v in values]
+        # u, v and the colour (0-256) scaled to be similar
+        attributes = [(v[9], v[10], v[6] / 256.0, v[7] / 256.0, v[8] / 256.0) for v in values]
+
+        target = max(1, int(math.ceil(len(triangles) * ratio)))
+        triangles, error = decimate(positions, attributes, triangles, target)
+
+        gif_tag = strips[0].gif_tag
+        exec_tag = strips[0].exec_tag
+        new_strips = []
+        for strip in build_strips(triangles, MAX_STRIP_LENGTH):
+            new_strips.append(HG2PartStrip(gif_tag, exec_tag, [vertices[i] for i in strip]))
+        return new_strips, error
+
+
+# Simplifies the part until it fits in max_size bytes
+# returns (part bytes, size, error), the size will be over max_size if it could not be made to fit
+def fit_part_to_size(data, max_size, max_passes=16):
+    part = HG2Part.read(data)
+    size = part.get_size()
+    if len(data) <= max_size:
+        return data, len(data), 0.0
+    print(f"Fitting part of {size} bytes ({part.get_triangle_count()} triangles) into {max_size} bytes")
+
+    ratio = 1.0
+    best = (part, size, 0.0)
+    previous_triangles = part.get_triangle_count()
+    for i in range(max_passes):
+        # Aim a little under, as the strips will not shrink quite as much as the triangles
+        ratio *= min(0.95, max(0.5, max_size / size * 0.95))
+        fitted, error = part.decimated(ratio)
+        size = fitted.get_size()
+        triangles = fitted.get_triangle_count()
+        print(f"Pass {i}: {ratio:.3f} of the triangles, {triangles} triangles {size} bytes, error {error:.4f}")
+        if size < best[1]:
+            best = (fitted, size, error)
+        if size <= max_size:
+            break
+        if triangles >= previous_triangles:
+            # Nothing else can be removed (seams/borders)
+            break
+        previous_triangles = triangles
+
+    fitted, size, error = best
+    return fitted.to_bytes(), size, error
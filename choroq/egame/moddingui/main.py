@@ -1,7 +1,6 @@
 import os
 import functools
 
-import re
 import pycdlib
 import customtkinter
 from tkinter import filedialog, messagebox, Menu
@@ -21,6 +20,8 @@ from choroq.egame.moddingui.entries.hg3_car_entry import HG3CarEntry
 from choroq.egame.moddingui.entries.hg3_course_entry import HG3CourseEntry
 from choroq.egame.moddingui.modules.hg2_option_handler import HG2CarOptionHandler
 from choroq.egame.moddingui.modules.hg3_option_handler import HG3CarOptionHandler
+from choroq.iso_index import IsoIndex
+from choroq.iso_patch import IsoPatchSession
 from egame_converter import EGameConverter
 
 import choroq.read_utils as U
@@ -186,6 +187,13 @@ class ModdingUi(customtkinter.CTk):
             return
 
     def check_and_load_iso(self) -> bool:
+        # Put back the original data, if a replacement was stopped part way through writing
+        try:
+            IsoPatchSession.recover(self.iso_path)
+        except Exception as e:
+            print("failed to recover iso from its patch journal")
+            print(e)
+
         # Open iso using cdlib, and check what the disk is
         self.iso = pycdlib.PyCdlib()
         try:
@@ -268,55 +276,42 @@ class ModdingUi(customtkinter.CTk):
         # creating the required GameEntry instances for each file,
         # and structure as needed
 
+        matches = None
         if self.game_version == GameVersion.CHOROQ_HG_2:
             matches = [
-                (re.compile("/CAR[0-4,S]/Q[0-9]([0-9]+).BIN"), HG2CarEntry),
-                (re.compile("/CARS/TIRE.BIN"), HG2ObjectEntry),
-                (re.compile("/CARS/WHEEL.BIN"), HG2ObjectEntry),
-                (re.compile("/CARS/PARTS.BIN"), HG2ObjectEntry),
-                (re.compile("/COURSE/C[0-9][0-9].BIN"), HG2CourseEntry),
-                (re.compile("/ACTION/A[0-9][0-9].BIN"), HG2CourseEntry),
-                (re.compile("/FLD/[0-9][0-9][0-9].BIN"), HG2FieldEntry),
-                (re.compile("/SHOP/T[0-9][0-9].BIN"), HG2ShopEntry),
+                ("/CAR[0-4,S]/Q[0-9]([0-9]+).BIN", HG2CarEntry),
+                ("/CARS/TIRE.BIN", HG2ObjectEntry),
+                ("/CARS/WHEEL.BIN", HG2ObjectEntry),
+                ("/CARS/PARTS.BIN", HG2ObjectEntry),
+                ("/COURSE/C[0-9][0-9].BIN", HG2CourseEntry),
+                ("/ACTION/A[0-9][0-9].BIN", HG2CourseEntry),
+                ("/FLD/[0-9][0-9][0-9].BIN", HG2FieldEntry),
+                ("/SHOP/T[0-9][0-9].BIN", HG2ShopEntry),
             ]
-            facade = self.iso.get_iso9660_facade()
-            self.entries = {}
-
-            for dirname, dirlist, filelist in self.iso.walk(iso_path='/'):
-                folder_entries = {}
-                for matcher, entry_type in matches:
-                    for filename in filelist:
-                        path = f"{dirname}/{filename}"
-                        if matcher.match(path):
-                            path = f"{dirname}/{filename}"
-                            record = facade.get_record(path)
-                            entry = entry_type(dirname, path, self.game_version, self.game_variant, record)
-                            folder_entries[filename] = entry
-
-                self.entries[dirname] = folder_entries
         elif self.game_version == GameVersion.CHOROQ_HG_3:
             matches = [
-                (re.compile("/CARS/Q[0-9]([0-9]+).BIN"), HG3CarEntry),
-                (re.compile("/COURSE/C[0-9][0-9](L|M|S|).BIN"), HG3CourseEntry),
-                (re.compile("/COURSE/A[0-9][0-9].BIN"), HG3CourseEntry),
-                # (re.compile("SYS/T[0-9][0-9].BIN"), HG3TownEntry),
-                # (re.compile("SYS/T00S01.BIN"), HG3TownEntry),
+                ("/CARS/Q[0-9]([0-9]+).BIN", HG3CarEntry),
+                ("/COURSE/C[0-9][0-9](L|M|S|).BIN", HG3CourseEntry),
+                ("/COURSE/A[0-9][0-9].BIN", HG3CourseEntry),
+                # ("SYS/T[0-9][0-9].BIN", HG3TownEntry),
+                # ("SYS/T00S01.BIN", HG3TownEntry),
             ]
-            facade = self.iso.get_iso9660_facade()
-            self.entries = {}
-
-            for dirname, dirlist, filelist in self.iso.walk(iso_path='/'):
-                folder_entries = {}
-                for matcher, entry_type in matches:
-                    for filename in filelist:
-                        path = f"{dirname}/{filename}"
-                        if matcher.match(path):
-                            path = f"{dirname}/{filename}"
-                            record = facade.get_record(path)
-                            entry = entry_type(dirname, path, self.game_version, self.game_variant, record)
-                            folder_entries[filename] = entry
-
-                self.entries[dirname] = folder_entries
+        if matches is None:
+            return
+
+        # Walks the iso once (or uses the saved index, if this iso has not changed since)
+        index = IsoIndex.open(self.iso, self.iso_path, [pattern for pattern, entry_type in matches])
+        self.entries = {}
+        for dirname, files in index.folders.items():
+            folder_entries = {}
+            for filename, pattern_index, extent, size in files:
+                path = f"{dirname}/{filename}"
+                record = index.get_record(self.iso, dirname, filename)
+                entry_type = matches[pattern_index][1]
+                entry = entry_type(dirname, path, self.game_version, self.game_variant, record)
+                folder_entries[filename] = entry
+
+            self.entries[dirname] = folder_entries
 
     def on_close(self):
         self.config.save_config()
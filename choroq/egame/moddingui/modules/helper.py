@@ -18,6 +18,14 @@ class Helper:
 
         return offsets
 
+    # Writes data into the buffer (bytearray) at position, like seek + write
+    # on a file, the buffer is extended with zeros if position is past its end
+    @staticmethod
+    def write_at(buffer, position, data):
+        if position + len(data) > len(buffer):
+            buffer.extend(bytes(position + len(data) - len(buffer)))
+        buffer[position:position + len(data)] = data
+
     @staticmethod
     def find_texture_addresses(stream):
         offsets = Helper.find_offsets(stream)
@@ -15,6 +15,8 @@ from choroq.egame.moddingui.entries.hg2_object_entry import HG2ObjectEntry
 
 import choroq.read_utils as U
 from choroq.egame.moddingui.modules.helper import Helper
+from choroq.egame.hg2_part import fit_part_to_size
+from choroq.iso_patch import IsoPatchSession
 
 
 class CarPartReplaceMenu(customtkinter.CTkToplevel):
@@ -138,6 +140,8 @@ class CarPartReplaceMenu(customtkinter.CTkToplevel):
         self.part_sizes = []
 
         self.replacement_part_size = 0
+        # Simplified copy of the replacement part, made to fit the chosen part (see simplify_cb)
+        self.fitted_part_data = None
 
         for i in range(len(parts_string)):
             size = self.offsets[i+1] - self.offsets[i]
@@ -166,8 +170,10 @@ class CarPartReplaceMenu(customtkinter.CTkToplevel):
         # TODO: have checkbox to allow overwriting LP body, only do this on replace (and check and lock if o[0] == 0[1])
 
         self.replace_btn = customtkinter.CTkButton(self, text="Replace", command=self.replace, state="disabled", fg_color="Red")
+        self.simplify_btn = customtkinter.CTkButton(self, text="Simplify to fit", command=self.simplify_cb)
         self.close_btn = customtkinter.CTkButton(self, text="Close", command=self.close_cb)
         self.replace_btn.grid(row=6, column=0, columnspan=2, sticky="nesw")
+        self.simplify_btn.grid(row=6, column=2, sticky="nesw")
         self.close_btn.grid(row=6, column=3, columnspan=2, sticky="nesw")
 
         self.columnconfigure(0, weight=1)
@@ -186,25 +192,56 @@ class CarPartReplaceMenu(customtkinter.CTkToplevel):
             self.replace_btn.configure(fg_color="Red")
             if self.replacement_part_size != 0:
                 # TODO handle check for when we allow replacing/merging low poly
-                if self.replacement_part_size <= self.part_sizes[index]:
+                if self.get_replacement_size() <= self.part_sizes[index]:
                     # Enable replace button, as it fits
                     self.replace_btn.configure(state="enabled")
                     self.replace_btn.configure(fg_color="Blue")
                     self.replace_btn.after(1, self.update())
-                    self.valid_var.set("Replacement part will fit")
+                    if self.fitted_part_data is not None:
+                        self.valid_var.set("Simplified replacement part will fit")
+                    else:
+                        self.valid_var.set("Replacement part will fit")
                 else:
-                    self.valid_var.set("Replacement part too big!")
+                    self.valid_var.set("Replacement part too big! (try Simplify to fit)")
         else:
             self.valid_var.set("Invalid part choice")
             print(f"Invalid part choice {value}")
         self.replace_btn.after(1, self.update())
 
+    def get_replacement_size(self):
+        if self.fitted_part_data is not None:
+            return len(self.fitted_part_data)
+        return self.replacement_part_size
+
+    def simplify_cb(self):
+        value = self.part_chosen.get()
+        if value not in self.part_options or self.replacement_part_size == 0:
+            self.valid_var.set("Choose a replacement part, and the part to replace first")
+            return
+        index = self.part_options.index(value)
+        path = self.part_path.get()
+        try:
+            with open(path, "rb") as part_in:
+                data = part_in.read()
+            fitted_data, fitted_size, error = fit_part_to_size(data, self.part_sizes[index])
+        except Exception as e:
+            self.output_var.set(f"Failed to simplify replacement part\n {e}")
+            print(e)
+            return
+
+        if fitted_size < len(data):
+            self.fitted_part_data = fitted_data
+        self.output_var.set(f"Replacement file is {self.replacement_part_size} bytes, "
+                            f"simplified to {fitted_size} bytes (max error {error:.4f})")
+        self.check_size_valid()
+
     def on_replacement_file_selected(self, variable, other, trace_mode):
         print(f"File: {variable} | {other} | {trace_mode}")
         value = self.root.getvar(variable)
         print(value)
         if trace_mode == 'write':
             print(f"New replacement part path {value}")
+            self.fitted_part_data = None
             try:
                 with open(value, "rb") as file:
                     # Get size of the part they wish to
@@ -218,6 +255,9 @@ class CarPartReplaceMenu(customtkinter.CTkToplevel):
                 print(e)
 
     def on_part_choice_change(self, variable, other, trace_mode):
+        if trace_mode == 'write':
+            # Simplified for a different part's size
+            self.fitted_part_data = None
         self.check_size_valid()
 
     def load_offsets(self):
@@ -232,9 +272,9 @@ class CarPartReplaceMenu(customtkinter.CTkToplevel):
         print("Replacing file, checking everything")
 
         # Reopen the iso as read and write
+        patch_session = IsoPatchSession(self.entry.record.data_fp.name)
         try:
-            write_test = open(self.entry.record.data_fp.name, "r+b")
-            write_test.close()
+            patch_session.check_writable()
         except Exception as e:
             print("failed to write to iso (test)")
             print(e)
@@ -274,6 +314,10 @@ class CarPartReplaceMenu(customtkinter.CTkToplevel):
 
                 # Move back to the start after sanity check
                 replacement_in.seek(0, os.SEEK_SET)
+                if self.fitted_part_data is not None:
+                    replacement_data = self.fitted_part_data
+                else:
+                    replacement_data = replacement_in.read()
 
                 # Find which offset we are replacing, and move to it
                 part_value = self.part_chosen.get()
@@ -282,17 +326,14 @@ class CarPartReplaceMenu(customtkinter.CTkToplevel):
 
                     part_offset = self.offsets[index]
 
-                    # Dirty, open file again then write where it should be,
+                    # Write into the iso file where it should be (not through pycdlib),
                     # without doing this the data positions change
                     print(f"Replacing file, replacing {part_value}")
-                    with open(self.entry.record.data_fp.name, "r+b") as edited_out:
-                        # Move to the iso's file position, and move to the start of the part
-                        part_offset = self.entry.record.fp_offset + part_offset
-                        edited_out.seek(part_offset, os.SEEK_SET)
-
-                        amount_written = edited_out.write(replacement_in.read())
-                        if amount_written < self.replacement_part_size:
-                            raise Exception(f"Failed to replace, did not write full size")
+                    # Move to the iso's file position, and move to the start of the part
+                    part_offset = self.entry.record.fp_offset + part_offset
+                    patch_session.add(part_offset, replacement_data, part_offset, self.part_sizes[index],
+                                      f"{self.entry.basename} {part_value}")
+                    patch_session.commit()
 
                     # Do not use this function, it changes LBA and file positions
                     # This is here to remind me to not do this
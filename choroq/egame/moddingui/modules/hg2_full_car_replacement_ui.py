@@ -18,6 +18,8 @@ from choroq.egame.moddingui.entries.hg2_object_entry import HG2ObjectEntry
 import choroq.read_utils as U
 from choroq.egame.moddingui.modules.helper import Helper
 from choroq.texture_utils import TextureUtil
+from choroq.egame.hg2_part import fit_part_to_size
+from choroq.iso_patch import IsoPatchSession
 
 
 class FullCarReplaceMenu(customtkinter.CTkToplevel):
@@ -30,6 +32,7 @@ class FullCarReplaceMenu(customtkinter.CTkToplevel):
         self.valid_label = None
         self.close_btn = None
         self.replace_btn = None
+        self.simplify_btn = None
         self.wm_transient(root)
         self.root = root
 
@@ -193,8 +196,10 @@ class FullCarReplaceMenu(customtkinter.CTkToplevel):
         self.valid_label.grid(row=title_size+self.part_count+2, column=0, padx=5, pady=5, sticky="nesw", columnspan=4)
 
         self.replace_btn = customtkinter.CTkButton(self, text="Replace", command=self.replace, state="disabled", fg_color="Red")
+        self.simplify_btn = customtkinter.CTkButton(self, text="Simplify to fit", command=self.simplify_cb)
         self.close_btn = customtkinter.CTkButton(self, text="Close", command=self.close_cb)
         self.replace_btn.grid(row=title_size+self.part_count+3, column=0, columnspan=2, sticky="nesw")
+        self.simplify_btn.grid(row=title_size+self.part_count+3, column=2, sticky="nesw")
         self.close_btn.grid(row=title_size+self.part_count+3, column=3, columnspan=2, sticky="nesw")
 
         self.columnconfigure(0, weight=1)
@@ -232,6 +237,38 @@ class FullCarReplaceMenu(customtkinter.CTkToplevel):
         self.replace_btn.after(1, self.update())
         self.valid_var.set(all_valid_str)
 
+    def get_texture_size(self):
+        if self.texture_tag_data is None:
+            return 0
+        texture_header, texture_data, texture_size, clut_header, clut_data, clut_size, clut_tail = self.texture_tag_data
+        return len(texture_header) + texture_size + len(clut_header) + clut_size + len(clut_tail)
+
+    def simplify_cb(self):
+        # Share out the space left after the offset table and texture between the mesh parts, by their size
+        mesh_parts = [part for part in self.parts_ui[:self.part_count] if part.valid_path]
+        if len(mesh_parts) == 0:
+            self.output_var.set("Select the parts to simplify first")
+            return
+        space = self.entry.get_size() - 48 - self.get_texture_size()
+        total = sum(part.original_part_size for part in mesh_parts)
+        if total <= space:
+            self.output_var.set("Parts already fit, nothing to simplify")
+            return
+
+        results = []
+        for part in mesh_parts:
+            # Rounded down, as each part is padded to 16 bytes
+            max_size = (space * part.original_part_size // total) & ~15
+            try:
+                error = part.fit_to_size(max_size)
+            except Exception as e:
+                self.output_var.set(f"Failed to simplify {part.part_name}\n {e}")
+                print(e)
+                return
+            results.append(f"{part.part_name}: {part.replacement_part_size} bytes (max error {error:.4f})")
+        self.output_var.set("Simplified parts\n" + "\n".join(results))
+        self.recalculate_size()
+
     def load_offsets(self):
         self.offsets = Helper.find_offsets(self.original_data)
 
@@ -251,9 +288,9 @@ class FullCarReplaceMenu(customtkinter.CTkToplevel):
 
     def replace(self):
         # Reopen the iso as read and write
+        patch_session = IsoPatchSession(self.entry.record.data_fp.name)
         try:
-            write_test = open(self.entry.record.data_fp.name, "r+b")
-            write_test.close()
+            patch_session.check_writable()
         except Exception as e:
             print("failed to write to iso (test)")
             print(e)
@@ -286,8 +323,11 @@ class FullCarReplaceMenu(customtkinter.CTkToplevel):
 
                 path = self.parts_ui[part_index].part_path.get()
                 try:
-                    with open(path, "rb") as part_in:
-                        replacement_bytes.write(part_in.read())
+                    if self.parts_ui[part_index].fitted_part_data is not None:
+                        replacement_bytes.write(self.parts_ui[part_index].fitted_part_data)
+                    else:
+                        with open(path, "rb") as part_in:
+                            replacement_bytes.write(part_in.read())
 
                     # Get the position after writing, and pad to be 16 byte aligned for the next section
                     next_position = replacement_bytes.tell()
@@ -344,16 +384,14 @@ class FullCarReplaceMenu(customtkinter.CTkToplevel):
 
         try:
 
-            # Dirty, open file again then write where it should be,
+            # Write into the iso file where it should be (not through pycdlib),
             # without doing this the data positions change
             print(f"Replacing all parts of car {self.entry.basename}")
-            with open(self.entry.record.data_fp.name, "r+b") as edited_out:
-                # Move to the iso's file position, and move to the start of the part
-                edited_out.seek(self.entry.record.fp_offset, os.SEEK_SET)
-
-                amount_written = edited_out.write(replacement_bytes.read())
-                if amount_written < self.replacement_total_size:
-                    raise Exception(f"Failed to replace, did not write full size {amount_written} != {self.replacement_total_size}")
+            replacement_data = replacement_bytes.getvalue()
+            if len(replacement_data) < self.replacement_total_size:
+                raise Exception(f"Failed to replace, did not write full size {len(replacement_data)} != {self.replacement_total_size}")
+            patch_session.add_entry(self.entry, replacement_data)
+            patch_session.commit()
 
             # Do not use this function, it changes LBA and file positions
             # This is here to remind me to not do this
@@ -388,6 +426,9 @@ class CarPartSection(customtkinter.CTkFrame):
         self.optional = optional
 
         self.replacement_part_size = 0
+        # Size of the selected file, and a simplified copy of it (see fit_to_size)
+        self.original_part_size = 0
+        self.fitted_part_data = None
 
         self.columnconfigure(0, weight=20)
         self.columnconfigure(1, weight=20)
@@ -415,11 +456,13 @@ class CarPartSection(customtkinter.CTkFrame):
         print("Asking for replacement part file path")
         self.part_path.set(filedialog.askopenfilename(defaultextension='.BIN', initialdir=self.root.config.get_last_part_path()))
         value = self.part_path.get()
+        self.fitted_part_data = None
         try:
             with open(value, "rb") as file:
                 # Get size of the part they wish to
                 file.seek(0, os.SEEK_END)
                 self.replacement_part_size = file.tell()
+                self.original_part_size = self.replacement_part_size
                 self.output_var.set(f"Part is {self.replacement_part_size} bytes")
                 if self.replacement_part_size % 16 != 0:
                     raise Exception("Part is not 16 byte aligned")
@@ -431,6 +474,18 @@ class CarPartSection(customtkinter.CTkFrame):
             print(e)
         self.on_change_cb()
 
+    # Simplifies the selected part so it is at most max_size bytes, returns the error
+    def fit_to_size(self, max_size):
+        with open(self.part_path.get(), "rb") as part_in:
+            data = part_in.read()
+        fitted_data, fitted_size, error = fit_part_to_size(data, max_size)
+        if fitted_size < len(data):
+            self.fitted_part_data = fitted_data
+            self.replacement_part_size = fitted_size
+        self.output_var.set(f"Part is {self.original_part_size} bytes, simplified to {fitted_size} bytes "
+                            f"(max error {error:.4f})")
+        return error
+
     def part_valid(self):
         if self.optional and not self.valid_path:
             return True
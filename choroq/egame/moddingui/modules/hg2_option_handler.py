@@ -18,6 +18,7 @@ from choroq.egame.moddingui.modules.message_box import MessageBox
 
 from choroq.egame.moddingui.common import *
 from choroq.egame.moddingui.entries.game_entry import GameEntry
+from choroq.iso_patch import IsoPatchSession
 from egame_converter import EGameConverter
 
 import choroq.read_utils as U
@@ -93,9 +94,9 @@ class HG2CarOptionHandler:
     @staticmethod
     def import_replacement_confirmed(entrymenu, root, iso: pycdlib.PyCdlib, entry: GameEntry, button_index, button_name):
         # Reopen the iso as read and write
+        patch_session = IsoPatchSession(entry.record.data_fp.name)
         try:
-            write_test = open(entry.record.data_fp.name, "r+b")
-            write_test.close()
+            patch_session.check_writable()
         except Exception as e:
             print("failed to write to iso (test)")
             print(e)
@@ -118,15 +119,13 @@ class HG2CarOptionHandler:
         try:
             with open(path, "rb") as replacement_in:
                 root.config.update_replacement_path(path, entry.game_version)
-                replacement_bytes = BytesIO()
+                # Converted in memory, and patched in place before writing it to the iso
                 if entry.game_version == GameVersion.CHOROQ_HG_2:
-                    EGameConverter.convert_hg3_to_hg2_stream(replacement_in, replacement_bytes)
+                    replacement_bytes = EGameConverter.convert_hg3_to_hg2_stream(replacement_in)
                 else:
-                    EGameConverter.convert_hg2_to_hg3_stream(replacement_in, replacement_bytes)
+                    replacement_bytes = EGameConverter.convert_hg2_to_hg3_stream(replacement_in)
 
-                replacement_bytes.seek(0, os.SEEK_END)
-                converted_size = replacement_bytes.tell()
-                replacement_bytes.seek(0, os.SEEK_SET)
+                converted_size = len(replacement_bytes)
 
                 if converted_size > entry.get_size():
                     MessageBox(root, ["Close"],
@@ -155,31 +154,24 @@ class HG2CarOptionHandler:
                     original_flush = original_data.read(48)
 
                     # Find offsets again in this data and write it back, very similar code
-                    replacement_bytes.seek(0, os.SEEK_SET)
-                    offsets = Helper.find_offsets(replacement_bytes)
+                    # (only the offset table is copied, the first offset is the table's size)
+                    table_size = int.from_bytes(replacement_bytes[0:4], byteorder='little')
+                    offsets = Helper.find_offsets(BytesIO(replacement_bytes[:table_size]))
                     texture_offset = offsets[-2]
                     # Jump to the texture subfile
-                    replacement_bytes.seek(texture_offset, os.SEEK_SET)
-                    replacement_bytes.write(original_texture_header)
+                    Helper.write_at(replacement_bytes, texture_offset, original_texture_header)
                     # Skip past texture data, to palette header
-                    replacement_bytes.seek(texture_offset + 112 + 256 * 256, os.SEEK_SET)
-                    replacement_bytes.write(original_palette_header)
+                    Helper.write_at(replacement_bytes, texture_offset + 112 + 256 * 256, original_palette_header)
                     # Skip past palette data
-                    replacement_bytes.seek(texture_offset + 112 + 256 * 256 + 112 + 1024, os.SEEK_SET)
                     # read last bit + flush
-                    replacement_bytes.write(original_flush)
+                    Helper.write_at(replacement_bytes, texture_offset + 112 + 256 * 256 + 112 + 1024, original_flush)
 
                     # Finally write back the replaced mesh
 
-                    # Dirty, open file again then write where it should be
+                    # Write into the iso file where it should be (not through pycdlib),
                     # without doing this the data positions change
-                    with open(entry.record.data_fp.name, "r+b") as edited_out:
-                        edited_out.seek(entry.record.fp_offset)
-                        edited_out.write(replacement_bytes.getbuffer().tobytes())
-
-                    # Force closure, so other programs can use
-                    fp = open(entry.record.data_fp.name, "r")
-                    fp.close()
+                    patch_session.add_entry(entry, replacement_bytes)
+                    patch_session.commit()
 
                     # Do not use this function, it changes LBA and file positions
                     # This is here to remind me to not do this
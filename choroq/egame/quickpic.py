@@ -1,23 +1,29 @@
 # Class for extracting/holding all quick-pic (PUTI) activity images, found in cdrom0:/SYS/PUTI.BIN
 # 
-# Textures are 256x128 with a white border, 800 bytes of padding after the palette (usually 16x16 1024 byte palette)
+# Textures are 256x128 with a white border, followed by their palette (usually 16x16 1024 byte palette) then padding
+# up to the next image, each image starts at a sector, so they are found with a texture index (see texture_index)
 # The images do not contain the car, as this is drawn on top for the current player config
 
-import os
-from choroq.egame.texture import Texture
+from choroq.egame.texture_index import build_texture_index, decode_textures
+from choroq.game_source import map_file
 
 
 class QuickPic:
 
-    def __init__(self, textures=[]):
-        self.textures = textures
+    def __init__(self, textures=None, palettes=None):
+        self.textures = textures if textures is not None else []
+        self.palettes = palettes if palettes is not None else []  # The clut texture for each, or None
 
+    # workers is the number of processes decoding the images (all cpus if None, 1 decodes them in this process)
     @staticmethod
-    def fromFile(file, offset, size):
-        file.seek(offset, os.SEEK_SET)
-        
+    def from_file(file, offset=0, workers=1):
+        buffer = map_file(file)
+        # The palette directly after each image is not marked as a clut
+        index = build_texture_index(buffer, offset, clut_flag=False)
+
         textures = []
-        while file.tell() < size:
-            textures.append(Texture.read_texture(file, file.tell()))
-            file.seek(file.tell() + 800)
-        return QuickPic(textures)
\ No newline at end of file
+        palettes = []
+        for address, texture, clut in decode_textures(buffer, index, workers):
+            textures.append(texture)
+            palettes.append(clut)
+        return QuickPic(textures, palettes)
@@ -6,6 +6,8 @@
 
 import os
 from choroq.egame.texture import Texture
+from choroq.egame.texture_index import build_texture_index, decode_textures
+from choroq.game_source import map_file
 import choroq.ps2_utils as PS2
 import choroq.read_utils as U
 
@@ -14,55 +16,21 @@ class Shop():
     def __init__(self, textures):
         self.textures = textures
 
+    # Textures are found with a texture index (see texture_index), then decoded using up to workers processes
+    # (all cpus if None, 1 decodes them in this process)
     @staticmethod
-    def from_file(file, offset):
-        file.seek(0, os.SEEK_END)
-        max_length = file.tell()
-        file.seek(offset, os.SEEK_SET)
-        textures = []
-
-        while file.tell() + 64 < max_length:
-            test = U.BreadLong(file)
-            # This currently misses some, as DMA tag being "end" also somehow means load next texture for some
-            if (file.tell()-4) % 2048 == 0 and test & 0xFF000000 == 0x10000000:
-                file.seek(-4, os.SEEK_CUR)
-                print(f"Next texture at @ {file.tell()}")
+    def from_file(file, offset, workers=1):
+        buffer = map_file(file)
+        index = build_texture_index(buffer, offset)
+        print(f"Found {len(index)} textures, {sum(entry.has_clut() for entry in index)} with a clut")
 
-                last = False
-                while not last:
-                    test = U.BreadLong(file)
-                    if (file.tell() - 4) % 2048 == 0 and test & 0xFF000000 == 0x10000000:
-                        file.seek(-4, os.SEEK_CUR)  # Seek back for next read
-                    else:
-                        break  # No more textures
-                    # Read texture
-                    (address, texture), last = Texture.read_texture(file, file.tell())
-
-                    # AFAIK all addresses are 0 for textures for shops
-                    if address != 0:
-                        exit(910)
-
-                    textures.append(texture)
-
-                    if not last:
-                        # Check for FF which should mark the next texture as being a palette (CLUT)
-                        # if this is FF then assume it is for the pre texture, if not just try and
-                        # read more textures
-                        test2 = U.readLong(file)  # Peek
-                        file.seek(-4, os.SEEK_CUR)
-                        print(f"Checking for clut at @ {file.tell()} {test2:x}")
-                        if test2 & 0xFF000000 == 0x10000000 and test2 & 0x00FF0000 == 0x00FF0000:
-                            print(f"Has clut at @ {file.tell()}")
-                            # Probably a clut
-                            (clut_address, clut), last = Texture.read_texture(file, file.tell())
-                            unswizzled = Texture.unswizzle_bytes(clut)
-                            texture.palette = unswizzled  # Set the texture's palette accordingly
-                            texture.palette_width = clut.width
-                            texture.palette_height = clut.height
-
-
-                print(f"Done texture at @ {file.tell()}")
-                print(f"{len(textures)}")
+        textures = []
+        for entry, (address, texture, clut) in zip(index, decode_textures(buffer, index, workers)):
+            # AFAIK all addresses are 0 for textures for shops
+            if address != 0:
+                exit(910)
+            print(f"Texture at @ {entry.offset} size {entry.size} clut @ {entry.clut_offset}")
+            textures.append(texture)
 
         return Shop(textures)
 
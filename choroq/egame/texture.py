@@ -398,6 +398,12 @@ class Texture:
             return rgbd.tobytes()
 
     def write_texture_to_png(self, path, flip_x=False, flip_y=False, use_palette=True, use_given_palette=False):
+        rgbd = self.get_texture_as_image(flip_x, flip_y, use_palette, use_given_palette)
+        rgbd.save(path, "PNG")
+        print("Saved")
+
+    # Builds the RGBA image for this texture, applying the palette (CLUT) if one has been set
+    def get_texture_as_image(self, flip_x=False, flip_y=False, use_palette=True, use_given_palette=False):
         colour_list = []
         # Use the palette stored in use_given_palette if set
         palette_width = self.palette_width
@@ -412,10 +418,8 @@ class Texture:
                 image = Image.frombytes('RGBA', (self.width, self.height), self.texture, 'raw')
             elif self.bpp == 24: 
                 image = Image.frombytes('RGB', (self.width, self.height), self.texture, 'raw')
-                image.convert("RGBA").save(path, "PNG")
             elif self.bpp == 4 or self.bpp == 8:
                 image = Image.frombytes('L', (self.width, self.height), self.texture, 'raw')
-                image.convert("RGBA").save(path, "PNG")
             else:
                 print(f"BAD BPP value {self.bpp}")
                 exit()
@@ -447,8 +451,7 @@ class Texture:
             rgbd = ImageOps.mirror(rgbd)
         if flip_y:
             rgbd = ImageOps.flip(rgbd)
-        rgbd.save(path, "PNG")
-        print("Saved")
+        return rgbd
 
     def write_palette_to_png(self, path):
         colour_list = []
@@ -0,0 +1,255 @@
+
+# Packs the textures used by a course/field into one or a few power of two atlases
+#
+# Each (clut, texture) pair used by a course/field is normally exported as its own material,
+# which leaves most fields with dozens of materials and so dozens of draw calls in an engine.
+# This takes the meshes grouped by material (see group_meshes_by_material), packs each
+# material's decoded texture into an atlas page using a skyline packer, and produces one
+# merged CourseMesh per page with the UVs remapped into the page.
+#
+# Not every material can be packed:
+#   - Materials without a usable texture (missing address/clut) are left as is
+#   - Materials whose UVs go outside of 0-1 rely on the texture repeating, this cannot be done
+#     from within an atlas so these are left as is too
+# Anything left out is returned so it can be saved the usual way.
+
+from choroq.egame.amesh import MeshBuffer
+from choroq.egame.course import CourseMesh
+from choroq.egame.texture import Texture
+
+from PIL import Image
+
+
+class SkylinePacker:
+
+    # Bottom-left skyline packer, the skyline is stored as a list of
+    # segments (x, y, width) running left to right across the page
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.skyline = [(0, 0, width)]
+        self.used_width = 0
+        self.used_height = 0
+
+    def insert(self, width, height):
+        best = None
+        best_index = -1
+        for i in range(len(self.skyline)):
+            y = self._fits(i, width, height)
+            if y is None:
+                continue
+            x = self.skyline[i][0]
+            # Prefer the lowest position, then the left most
+            if best is None or y < best[1] or (y == best[1] and x < best[0]):
+                best = (x, y)
+                best_index = i
+        if best is None:
+            return None
+
+        self._add_level(best_index, best[0], best[1], width, height)
+        self.used_width = max(self.used_width, best[0] + width)
+        self.used_height = max(self.used_height, best[1] + height)
+        return best
+
+    def _fits(self, index, width, height):
+        x = self.skyline[index][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        i = index
+        while remaining > 0:
+            if i >= len(self.skyline):
+                return None
+            y = max(y, self.skyline[i][1])
+            if y + height > self.height:
+                return None
+            remaining -= self.skyline[i][2]
+            i += 1
+        return y
+
+    def _add_level(self, index, x, y, width, height):
+        self.skyline.insert(index, (x, y + height, width))
+
+        # Shrink/remove the segments now covered by the new one
+        i = index + 1
+        while i < len(self.skyline):
+            seg_x, seg_y, seg_width = self.skyline[i]
+            prev_x, _, prev_width = self.skyline[i - 1]
+            if seg_x < prev_x + prev_width:
+                shrink = prev_x + prev_width - seg_x
+                if seg_width - shrink <= 0:
+                    self.skyline.pop(i)
+                    continue
+                self.skyline[i] = (seg_x + shrink, seg_y, seg_width - shrink)
+            break
+
+        # Merge neighbouring segments at the same height
+        i = 0
+        while i < len(self.skyline) - 1:
+            if self.skyline[i][1] == self.skyline[i + 1][1]:
+                seg_x, seg_y, seg_width = self.skyline[i]
+                self.skyline[i] = (seg_x, seg_y, seg_width + self.skyline[i + 1][2])
+                self.skyline.pop(i + 1)
+            else:
+                i += 1
+
+
+class AtlasPage:
+
+    def __init__(self, image, mesh, regions):
+        self.image = image  # RGBA PIL image, always a power of 2 in each direction
+        self.mesh = mesh  # Single CourseMesh holding all meshes placed on this page
+        self.regions = regions  # (clut, texture) -> (x, y, width, height) in pixels
+
+    def write_texture_to_png(self, path):
+        self.image.save(path, "PNG")
+
+
+class TextureAtlas:
+
+    @staticmethod
+    def build(mesh_by_material, textures, max_size=2048, padding=2):
+        # Returns ([AtlasPage], {(clut, texture): [CourseMesh]}) where the dict holds all the
+        # materials that could not be placed in an atlas
+        images = {}
+        remaining = {}
+        for key, meshes in mesh_by_material.items():
+            image = None
+            if TextureAtlas._uvs_in_range(meshes):
+                image = TextureAtlas.get_material_image(key, textures)
+            if image is None or image.width + padding * 2 > max_size or image.height + padding * 2 > max_size:
+                remaining[key] = meshes
+                continue
+            images[key] = image
+
+        # Place the tallest first, gives a much flatter skyline
+        keys = sorted(images.keys(), key=lambda k: (images[k].height, images[k].width), reverse=True)
+
+        pages = []
+        while len(keys) > 0:
+            packer = SkylinePacker(max_size, max_size)
+            placed = {}
+            not_placed = []
+            for key in keys:
+                image = images[key]
+                position = packer.insert(image.width + padding * 2, image.height + padding * 2)
+                if position is None:
+                    not_placed.append(key)
+                    continue
+                placed[key] = (position[0] + padding, position[1] + padding, image.width, image.height)
+
+            if len(placed) == 0:
+                # Should not happen as the sizes are checked above, but prevents looping forever
+                for key in not_placed:
+                    remaining[key] = mesh_by_material[key]
+                break
+
+            page_width = TextureAtlas._next_power_of_2(packer.used_width)
+            page_height = TextureAtlas._next_power_of_2(packer.used_height)
+            page_image = Image.new("RGBA", (page_width, page_height), (0, 0, 0, 0))
+            for key, region in placed.items():
+                TextureAtlas._paste_with_padding(page_image, images[key], region, padding)
+
+            mesh = TextureAtlas.merge_meshes(mesh_by_material, placed, page_width, page_height)
+            pages.append(AtlasPage(page_image, mesh, placed))
+            print(f"Packed {len(placed)} textures into atlas {len(pages) - 1} ({page_width}x{page_height})")
+            keys = not_placed
+
+        return pages, remaining
+
+    @staticmethod
+    def get_material_image(key, textures):
+        # Matches how the textures are combined with their CLUT when saving materials
+        clut_address, texture_address = key
+        if texture_address == 0 or clut_address == 0:
+            return None
+        if texture_address not in textures:
+            return None
+        texture = textures[texture_address]
+        if not isinstance(texture, Texture):
+            return None
+
+        if clut_address not in textures:
+            if texture.bpp > 8:
+                return texture.get_texture_as_image(use_palette=False)
+            return None
+
+        clut = textures[clut_address]
+        if clut.bpp != 32 and clut.bpp != 24:
+            return texture.get_texture_as_image(use_palette=False)
+        texture.palette = Texture.unswizzle_bytes(clut)
+        texture.palette_width = clut.width
+        texture.palette_height = clut.height
+        try:
+            return texture.get_texture_as_image()
+        except ValueError as e:
+            if len(e.args) == 1 and e.args[0] == "invalid palette size":
+                texture.palette = []
+                texture.palette_width = 0
+                texture.palette_height = 0
+                return texture.get_texture_as_image(use_palette=False)
+            return None
+
+    @staticmethod
+    def merge_meshes(mesh_by_material, regions, page_width, page_height):
+        # Creates one mesh from all meshes in regions, with their UVs moved into the page
+        # the original meshes are left unchanged
+        verts = MeshBuffer(3, typecode='d')
+        normals = MeshBuffer(3, typecode='d')
+        uvs = MeshBuffer(3, typecode='d')
+        faces = MeshBuffer(3, typecode='I')
+        day_colours = MeshBuffer(4, typecode='d')
+        night_colours = MeshBuffer(4, typecode='d')
+        extras = MeshBuffer(3, typecode='d')
+        for key, (x, y, width, height) in regions.items():
+            scale_u = width / page_width
+            scale_v = height / page_height
+            offset_u = x / page_width
+            # V is flipped (1 - v) in the meshes, so work from the bottom of the page
+            offset_v = 1 - (y + height) / page_height
+            for mesh in mesh_by_material[key]:
+                start = len(verts)
+                verts += mesh.mesh_verts
+                normals += mesh.mesh_normals
+                day_colours += mesh.mesh_day_colours
+                night_colours += mesh.mesh_night_colours
+                extras += mesh.mesh_extras
+                for uv in mesh.mesh_uvs:
+                    uvs.append((offset_u + uv[0] * scale_u, offset_v + uv[1] * scale_v, uv[2]))
+                for face in mesh.mesh_faces:
+                    faces.append((face[0] + start, face[1] + start, face[2] + start))
+
+        return CourseMesh(len(verts), verts, normals, uvs, faces, day_colours, night_colours, extras)
+
+    @staticmethod
+    def _uvs_in_range(meshes):
+        # A small tolerance, as the edges of most textures are stored slightly outside of 0-1
+        for mesh in meshes:
+            for uv in mesh.mesh_uvs:
+                if uv[0] < -0.001 or uv[0] > 1.001 or uv[1] < -0.001 or uv[1] > 1.001:
+                    return False
+        return True
+
+    @staticmethod
+    def _paste_with_padding(page_image, image, region, padding):
+        x, y, width, height = region
+        page_image.paste(image, (x, y))
+        if padding == 0:
+            return
+        # Repeat the edge pixels into the padding, to prevent bleeding when filtering/mip-mapping
+        top = image.crop((0, 0, width, 1)).resize((width, padding))
+        bottom = image.crop((0, height - 1, width, height)).resize((width, padding))
+        left = image.crop((0, 0, 1, height)).resize((padding, height))
+        right = image.crop((width - 1, 0, width, height)).resize((padding, height))
+        page_image.paste(top, (x, y - padding))
+        page_image.paste(bottom, (x, y + height))
+        page_image.paste(left, (x - padding, y))
+        page_image.paste(right, (x + width, y))
+
+    @staticmethod
+    def _next_power_of_2(value):
+        size = 1
+        while size < value:
+            size <<= 1
+        return size
@@ -0,0 +1,147 @@
+
+# Index of the textures in files that are just runs of textures (SHOP/*.BIN, SYS/PUTI.BIN), then decoding them
+#
+# Each run of textures starts at the start of a sector (2048 bytes), with a DMA tag whose top byte is 0x10 (cnt).
+# Rather than reading every 4 bytes of the file to find these, only the first 4 bytes of each sector are checked,
+# all at once with numpy over the memory-mapped file (see game_source.map_file).
+#
+# Each texture is one DMA chunk, so its size is from its DMA tag (qwordCount * 16 + 16) without decoding it.
+# Textures in a run after the first also start at a sector, a CLUT (palette) directly follows the texture it is
+# for, which for shops is marked by 0xFF in the third byte of its tag.
+#
+# Once indexed, each texture (and its CLUT) can be decoded on its own, from just its bytes. As decoding is slow
+# python, it can be spread over processes (workers > 1), threads would be held back by the GIL.
+
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from choroq.egame.texture import Texture
+
+SECTOR_SIZE = 2048
+DMA_TAG_SIZE = 16
+# Top byte of the DMA tag starting each texture (cnt)
+TEXTURE_TAG = 0x10
+# Third byte of the DMA tag of a CLUT
+CLUT_FLAG = 0xFF
+# DMA tag ids ending a chain (refe, ret and end)
+END_TAG_IDS = [0, 6, 7]
+# Fewer textures than this are decoded in this process, as starting the workers would take longer
+PARALLEL_MIN_TEXTURES = 16
+
+
+class TextureIndexEntry:
+
+    def __init__(self, offset, size, clut_offset=None, clut_size=0):
+        self.offset = offset
+        self.size = size
+        self.clut_offset = clut_offset
+        self.clut_size = clut_size
+
+    def has_clut(self):
+        return self.clut_offset is not None
+
+    def __repr__(self):
+        return f"TextureIndexEntry({self.offset}, {self.size}, {self.clut_offset}, {self.clut_size})"
+
+
+# Returns (size, is last) of the DMA chunk at offset, or None if it does not fit in the file
+def read_chunk_size(data, offset):
+    if offset + DMA_TAG_SIZE > len(data):
+        return None
+    qword_count = int(data[offset]) | (int(data[offset + 1]) << 8)
+    tag_id = (int(data[offset + 3]) >> 4) & 0x7
+    size = qword_count * 16 + DMA_TAG_SIZE
+    if offset + size > len(data):
+        return None
+    return size, tag_id in END_TAG_IDS
+
+
+# Returns the sector aligned offsets from offset (with at least 64 bytes after them) that start with a texture tag,
+# step is the distance between the sectors checked, a multiple of SECTOR_SIZE
+def find_texture_starts(data, offset=0, step=SECTOR_SIZE):
+    first = -(-offset // SECTOR_SIZE) * SECTOR_SIZE
+    starts = np.arange(first, len(data) - 64, step)
+    return starts[data[starts + 3] == TEXTURE_TAG]
+
+
+# Returns [TextureIndexEntry] for the runs of textures in the buffer
+# If clut_flag is False the chunk after each texture (that is not the last of its run) is always used as its CLUT,
+# rather than only when its tag is marked
+def build_texture_index(buffer, offset=0, step=SECTOR_SIZE, clut_flag=True):
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    index = []
+    position = 0
+    for start in find_texture_starts(data, offset, step):
+        start = int(start)
+        if start < position:
+            # Part of the previous run
+            continue
+        position = start
+        last = False
+        while not last and position % SECTOR_SIZE == 0 and data[position + 3] == TEXTURE_TAG:
+            chunk = read_chunk_size(data, position)
+            if chunk is None:
+                break
+            size, last = chunk
+            entry = TextureIndexEntry(position, size)
+            index.append(entry)
+            position += size
+
+            if not last:
+                clut = read_chunk_size(data, position)
+                if clut is not None and (not clut_flag or (data[position + 3] == TEXTURE_TAG
+                                                            and data[position + 2] == CLUT_FLAG)):
+                    entry.clut_offset = position
+                    entry.clut_size, last = clut
+                    position += entry.clut_size
+            if position + 4 > len(data):
+                break
+    return index
+
+
+# Used by the worker processes, decoding prints a lot
+def init_worker():
+    sys.stdout = open(os.devnull, "w")
+
+
+# Returns (address, texture, clut) from the bytes of one indexed texture (and its CLUT), the texture's palette
+# is set from the CLUT if it has one and is paletted (<= 8 bpp)
+def decode_texture(texture_bytes, clut_bytes=None):
+    (address, texture), last = read_chunk(texture_bytes)
+    clut = None
+    if clut_bytes is not None:
+        (clut_address, clut), last = read_chunk(clut_bytes)
+        if texture is not None and clut is not None and texture.bpp <= 8:
+            texture.palette = Texture.unswizzle_bytes(clut)
+            texture.palette_width = clut.width
+            texture.palette_height = clut.height
+    return address, texture, clut
+
+
+def read_chunk(chunk_bytes):
+    file = io.BytesIO(chunk_bytes)
+    result = Texture.read_texture(file, 0)
+    if file.tell() != len(chunk_bytes):
+        print(f"Texture read {file.tell()} bytes, expected {len(chunk_bytes)} from its DMA tag")
+    return result
+
+
+# Returns [(address, texture, clut)] for each entry of the index, in the same order
+def decode_textures(buffer, index, workers=1):
+    chunks = []
+    for entry in index:
+        texture_bytes = bytes(buffer[entry.offset:entry.offset + entry.size])
+        clut_bytes = None
+        if entry.has_clut():
+            clut_bytes = bytes(buffer[entry.clut_offset:entry.clut_offset + entry.clut_size])
+        chunks.append((texture_bytes, clut_bytes))
+
+    if workers is not None and workers <= 1 or len(chunks) < PARALLEL_MIN_TEXTURES:
+        return [decode_texture(texture_bytes, clut_bytes) for texture_bytes, clut_bytes in chunks]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        return list(pool.map(decode_texture, *zip(*chunks), chunksize=4))
@@ -0,0 +1,225 @@
+
+# Sources of game files for the extractors, either a folder holding the extracted disc or the disc image (.iso) itself
+#
+# Reading from the iso does not copy the files out of it. The iso's directory records are read (using pycdlib)
+# to find where each file is (its extent and size), then each file is read through a memory-mapped view of
+# that part of the image.
+#
+# Paths are relative to the root of the disc, using "/" e.g "FLD/000.BIN"
+
+import io
+import mmap
+import os
+import posixpath
+from pathlib import Path
+
+SECTOR_SIZE = 2048
+
+
+# Opens the given source, which may be a folder or an .iso path (or an already opened source)
+def open_source(source):
+    if isinstance(source, (FolderSource, IsoSource)):
+        return source
+    if is_iso_path(source):
+        return IsoSource(source)
+    return FolderSource(source)
+
+
+def is_iso_path(path):
+    return str(path).lower().endswith(".iso") and os.path.isfile(path)
+
+
+# Opens an entry from a source, or a normal file path, for reading
+def open_entry(entry):
+    if isinstance(entry, SourceEntry):
+        return entry.open()
+    return open(entry, "rb")
+
+
+# Returns the whole of a file opened with open_entry as a read only buffer (e.g for numpy.frombuffer),
+# memory-mapped rather than read in where possible
+def map_file(file):
+    raw = getattr(file, "raw", file)
+    if isinstance(raw, MappedFileView):
+        return raw.get_buffer()
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        # Empty files can't be mapped, nor can files not on disk
+        file.seek(0, os.SEEK_SET)
+        return file.read()
+
+
+class SourceEntry:
+
+    def __init__(self, source, path):
+        self.source = source
+        self.path = path
+        self.name = posixpath.basename(path)
+
+    def is_file(self):
+        return self.source.exists(self.path)
+
+    def open(self):
+        return self.source.open(self.path)
+
+    def get_size(self):
+        return self.source.get_size(self.path)
+
+    def __str__(self):
+        return self.path
+
+    def __fspath__(self):
+        return self.path
+
+
+class FolderSource:
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def is_dir(self, folder):
+        return (self.path / folder).is_dir()
+
+    def exists(self, path):
+        return (self.path / path).is_file()
+
+    def get_entry(self, path):
+        return SourceEntry(self, path)
+
+    # Files (not folders) within the folder, in the same order as os.scandir
+    def list_files(self, folder):
+        entries = []
+        if not self.is_dir(folder):
+            return entries
+        with os.scandir(self.path / folder) as it:
+            for entry in it:
+                if entry.is_file():
+                    entries.append(SourceEntry(self, posixpath.join(folder, entry.name)))
+        return entries
+
+    def open(self, path):
+        return open(self.path / path, "rb")
+
+    def get_size(self, path):
+        return os.path.getsize(self.path / path)
+
+    def close(self):
+        pass
+
+    def __str__(self):
+        return str(self.path)
+
+
+class IsoSource:
+
+    def __init__(self, iso_path):
+        # Only needed for reading the iso
+        import pycdlib
+
+        self.iso_path = iso_path
+        self.files = {}  # path -> (offset, size) in bytes
+        self.folders = {}  # folder -> [file names]
+
+        iso = pycdlib.PyCdlib()
+        iso.open(str(iso_path), 'rb')
+        try:
+            facade = iso.get_iso9660_facade()
+            for dirname, dirlist, filelist in iso.walk(iso_path='/'):
+                folder = dirname.strip('/')
+                names = []
+                for filename in filelist:
+                    record = facade.get_record(posixpath.join(dirname, filename))
+                    # Remove the version e.g ";1"
+                    name = filename.split(';')[0]
+                    names.append(name)
+                    self.files[posixpath.join(folder, name)] = (record.extent_location() * SECTOR_SIZE,
+                                                                record.get_data_length())
+                self.folders[folder] = names
+        finally:
+            iso.close()
+
+        self.fp = open(iso_path, "rb")
+        self.mapped = mmap.mmap(self.fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _normalise(path):
+        return str(path).replace('\\', '/').strip('/')
+
+    def is_dir(self, folder):
+        return self._normalise(folder) in self.folders
+
+    def exists(self, path):
+        return self._normalise(path) in self.files
+
+    def get_entry(self, path):
+        return SourceEntry(self, self._normalise(path))
+
+    def list_files(self, folder):
+        folder = self._normalise(folder)
+        return [SourceEntry(self, posixpath.join(folder, name)) for name in self.folders.get(folder, [])]
+
+    def list_all_files(self):
+        return [SourceEntry(self, path) for path in self.files]
+
+    def open(self, path):
+        path = self._normalise(path)
+        if path not in self.files:
+            raise FileNotFoundError(f"{path} not found in {self.iso_path}")
+        offset, size = self.files[path]
+        return io.BufferedReader(MappedFileView(self.mapped, offset, size))
+
+    def get_size(self, path):
+        return self.files[self._normalise(path)][1]
+
+    def close(self):
+        self.mapped.close()
+        self.fp.close()
+
+    def __str__(self):
+        return str(self.iso_path)
+
+
+# Read only file, for a section of a memory-mapped file
+class MappedFileView(io.RawIOBase):
+
+    def __init__(self, mapped, offset, size):
+        super().__init__()
+        self.mapped = mapped
+        self.offset = offset
+        self.size = size
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        length = max(0, min(len(b), self.size - self.position))
+        start = self.offset + self.position
+        b[:length] = self.mapped[start:start + length]
+        self.position += length
+        return length
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self.position + offset
+        elif whence == os.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence {whence}")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+        self.position = position
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    # The section of the memory-mapped file, without copying it
+    def get_buffer(self):
+        return memoryview(self.mapped)[self.offset:self.offset + self.size]
@@ -0,0 +1,313 @@
+
+# Makes and applies patches between an original disc image (.iso) and a modified copy of it
+#
+# The modding UIs only change files in place (see iso_patch.py), so a modified image only differs
+# from the original in some of its sectors. A patch holds only the changed sectors, grouped in to runs of
+# sectors within one file (using the files' extents on the disc, read with pycdlib), each compressed on its own.
+# Sectors that are not part of any file (e.g directory records) are kept under a file with an empty path.
+#
+# Each changed file has a hash of its whole original, and modified contents, so a patch is only applied
+# to the image it was made for, and the result is checked before anything is written.
+#
+# Patch layout:
+#   Header: 4 byte magic "CQDP", short version, short sector size,
+#           long long original image size, long file count, long run count
+#   Files:  For each file: long first sector, long long size, 32 byte original hash, 32 byte modified hash,
+#           short path length, path (utf-8)
+#   Runs:   For each run: long first sector, long sector count, long file index,
+#           long long data offset (in the patch), long data size, long flags (1 = zlib compressed)
+#   Data for each run
+#
+# All the tables are at the start, so any run can be found without reading the data before it.
+
+import bisect
+import hashlib
+import os
+import shutil
+import struct
+import zlib
+
+from choroq.game_source import IsoSource, SECTOR_SIZE
+from choroq.iso_patch import IsoPatchSession
+
+PATCH_MAGIC = b"CQDP"
+PATCH_VERSION = 1
+PATCH_HEADER = struct.Struct("<4sHHQII")
+PATCH_FILE = struct.Struct("<IQ32s32sH")
+PATCH_RUN = struct.Struct("<IIIQII")
+
+RUN_COMPRESSED = 1
+# Max sectors in a run, so a single run does not need to be read whole for a large file
+MAX_RUN_SECTORS = 256
+# Sectors compared at a time, when looking for changes
+COMPARE_SECTORS = 512
+
+
+class PatchFile:
+
+    def __init__(self, path, sector, size, original_hash=bytes(32), modified_hash=bytes(32)):
+        self.path = path  # "" for sectors not in any file
+        self.sector = sector
+        self.size = size
+        self.original_hash = original_hash
+        self.modified_hash = modified_hash
+        self.runs = []
+
+    def get_sector_count(self):
+        return (self.size + SECTOR_SIZE - 1) // SECTOR_SIZE
+
+    def get_name(self):
+        return self.path if self.path != "" else "<not in a file>"
+
+
+class PatchRun:
+
+    def __init__(self, sector, sector_count, file_index, data_offset=0, data_size=0, flags=0):
+        self.sector = sector
+        self.sector_count = sector_count
+        self.file_index = file_index
+        self.data_offset = data_offset
+        self.data_size = data_size
+        self.flags = flags
+
+    def get_position(self):
+        return self.sector * SECTOR_SIZE
+
+    def get_size(self):
+        return self.sector_count * SECTOR_SIZE
+
+
+class IsoDiffPatch:
+
+    def __init__(self, original_size, files, runs):
+        self.original_size = original_size
+        self.files = files
+        self.runs = runs
+
+    def get_changed_size(self):
+        return sum(run.get_size() for run in self.runs)
+
+    @staticmethod
+    def read(patch_in):
+        magic, version, sector_size, original_size, file_count, run_count = \
+            PATCH_HEADER.unpack(patch_in.read(PATCH_HEADER.size))
+        if magic != PATCH_MAGIC:
+            raise Exception("Not an iso patch")
+        if version != PATCH_VERSION or sector_size != SECTOR_SIZE:
+            raise Exception(f"Unsupported iso patch version {version} (sector size {sector_size})")
+
+        files = []
+        for i in range(file_count):
+            sector, size, original_hash, modified_hash, path_length = PATCH_FILE.unpack(patch_in.read(PATCH_FILE.size))
+            path = patch_in.read(path_length).decode("utf-8")
+            files.append(PatchFile(path, sector, size, original_hash, modified_hash))
+
+        runs = []
+        for i in range(run_count):
+            run = PatchRun(*PATCH_RUN.unpack(patch_in.read(PATCH_RUN.size)))
+            runs.append(run)
+            files[run.file_index].runs.append(run)
+        return IsoDiffPatch(original_size, files, runs)
+
+    @staticmethod
+    def read_run_data(patch_in, run):
+        patch_in.seek(run.data_offset, os.SEEK_SET)
+        data = patch_in.read(run.data_size)
+        if run.flags & RUN_COMPRESSED:
+            data = zlib.decompress(data)
+        if len(data) != run.get_size():
+            raise Exception(f"Patch data for sector {run.sector} is not the expected size")
+        return data
+
+    # Makes a patch from the original and modified image, and writes it to patch_path
+    @staticmethod
+    def create(original_path, modified_path, patch_path):
+        original_size = os.path.getsize(original_path)
+        if os.path.getsize(modified_path) != original_size:
+            raise Exception("The images are not the same size, only in place changes can be patched")
+
+        original_files = IsoDiffPatch.read_extents(original_path)
+        if IsoDiffPatch.read_extents(modified_path) != original_files:
+            raise Exception("Files have been moved/resized in the modified image, only in place changes can be patched")
+
+        changed_sectors = IsoDiffPatch.find_changed_sectors(original_path, modified_path)
+        print(f"Found {len(changed_sectors)} changed sectors")
+
+        # Sorted by where the files are, to look up which file a sector is in
+        extents = sorted((offset // SECTOR_SIZE, size, path) for path, (offset, size) in original_files.items())
+        extent_starts = [extent[0] for extent in extents]
+
+        files = []
+        file_indices = {}
+        runs = []
+        for sector in changed_sectors:
+            i = bisect.bisect_right(extent_starts, sector) - 1
+            if i >= 0 and sector < extents[i][0] + (extents[i][1] + SECTOR_SIZE - 1) // SECTOR_SIZE:
+                start, size, path = extents[i]
+            else:
+                start, size, path = 0, 0, ""
+            if path not in file_indices:
+                file_indices[path] = len(files)
+                files.append(PatchFile(path, start, size))
+            file_index = file_indices[path]
+
+            previous = runs[-1] if len(runs) > 0 else None
+            if (previous is not None and previous.file_index == file_index
+                    and previous.sector + previous.sector_count == sector
+                    and previous.sector_count < MAX_RUN_SECTORS):
+                previous.sector_count += 1
+            else:
+                runs.append(PatchRun(sector, 1, file_index))
+        for run in runs:
+            files[run.file_index].runs.append(run)
+
+        with open(original_path, "rb") as original_in, open(modified_path, "rb") as modified_in:
+            for patch_file in sorted(files, key=lambda f: f.sector):
+                patch_file.original_hash = IsoDiffPatch.hash_file(original_in, patch_file)
+                patch_file.modified_hash = IsoDiffPatch.hash_file(modified_in, patch_file)
+
+            tables_size = PATCH_HEADER.size + PATCH_RUN.size * len(runs)
+            tables_size += sum(PATCH_FILE.size + len(f.path.encode("utf-8")) for f in files)
+            run_data = []
+            data_offset = tables_size
+            for run in runs:
+                modified_in.seek(run.get_position(), os.SEEK_SET)
+                data = modified_in.read(run.get_size())
+                compressed = zlib.compress(data, 9)
+                if len(compressed) < len(data):
+                    data = compressed
+                    run.flags = RUN_COMPRESSED
+                run.data_offset = data_offset
+                run.data_size = len(data)
+                data_offset += len(data)
+                run_data.append(data)
+
+        patch = IsoDiffPatch(original_size, files, runs)
+        with open(patch_path, "wb") as patch_out:
+            patch.write_tables(patch_out)
+            for data in run_data:
+                patch_out.write(data)
+        print(f"Patch has {len(files)} changed files, {len(runs)} runs, {data_offset} bytes")
+        return patch
+
+    def write_tables(self, patch_out):
+        patch_out.write(PATCH_HEADER.pack(PATCH_MAGIC, PATCH_VERSION, SECTOR_SIZE, self.original_size,
+                                          len(self.files), len(self.runs)))
+        for patch_file in self.files:
+            path = patch_file.path.encode("utf-8")
+            patch_out.write(PATCH_FILE.pack(patch_file.sector, patch_file.size, patch_file.original_hash,
+                                            patch_file.modified_hash, len(path)))
+            patch_out.write(path)
+        for run in self.runs:
+            patch_out.write(PATCH_RUN.pack(run.sector, run.sector_count, run.file_index,
+                                           run.data_offset, run.data_size, run.flags))
+
+    # Applies the patch at patch_path to the image, if out_path is given the image is copied there first
+    # Nothing is written unless every changed file matches its original hash, and will match its modified hash
+    @staticmethod
+    def apply(patch_path, iso_path, out_path=None):
+        with open(patch_path, "rb") as patch_in:
+            patch = IsoDiffPatch.read(patch_in)
+            if os.path.getsize(iso_path) != patch.original_size:
+                raise Exception(f"The image is not the same size as the original this patch was made for "
+                                f"{os.path.getsize(iso_path)} != {patch.original_size}")
+
+            # Check and patch each file in memory first, in the order they are on the disc
+            patches = []
+            with open(iso_path, "rb") as iso_in:
+                for patch_file in sorted(patch.files, key=lambda f: f.sector):
+                    patches += IsoDiffPatch.patch_file(patch_in, iso_in, patch_file)
+
+        if out_path is not None:
+            print(f"Copying {iso_path} to {out_path}")
+            shutil.copyfile(iso_path, out_path)
+            iso_path = out_path
+
+        session = IsoPatchSession(iso_path)
+        for position, data, extent_start, extent_size, name in patches:
+            session.add(position, data, extent_start, extent_size, name)
+        session.commit()
+        return patch
+
+    # Returns [(position, data, extent start, extent size, name)] to write for the patch file
+    @staticmethod
+    def patch_file(patch_in, iso_in, patch_file):
+        if patch_file.path == "":
+            # Not in a file, so only the changed sectors are hashed
+            original = bytearray()
+            for run in patch_file.runs:
+                iso_in.seek(run.get_position(), os.SEEK_SET)
+                original += iso_in.read(run.get_size())
+            start = 0
+        else:
+            iso_in.seek(patch_file.sector * SECTOR_SIZE, os.SEEK_SET)
+            original = bytearray(iso_in.read(patch_file.get_sector_count() * SECTOR_SIZE))
+            start = patch_file.sector
+        if IsoDiffPatch.hash_data(original, patch_file) != patch_file.original_hash:
+            raise Exception(f"{patch_file.get_name()} does not match the original this patch was made for")
+
+        writes = []
+        position = 0
+        for run in patch_file.runs:
+            data = IsoDiffPatch.read_run_data(patch_in, run)
+            if patch_file.path != "":
+                position = (run.sector - start) * SECTOR_SIZE
+            original[position:position + len(data)] = data
+            position += len(data)
+            if patch_file.path == "":
+                writes.append((run.get_position(), data, run.get_position(), run.get_size(), "<not in a file>"))
+            else:
+                writes.append((run.get_position(), data, start * SECTOR_SIZE,
+                               patch_file.get_sector_count() * SECTOR_SIZE, patch_file.path))
+        if IsoDiffPatch.hash_data(original, patch_file) != patch_file.modified_hash:
+            raise Exception(f"{patch_file.get_name()} would not match the modified file after patching")
+        return writes
+
+    # Returns {path: (offset, size)} of every file in the image
+    @staticmethod
+    def read_extents(iso_path):
+        source = IsoSource(iso_path)
+        try:
+            return dict(source.files)
+        finally:
+            source.close()
+
+    # Returns the sorted list of sectors that are different between the images
+    @staticmethod
+    def find_changed_sectors(original_path, modified_path):
+        changed = []
+        chunk_size = COMPARE_SECTORS * SECTOR_SIZE
+        sector = 0
+        with open(original_path, "rb") as original_in, open(modified_path, "rb") as modified_in:
+            while True:
+                original = original_in.read(chunk_size)
+                modified = modified_in.read(chunk_size)
+                if len(original) == 0:
+                    break
+                if original != modified:
+                    original_view = memoryview(original)
+                    modified_view = memoryview(modified)
+                    for i in range(0, len(original), SECTOR_SIZE):
+                        if original_view[i:i + SECTOR_SIZE] != modified_view[i:i + SECTOR_SIZE]:
+                            changed.append(sector + i // SECTOR_SIZE)
+                sector += len(original) // SECTOR_SIZE
+        return changed
+
+    @staticmethod
+    def hash_file(iso_in, patch_file):
+        if patch_file.path == "":
+            data = bytearray()
+            for run in patch_file.runs:
+                iso_in.seek(run.get_position(), os.SEEK_SET)
+                data += iso_in.read(run.get_size())
+        else:
+            iso_in.seek(patch_file.sector * SECTOR_SIZE, os.SEEK_SET)
+            data = iso_in.read(patch_file.get_sector_count() * SECTOR_SIZE)
+        return IsoDiffPatch.hash_data(data, patch_file)
+
+    # Hashes the file's data (not the padding to the end of its last sector)
+    @staticmethod
+    def hash_data(data, patch_file):
+        if patch_file.path != "":
+            data = memoryview(data)[:patch_file.size]
+        return hashlib.sha256(data).digest()
@@ -0,0 +1,138 @@
+
+# Index of the files in a disc image (.iso) that the modding UIs show, saved so reopening the same image is quick
+#
+# The image's directories are walked once (with pycdlib), each file's path is checked against all the
+# patterns at once (one compiled alternation), and the directory records are taken from the walk, instead of
+# looking each file up again.
+#
+# The index (matched paths, extents and sizes, and any CPK subfile tables, see bhe/moddingui) is saved to a
+# json file, with the image's size, modified time and a hash of its volume descriptors. It is only used again
+# if all of these (and the patterns) match, so replacing data in the image (which changes the modified time)
+# makes it be rebuilt.
+
+import hashlib
+import json
+import os
+import re
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_PATH = "iso_index.json"
+SECTOR_SIZE = 2048
+# Primary volume descriptor, and the descriptor after it
+HEADER_START = 16 * SECTOR_SIZE
+HEADER_SIZE = 2 * SECTOR_SIZE
+
+
+# Returns a single compiled pattern, matching any of the patterns, the group "p<index>" is set for the match
+def compile_patterns(patterns):
+    return re.compile("|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(patterns)))
+
+
+# Returns the index of the pattern that matched
+def get_pattern_index(match):
+    return int(match.lastgroup[1:])
+
+
+class IsoIndex:
+
+    def __init__(self, key, patterns, folders, cpks=None):
+        self.key = key
+        self.patterns = patterns
+        self.folders = folders  # dirname -> [(filename, pattern index, extent, size)]
+        self.cpks = cpks if cpks is not None else {}  # path -> CPK subfile table (see bhe/moddingui)
+        self.records = {}  # path -> DirectoryRecord, for the currently open image
+
+    # Returns [size, modified time, header hash] for the image
+    @staticmethod
+    def get_key(iso_path):
+        stat = os.stat(iso_path)
+        with open(iso_path, "rb") as iso_in:
+            iso_in.seek(HEADER_START, os.SEEK_SET)
+            header_hash = hashlib.sha1(iso_in.read(HEADER_SIZE)).hexdigest()
+        return [stat.st_size, stat.st_mtime_ns, header_hash]
+
+    # Walks the whole image, matching each file against patterns
+    @staticmethod
+    def build(iso, iso_path, patterns):
+        matcher = compile_patterns(patterns)
+        facade = iso.get_iso9660_facade()
+        folders = {}
+        records = {}
+        dirnames = ["/"]
+        while len(dirnames) > 0:
+            dirname = dirnames.pop()
+            matched = []
+            for record in facade.list_children(iso_path=dirname):
+                if record.is_dot() or record.is_dotdot():
+                    continue
+                name = record.file_identifier().decode("ascii")
+                if record.is_dir():
+                    dirnames.append(f"{dirname.rstrip('/')}/{name}")
+                    continue
+                path = f"{dirname}/{name}"
+                match = matcher.match(path)
+                if match is not None:
+                    matched.append((name, get_pattern_index(match), record.orig_extent_loc, record.data_length))
+                    records[path] = record
+            # Grouped by pattern, in the order the patterns were given
+            matched.sort(key=lambda file: file[1])
+            folders[dirname] = matched
+
+        index = IsoIndex(IsoIndex.get_key(iso_path), list(patterns), folders)
+        index.records = records
+        print(f"Indexed {sum(len(files) for files in folders.values())} files in {len(folders)} folders")
+        return index
+
+    # Returns the saved index if it is for this image and patterns, otherwise None
+    @staticmethod
+    def load(index_path, iso_path, patterns):
+        if not os.path.exists(index_path):
+            return None
+        try:
+            with open(index_path, "r") as index_in:
+                saved = json.load(index_in)
+            if saved.get("version") != INDEX_VERSION or saved["patterns"] != list(patterns):
+                return None
+            if saved["iso_path"] != os.path.abspath(iso_path) or saved["key"] != IsoIndex.get_key(iso_path):
+                return None
+            folders = {dirname: [tuple(file) for file in files] for dirname, files in saved["folders"].items()}
+            return IsoIndex(saved["key"], saved["patterns"], folders, saved["cpks"])
+        except Exception as e:
+            print(f"Failed to load the iso index {index_path}: {e}")
+            return None
+
+    # Returns the saved index if it can be used, otherwise walks the image, and saves its index
+    @staticmethod
+    def open(iso, iso_path, patterns, index_path=DEFAULT_INDEX_PATH):
+        index = IsoIndex.load(index_path, iso_path, patterns)
+        if index is not None:
+            print(f"Using the saved iso index {index_path}")
+            return index
+        index = IsoIndex.build(iso, iso_path, patterns)
+        index.save(index_path, iso_path)
+        return index
+
+    def save(self, index_path, iso_path):
+        saved = {
+            "version": INDEX_VERSION,
+            "iso_path": os.path.abspath(iso_path),
+            "key": self.key,
+            "patterns": self.patterns,
+            "folders": self.folders,
+            "cpks": self.cpks,
+        }
+        try:
+            with open(index_path, "w") as index_out:
+                json.dump(saved, index_out)
+        except Exception as e:
+            print(f"Failed to save the iso index {index_path}: {e}")
+
+    # Returns the record for a matched path, only the folders needed are listed (once) from a loaded index
+    def get_record(self, iso, dirname, filename):
+        path = f"{dirname}/{filename}"
+        if path not in self.records:
+            facade = iso.get_iso9660_facade()
+            for record in facade.list_children(iso_path=dirname):
+                if not (record.is_dot() or record.is_dotdot() or record.is_dir()):
+                    self.records[f"{dirname}/{record.file_identifier().decode('ascii')}"] = record
+        return self.records[path]
@@ -0,0 +1,179 @@
+
+# Writes replacement data (patches) into a disc image (.iso) in place, as a batch
+#
+# Patches are queued with add/add_entry, and only written on commit. Before anything is written, every patch
+# is checked to fit within its file (extent) and the image, and that no two patches overlap.
+# Patches are then written in the order they are in the image, in one pass with one fsync at the end.
+#
+# An undo journal of the original bytes (under each patch) is written (and synced) next to the image before
+# the image is changed. If writing fails, the original bytes are put back. If the program is stopped part way,
+# the journal is left behind, and recover puts the original bytes back the next time the image is opened.
+#
+# Journal layout:
+#   4 byte magic "CQPJ", long long image size, long patch count
+#   For each patch: long long position, long size, original bytes
+#   4 byte end marker "CQPE", only present once the whole journal has been written
+
+import os
+import struct
+
+JOURNAL_MAGIC = b"CQPJ"
+JOURNAL_END = b"CQPE"
+JOURNAL_HEADER = struct.Struct("<4sQI")
+JOURNAL_ENTRY = struct.Struct("<QI")
+
+
+def get_journal_path(iso_path):
+    return str(iso_path) + ".journal"
+
+
+class IsoPatch:
+
+    def __init__(self, position, data, extent_start, extent_size, name):
+        self.position = position  # In the image
+        self.data = data
+        self.extent_start = extent_start  # The file (or part of a file) being replaced, in the image
+        self.extent_size = extent_size
+        self.name = name
+
+    def get_end(self):
+        return self.position + len(self.data)
+
+    def __str__(self):
+        return f"{self.name} ({len(self.data)} bytes @ {self.position})"
+
+
+class IsoPatchSession:
+
+    def __init__(self, iso_path, journal_path=None):
+        self.iso_path = iso_path
+        self.journal_path = journal_path if journal_path is not None else get_journal_path(iso_path)
+        self.patches = []
+
+    # Queues data to be written at position in the image, which must be within extent_size bytes of extent_start
+    def add(self, position, data, extent_start, extent_size, name=""):
+        self.patches.append(IsoPatch(position, bytes(data), extent_start, extent_size, name))
+
+    # Queues data to be written offset bytes into the entry (any ui entry with get_offset and get_size)
+    def add_entry(self, entry, data, offset=0):
+        self.add(entry.get_offset() + offset, data, entry.get_offset(), entry.get_size(), entry.basename)
+
+    def get_size(self):
+        return sum(len(patch.data) for patch in self.patches)
+
+    # Raises an exception if the image cannot be opened for writing
+    def check_writable(self):
+        with open(self.iso_path, "r+b"):
+            pass
+
+    # Returns a list of problems, empty if every patch can be written
+    def validate(self):
+        problems = []
+        iso_size = os.path.getsize(self.iso_path)
+        for patch in self.patches:
+            if patch.extent_size < 0 or patch.extent_start < 0:
+                problems.append(f"{patch} is not in the image")
+            elif patch.position < patch.extent_start:
+                problems.append(f"{patch} starts before its file @ {patch.extent_start}")
+            elif patch.get_end() > patch.extent_start + patch.extent_size:
+                problems.append(f"{patch} is larger than its file, "
+                                f"{patch.get_end() - patch.extent_start} > {patch.extent_size} bytes")
+            elif patch.get_end() > iso_size:
+                problems.append(f"{patch} runs past the end of the image")
+
+        ordered = sorted(self.patches, key=lambda p: p.position)
+        for previous, patch in zip(ordered, ordered[1:]):
+            if patch.position < previous.get_end():
+                problems.append(f"{patch} overlaps {previous}")
+        return problems
+
+    # Writes all the queued patches, raises an exception (after undoing any writes) if they could not be written
+    def commit(self):
+        if os.path.exists(self.journal_path):
+            raise Exception(f"A patch journal already exists, recover the image first {self.journal_path}")
+        problems = self.validate()
+        if len(problems) > 0:
+            raise Exception("Patches are not valid:\n" + "\n".join(problems))
+        if len(self.patches) == 0:
+            return 0
+
+        ordered = sorted(self.patches, key=lambda p: p.position)
+        with open(self.iso_path, "r+b") as iso:
+            originals = []
+            for patch in ordered:
+                iso.seek(patch.position, os.SEEK_SET)
+                originals.append(iso.read(len(patch.data)))
+            IsoPatchSession.write_journal(self.journal_path, os.fstat(iso.fileno()).st_size, ordered, originals)
+
+            print(f"Writing {len(ordered)} patches ({self.get_size()} bytes) to {self.iso_path}")
+            try:
+                for patch in ordered:
+                    iso.seek(patch.position, os.SEEK_SET)
+                    if iso.write(patch.data) < len(patch.data):
+                        raise Exception(f"Failed to write {patch}, did not write full size")
+                iso.flush()
+                os.fsync(iso.fileno())
+            except Exception as e:
+                print(f"Failed to write patches, undoing changes: {e}")
+                IsoPatchSession.write_originals(iso, [(patch.position, original)
+                                                      for patch, original in zip(ordered, originals)])
+                os.remove(self.journal_path)
+                raise
+
+        os.remove(self.journal_path)
+        return len(ordered)
+
+    @staticmethod
+    def write_journal(journal_path, iso_size, patches, originals):
+        with open(journal_path, "wb") as journal:
+            journal.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, iso_size, len(patches)))
+            for patch, original in zip(patches, originals):
+                journal.write(JOURNAL_ENTRY.pack(patch.position, len(original)))
+                journal.write(original)
+            journal.write(JOURNAL_END)
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    # Returns [(position, original bytes)], or None if the journal was not completely written
+    # (in which case the image was not changed)
+    @staticmethod
+    def read_journal(journal_path):
+        with open(journal_path, "rb") as journal:
+            data = journal.read()
+        if len(data) < JOURNAL_HEADER.size + len(JOURNAL_END) or not data.endswith(JOURNAL_END):
+            return None
+        magic, iso_size, count = JOURNAL_HEADER.unpack_from(data, 0)
+        if magic != JOURNAL_MAGIC:
+            raise Exception(f"Not a patch journal {journal_path}")
+        entries = []
+        position = JOURNAL_HEADER.size
+        for i in range(count):
+            patch_position, size = JOURNAL_ENTRY.unpack_from(data, position)
+            position += JOURNAL_ENTRY.size
+            entries.append((patch_position, data[position:position + size]))
+            position += size
+        return entries
+
+    @staticmethod
+    def write_originals(iso, entries):
+        for position, original in entries:
+            iso.seek(position, os.SEEK_SET)
+            iso.write(original)
+        iso.flush()
+        os.fsync(iso.fileno())
+
+    # Puts back the original bytes from a journal left by an unfinished commit
+    # Returns True if the image was restored
+    @staticmethod
+    def recover(iso_path, journal_path=None):
+        if journal_path is None:
+            journal_path = get_journal_path(iso_path)
+        if not os.path.exists(journal_path):
+            return False
+        entries = IsoPatchSession.read_journal(journal_path)
+        if entries is not None:
+            print(f"Restoring {len(entries)} original parts of {iso_path} from {journal_path}")
+            with open(iso_path, "r+b") as iso:
+                IsoPatchSession.write_originals(iso, entries)
+        os.remove(journal_path)
+        return entries is not None
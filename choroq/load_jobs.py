@@ -0,0 +1,166 @@
+
+# Jobs that load files on background threads, then upload what was loaded (e.g to the GPU) on the render thread
+#
+# A job's load function is run on one of the loader's threads, it is given the job and returns what it loaded
+# (e.g numpy arrays). Long loads should check job.cancelled between steps, returning early once it is set, and
+# can set job.progress (0 to 1) for the UI.
+#
+# The upload function is called on the render thread (from Loader.update, at the start of each frame) with the
+# job and what was loaded. It can be a generator that yields between steps (e.g after each mesh), then only as
+# many steps as fit in the frame's time budget are run each frame, so a large model does not stall the frame.
+# If the job is cancelled part way through its upload the generator is closed, which raises GeneratorExit at
+# the yield, so it can unload what it had uploaded.
+#
+# Threads are used rather than processes, as what is loaded is handed straight to the render thread (raylib
+# can only be used from there), and python switches between the threads often enough to keep the UI responsive.
+
+import inspect
+import queue
+import threading
+import time
+
+from choroq.profiler import profiler, UPLOAD
+
+PENDING = "pending"  # Waiting for a loader thread
+LOADING = "loading"  # load running on a loader thread
+UPLOADING = "uploading"  # upload running on the render thread
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+LOADER_THREADS = 2
+# Seconds per frame spent uploading, a quarter of a frame at 60fps
+UPLOAD_BUDGET = 0.004
+
+
+class LoadJob:
+
+    def __init__(self, name, load, upload=None):
+        self.name = name
+        self.load = load
+        self.upload = upload
+        self.state = PENDING
+        self.progress = 0.0
+        self.cancelled = False
+        self.result = None  # What load returned, until it is uploaded
+        self.steps = None  # The upload generator, while uploading
+
+    # The job is dropped at its next step, e.g when the user has picked something else to view
+    def cancel(self):
+        self.cancelled = True
+
+    def is_finished(self):
+        return self.state in [DONE, CANCELLED, FAILED]
+
+
+class Loader:
+
+    def __init__(self, thread_count=LOADER_THREADS, budget=UPLOAD_BUDGET):
+        self.budget = budget
+        self.pending = queue.Queue()  # Jobs waiting for a loader thread
+        self.loaded = queue.Queue()  # Jobs loaded, not yet seen by the render thread
+
+        # Only used on the render thread
+        self.jobs = []  # Submitted jobs that have not finished, in the order they were submitted
+        self.uploading = []
+        self.spent = 0.0  # Seconds spent uploading this frame
+
+        self.threads = [threading.Thread(target=self.work, daemon=True) for i in range(thread_count)]
+        for thread in self.threads:
+            thread.start()
+
+    # load(job) runs on a loader thread, upload(job, loaded) on the render thread (see above)
+    def submit(self, name, load, upload=None):
+        job = LoadJob(name, load, upload)
+        profiler.clear_load_times(name)
+        self.jobs.append(job)
+        self.pending.put(job)
+        return job
+
+    # Runs on each loader thread
+    def work(self):
+        while True:
+            job = self.pending.get()
+            if job is None:
+                return
+            if job.cancelled:
+                job.state = CANCELLED
+                continue
+            job.state = LOADING
+            try:
+                job.result = job.load(job)
+            except Exception as e:
+                print(f"Failed to load {job.name}: {e}")
+                job.state = FAILED
+                continue
+            self.loaded.put(job)
+
+    # Called at the start of each frame on the render thread, runs upload steps until the frame's budget is spent
+    def update(self):
+        self.spent = 0.0
+        while not self.loaded.empty():
+            self.uploading.append(self.loaded.get_nowait())
+
+        start = time.perf_counter()
+        # At least one step each frame, so a step longer than the whole budget is still run
+        steps = 0
+        while len(self.uploading) > 0 and (steps == 0 or time.perf_counter() - start < self.budget):
+            job = self.uploading[0]
+            if job.cancelled:
+                if job.steps is not None:
+                    job.steps.close()
+                self.finish(job, CANCELLED)
+            else:
+                self.step(job)
+            steps += 1
+        self.spent = time.perf_counter() - start
+
+        self.jobs = [job for job in self.jobs if not job.is_finished()]
+
+    # Runs the job's next upload step, the job is finished once its upload returns
+    def step(self, job):
+        with profiler.stage(job.name, UPLOAD):
+            self.run_step(job)
+
+    def run_step(self, job):
+        try:
+            if job.steps is None:
+                job.state = UPLOADING
+                steps = job.upload(job, job.result) if job.upload is not None else None
+                if not inspect.isgenerator(steps):
+                    # Not a generator, so the upload was done in one step
+                    self.finish(job, DONE)
+                    return
+                job.steps = steps
+            next(job.steps)
+        except StopIteration:
+            self.finish(job, DONE)
+        except Exception as e:
+            print(f"Failed to upload {job.name}: {e}")
+            self.finish(job, FAILED)
+
+    def finish(self, job, state):
+        if job in self.uploading:
+            self.uploading.remove(job)
+        job.state = state
+        job.result = None
+        job.steps = None
+
+    # Other uploads on the render thread (e.g streaming a course's chunks) share the frame's budget,
+    # checking has_budget before uploading, then adding the time taken with spend
+    def has_budget(self):
+        return self.spent < self.budget
+
+    def spend(self, seconds):
+        self.spent += seconds
+
+    # The jobs still loading or uploading
+    def get_active_jobs(self):
+        return [job for job in self.jobs if not job.is_finished()]
+
+    # Cancels every job and stops the loader threads (once their current job returns)
+    def close(self):
+        for job in self.jobs:
+            job.cancel()
+        for thread in self.threads:
+            self.pending.put(None)
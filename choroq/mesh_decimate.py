@@ -0,0 +1,196 @@
+
+# Simplifies an indexed triangle mesh, using quadric error edge collapses (Garland & Heckbert)
+#
+# Each collapse is a half-edge collapse, a vertex is merged into one of its neighbours which stays where it is.
+# This means no new vertices are made, so UVs and colours never have to be interpolated, the cost of
+# moving a vertex's triangles onto a neighbour with different UVs/colours is added to its error instead.
+#
+# Vertices that are on a UV/colour seam (the same position used by more than one vertex) or on the border
+# of the mesh are never removed, so seams and outlines stay exactly where they are.
+#
+# Collapses that would flip a triangle, or join two parts of the mesh together (non-manifold), are skipped.
+#
+# positions:  [(x, y, z)] per vertex
+# attributes: [(...)] per vertex, e.g (u, v, r, g, b) compared when collapsing, or None
+# triangles:  [(a, b, c)] vertex indices
+
+import heapq
+import math
+
+
+# Returns (triangles, error) with at most target_count triangles if possible, error is the largest
+# distance (approx) moved by any collapse
+def decimate(positions, attributes, triangles, target_count, attribute_weight=1.0):
+    tris = [list(t) for t in triangles if t[0] != t[1] and t[1] != t[2] and t[2] != t[0]]
+    tri_count = len(tris)
+    if tri_count <= target_count:
+        return [tuple(t) for t in tris], 0.0
+
+    vertex_tris = {}
+    for t, tri in enumerate(tris):
+        for v in tri:
+            vertex_tris.setdefault(v, set()).add(t)
+
+    quadrics = {v: [0.0] * 10 for v in vertex_tris}
+    for tri in tris:
+        plane = _plane(positions, tri)
+        if plane is None:
+            continue
+        q = _plane_quadric(plane)
+        for v in tri:
+            _add_quadric(quadrics[v], q)
+
+    locked = _locked_vertices(positions, tris, vertex_tris)
+
+    queue = []
+    for tri in tris:
+        for i in range(3):
+            _push_collapses(queue, tri[i], tri[(i + 1) % 3], positions, attributes, quadrics, locked, attribute_weight)
+
+    max_error = 0.0
+    while tri_count > target_count and queue:
+        cost, u, v = heapq.heappop(queue)
+        if u not in vertex_tris or v not in vertex_tris:
+            continue  # One has already been removed
+        shared = vertex_tris[u] & vertex_tris[v]
+        if len(shared) == 0:
+            continue  # No longer an edge
+        current = _collapse_cost(u, v, positions, attributes, quadrics, attribute_weight)
+        if current > cost + 1e-12:
+            heapq.heappush(queue, (current, u, v))
+            continue
+        if not _can_collapse(u, v, shared, tris, vertex_tris, positions):
+            continue
+
+        # Move u's triangles on to v, removing the ones on the edge
+        for t in vertex_tris[u]:
+            tri = tris[t]
+            if t in shared:
+                for w in tri:
+                    if w != u:
+                        vertex_tris[w].discard(t)
+                tris[t] = None
+                tri_count -= 1
+            else:
+                tri[tri.index(u)] = v
+                vertex_tris[v].add(t)
+        del vertex_tris[u]
+        _add_quadric(quadrics[v], quadrics[u])
+        max_error = max(max_error, math.sqrt(max(0.0, _quadric_error(quadrics[u], positions[v]))))
+
+        for w in _neighbours(v, tris, vertex_tris):
+            _push_collapses(queue, v, w, positions, attributes, quadrics, locked, attribute_weight)
+
+    return [tuple(t) for t in tris if t is not None], max_error
+
+
+def _locked_vertices(positions, tris, vertex_tris):
+    locked = set()
+    # Border edges are only used by one triangle
+    edge_counts = {}
+    for tri in tris:
+        for i in range(3):
+            a, b = tri[i], tri[(i + 1) % 3]
+            key = (a, b) if a < b else (b, a)
+            edge_counts[key] = edge_counts.get(key, 0) + 1
+    for (a, b), count in edge_counts.items():
+        if count != 2:
+            locked.add(a)
+            locked.add(b)
+    # Seams, where the same position has more than one vertex
+    by_position = {}
+    for v in vertex_tris:
+        by_position.setdefault(tuple(positions[v]), []).append(v)
+    for same in by_position.values():
+        if len(same) > 1:
+            locked.update(same)
+    return locked
+
+
+def _push_collapses(queue, a, b, positions, attributes, quadrics, locked, attribute_weight):
+    if a not in locked:
+        heapq.heappush(queue, (_collapse_cost(a, b, positions, attributes, quadrics, attribute_weight), a, b))
+    if b not in locked:
+        heapq.heappush(queue, (_collapse_cost(b, a, positions, attributes, quadrics, attribute_weight), b, a))
+
+
+# Cost of merging u into v
+def _collapse_cost(u, v, positions, attributes, quadrics, attribute_weight):
+    q = list(quadrics[u])
+    _add_quadric(q, quadrics[v])
+    cost = _quadric_error(q, positions[v])
+    if attributes is not None:
+        cost += attribute_weight * sum((a - b) ** 2 for a, b in zip(attributes[u], attributes[v]))
+    return max(0.0, cost)
+
+
+def _can_collapse(u, v, shared, tris, vertex_tris, positions):
+    # Link condition, the only neighbours in common should be the ones on the shared triangles
+    # otherwise the collapse would pinch the mesh together
+    opposite = set()
+    for t in shared:
+        for w in tris[t]:
+            if w != u and w != v:
+                opposite.add(w)
+    if (_neighbours(u, tris, vertex_tris) & _neighbours(v, tris, vertex_tris)) != opposite:
+        return False
+
+    # No triangle should flip over
+    for t in vertex_tris[u]:
+        if t in shared:
+            continue
+        tri = tris[t]
+        before = _normal(positions, tri)
+        after = _normal(positions, [v if w == u else w for w in tri])
+        if before[0] * after[0] + before[1] * after[1] + before[2] * after[2] <= 0:
+            return False
+    return True
+
+
+def _neighbours(v, tris, vertex_tris):
+    neighbours = set()
+    for t in vertex_tris[v]:
+        neighbours.update(tris[t])
+    neighbours.discard(v)
+    return neighbours
+
+
+def _normal(positions, tri):
+    ax, ay, az = positions[tri[0]]
+    bx, by, bz = positions[tri[1]]
+    cx, cy, cz = positions[tri[2]]
+    ux, uy, uz = bx - ax, by - ay, bz - az
+    vx, vy, vz = cx - ax, cy - ay, cz - az
+    return uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+
+
+def _plane(positions, tri):
+    nx, ny, nz = _normal(positions, tri)
+    length = math.sqrt(nx * nx + ny * ny + nz * nz)
+    if length == 0:
+        return None
+    nx, ny, nz = nx / length, ny / length, nz / length
+    px, py, pz = positions[tri[0]]
+    return nx, ny, nz, -(nx * px + ny * py + nz * pz)
+
+
+# Symmetric 4x4 matrix of the plane, stored as the upper triangle
+def _plane_quadric(plane):
+    a, b, c, d = plane
+    return [a * a, a * b, a * c, a * d,
+            b * b, b * c, b * d,
+            c * c, c * d,
+            d * d]
+
+
+def _add_quadric(q, other):
+    for i in range(10):
+        q[i] += other[i]
+
+
+def _quadric_error(q, position):
+    x, y, z = position
+    return (q[0] * x * x + 2 * q[1] * x * y + 2 * q[2] * x * z + 2 * q[3] * x
+            + q[4] * y * y + 2 * q[5] * y * z + 2 * q[6] * y
+            + q[7] * z * z + 2 * q[8] * z
+            + q[9])
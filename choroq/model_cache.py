@@ -0,0 +1,363 @@
+# Cache of parsed models (CarModel/CourseModel etc), so a file only needs to go through the
+# DMA/VIF/GIF parsing once. Each parsed model is stored in the cache folder as a folder of its own, keyed by the
+# hash of the file's contents, the parser used (and its args) and PARSER_VERSION.
+#
+# Nothing is pickled, as loading a pickle can run code if the cache folder has been tampered with.
+# The geometry (MeshBuffers), texture bytes and long lists of numbers go into a few flat numpy arrays,
+# one per type, each saved as a .npy file, and the rest of the model is stored as JSON (model.json) that
+# refers to slices of them. Only classes from the choroq package are rebuilt from it, by setting their attributes.
+#
+# The .npy files are memory-mapped when loading, so only the slices used are read, and each is copied once,
+# into the array of its MeshBuffer (or bytes/list), as the models need their own (writable) arrays.
+#
+# The cache is limited in size, once over max_size the least recently used entries are removed.
+# The modified time of each entry (folder) is updated when it is used, and is used to track this.
+#
+# Usage:
+#   with open(path, "rb") as f:
+#       car = model_cache.load(f, CarModel.read_car, 0, file_size)
+
+import hashlib
+import importlib
+import json
+import os
+import re
+import shutil
+import tempfile
+from array import array
+from pathlib import Path
+
+import numpy as np
+
+from choroq.egame.amesh import MeshBuffer
+
+# Increase this whenever the output of any of the parsers change, so old entries are not used
+PARSER_VERSION = 1
+
+DEFAULT_CACHE_FOLDER = Path.home() / ".cache" / "roadtrip-choroq-tools" / "models"
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024  # 1GB
+CACHE_EXTENSION = ".model"
+# Entries written by older versions, these are never loaded, only removed
+OLD_CACHE_EXTENSIONS = [".pickle", ".npz"]
+# Only classes from these packages are rebuilt when loading
+ALLOWED_PACKAGES = ["choroq."]
+# Lists of numbers at least this long are stored in the arrays rather than the JSON
+MIN_ARRAY_LIST = 64
+MODEL_FILE = "model.json"
+# Names of the array files, these are named by number rather than typecode, as typecodes differ only by case
+POOL_FILE_PATTERN = re.compile(r"pool_[0-9]+\.npy")
+
+
+class ModelCache:
+
+    def __init__(self, folder=DEFAULT_CACHE_FOLDER, max_size=DEFAULT_MAX_SIZE, enabled=True):
+        self.folder = Path(folder)
+        self.max_size = max_size
+        self.enabled = enabled
+
+    # Returns parse(file, *args), using the cached copy if there is one
+    def load(self, file, parse, *args):
+        if not self.enabled:
+            return parse(file, *args)
+
+        path = self.folder / (self.get_key(file, parse, args) + CACHE_EXTENSION)
+        if path.exists():
+            try:
+                with open(path / MODEL_FILE, "r", encoding="utf-8") as fin:
+                    saved = json.load(fin)
+                model = ModelDecoder(path, saved["pools"]).decode(saved["model"])
+                # Mark as recently used
+                os.utime(path)
+                print(f"Loaded {parse.__qualname__} from cache {path.name}")
+                return model
+            except (OSError, EOFError, ValueError, KeyError, TypeError, IndexError, AttributeError,
+                    ImportError) as e:
+                # Broken, or written by a different version of the classes
+                print(f"Failed to load cached model {path.name}, parsing again: {e}")
+                self._remove(path)
+
+        file.seek(0, os.SEEK_SET)
+        model = parse(file, *args)
+        self.store(path, model)
+        return model
+
+    @staticmethod
+    def get_key(file, parse, args):
+        file.seek(0, os.SEEK_SET)
+        file_hash = hashlib.sha1()
+        while True:
+            data = file.read(1024 * 1024)
+            if not data:
+                break
+            file_hash.update(data)
+        file.seek(0, os.SEEK_SET)
+
+        key = hashlib.sha1(f"{parse.__module__}.{parse.__qualname__}{args}{PARSER_VERSION}".encode("utf-8"))
+        key.update(file_hash.digest())
+        return f"{parse.__qualname__}-{key.hexdigest()}"
+
+    def store(self, path, model):
+        try:
+            self.folder.mkdir(parents=True, exist_ok=True)
+            encoded = ModelEncoder().encode_files(model)
+            # Write to a temporary folder first, so a partly written entry is never used
+            temp_path = Path(tempfile.mkdtemp(dir=self.folder, suffix=".tmp"))
+            try:
+                for name, values in encoded.items():
+                    if name == MODEL_FILE:
+                        with open(temp_path / name, "w", encoding="utf-8") as fout:
+                            fout.write(values)
+                    else:
+                        # allow_pickle=False, as these only hold numbers
+                        np.save(temp_path / name, values, allow_pickle=False)
+                os.replace(temp_path, path)
+            except OSError:
+                self._remove(temp_path)
+                raise
+        except (OSError, TypeError, ValueError, OverflowError) as e:
+            print(f"Failed to cache model {path.name}: {e}")
+            return
+        self.evict()
+
+    # Remove the least recently used entries, until the cache fits in max_size
+    def evict(self):
+        for extension in OLD_CACHE_EXTENSIONS:
+            for path in self.folder.glob("*" + extension):
+                self._remove(path)
+
+        entries = []
+        total_size = 0
+        for path in self.folder.glob("*" + CACHE_EXTENSION):
+            try:
+                mtime = path.stat().st_mtime
+                size = sum(file.stat().st_size for file in path.iterdir())
+            except OSError:
+                continue
+            entries.append((mtime, size, path))
+            total_size += size
+
+        entries.sort()
+        for mtime, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            print(f"Removing old cached model {path.name}")
+            self._remove(path)
+            total_size -= size
+
+    def clear(self):
+        for path in self.folder.glob("*" + CACHE_EXTENSION):
+            self._remove(path)
+        for extension in OLD_CACHE_EXTENSIONS:
+            for path in self.folder.glob("*" + extension):
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            if path.is_dir():
+                shutil.rmtree(path)
+            else:
+                path.unlink()
+        except OSError:
+            pass
+
+
+# Turns a model into JSON friendly values, with the large runs of numbers/bytes moved into one flat array per type.
+# Anything that is not a str/int/float/bool/None/list is a dict with a single "$" key saying what it is, e.g
+#   {"$buffer": ["d", start, count], "width": 3} for a MeshBuffer, using count items of the "d" array from start
+#   {"$object": "choroq.egame.car.CarMesh", "attributes": {...}}
+class ModelEncoder:
+
+    def __init__(self):
+        # typecode -> ([bytes], item count)
+        self.pools = {}
+
+    # Returns {file name: contents} to save for the model, the JSON (str) under MODEL_FILE and an array for
+    # each pool, empty pools are not saved
+    def encode_files(self, model):
+        encoded = self.encode(model)
+        files = {}
+        pool_files = {}
+        for typecode, (chunks, count) in self.pools.items():
+            if count == 0:
+                continue
+            name = f"pool_{len(pool_files)}.npy"
+            pool_files[typecode] = name
+            files[name] = np.frombuffer(b"".join(chunks), dtype=np.dtype(typecode))
+        files[MODEL_FILE] = json.dumps({"pools": pool_files, "model": encoded}, separators=(",", ":"),
+                                       allow_nan=True)
+        return files
+
+    # Adds the bytes of count items of typecode to its array, returns [typecode, start, count]
+    def add_to_pool(self, typecode, data, count):
+        chunks, start = self.pools.get(typecode, ([], 0))
+        chunks.append(data)
+        self.pools[typecode] = (chunks, start + count)
+        return [typecode, start, count]
+
+    def encode(self, value):
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        if isinstance(value, int):
+            return int(value)
+        if isinstance(value, float):
+            return float(value)
+        if isinstance(value, MeshBuffer):
+            return {"$buffer": self.encode_array(value.data), "width": value.width}
+        if isinstance(value, array):
+            return {"$array": self.encode_array(value)}
+        if isinstance(value, (bytes, bytearray)):
+            return {"$bytes": self.add_to_pool("B", bytes(value), len(value)), "mutable": isinstance(value, bytearray)}
+        if isinstance(value, list):
+            numbers = self.encode_numbers(value)
+            if numbers is not None:
+                return {"$list": numbers}
+            return [self.encode(v) for v in value]
+        if isinstance(value, tuple):
+            return {"$tuple": [self.encode(v) for v in value]}
+        if isinstance(value, dict):
+            return {"$dict": [[self.encode(k), self.encode(v)] for k, v in value.items()]}
+        if isinstance(value, (set, frozenset)):
+            return {"$set": [self.encode(v) for v in value], "frozen": isinstance(value, frozenset)}
+        return self.encode_object(value)
+
+    def encode_array(self, values):
+        if values.typecode == "u":
+            raise TypeError("Cannot cache unicode arrays")
+        return self.add_to_pool(values.typecode, values.tobytes(), len(values))
+
+    # Returns the pool reference for a long list of only ints or only floats, otherwise None
+    def encode_numbers(self, values):
+        if len(values) < MIN_ARRAY_LIST:
+            return None
+        if all(type(v) is float for v in values):
+            return self.add_to_pool("d", array("d", values).tobytes(), len(values))
+        if all(type(v) is int for v in values):
+            try:
+                return self.add_to_pool("q", array("q", values).tobytes(), len(values))
+            except OverflowError:
+                return None
+        return None
+
+    def encode_object(self, value):
+        cls = type(value)
+        name = f"{cls.__module__}.{cls.__qualname__}"
+        if not is_allowed_class(cls.__module__):
+            raise TypeError(f"Cannot cache {name}")
+        attributes = {}
+        for attribute in get_attribute_names(value):
+            attributes[attribute] = self.encode(getattr(value, attribute))
+        return {"$object": name, "attributes": attributes}
+
+
+# Rebuilds a model from the JSON written by ModelEncoder, and the array files in its folder
+# pool_files is {typecode: file name}
+class ModelDecoder:
+
+    def __init__(self, folder, pool_files):
+        self.folder = Path(folder)
+        self.pool_files = pool_files
+        self.pools = {}
+
+    # Returns the items of the slice of the typecode array, as an array
+    def get_slice(self, reference):
+        typecode, start, count = reference
+        if count == 0:
+            return array(typecode)
+        if typecode not in self.pools:
+            name = self.pool_files[typecode]
+            if not POOL_FILE_PATTERN.fullmatch(name):
+                raise ValueError(f"Not a cached array file {name}")
+            # Memory-mapped, only the parts sliced are read, allow_pickle=False so object arrays are refused
+            pool = np.load(self.folder / name, mmap_mode="r", allow_pickle=False)
+            if pool.dtype != np.dtype(typecode) or pool.ndim != 1:
+                raise ValueError(f"Cached array {name} has type {pool.dtype}")
+            self.pools[typecode] = pool
+        pool = self.pools[typecode]
+        if start < 0 or count < 0 or start + count > len(pool):
+            raise IndexError(f"Cached slice {start}+{count} is outside pool_{typecode} ({len(pool)})")
+        values = array(typecode)
+        values.frombytes(pool[start:start + count].tobytes())
+        return values
+
+    def decode(self, value):
+        if isinstance(value, list):
+            return [self.decode(v) for v in value]
+        if not isinstance(value, dict):
+            return value
+        if "$buffer" in value:
+            values = self.get_slice(value["$buffer"])
+            buffer = MeshBuffer(value["width"], None, values.typecode)
+            buffer.data = values
+            return buffer
+        if "$array" in value:
+            return self.get_slice(value["$array"])
+        if "$bytes" in value:
+            values = self.get_slice(value["$bytes"]).tobytes()
+            return bytearray(values) if value["mutable"] else values
+        if "$list" in value:
+            return self.get_slice(value["$list"]).tolist()
+        if "$tuple" in value:
+            return tuple(self.decode(v) for v in value["$tuple"])
+        if "$dict" in value:
+            return {self.decode(k): self.decode(v) for k, v in value["$dict"]}
+        if "$set" in value:
+            values = [self.decode(v) for v in value["$set"]]
+            return frozenset(values) if value["frozen"] else set(values)
+        if "$object" in value:
+            return self.decode_object(value["$object"], value["attributes"])
+        raise ValueError(f"Unknown cached value {list(value)}")
+
+    def decode_object(self, name, attributes):
+        cls = find_class(name)
+        # Not calling __init__, the attributes are set as they were
+        instance = cls.__new__(cls)
+        for attribute, value in attributes.items():
+            setattr(instance, attribute, self.decode(value))
+        return instance
+
+
+def is_allowed_class(module):
+    return any(module.startswith(package) for package in ALLOWED_PACKAGES)
+
+
+# Returns the class for "module.Class", only from ALLOWED_PACKAGES
+def find_class(name):
+    # The module is the longest prefix that can be imported, as the class could be nested
+    parts = name.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        module = ".".join(parts[:i])
+        if not is_allowed_class(module + "."):
+            break
+        try:
+            value = importlib.import_module(module)
+        except ImportError:
+            continue
+        for part in parts[i:]:
+            value = getattr(value, part)
+        if not isinstance(value, type) or not is_allowed_class(value.__module__):
+            break
+        return value
+    raise ImportError(f"Cannot load cached class {name}")
+
+
+# Names of the attributes set on value, from __slots__ (of each class) and __dict__
+def get_attribute_names(value):
+    names = []
+    for cls in type(value).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = [slots]
+        for slot in slots:
+            if slot in ("__dict__", "__weakref__") or slot in names:
+                continue
+            if hasattr(value, slot):
+                names.append(slot)
+    for name in getattr(value, "__dict__", {}):
+        if name not in names:
+            names.append(name)
+    return names
+
+
+# Shared cache used by the tools, set model_cache.enabled = False to turn it off (e.g --no-cache)
+model_cache = ModelCache()
@@ -0,0 +1,147 @@
+
+# Frame and load timings for the viewers (choroq_ui), shown in an overlay and saved as a Chrome trace
+#
+# Each frame's time (from begin_frame to end_frame, the work done for the frame, not the wait for vsync) is
+# kept for the last FRAME_HISTORY frames, for the percentiles. Draw calls and uploaded bytes are counted per
+# frame, and for the whole session.
+#
+# Loads are timed per stage (parse, convert, upload) for each model, with:
+#   with profiler.stage(name, "parse"):
+#       car = model_cache.load(f, QCar.read_car, 0, file_size)
+# stage can be used from any thread (e.g the loader threads), times for the same model and stage are added up.
+#
+# Every frame and stage is also kept as a trace event, save_trace writes them in the Chrome trace format, which
+# can be opened in chrome://tracing or https://ui.perfetto.dev
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+FRAME_HISTORY = 300
+# Events past this are dropped, about an hour of frames at 60fps
+MAX_TRACE_EVENTS = 250000
+DEFAULT_TRACE_PATH = "choroq_trace.json"
+
+PARSE = "parse"
+CONVERT = "convert"
+UPLOAD = "upload"
+LOAD_STAGES = [PARSE, CONVERT, UPLOAD]
+
+
+# e.g 1.5MB, for the overlay
+def format_bytes(size):
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+class Profiler:
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.start_time = time.perf_counter()
+        self.frame_times = deque(maxlen=FRAME_HISTORY)
+        self.frame_start = None
+
+        # Counted for the current frame, then moved to the last_ values by end_frame
+        self.draw_calls = 0
+        self.vertex_bytes = 0
+        self.texture_bytes = 0
+        self.last_draw_calls = 0
+        self.last_vertex_bytes = 0
+        self.last_texture_bytes = 0
+        self.total_vertex_bytes = 0
+        self.total_texture_bytes = 0
+
+        self.load_times = {}  # model name -> {stage: seconds}
+        self.last_model = None  # The model most recently timed
+        self.events = []
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+        self.draw_calls = 0
+        self.vertex_bytes = 0
+        self.texture_bytes = 0
+
+    def end_frame(self):
+        if self.frame_start is None:
+            return
+        end = time.perf_counter()
+        self.frame_times.append(end - self.frame_start)
+        self.add_event("frame", "frame", self.frame_start, end)
+        self.last_draw_calls = self.draw_calls
+        self.last_vertex_bytes = self.vertex_bytes
+        self.last_texture_bytes = self.texture_bytes
+
+    def count_draw(self, count=1):
+        self.draw_calls += count
+
+    def count_upload(self, vertex_bytes=0, texture_bytes=0):
+        self.vertex_bytes += vertex_bytes
+        self.texture_bytes += texture_bytes
+        self.total_vertex_bytes += vertex_bytes
+        self.total_texture_bytes += texture_bytes
+
+    # Removes the model's times, when it is loaded again
+    def clear_load_times(self, model):
+        with self.lock:
+            self.load_times.pop(model, None)
+            if self.last_model == model:
+                self.last_model = None
+
+    # Times the block, as a load stage (see LOAD_STAGES) of the model
+    @contextmanager
+    def stage(self, model, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self.lock:
+                times = self.load_times.setdefault(model, {})
+                times[stage] = times.get(stage, 0.0) + end - start
+                self.last_model = model
+            self.add_event(f"{stage} {model}", stage, start, end)
+
+    def add_event(self, name, category, start, end):
+        with self.lock:
+            if len(self.events) >= MAX_TRACE_EVENTS:
+                return
+            # Trace times are in microseconds
+            self.events.append({"name": name, "cat": category, "ph": "X", "pid": 0, "tid": threading.get_ident(),
+                                "ts": (start - self.start_time) * 1e6, "dur": (end - start) * 1e6})
+
+    # Returns the 50th, 95th and 99th percentile frame times in ms, or None before the first frame
+    def get_frame_percentiles(self):
+        if len(self.frame_times) == 0:
+            return None
+        return np.percentile(np.array(self.frame_times) * 1000, [50, 95, 99])
+
+    # Returns (model name, {stage: seconds}) for the model most recently timed
+    def get_last_load_times(self):
+        with self.lock:
+            if self.last_model is None:
+                return None, {}
+            return self.last_model, dict(self.load_times[self.last_model])
+
+    def save_trace(self, path=DEFAULT_TRACE_PATH):
+        with self.lock:
+            events = list(self.events)
+        # Name the threads, so the loader threads can be told apart from the render thread
+        thread_names = [{"name": "thread_name", "ph": "M", "pid": 0, "tid": thread.ident, "args": {"name": thread.name}}
+                        for thread in threading.enumerate()]
+        try:
+            with open(path, "w") as trace_out:
+                json.dump({"traceEvents": thread_names + events, "displayTimeUnit": "ms"}, trace_out)
+            print(f"Saved trace of {len(events)} events to {path}")
+        except Exception as e:
+            print(f"Failed to save the trace {path}: {e}")
+
+
+profiler = Profiler()
@@ -0,0 +1,66 @@
+
+# Progress events from the extractors, so a UI can show progress without reading what is printed
+#
+# The extractor (choroq_extractor.progress_callback) is given a callback, which is called from the thread doing
+# the extraction. ProgressQueue's put can be used as the callback, it puts each event on a queue.Queue
+# (thread safe), which the UI then drains from its own thread (e.g on a tkinter "after" timer).
+#
+# Each stage (e.g "COURSE", "CARS") is started with the number of files it will process, so the UI does not need
+# to know how many files each game has.
+
+import queue
+
+STAGE_STARTED = "stage_started"  # name = stage, total = number of files in the stage
+STAGE_FINISHED = "stage_finished"  # name = stage, sent even if the stage stopped early
+FILE_STARTED = "file_started"  # name = file path
+FILE_FINISHED = "file_finished"  # name = file path, size = bytes of the file processed
+FILE_FAILED = "file_failed"  # name = file path, message = error
+ERROR = "error"  # message = error, for errors outside of a file
+DONE = "done"  # Sent by the UI's worker when everything has finished
+
+
+class ProgressEvent:
+
+    def __init__(self, kind, name="", total=0, size=0, message=""):
+        self.kind = kind
+        self.name = name
+        self.total = total
+        self.size = size
+        self.message = message
+
+    def __str__(self):
+        if self.kind == STAGE_STARTED:
+            return f"Processing {self.name} ({self.total} files)"
+        if self.kind == STAGE_FINISHED:
+            return f"Finished {self.name}"
+        if self.kind == FILE_STARTED:
+            return f"Processing {self.name}"
+        if self.kind == FILE_FINISHED:
+            return f"Done {self.name}"
+        if self.kind == FILE_FAILED:
+            return f"Failed to process {self.name}: {self.message}"
+        if self.kind == ERROR:
+            return f"Error: {self.message}"
+        return "Done"
+
+
+class ProgressQueue:
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def put(self, event):
+        self.queue.put(event)
+
+    def emit(self, kind, name="", total=0, size=0, message=""):
+        self.queue.put(ProgressEvent(kind, name, total, size, message))
+
+    # Returns the events queued so far (up to max_events), without waiting for more
+    def drain(self, max_events=None):
+        events = []
+        while max_events is None or len(events) < max_events:
+            try:
+                events.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
@@ -0,0 +1,193 @@
+
+# Catalog of the files in the game folders that the viewers (choroq_ui) list, saved so the folders are only
+# scanned again when they change
+#
+# Each folder is stored with its modified time, which changes whenever a file is added, removed or renamed in
+# it, so a folder is only scanned (os.scandir) again if its modified time has changed. A file replaced in place
+# does not change its folder's modified time, so each file is also checked (os.stat) before what was known about
+# it is used. Files with the same size and modified time as before keep it, as do files only touched (same size
+# and hash, but a new modified time).
+#
+# For each file the size and modified time are stored, then once a viewer has parsed it, a hash of its contents
+# and a summary (mesh count, texture count, bounds) are added with set_summary, so the lists can show these
+# without opening the files again.
+#
+# The catalog is saved to a json file (like iso_index), entries for folders no longer used are kept, so
+# switching between game folders does not scan them again.
+
+import hashlib
+import json
+import os
+import threading
+
+from choroq.profiler import format_bytes
+
+CATALOG_VERSION = 1
+DEFAULT_CATALOG_PATH = "resource_catalog.json"
+
+
+class ResourceCatalog:
+
+    def __init__(self, folders=None):
+        self.lock = threading.Lock()
+        # folder path -> {"mtime": modified time, "files": {filename: file info}}
+        # file info is {"size", "mtime", "hash", "summary"}, hash and summary are None until set_summary
+        self.folders = folders if folders is not None else {}
+        self.changed = False
+
+    # Returns the saved catalog, or an empty one if there isn't one (or it is from a different version)
+    @staticmethod
+    def load(catalog_path=DEFAULT_CATALOG_PATH):
+        if not os.path.exists(catalog_path):
+            return ResourceCatalog()
+        try:
+            with open(catalog_path, "r") as catalog_in:
+                saved = json.load(catalog_in)
+            if saved.get("version") != CATALOG_VERSION:
+                return ResourceCatalog()
+            return ResourceCatalog(saved["folders"])
+        except Exception as e:
+            print(f"Failed to load the resource catalog {catalog_path}: {e}")
+            return ResourceCatalog()
+
+    # Saves the catalog, if anything has changed since it was loaded
+    def save(self, catalog_path=DEFAULT_CATALOG_PATH):
+        with self.lock:
+            if not self.changed:
+                return
+            saved = {"version": CATALOG_VERSION, "folders": self.folders}
+            try:
+                with open(catalog_path, "w") as catalog_out:
+                    json.dump(saved, catalog_out)
+                self.changed = False
+            except Exception as e:
+                print(f"Failed to save the resource catalog {catalog_path}: {e}")
+
+    # Returns [(filename, path, file info)] for the (non hidden) files in the folder, sorted by name,
+    # the folder is only scanned if it has changed since it was last scanned
+    def list_folder(self, folder):
+        folder = os.path.abspath(folder)
+        if not os.path.isdir(folder):
+            return []
+        mtime = os.stat(folder).st_mtime_ns
+
+        with self.lock:
+            entry = self.folders.get(folder)
+            if entry is None or entry["mtime"] != mtime or not self.check_files(folder, entry):
+                entry = self.scan_folder(folder, mtime, entry)
+                self.folders[folder] = entry
+                self.changed = True
+            return [(name, os.path.join(folder, name), info) for name, info in sorted(entry["files"].items())]
+
+    # Checks each file of an unchanged folder, returns False if one is missing (so the folder needs scanning)
+    def check_files(self, folder, entry):
+        for name, info in entry["files"].items():
+            try:
+                stat = os.stat(os.path.join(folder, name))
+            except OSError:
+                return False
+            if self.check_file(os.path.join(folder, name), info, stat):
+                self.changed = True
+        return True
+
+    # Resets the file info (in place) if the file has changed since it was stored, returns True if info changed
+    @staticmethod
+    def check_file(path, info, stat):
+        if info["size"] == stat.st_size and info["mtime"] == stat.st_mtime_ns:
+            return False
+        if info["hash"] is not None and info["size"] == stat.st_size and hash_file(path) == info["hash"]:
+            # Only touched, the contents are the same
+            info["mtime"] = stat.st_mtime_ns
+            return True
+        info["size"] = stat.st_size
+        info["mtime"] = stat.st_mtime_ns
+        info["hash"] = None
+        info["summary"] = None
+        return True
+
+    @staticmethod
+    def scan_folder(folder, mtime, previous):
+        previous_files = previous["files"] if previous is not None else {}
+        files = {}
+        with os.scandir(folder) as it:
+            for dir_entry in it:
+                if dir_entry.name.startswith('.') or not dir_entry.is_file():
+                    continue
+                stat = dir_entry.stat()
+                info = previous_files.get(dir_entry.name)
+                if info is None:
+                    info = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "hash": None, "summary": None}
+                else:
+                    ResourceCatalog.check_file(dir_entry.path, info, stat)
+                files[dir_entry.name] = info
+        print(f"Scanned {folder}, {len(files)} files")
+        return {"mtime": mtime, "files": files}
+
+    # Returns the file info for the path, or None if its folder has not been listed (or it no longer exists),
+    # the file is checked first, so the info is reset if it has changed
+    def get_info(self, path):
+        path = os.path.abspath(path)
+        folder, name = os.path.split(path)
+        with self.lock:
+            entry = self.folders.get(folder)
+            if entry is None:
+                return None
+            info = entry["files"].get(name)
+            if info is None:
+                return None
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return None
+            if self.check_file(path, info, stat):
+                self.changed = True
+            return info
+
+    # Adds what the viewer found when it parsed the file, summary is {"meshes", "textures", "bounds"}
+    # Can be called from any thread, the file info (from list_folder/get_info) is updated in place
+    def set_summary(self, path, summary):
+        info = self.get_info(path)
+        if info is None:
+            return
+        stat = os.stat(path)
+        file_hash = hash_file(path)
+        with self.lock:
+            info["size"] = stat.st_size
+            info["mtime"] = stat.st_mtime_ns
+            info["hash"] = file_hash
+            info["summary"] = summary
+            self.changed = True
+
+
+# sha1 of the file's contents, as hex
+def hash_file(path):
+    file_hash = hashlib.sha1()
+    with open(path, "rb") as file_in:
+        while True:
+            data = file_in.read(1024 * 1024)
+            if not data:
+                break
+            file_hash.update(data)
+    return file_hash.hexdigest()
+
+
+# Returns {"meshes", "textures", "bounds"}, bounds are ([x, y, z] min, [x, y, z] max) or None without vertices
+def make_summary(mesh_count, texture_count, bounds_min=None, bounds_max=None):
+    bounds = None
+    if bounds_min is not None:
+        bounds = [[float(v) for v in bounds_min], [float(v) for v in bounds_max]]
+    return {"meshes": mesh_count, "textures": texture_count, "bounds": bounds}
+
+
+# e.g "1.2MB, 12 meshes, 2 textures, 3.1 x 1.2 x 4.0" for the viewer lists
+def describe(info):
+    if info is None:
+        return ""
+    text = format_bytes(info["size"])
+    summary = info["summary"]
+    if summary is not None:
+        text += f", {summary['meshes']} meshes, {summary['textures']} textures"
+        if summary["bounds"] is not None:
+            size = [high - low for low, high in zip(*summary["bounds"])]
+            text += ", {:.1f} x {:.1f} x {:.1f}".format(*size)
+    return text
@@ -0,0 +1,154 @@
+
+# Builds triangle strips from an indexed triangle list, for writing meshes back out in the PS2 (GIF tristrip) format
+#
+# Greedy SGI style stripification:
+#   - Start each strip from the unused triangle with the fewest unused neighbours, so the awkward/isolated
+#     triangles are used first, rather than being left as single triangle strips at the end
+#   - Try each of the start triangle's three edges, and keep whichever strip is the longest
+#   - Extend the strip across the shared edge while the next triangle has the matching winding. Strips with
+#     an even number of vertices are also extended back from their start, as reversing them keeps the winding
+#
+# Triangles are (a, b, c) vertex indices, strips are lists of vertex indices where triangle i is
+# (s[i], s[i+1], s[i+2]) for even i, and (s[i+1], s[i], s[i+2]) for odd i. So each triangle keeps
+# the winding it was given.
+#
+# Each strip is limited to max_length vertices, as each strip has to fit in the VU1 buffer (and the GIF/VIF tags)
+#
+# Strips can be joined with degenerate triangles (stitch_strips), which gives fewer strips at the cost of 2 or 3
+# repeated vertices per join. For the car format each vertex is 48 bytes, while each strip only costs 28 bytes of
+# tags, so joining strips makes cars bigger, it is only worth it if vertex_size * 2 < strip_overhead.
+
+import heapq
+
+# The VIF expand tag's count (vertex count * 4) has to fit in one byte
+MAX_STRIP_LENGTH = 63
+
+
+# Returns a list of strips (lists of vertex indices) covering all (non-degenerate) triangles
+def build_strips(triangles, max_length=MAX_STRIP_LENGTH):
+    if max_length < 3:
+        raise ValueError(f"Strips need at least 3 vertices, max_length {max_length}")
+
+    tris = []
+    for a, b, c in triangles:
+        if a == b or b == c or c == a:
+            continue
+        tris.append((a, b, c))
+
+    # Directed edge (u, v) -> triangles with that edge in their winding
+    edge_tris = {}
+    for t, (a, b, c) in enumerate(tris):
+        edge_tris.setdefault((a, b), []).append(t)
+        edge_tris.setdefault((b, c), []).append(t)
+        edge_tris.setdefault((c, a), []).append(t)
+
+    # Neighbours are the triangles across each edge with the opposite winding (so a strip can continue into them)
+    neighbours = []
+    for a, b, c in tris:
+        tri_neighbours = set()
+        for u, v in ((a, b), (b, c), (c, a)):
+            tri_neighbours.update(edge_tris.get((v, u), ()))
+        neighbours.append(tri_neighbours)
+
+    used = [False] * len(tris)
+    free_neighbours = [len(n) for n in neighbours]
+    queue = [(count, t) for t, count in enumerate(free_neighbours)]
+    heapq.heapify(queue)
+
+    strips = []
+    while queue:
+        count, start = heapq.heappop(queue)
+        if used[start] or count != free_neighbours[start]:
+            continue  # Stale entry
+
+        best_strip = None
+        best_tris = None
+        a, b, c = tris[start]
+        for first in ((a, b, c), (b, c, a), (c, a, b)):
+            strip, strip_tris = _extend(list(first), [start], tris, edge_tris, used, max_length)
+            if best_strip is None or len(strip) > len(best_strip):
+                best_strip, best_tris = strip, strip_tris
+
+        if len(best_strip) % 2 == 0 and len(best_strip) < max_length:
+            best_strip.reverse()
+            best_strip, best_tris = _extend(best_strip, best_tris, tris, edge_tris, used, max_length)
+
+        for t in best_tris:
+            used[t] = True
+        for t in best_tris:
+            for n in neighbours[t]:
+                if not used[n]:
+                    free_neighbours[n] -= 1
+                    heapq.heappush(queue, (free_neighbours[n], n))
+        strips.append(best_strip)
+    return strips
+
+
+def _extend(strip, strip_tris, tris, edge_tris, used, max_length):
+    in_strip = set(strip_tris)
+    while len(strip) < max_length:
+        u, v = strip[-2], strip[-1]
+        # The next triangle's winding depends on its position in the strip
+        if (len(strip) - 2) % 2 == 1:
+            u, v = v, u
+        next_tri = None
+        for t in edge_tris.get((u, v), ()):
+            if not used[t] and t not in in_strip:
+                next_tri = t
+                break
+        if next_tri is None:
+            break
+        in_strip.add(next_tri)
+        strip_tris.append(next_tri)
+        strip.append(_third_vertex(tris[next_tri], u, v))
+    return strip, strip_tris
+
+
+def _third_vertex(tri, u, v):
+    for w in tri:
+        if w != u and w != v:
+            return w
+    raise ValueError(f"Triangle {tri} is degenerate")
+
+
+# Joins strips together using degenerate triangles, while they fit in max_length
+def stitch_strips(strips, max_length=MAX_STRIP_LENGTH):
+    stitched = []
+    current = None
+    for strip in strips:
+        if current is None:
+            current = list(strip)
+            continue
+        # The next strip has to start on an even triangle to keep its winding
+        if len(current) % 2 == 0:
+            join = [current[-1], strip[0]]
+        else:
+            join = [current[-1], current[-1], strip[0]]
+        if len(current) + len(join) + len(strip) > max_length:
+            stitched.append(current)
+            current = list(strip)
+            continue
+        current += join
+        current += strip
+    if current is not None:
+        stitched.append(current)
+    return stitched
+
+
+# Returns the (non-degenerate) triangles drawn by the strips, with their winding
+def strips_to_triangles(strips):
+    triangles = []
+    for strip in strips:
+        for i in range(len(strip) - 2):
+            if i % 2 == 0:
+                tri = (strip[i], strip[i + 1], strip[i + 2])
+            else:
+                tri = (strip[i + 1], strip[i], strip[i + 2])
+            if tri[0] == tri[1] or tri[1] == tri[2] or tri[2] == tri[0]:
+                continue
+            triangles.append(tri)
+    return triangles
+
+
+def count_strip_vertices(strips):
+    return sum(len(strip) for strip in strips)
@@ -0,0 +1,61 @@
+
+# View frustum culling of axis aligned bounding boxes, e.g for the chunks of a course in choroq_ui
+#
+# Matrices are 4x4 numpy arrays, used as matrix @ column vector, the same as raylib/OpenGL.
+# look_at and perspective match raylib's camera (BeginMode3D), so the planes match what is drawn.
+
+import numpy as np
+
+# The near/far planes raylib uses for 3D mode (RL_CULL_DISTANCE_NEAR/FAR)
+CULL_DISTANCE_NEAR = 0.01
+CULL_DISTANCE_FAR = 1000.0
+
+
+def look_at(eye, target, up):
+    eye = np.asarray(eye, dtype=np.float64)
+    forward = np.asarray(target, dtype=np.float64) - eye
+    forward /= np.linalg.norm(forward)
+    right = np.cross(forward, np.asarray(up, dtype=np.float64))
+    right /= np.linalg.norm(right)
+    true_up = np.cross(right, forward)
+
+    view = np.identity(4)
+    view[0, :3] = right
+    view[1, :3] = true_up
+    view[2, :3] = -forward
+    view[:3, 3] = -(view[:3, :3] @ eye)
+    return view
+
+
+# fovy is in degrees
+def perspective(fovy, aspect, near=CULL_DISTANCE_NEAR, far=CULL_DISTANCE_FAR):
+    f = 1.0 / np.tan(np.radians(fovy) / 2.0)
+    projection = np.zeros((4, 4))
+    projection[0, 0] = f / aspect
+    projection[1, 1] = f
+    projection[2, 2] = (far + near) / (near - far)
+    projection[2, 3] = 2.0 * far * near / (near - far)
+    projection[3, 2] = -1.0
+    return projection
+
+
+# Returns the 6 planes (a, b, c, d) of the frustum as a (6, 4) array,
+# points inside the frustum have a*x + b*y + c*z + d >= 0 for every plane
+def get_frustum_planes(view_projection):
+    m = view_projection
+    planes = np.array([m[3] + m[0], m[3] - m[0], m[3] + m[1], m[3] - m[1], m[3] + m[2], m[3] - m[2]])
+    return planes / np.linalg.norm(planes[:, :3], axis=1)[:, None]
+
+
+def get_camera_planes(position, target, up, fovy, aspect):
+    return get_frustum_planes(perspective(fovy, aspect) @ look_at(position, target, up))
+
+
+# Returns a bool for each box (mins and maxs are (N, 3) arrays), True if the box is at least partly within the planes
+# Boxes near a corner of the frustum may be kept even though they are just outside, but no visible box is removed
+def boxes_in_frustum(planes, mins, maxs):
+    normals = planes[:, :3]
+    # For each box and plane, the corner furthest along the plane's normal
+    corners = np.where(normals[None, :, :] >= 0, maxs[:, None, :], mins[:, None, :])
+    distances = np.einsum("npk,pk->np", corners, normals) + planes[:, 3]
+    return np.all(distances >= 0, axis=1)
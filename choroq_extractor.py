@@ -3,13 +3,20 @@ from choroq.egame.texture import Texture
 from choroq.egame.car import CarModel, CarMesh
 # from choroq.egame.car_hg3 import HG3CarModel, HG3CarMesh
 from choroq.egame.course import CourseModel, Course
+from choroq.egame.texture_atlas import TextureAtlas
+from choroq.egame.comb_binary import write_comb_binary_header, update_comb_binary_mesh_count, COMB_TYPE_CAR, COMB_TYPE_FIELD
 from choroq.egame.garage import GarageModel
 from choroq.egame.shop import Shop
 from choroq.egame.quickpic import QuickPic
+from choroq.model_cache import model_cache
+from choroq.game_source import open_source, open_entry, is_iso_path
+from choroq.progress import ProgressEvent, STAGE_STARTED, STAGE_FINISHED, FILE_STARTED, FILE_FINISHED, FILE_FAILED
 
 import io
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 import colorama
 from colorama import Fore, Back, Style
@@ -29,7 +36,23 @@ CREATE_LOG_FILES = False
 # files and takes up more space. Output into new folder, e.g "C00/tex-unused/"
 TRY_DUMP_UNUSED_TEXTURES = False
 
+# If this is set to true, the textures for each field/course/action are packed into one (or a few) atlas textures
+# and the meshes using them are merged into one mesh per atlas, e.g "C00/meshes/C00-atlas0.obj", this massively
+# reduces the number of materials. Textures that repeat (UVs outside 0-1) are still saved as separate materials
+ATLAS_TEXTURES = False
+# Largest size (width/height) of each atlas texture
+ATLAS_MAX_SIZE = 2048
+# Save the course/field meshes as each chunk is read, rather than reading them all first, this keeps the memory
+# use down to a single chunk. Not used with ATLAS_TEXTURES or OUTPUT_CHUNKED_MESHES as they need all meshes at once
+STREAM_COURSE_MESHES = True
+# Processes decoding the shops (SHOP, including the garage) and quick pics (PUTI.BIN), None for one per cpu. Set to None
+# when run from the command line, it is 1 by default as processes re-import the script that started them, which
+# must then be guarded by if __name__ == '__main__'
+TEXTURE_WORKERS = 1
+
 should_exit = False
+# Called with a ProgressEvent as each stage and file is processed (from the thread doing the extraction), see progress.py
+progress_callback = None
 
 def show_help():
     print(Fore.BLUE+"##############################################################################################")
@@ -41,15 +64,18 @@ def show_help():
     print("Textures are exported in PNG format") #, and the texture palette is marked \"-p\"")
     print("Models will be exported as OBJ by default")
     print("")
-    print("Currently this will only work when given the path to the game root")
+    print("Currently this will only work when given the path to the game root, or the game's iso")
     print("")
     print("Options: <REQUIRED> [OPTIONAL]")
-    print("<source path>")
+    print("<source path>             : game root folder, or .iso file")
     print("<output folder>")
     # print("[makefolders]             : whether to create sub folders for each car : 1 = Yes")
     print("[type]                    : model output format")
     print("                            -- 1 = OBJ only, grouped by texture (default)")
     print("                            -- C = OBJ only, grouped by texture with r/g/b after x/y/z (blender)")
+    print("                            -- B = binary comb, for the blender comb importer (blender-py)")
+    print("[--no-cache]              : always parse the game files, rather than using the cache of parsed models")
+    print("[--no-parallel]           : decode shops, the garage and quick pics in one process, rather than one per cpu")
     # print("                            -- 2 = PLY only")
 
     print("The output folder structure will be as follows:")
@@ -118,205 +144,321 @@ def group_meshes_by_material(meshes):
     return mesh_by_material, number_of_meshes
     
 
+def save_material_texture(key, mm, dest_folder, file_number, mat_index, out_type, file_prefix, textures):
+    # Export the texture for this material, combined with its clut
+    # returns True if the material had a texture
+    material_name = f"{file_prefix}{file_number}-{mat_index}"
+    texture_path_relative = f"tex/t{file_number}-{mat_index}.png"
+
+    clut_address, texture_address = key
+
+    if texture_address == 0 or clut_address == 0:  # 0, 0 is often added, but with no meshes
+        if len(mm) != 0:
+            print(
+                f"Mat index {mat_index} has no texture {texture_address} or no clut {clut_address} meshes {len(mm)}")
+            for m in mm:
+                print(f"Mesh with {len(m.mesh_verts)} verts {len(m.mesh_faces)} faces")
+    elif texture_address not in textures:
+        print(f"Texture addressing wrong, check value {texture_address}")
+        exit(2)
+    else:
+        texture = textures[texture_address]
+
+        if clut_address not in textures:
+            # Check texture type
+            if texture.bpp > 8:
+                # This is possibly just an image, no clut, esp if bpp == 24 or 32
+                # save texture as is, without using any CLUTs
+                print(f"Clut addressing wrong, {clut_address} but image should be fine as is")
+                print(f"{dest_folder}/meshes/{texture_path_relative}")
+                texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}",
+                                             use_palette=False)
+            else:
+                # This texture almost certainly needs a CLUT, as it would be B&W otherwise, unlikely
+                print(f"Clut addressing wrong, check value {clut_address}")
+        else:
+            # Fetch the texture, and the clut to use
+            clut = textures[clut_address]
+            print(
+                f"Creating paletted image {texture_address} {texture_address:x} using {clut_address} {clut_address:x}")
+            print(f"clut bpp: {clut.bpp}")
+            if clut.bpp != 32 and clut.bpp != 24:
+                print(f"Not using CLUT: as bpp {clut.bpp} is not right")
+                print(f"{dest_folder}/meshes/{texture_path_relative}")
+                texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}",
+                                             use_palette=False)
+            else:
+                # Clut valid enough
+                # Unswizzle the palette, as these are (should) be swizzled for the PS2
+                unswizzled = Texture.unswizzle_bytes(clut)
+                texture.palette = unswizzled  # Set the texture's palette accordingly
+                texture.palette_width = clut.width
+                texture.palette_height = clut.height
+                try:
+                    # Save the texture using the given clut
+                    print(f"{dest_folder}/meshes/{texture_path_relative}")
+                    texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}")
+                    print(f"Saved texture for material group {mat_index} t{file_number}-{mat_index}.png")
+                    print()
+                except Exception as e:
+                    if isinstance(e, ValueError):
+                        if len(e.args) == 1 and e.args[0] == "invalid palette size":
+                            # Assume this is a normal b&w texture and the clut is probably just a different tex
+                            print(f"Not using CLUT: as bpp {clut.bpp} is not right")
+                            print(f"{dest_folder}/meshes/{texture_path_relative}")
+                            texture.palette = []
+                            texture.palette_width = 0
+                            texture.palette_height = 0
+                            texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}", use_palette=False)
+                    else:
+                        texture.write_texture_to_png(f"{dest_folder}/meshes/failed-t{file_number}-{mat_index}-{texture_address:x}.png", use_palette=False)
+                        clut.write_texture_to_png(f"{dest_folder}/meshes/failed-clut-t{file_number}-{mat_index}-{clut_address:x}.png")
+                        print(f"Failed to write texture probably decoded badly Course:{file_number} Texture: {texture_address} {clut_address} {texture}")
+                        print(f"Info: W: {texture.width} x H:{texture.height}  pW: {texture.palette_width} x pH: {texture.palette_height}")
+                        print(e)
+
+        # create material for this texture, for obj
+        if out_type == "obj" or out_type == "obj-combined" or out_type == "obj+colour":
+            with open(f"{dest_folder}/meshes/{material_name}.mtl", "w") as fout:
+                Texture.save_material_file_obj(fout, material_name, texture_path_relative)
+        return True
+    return False
+
+
+def save_unused_textures(dest_folder, file_number, textures, done_addresses):
+    # Save all unreferenced textures, such as the skybox
+    # This ofc will be referenced by the game somewhere, but its not directly addressed here
+    unused_textures = []
+    unreferenced_textures = []
+
+    for address in textures:
+        if address not in done_addresses:
+            # Ignore any none or invalid types
+            if isinstance(textures[address], Texture):
+                unused_textures.append(address)
+
+    if len(unused_textures) > 0:
+        Path(f"{dest_folder}/tex-unused/").mkdir(parents=True, exist_ok=True)
+
+    # Now try and combine the textures using a guess at its palette
+    for texture_address in unused_textures:
+        texture = textures[texture_address]
+
+        if texture.bpp > 8 and texture.width > 16 and texture.height > 16:
+            # Does not need a clut
+            # write as is
+            texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-full.png", use_palette=False)
+            # Save this address, so we do not use it as a palette
+            unreferenced_textures.append(texture_address)
+        else:
+            # This texture needs a clut, or is b&w (unlikely)
+            # Save a raw copy
+            texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-raw.png", use_palette=False)
+
+            # Locate next palette and use that, might not work, but we do not know how it gets referenced so we do not
+            # have two addresses, this makes lots of attempts, x*x for number of textures/cluts
+            for clut_address in unused_textures:
+                clut = textures[clut_address]
+                if clut is None:
+                    continue
+                if clut.bpp <= 8 or clut.width > 64 or clut.height > 64:
+                    continue  # skip this as it is not a clut, probably a texture
+
+                print("Found next clut for unreferenced texture")
+                # Clut valid enough
+                # Unswizzle the palette, as these are (should) be swizzled for the PS2
+                unswizzled = Texture.unswizzle_bytes(clut)
+                texture.palette = unswizzled  # Set the texture's palette accordingly
+                texture.palette_width = clut.width
+                texture.palette_height = clut.height
+                try:
+                    # Save the texture using the given clut
+                    texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-{clut_address:x}.png")
+                    print(f"Attempted to save unreferenced texture: unused-{texture_address:x}.png")
+                    print()
+                except Exception as e:
+                    if isinstance(e, ValueError):
+                        if len(e.args) == 1 and e.args[0] == "invalid palette size":
+                            # Assume this is a normal b&w texture and the clut is probably just a different tex
+                            print(f"Not using CLUT: as bpp {clut.bpp} is not right")
+                            print(f"{dest_folder}/tex-unused/unused-{texture_address:x}.png")
+                            texture.palette = []
+                            texture.palette_width = 0
+                            texture.palette_height = 0
+                            texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-raw.png", use_palette=False)
+                    else:
+                        texture.write_texture_to_png(
+                            f"{dest_folder}/tex-unused/failed-unused-{texture_address:x}.png",
+                            use_palette=False)
+                        clut.write_texture_to_png(
+                            f"{dest_folder}/tex-unused/failed-clut-unused-{clut_address:x}.png")
+                        print(
+                            f"Failed to write texture probably decoded badly Course:{file_number} Texture: {texture_address} {clut_address} {texture}")
+                        print(
+                            f"Info: W: {texture.width} x H:{texture.height}  pW: {texture.palette_width} x pH: {texture.palette_height}")
+                        print(e)
+
+
+# Saves meshes into one file per material (clut, texture) as they are given, so the whole course does
+# not need to be read/grouped first. Materials are numbered in the order they are first seen, which
+# gives the same files as grouping everything first
+class GroupedMeshWriter:
+
+    def __init__(self, dest_folder, file_number, out_type, file_prefix, textures):
+        self.dest_folder = dest_folder
+        self.file_number = file_number
+        self.out_type = out_type
+        self.file_prefix = file_prefix
+        self.textures = textures
+        # (clut, texture) -> [mat_index, fout, vert_count, mesh_count]
+        self.materials = {}
+        self.number_of_meshes = 0
+        # Build a list of used textures, so we can save the other ones too
+        self.done_addresses = []
+        Path(f"{dest_folder}/meshes/tex/").mkdir(parents=True, exist_ok=True)
+
+    def write(self, key, mm):
+        if key not in self.materials:
+            self._start_material(key, mm)
+        material = self.materials[key]
+        mat_index, fout, vert_count, mesh_count = material
+        material_name = f"{self.file_prefix}{self.file_number}-{mat_index}"
+        texture_path_relative = f"tex/t{self.file_number}-{mat_index}.png"
+
+        for mesh in mm:
+            # If you come across this, this is a custom file format I have made, expect this to change over time
+            # you will have to modify this file to get this to output
+            if self.out_type == "comb":
+                fout.write(f"s z-{mesh_count}\n")  # Start of a mesh
+                mesh.write_mesh_to_type(self.out_type, fout, material=texture_path_relative)
+                fout.write(f"e z-{mesh_count}\n")  # End of a mesh
+            elif self.out_type == "combb":
+                mesh.write_mesh_to_comb_binary(fout, 0)
+            elif self.out_type == "obj" or self.out_type == "obj+colour":
+                if OUTPUT_GROUPED_OBJS:
+                    fout.write(f"o {mesh_count}\n")  # Start of an object
+                vert_count += mesh.write_mesh_to_type(self.out_type, fout, vert_count, material_name)
+            elif self.out_type == "ply":
+                vert_count += mesh.write_mesh_to_type(self.out_type, fout, vert_count, material_name)
+            mesh_count += 1
+        material[2] = vert_count
+        material[3] = mesh_count
+        self.number_of_meshes += 1
+
+    def _start_material(self, key, mm):
+        mat_index = len(self.materials)
+        # save texture for this mesh
+        if save_material_texture(key, mm, self.dest_folder, self.file_number, mat_index, self.out_type,
+                                 self.file_prefix, self.textures):
+            self.done_addresses.append(key[0])  # clut/texture address vs key
+            self.done_addresses.append(key[1])
+
+        fout = None
+        path = f"{self.dest_folder}/meshes/{self.file_prefix}{self.file_number}-{mat_index}"
+        if self.out_type == "comb":
+            # The header needs the number of meshes, so hold the meshes in a temporary file until close
+            fout = tempfile.TemporaryFile("w+")
+        elif self.out_type == "combb":
+            # The mesh count is filled in on close
+            fout = open(f"{path}.combb", "wb")
+            write_comb_binary_header(fout, COMB_TYPE_FIELD, 0, [f"tex/t{self.file_number}-{mat_index}.png"])
+        elif self.out_type == "obj" or self.out_type == "obj+colour":
+            fout = open(f"{path}.obj", "w")
+        elif self.out_type == "ply":
+            fout = open(f"{path}.ply", "w")
+        self.materials[key] = [mat_index, fout, 0, 0]
+
+    def close(self):
+        print("Mesh by material keys")
+        print(self.materials.keys())
+        print("Number of meshes")
+        print(self.number_of_meshes)
+        for key, (mat_index, fout, vert_count, mesh_count) in self.materials.items():
+            if fout is None:
+                continue
+            if self.out_type == "comb":
+                with open(f"{self.dest_folder}/meshes/{self.file_prefix}{self.file_number}-{mat_index}.{self.out_type}", "w") as fcomb:
+                    fcomb.write("comb - mesh data format\n")
+                    fcomb.write(f"meshes {mesh_count}\n")
+                    fcomb.write(f"type field\n")
+                    fout.seek(0, os.SEEK_SET)
+                    shutil.copyfileobj(fout, fcomb)
+            elif self.out_type == "combb":
+                update_comb_binary_mesh_count(fout, mesh_count)
+            fout.close()
+        self.materials = {}
+
+        if TRY_DUMP_UNUSED_TEXTURES:
+            save_unused_textures(self.dest_folder, self.file_number, self.textures, self.done_addresses)
+
+
 def save_course_type_grouped(mesh_by_material, number_of_meshes, dest_folder, file_number, out_type, file_prefix, textures):
     # Save all meshes into one file, based on their data/mat type
-    mat_index = 0
-    print("Mesh by material keys")
-    print(mesh_by_material.keys())
-    print("Number of meshes")
-    print(number_of_meshes)
+    writer = GroupedMeshWriter(dest_folder, file_number, out_type, file_prefix, textures)
+    try:
+        for key, mm in mesh_by_material.items():
+            if should_exit:
+                break
+            writer.write(key, mm)
+    finally:
+        writer.close()
+
+
+def save_course_type_streamed(course_file, mesh_offsets, dest_folder, file_number, out_type, file_prefix, textures):
+    # Same output as save_course_type_grouped, but each chunk is saved as it is read
+    # so only one chunk's meshes are held in memory at a time
+    writer = GroupedMeshWriter(dest_folder, file_number, out_type, file_prefix, textures)
+    try:
+        for offset in mesh_offsets:
+            for z, meshes_by_texture in Course.iter_course_meshes(course_file, offset):
+                if should_exit:
+                    break
+                for key, mm in meshes_by_texture.items():
+                    writer.write(key, mm)
+            if should_exit:
+                break
+    finally:
+        writer.close()
+
+
+def save_course_type_atlased(mesh_by_material, dest_folder, file_number, out_type, file_prefix, textures):
+    # Pack the textures into atlases, and save a single mesh per atlas
+    # returns the meshes by material that could not be put into an atlas
+    pages, remaining = TextureAtlas.build(mesh_by_material, textures, ATLAS_MAX_SIZE)
+    print(f"Created {len(pages)} atlases, {len(remaining)} materials left unpacked")
 
     Path(f"{dest_folder}/meshes/tex/").mkdir(parents=True, exist_ok=True)
-    mat_index = 0
-    # Build a list of used and unused textures, so we can save the other ones too
-    done_addresses = []
-    done_textures = []
-    for key, mm in mesh_by_material.items():
+    extension = out_type
+    if out_type == "obj+colour":
+        extension = "obj"
+
+    for atlas_index, page in enumerate(pages):
         if should_exit:
             break
-        # Export textures
-        material_name = f"{file_prefix}{file_number}-{mat_index}"
-        texture_path_relative = f"tex/t{file_number}-{mat_index}.png"
+        material_name = f"{file_prefix}{file_number}-atlas{atlas_index}"
+        texture_path_relative = f"tex/t{file_number}-atlas{atlas_index}.png"
+        page.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}")
 
-        # save texture for this mesh
-        if key not in done_textures:
-            clut_address, texture_address = key
-
-            if texture_address == 0 or clut_address == 0:  # 0, 0 is often added, but with no meshes
-                if len(mm) != 0:
-                    print(
-                        f"Mat index {mat_index} has no texture {texture_address} or no clut {clut_address} meshes {len(mm)}")
-                    for m in mm:
-                        print(vars(m))
-            elif texture_address not in textures:
-                print(f"Texture addressing wrong, check value {texture_address}")
-                exit(2)
-            else:
-                texture = textures[texture_address]
-
-                if clut_address not in textures:
-                    # Check texture type
-                    if texture.bpp > 8:
-                        # This is possibly just an image, no clut, esp if bpp == 24 or 32
-                        # save texture as is, without using any CLUTs
-                        print(f"Clut addressing wrong, {clut_address} but image should be fine as is")
-                        print(f"{dest_folder}/meshes/{texture_path_relative}")
-                        texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}",
-                                                     use_palette=False)
-                    else:
-                        # This texture almost certainly needs a CLUT, as it would be B&W otherwise, unlikely
-                        print(f"Clut addressing wrong, check value {clut_address}")
-                else:
-                    # Fetch the texture, and the clut to use
-                    clut = textures[clut_address]
-                    print(
-                        f"Creating paletted image {texture_address} {texture_address:x} using {clut_address} {clut_address:x}")
-                    print(f"clut bpp: {clut.bpp}")
-                    if clut.bpp != 32 and clut.bpp != 24:
-                        print(f"Not using CLUT: as bpp {clut.bpp} is not right")
-                        print(f"{dest_folder}/meshes/{texture_path_relative}")
-                        texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}",
-                                                     use_palette=False)
-                    else:
-                        # Clut valid enough
-                        # Unswizzle the palette, as these are (should) be swizzled for the PS2
-                        unswizzled = Texture.unswizzle_bytes(clut)
-                        texture.palette = unswizzled  # Set the texture's palette accordingly
-                        texture.palette_width = clut.width
-                        texture.palette_height = clut.height
-                        try:
-                            # Save the texture using the given clut
-                            print(f"{dest_folder}/meshes/{texture_path_relative}")
-                            texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}")
-                            print(f"Saved texture for material group {mat_index} t{file_number}-{mat_index}.png")
-                            print()
-                        except Exception as e:
-                            if isinstance(e, ValueError):
-                                if len(e.args) == 1 and e.args[0] == "invalid palette size":
-                                    # Assume this is a normal b&w texture and the clut is probably just a different tex
-                                    print(f"Not using CLUT: as bpp {clut.bpp} is not right")
-                                    print(f"{dest_folder}/meshes/{texture_path_relative}")
-                                    texture.palette = []
-                                    texture.palette_width = 0
-                                    texture.palette_height = 0
-                                    texture.write_texture_to_png(f"{dest_folder}/meshes/{texture_path_relative}", use_palette=False)
-                            else:
-                                texture.write_texture_to_png(f"{dest_folder}/meshes/failed-t{file_number}-{mat_index}-{texture_address:x}.png", use_palette=False)
-                                clut.write_texture_to_png(f"{dest_folder}/meshes/failed-clut-t{file_number}-{mat_index}-{clut_address:x}.png")
-                                print(f"Failed to write texture probably decoded badly Course:{file_number} Texture: {texture_address} {clut_address} {texture}")
-                                print(f"Info: W: {texture.width} x H:{texture.height}  pW: {texture.palette_width} x pH: {texture.palette_height}")
-                                print(e)
-
-                # create material for this texture, for obj
-                if out_type == "obj" or out_type == "obj-combined" or out_type == "obj+colour":
-                    with open(f"{dest_folder}/meshes/{material_name}.mtl", "w") as fout:
-                        Texture.save_material_file_obj(fout, material_name, texture_path_relative)
-
-                done_textures.append(key)
-                done_addresses.append(key[0]) # clut/texture address vs key
-                done_addresses.append(key[1])
-
-        # If you come across this, this is a custom file format I have made, expect this to change over time
-        # you will have to modify this file to get this to output
         if out_type == "comb":
-            with open(f"{dest_folder}/meshes/{file_prefix}{file_number}-{mat_index}.{out_type}", "w") as fout:
+            with open(f"{dest_folder}/meshes/{material_name}.{out_type}", "w") as fout:
                 fout.write("comb - mesh data format\n")
-                fout.write(f"meshes {len(mm)}\n")
+                fout.write(f"meshes 1\n")
                 fout.write(f"type field\n")
-
-                for m, mesh in enumerate(mm):
-                    fout.write(f"s z-{m}\n") # Start of a mesh
-                    mesh.write_mesh_to_type(out_type, fout, material=texture_path_relative)
-                    fout.write(f"e z-{m}\n") # End of a mesh
-        elif out_type == "obj" or out_type == "obj+colour":
-            extension = out_type
-            if out_type == "obj+colour":
-                extension = "obj"
-            with open(f"{dest_folder}/meshes/{file_prefix}{file_number}-{mat_index}.{extension}", "w") as fout:
-                vert_count = 0
-                for m, mesh in enumerate(mm):
-                    if OUTPUT_GROUPED_OBJS:
-                        fout.write(f"o {m}\n") # Start of an object
-                    vert_count += mesh.write_mesh_to_type(out_type, fout, vert_count, material_name)
-        elif out_type == "ply":
-            with open(f"{dest_folder}/meshes/{file_prefix}{file_number}-{mat_index}.{out_type}", "w") as fout:
-                vert_count = 0
-                for m, mesh in enumerate(mm):
-                    vert_count += mesh.write_mesh_to_type(out_type, fout, vert_count, material_name)
-
-        mat_index += 1
-    if TRY_DUMP_UNUSED_TEXTURES:
-        # Save all unreferenced textures, such as the skybox
-        # This ofc will be referenced by the game somewhere, but its not directly addressed here
-        unused_textures = []
-        unreferenced_textures = []
-
-        for address in textures:
-            if address not in done_addresses:
-                # Ignore any none or invalid types
-                if isinstance(textures[address], Texture):
-                    unused_textures.append(address)
-
-        if len(unused_textures) > 0:
-            Path(f"{dest_folder}/tex-unused/").mkdir(parents=True, exist_ok=True)
-
-        # Now try and combine the textures using a guess at its palette
-        for texture_address in unused_textures:
-            texture = textures[texture_address]
-
-            if texture.bpp > 8 and texture.width > 16 and texture.height > 16:
-                # Does not need a clut
-                # write as is
-                texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-full.png", use_palette=False)
-                # Save this address, so we do not use it as a palette
-                unreferenced_textures.append(texture_address)
-            else:
-                # This texture needs a clut, or is b&w (unlikely)
-                # Save a raw copy
-                texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-raw.png", use_palette=False)
-
-                # Locate next palette and use that, might not work, but we do not know how it gets referenced so we do not
-                # have two addresses, this makes lots of attempts, x*x for number of textures/cluts
-                for clut_address in unused_textures:
-                    clut = textures[clut_address]
-                    if clut is None:
-                        continue
-                    if clut.bpp <= 8 or clut.width > 64 or clut.height > 64:
-                        continue  # skip this as it is not a clut, probably a texture
-
-                    print("Found next clut for unreferenced texture")
-                    # Clut valid enough
-                    # Unswizzle the palette, as these are (should) be swizzled for the PS2
-                    unswizzled = Texture.unswizzle_bytes(clut)
-                    texture.palette = unswizzled  # Set the texture's palette accordingly
-                    texture.palette_width = clut.width
-                    texture.palette_height = clut.height
-                    try:
-                        # Save the texture using the given clut
-                        texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-{clut_address:x}.png")
-                        print(f"Attempted to save unreferenced texture: unused-{texture_address:x}.png")
-                        print()
-                    except Exception as e:
-                        if isinstance(e, ValueError):
-                            if len(e.args) == 1 and e.args[0] == "invalid palette size":
-                                # Assume this is a normal b&w texture and the clut is probably just a different tex
-                                print(f"Not using CLUT: as bpp {clut.bpp} is not right")
-                                print(f"{dest_folder}/tex-unused/unused-{texture_address:x}.png")
-                                texture.palette = []
-                                texture.palette_width = 0
-                                texture.palette_height = 0
-                                texture.write_texture_to_png(f"{dest_folder}/tex-unused/unused-{texture_address:x}-raw.png", use_palette=False)
-                        else:
-                            texture.write_texture_to_png(
-                                f"{dest_folder}/tex-unused/failed-unused-{texture_address:x}.png",
-                                use_palette=False)
-                            clut.write_texture_to_png(
-                                f"{dest_folder}/tex-unused/failed-clut-unused-{clut_address:x}.png")
-                            print(
-                                f"Failed to write texture probably decoded badly Course:{file_number} Texture: {texture_address} {clut_address} {texture}")
-                            print(
-                                f"Info: W: {texture.width} x H:{texture.height}  pW: {texture.palette_width} x pH: {texture.palette_height}")
-                            print(e)
+                fout.write(f"s z-0\n")  # Start of a mesh
+                page.mesh.write_mesh_to_type(out_type, fout, material=texture_path_relative)
+                fout.write(f"e z-0\n")  # End of a mesh
+        elif out_type == "combb":
+            with open(f"{dest_folder}/meshes/{material_name}.{out_type}", "wb") as fout:
+                write_comb_binary_header(fout, COMB_TYPE_FIELD, 1, [texture_path_relative])
+                page.mesh.write_mesh_to_comb_binary(fout, 0)
+        elif out_type == "obj" or out_type == "obj+colour" or out_type == "ply":
+            if out_type != "ply":
+                with open(f"{dest_folder}/meshes/{material_name}.mtl", "w") as fout:
+                    Texture.save_material_file_obj(fout, material_name, texture_path_relative)
+            with open(f"{dest_folder}/meshes/{material_name}.{extension}", "w") as fout:
+                page.mesh.write_mesh_to_type(out_type, fout, 0, material_name)
+
+    return remaining
 
 
 def save_course_type(meshes, dest_folder, file_number, out_type, file_prefix):
@@ -345,9 +487,21 @@ def save_course_type(meshes, dest_folder, file_number, out_type, file_prefix):
                                 m += 1
 
 
+# Saves a single mesh read like a car's (e.g a course's map or extras, or the garage), combb is binary so
+# is written on its own with a header, the other types are text
+def save_car_mesh(mesh, path, out_type, texture_path=None):
+    if out_type == "combb":
+        with open(path, "wb") as fout:
+            write_comb_binary_header(fout, COMB_TYPE_CAR, 1, [texture_path] if texture_path is not None else [])
+            mesh.write_mesh_to_comb_binary(fout, 0 if texture_path is not None else -1)
+        return
+    with open(path, "w") as fout:
+        mesh.write_mesh_to_type(out_type, fout)
+
+
 # Open parse, and extract the common data, for fields/courses/actions
 def process_course_type(course_file, dest_folder, file_number, out_type, file_prefix):
-    with open(course_file, "rb") as f:  # Open input course data file
+    with open_entry(course_file) as f:  # Open input course data file
         # Check that the output folders exist (make them)
         Path(f"{dest_folder}/").mkdir(parents=True, exist_ok=True)
         Path(f"{dest_folder}/colliders").mkdir(parents=True, exist_ok=True)
@@ -363,12 +517,18 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
             file_size = f.tell()
             f.seek(0, os.SEEK_SET)
             # Parse the course
-            course = CourseModel.read_course(f)
+            stream_meshes = STREAM_COURSE_MESHES and not ATLAS_TEXTURES and not OUTPUT_CHUNKED_MESHES
+            course = model_cache.load(f, CourseModel.read_course, not stream_meshes)
 
-            # Need to group the meshes by the "data/material" info
             Path(f"{dest_folder}/meshes").mkdir(parents=True, exist_ok=True)
-            mesh_by_material, number_of_meshes = group_meshes_by_material(course.meshes)
-            save_course_type_grouped(mesh_by_material, number_of_meshes, dest_folder, file_number, out_type, file_prefix, course.textures)
+            if stream_meshes:
+                save_course_type_streamed(f, course.mesh_offsets, dest_folder, file_number, out_type, file_prefix, course.textures)
+            else:
+                # Need to group the meshes by the "data/material" info
+                mesh_by_material, number_of_meshes = group_meshes_by_material(course.meshes)
+                if ATLAS_TEXTURES:
+                    mesh_by_material = save_course_type_atlased(mesh_by_material, dest_folder, file_number, out_type, file_prefix, course.textures)
+                save_course_type_grouped(mesh_by_material, number_of_meshes, dest_folder, file_number, out_type, file_prefix, course.textures)
             if OUTPUT_CHUNKED_MESHES:
                 save_course_type(course.meshes, dest_folder,  file_number, out_type, file_prefix)
 
@@ -380,8 +540,7 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
             for i, mesh in enumerate(course.map_meshes):
                 if should_exit:
                     break
-                with open(f"{dest_folder}/{file_prefix}{file_number}-map{i}.{extension}", "w") as fout:
-                    mesh.write_mesh_to_type(out_type, fout)
+                save_car_mesh(mesh, f"{dest_folder}/{file_prefix}{file_number}-map{i}.{extension}", out_type)
             # Export any additional objects (e.g barrels)
             for e, extra in enumerate(course.extras):
                 if should_exit:
@@ -390,12 +549,10 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
                 if type(extra.meshes) is list and type(extra.meshes[0]) is list:
                     for i, subfile in enumerate(extra.meshes):
                         for mi, mesh in enumerate(subfile):
-                            with open(f"{dest_folder}/{file_prefix}{file_number}-extra{e}-{i}-{mi}.{extension}", "w") as fout:
-                                mesh.write_mesh_to_type(out_type, fout)
+                            save_car_mesh(mesh, f"{dest_folder}/{file_prefix}{file_number}-extra{e}-{i}-{mi}.{extension}", out_type)
                 else:
                     for i, mesh in enumerate(extra.meshes):
-                        with open(f"{dest_folder}/{file_prefix}{file_number}-extra{e}-{i}.{extension}", "w") as fout:
-                            mesh.write_mesh_to_type(out_type, fout)
+                        save_car_mesh(mesh, f"{dest_folder}/{file_prefix}{file_number}-extra{e}-{i}.{extension}", out_type)
                 for i in range(0, len(extra.textures)):
                     address, texture = extra.textures[i]
                     if texture is None:
@@ -437,6 +594,9 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
                             collider.write_mesh_to_type(out_type, fout)
                             fout.write(f"e {i}\n")  # End of a mesh
 
+                elif out_type == "combb":
+                    # Colliders have no binary comb writer (yet), use comb for them
+                    print(f"Skipping colliders {collider_mat_index}, not supported for combb")
                 elif out_type == "obj" or out_type == "obj+colour":
                     with open(f"{dest_folder}/colliders/{file_prefix}{file_number}-{collider_mat_index}.collider.{extension}", "w") as fout:
                         vert_count = 0
@@ -470,6 +630,8 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
                             fout.write(f"s {p}\n")  # Start of a mesh
                             post.write_mesh_to_type(out_type, fout)
                             fout.write(f"e {p}\n")  # End of a mesh
+                elif out_type == "combb":
+                    print("Skipping post colliders, not supported for combb")
                 elif out_type == "obj" or out_type == "obj+colour":
                     with open(f"{dest_folder}/colliders/{file_prefix}{file_number}-posts.collider.{extension}",
                               "w") as fout:
@@ -478,11 +640,16 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
                                 fout.write(f"o {p}\n")  # Start of an object
                             post.write_mesh_to_type(out_type, fout)
 
-            if len(course.extra_fields) > 0:
+            if len(course.extra_fields) > 0 or len(course.extra_field_offsets) > 0:
                 Path(f"{dest_folder}/extras/meshes").mkdir(parents=True, exist_ok=True)
                 Path(f"{dest_folder}/extras/colliders").mkdir(parents=True, exist_ok=True)
-                mesh_by_material, number_of_meshes = group_meshes_by_material(course.extra_fields)
-                save_course_type_grouped(mesh_by_material, number_of_meshes, f"{dest_folder}/extras/", file_number, out_type, file_prefix + "-E", course.textures)
+                if stream_meshes:
+                    save_course_type_streamed(f, course.extra_field_offsets, f"{dest_folder}/extras/", file_number, out_type, file_prefix + "-E", course.textures)
+                else:
+                    mesh_by_material, number_of_meshes = group_meshes_by_material(course.extra_fields)
+                    if ATLAS_TEXTURES:
+                        mesh_by_material = save_course_type_atlased(mesh_by_material, f"{dest_folder}/extras/", file_number, out_type, file_prefix + "-E", course.textures)
+                    save_course_type_grouped(mesh_by_material, number_of_meshes, f"{dest_folder}/extras/", file_number, out_type, file_prefix + "-E", course.textures)
                 collider_mat_index = 0
 
                 for ci, col in enumerate(course.extra_field_colliders):
@@ -509,6 +676,8 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
                                         collider.write_mesh_to_type(out_type, fout)
                                         fout.write(f"e {i}\n")  # End of a mesh
 
+                            elif out_type == "combb":
+                                print(f"Skipping extra colliders {ci}-{collider_mat_index}, not supported for combb")
                             elif out_type == "obj" or out_type == "obj+colour":
                                 with open(f"{dest_folder}/extras/colliders/{file_prefix}{file_number}-{ci}-{collider_mat_index}.{extension}",
                                           "w") as fout:
@@ -521,19 +690,51 @@ def process_course_type(course_file, dest_folder, file_number, out_type, file_pr
         sys.stdout = prev_std_out
 
 
+def emit_progress(kind, name="", total=0, size=0, message=""):
+    if progress_callback is not None:
+        progress_callback(ProgressEvent(kind, name, total, size, message))
+
+
+# Calls process_one for each entry, with progress events for the stage and each entry
+# Each entry gets one FILE_FINISHED or FILE_FAILED, if continue_on_error the rest of the entries are still processed
+# after one fails, otherwise the error is raised
+def run_stage(stage, entries, process_one, continue_on_error=False):
+    emit_progress(STAGE_STARTED, stage, total=len(entries))
+    try:
+        for entry in entries:
+            if should_exit:
+                break
+            emit_progress(FILE_STARTED, entry.path)
+            try:
+                process_one(entry)
+            except Exception as e:
+                emit_progress(FILE_FAILED, entry.path, message=str(e))
+                if continue_on_error:
+                    continue
+                raise
+            emit_progress(FILE_FINISHED, entry.path, size=entry.get_size())
+    finally:
+        emit_progress(STAGE_FINISHED, stage)
+
+
+# Files in the folder, skipping hidden files
+def list_stage_files(source, folder):
+    return [entry for entry in source.list_files(folder) if not entry.name.startswith('.') and entry.is_file()]
+
+
 def process_courses(source, dest, folder, output_formats):
-    if not Path(f"{source}/{folder}").is_dir():
+    source = open_source(source)
+    if not source.is_dir(folder):
         print(f"No {folder}s to process, folder {folder} missing")
+        run_stage(folder, [], None)
         return
 
     print(f"Processing {folder}s")
-    with os.scandir(f"{source}/{folder}") as it:
-        for entry in it:
-            if should_exit:
-                break
-            process_course(entry, dest, folder, output_formats)
+    run_stage(folder, list_stage_files(source, folder),
+              lambda entry: process_course(entry, dest, folder, output_formats), continue_on_error=True)
 
 
+# The other output types are still written if one fails, then the failure is raised (for run_stage to report)
 def process_course(entry, dest, folder, output_formats):
     if type(entry) is str:
         entry = Path(entry)
@@ -542,6 +743,7 @@ def process_course(entry, dest, folder, output_formats):
         c_prefix = c_number[0]
         c_number = c_number[1:]
         print(f"Processing {entry.name}")
+        failures = []
         for outType in output_formats:
             if should_exit:
                 break
@@ -554,10 +756,14 @@ def process_course(entry, dest, folder, output_formats):
                 print(e)
                 sys.stdout = sys.__stdout__
                 print(f"Failed to process file {entry.path}")
+                failures.append(f"{outType}: {e}")
+        if len(failures) > 0:
+            raise Exception(f"Failed to process {entry.name} ({', '.join(failures)})")
 
 
 def process_fields(source, dest, output_formats, merge_by_data=False):
-    if not Path(f"{source}/FLD").is_dir():
+    source = open_source(source)
+    if not source.is_dir("FLD"):
         print("FLD folder missing, assuming HG3")
         # for town in ["00", "00S01", "01", "02", "03"]:
         #     town_number = f"{town}"
@@ -566,50 +772,50 @@ def process_fields(source, dest, output_formats, merge_by_data=False):
         #     for out_type in output_formats:
         #         field_output_folder = f"{dest}/TOWN/T{town_number}{out_type}"
         #         process_course_type(town_file, field_output_folder, town_number, out_type, "T")
+        run_stage("FLD", [], None)
         return
     print("Processing fields (FLD)")
+    field_files = []
     for fx in [0, 1, 2, 3]:
         for fy in [0, 1, 2, 3]:
             for fz in [0, 1, 2, 3]:
-                if should_exit:
-                    break
-                field_number = f"{fx}{fy}{fz}"
-                field_file = f"{source}/FLD/{field_number}.BIN"
-                print(f"Processing {field_file}")
-                for out_type in output_formats:
-                    if should_exit:
-                        break
-                    field_output_folder = f"{dest}/FIELD/F{field_number}{out_type}"
-                    if not Path(field_file).exists():
-                        continue
-                    process_course_type(field_file, field_output_folder, field_number, out_type, "F")
+                field_file = source.get_entry(f"FLD/{fx}{fy}{fz}.BIN")
+                if field_file.is_file():
+                    field_files.append(field_file)
+    run_stage("FLD", field_files, lambda field_file: process_field(field_file, dest, output_formats))
+
+
+def process_field(field_file, dest, output_formats):
+    field_number = field_file.name[0: field_file.name.find('.')]
+    print(f"Processing {field_file}")
+    for out_type in output_formats:
+        if should_exit:
+            break
+        field_output_folder = f"{dest}/FIELD/F{field_number}{out_type}"
+        process_course_type(field_file, field_output_folder, field_number, out_type, "F")
 
 
 def process_cars(source, dest, output_formats):
     print("Processing cars")
+    source = open_source(source)
     # Default to hg2 cars
     version = 2
-    if not Path(f"{source}/CAR0").is_dir():
+    if not source.is_dir("CAR0"):
         # Then using chq hg 3 cars
         print("HG3 cars")
         version = 3
 
-    for carFolder in [f"{source}/CAR0", f"{source}/CAR1", f"{source}/CAR2", f"{source}/CAR3", f"{source}/CAR4", f"{source}/CARS"]:
-        if should_exit:
-            break
-        if Path(carFolder).is_dir():
-            with os.scandir(carFolder) as it:
-                for entry in it:
-                    if should_exit:
-                        break
-                    if entry.name == "FROG.BIN":
-                        # Frog is Mesh, followed by multiple Textures
-                        continue
-                    if entry.name == "STICKER.BIN":
-                        # just Textures
-                        continue
-                    if not entry.name.startswith('.') and entry.is_file():
-                        process_entry(entry, dest, output_formats, version, True)
+    entries = []
+    for carFolder in ["CAR0", "CAR1", "CAR2", "CAR3", "CAR4", "CARS"]:
+        for entry in list_stage_files(source, carFolder):
+            if entry.name == "FROG.BIN":
+                # Frog is Mesh, followed by multiple Textures
+                continue
+            if entry.name == "STICKER.BIN":
+                # just Textures
+                continue
+            entries.append(entry)
+    run_stage("CARS", entries, lambda entry: process_entry(entry, dest, output_formats, version, True))
 
 
 def process_entry(entry, folder_out, output_formats, version, is_car=False):
@@ -617,7 +823,7 @@ def process_entry(entry, folder_out, output_formats, version, is_car=False):
         entry = Path(entry)
     basename = entry.name[0 : entry.name.find('.')]
     print(f"Processing {entry}")
-    with open(entry, "rb") as file:
+    with open_entry(entry) as file:
         process_file(file, basename, folder_out, output_formats, version, is_car)
 
 
@@ -634,7 +840,7 @@ def process_file(file, basename, folder_out, output_formats, version, is_car=Fal
         file_size = file.tell()
         file.seek(0, os.SEEK_SET)
         # if version == 2:
-        car = CarModel.read_car(file, 0, file_size)
+        car = model_cache.load(file, CarModel.read_car, 0, file_size)
         # elif version == 3:
         #     car = HG3CarModel.from_file(file, 0, file_size)
         has_textures = len(car.textures) >= 2
@@ -689,6 +895,11 @@ def process_file(file, basename, folder_out, output_formats, version, is_car=Fal
                         mesh_path = f"{i}-{mi}-{mesh_section_names[i][mi]}"
                     else:
                         mesh_path = f"{i}-{mi}"
+                    if outType == "combb":
+                        with open(f"{out_folder}/{basename}-{mesh_path}.{extension}", "wb") as fout:
+                            write_comb_binary_header(fout, COMB_TYPE_CAR, 1, [texture_path] if has_textures else [])
+                            mesh.write_mesh_to_comb_binary(fout, 0 if has_textures else -1)
+                        continue
                     with open(f"{out_folder}/{basename}-{mesh_path}.{extension}", "w") as fout:
                         if outType == "comb":
                             mesh.write_mesh_to_type(outType, fout, material=f"{out_folder}/tex/{basename}.png")
@@ -703,227 +914,210 @@ def process_file(file, basename, folder_out, output_formats, version, is_car=Fal
 def process_items(source, dest, output_formats):
     print("Processing items")
 
-    item_folder = f"{source}/ITEM"
-    if Path(item_folder).is_dir():
-        with os.scandir(item_folder) as it:
-            for entry in it:
+    source = open_source(source)
+    run_stage("ITEM", list_stage_files(source, "ITEM"), lambda entry: process_item(entry, dest))
+
+
+def process_item(entry, dest):
+    basename = entry.name[0 : entry.name.find('.')]
+    out_folder = f"{dest}/ITEM/{basename}"
+    Path(out_folder).mkdir(parents=True, exist_ok=True)
+    print(f"Processing {entry}")
+    with open_entry(entry) as f:
+        if CREATE_LOG_FILES:
+            log_dest = f"{out_folder}/log.log"
+        else:
+            log_dest = os.devnull
+        prev_std_out = sys.stdout
+        with open(log_dest, "w") as sys.stdout:
+            textures = Texture.all_from_file(f, 0)
+            for i, (address, tex) in enumerate(textures):
                 if should_exit:
                     break
-                if not entry.name.startswith('.') and entry.is_file():
-                    if type(entry) is str:
-                        entry = Path(entry)
-                    basename = entry.name[0 : entry.name.find('.')]
-                    out_folder = f"{dest}/ITEM/{basename}"
-                    Path(out_folder).mkdir(parents=True, exist_ok=True)
-                    print(f"Processing {entry}")
-                    with open(entry, "rb") as f:
-                        if CREATE_LOG_FILES:
-                            log_dest = f"{out_folder}/log.log"
-                        else:
-                            log_dest = os.devnull
-                        prev_std_out = sys.stdout
-                        with open(log_dest, "w") as sys.stdout:
-                            textures = Texture.all_from_file(f, 0)
-                            for i, (address, tex) in enumerate(textures):
-                                if should_exit:
-                                    break
-                                if tex is None:
-                                    continue
-                                tex.write_texture_to_png(f"{out_folder}/{basename}-{address:x}.png")
-                        sys.stdout = prev_std_out
+                if tex is None:
+                    continue
+                tex.write_texture_to_png(f"{out_folder}/{basename}-{address:x}.png")
+        sys.stdout = prev_std_out
 
 
 def process_shops(source, dest, output_formats):
     print("Processing shops")
 
-    item_folder = f"{source}/SHOP"
+    source = open_source(source)
     # HG 3 does not have "SHOP" folder
-    if Path(item_folder).is_dir():
-        with os.scandir(item_folder) as it:
-            for entry in it:
-                if should_exit:
-                    break
-                if not entry.name.startswith('.') and entry.is_file():
-                    if type(entry) is str:
-                        entry = Path(entry)
-                    basename = entry.name[0 : entry.name.find('.')]
-                    out_folder = f"{dest}/SHOP/{basename}"
-                    Path(out_folder).mkdir(parents=True, exist_ok=True)
-                    print(f"Processing {entry} to {out_folder}")
-                    with open(entry, "rb") as f:
-                        if CREATE_LOG_FILES:
-                            log_dest = f"{out_folder}/log.log"
-                        else:
-                            log_dest = os.devnull
-                        prev_std_out = sys.stdout
-                        with open(log_dest, "w") as sys.stdout:
-                            if basename == "GARAGE":
-                                # GARAGE is different
-                                garage = GarageModel.from_file(f, 0)
-                                for ei, g_entry in enumerate(garage.entries):
-                                    if g_entry is None:
-                                        continue
-                                    for i in range(0, len(g_entry.textures)):
-                                        if should_exit:
-                                            break
-                                        address, texture = g_entry.textures[i]
-                                        if texture is None:
-                                            continue
-                                        print(f"{address}: {i} bpp: {texture.bpp} {texture.width}x{texture.height}")
-                                        if texture.bpp <= 8:
-                                            # Get next image as clut
-                                            clut_address, clut = g_entry.textures[i + 1]
-                                            # texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}-raw.png")
-                                            if clut is None:
-                                                texture.write_texture_to_png(
-                                                    f"{out_folder}/{basename}-{ei}-{i}.png")
-                                                continue
-                                            print(
-                                                f"Using clut to merge, bpp: {clut.bpp} {clut.width}x{clut.height}")
-                                            print(f"{clut_address}: {i}")
-                                            clut.write_texture_to_png(
-                                                f"{out_folder}/{basename}-{clut_address:x}-raw.png")
-                                            # Set the texture's palette accordingly
-                                            unswizzled = Texture.unswizzle_bytes(clut)
-                                            texture.palette = unswizzled
-                                            texture.palette_width = clut.width
-                                            texture.palette_height = clut.height
-
-                                            texture.write_texture_to_png(
-                                                f"{out_folder}/{basename}-{ei}-{i}.png")
-                                    for mi, mesh in enumerate(g_entry.meshes):
-                                        for outType in output_formats:
-                                            extension = outType
-                                            if outType == "obj+colour":
-                                                extension = "obj"
-                                            with open(f"{out_folder}/{basename}-{ei}-{mi}.{extension}", "w") as fout:
-                                                mesh.write_mesh_to_type(outType, fout, material="GARAGE")
-                                                if outType == "obj" or outType == "obj+colour":
-                                                    with open(f"{out_folder}/{basename}-{ei}-{mi}.mtl", "w") as fout:
-                                                        # cheap Fix as texture is not indexed same
-                                                        Texture.save_material_file_obj(fout, basename, f"./{basename}-{ei}-{2 - ((mi % 2) * 2)}.png")
-
-                            else:
-                                shops = Shop.from_file(f, 0)
-                                print(f"Done shop {entry}")
-                                for i, tex in enumerate(shops.textures):
-                                    if should_exit:
-                                        break
-                                    if tex is None:
-                                        continue
-                                    # for i, tex in enumerate(shop):
-                                    try:
-                                        tex.write_texture_to_png(f"{out_folder}/{basename}-{i}.png")
-                                    except Exception as E:
-                                        print(f"Failed to write texture/palette probably decoded badly Shop[{entry}]: Texture:{i} {tex} {E}")
-                                        raise E
-                        sys.stdout = prev_std_out
+    run_stage("SHOP", list_stage_files(source, "SHOP"), lambda entry: process_shop(entry, dest, output_formats))
+
+
+def process_shop(entry, dest, output_formats):
+    basename = entry.name[0 : entry.name.find('.')]
+    out_folder = f"{dest}/SHOP/{basename}"
+    Path(out_folder).mkdir(parents=True, exist_ok=True)
+    print(f"Processing {entry} to {out_folder}")
+    with open_entry(entry) as f:
+        if CREATE_LOG_FILES:
+            log_dest = f"{out_folder}/log.log"
+        else:
+            log_dest = os.devnull
+        prev_std_out = sys.stdout
+        with open(log_dest, "w") as sys.stdout:
+            if basename == "GARAGE":
+                # GARAGE is different
+                garage = GarageModel.from_file(f, 0)
+                garage.load_entries(TEXTURE_WORKERS)
+                for ei, g_entry in enumerate(garage):
+                    if g_entry is None:
+                        continue
+                    for i in range(0, len(g_entry.textures)):
+                        if should_exit:
+                            break
+                        address, texture = g_entry.textures[i]
+                        if texture is None:
+                            continue
+                        print(f"{address}: {i} bpp: {texture.bpp} {texture.width}x{texture.height}")
+                        if texture.bpp <= 8:
+                            # Get next image as clut
+                            clut_address, clut = g_entry.textures[i + 1]
+                            # texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}-raw.png")
+                            if clut is None:
+                                texture.write_texture_to_png(
+                                    f"{out_folder}/{basename}-{ei}-{i}.png")
+                                continue
+                            print(
+                                f"Using clut to merge, bpp: {clut.bpp} {clut.width}x{clut.height}")
+                            print(f"{clut_address}: {i}")
+                            clut.write_texture_to_png(
+                                f"{out_folder}/{basename}-{clut_address:x}-raw.png")
+                            # Set the texture's palette accordingly
+                            unswizzled = Texture.unswizzle_bytes(clut)
+                            texture.palette = unswizzled
+                            texture.palette_width = clut.width
+                            texture.palette_height = clut.height
+
+                            texture.write_texture_to_png(
+                                f"{out_folder}/{basename}-{ei}-{i}.png")
+                    for mi, mesh in enumerate(g_entry.meshes):
+                        for outType in output_formats:
+                            extension = outType
+                            if outType == "obj+colour":
+                                extension = "obj"
+                            texture_path = f"./{basename}-{ei}-{2 - ((mi % 2) * 2)}.png"
+                            if outType == "combb":
+                                save_car_mesh(mesh, f"{out_folder}/{basename}-{ei}-{mi}.{extension}", outType, texture_path)
+                                continue
+                            with open(f"{out_folder}/{basename}-{ei}-{mi}.{extension}", "w") as fout:
+                                mesh.write_mesh_to_type(outType, fout, material="GARAGE")
+                                if outType == "obj" or outType == "obj+colour":
+                                    with open(f"{out_folder}/{basename}-{ei}-{mi}.mtl", "w") as fout:
+                                        # cheap Fix as texture is not indexed same
+                                        Texture.save_material_file_obj(fout, basename, texture_path)
+
+            else:
+                shops = Shop.from_file(f, 0, TEXTURE_WORKERS)
+                print(f"Done shop {entry}")
+                for i, tex in enumerate(shops.textures):
+                    if should_exit:
+                        break
+                    if tex is None:
+                        continue
+                    # for i, tex in enumerate(shop):
+                    try:
+                        tex.write_texture_to_png(f"{out_folder}/{basename}-{i}.png")
+                    except Exception as E:
+                        print(f"Failed to write texture/palette probably decoded badly Shop[{entry}]: Texture:{i} {tex} {E}")
+                        raise E
+        sys.stdout = prev_std_out
 
 
 def process_sys(source, dest, output_formats):
     print("Processing items")
 
-    sys_folder = f"{source}/SYS"
-    if Path(sys_folder).is_dir():
-        with os.scandir(sys_folder) as it:
-            for entry in it:
-                if should_exit:
-                    break
-                if not entry.name.startswith('.') and entry.is_file():
-                    if type(entry) is str:
-                        entry = Path(entry)
-
-                    basename = entry.name[0: entry.name.find('.')]
-                    extension = entry.name[entry.name.find('.')+1:]
-                    out_folder = f"{dest}/SYS/{entry.name}"
-                    Path(out_folder).mkdir(parents=True, exist_ok=True)
-                    print(f"Processing {entry}")
-                    with open(entry, "rb") as f:
-                        if CREATE_LOG_FILES:
-                            log_dest = f"{out_folder}/log.log"
-                        else:
-                            log_dest = os.devnull
-                        prev_std_out = sys.stdout
-                        with open(log_dest, "w") as sys.stdout:
-                            if extension == "GSL":
-                                textures = Texture.all_from_file(f, 0)
-                                for i in range(0, len(textures)):
-                                    if should_exit:
-                                        break
-                                    address, texture = textures[i]
-                                    if texture is None:
-                                        continue
-                                    print(f"{address}: {i} bpp: {texture.bpp} {texture.width}x{texture.height}")
-                                    if texture.bpp <= 8:
-                                        # Get next image as clut
-                                        clut_address, clut = textures[i+1]
-                                        # texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}-raw.png")
-                                        if clut is None:
-                                            texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}.png")
-                                            continue
-                                        print(f"Using clut to merge, bpp: {clut.bpp} {clut.width}x{clut.height}")
-                                        print(f"{clut_address}: {i}")
-                                        clut.write_texture_to_png(f"{out_folder}/{entry.name}-{clut_address:x}-raw.png")
-                                        # Set the texture's palette accordingly
-                                        unswizzled = Texture.unswizzle_bytes(clut)
-                                        texture.palette = unswizzled
-                                        texture.palette_width = clut.width
-                                        texture.palette_height = clut.height
-
-                                        texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}.png")
-                            elif entry.name == "PUTI.BIN":
-                                textures = []
-                                total_length = 49152
-                                img_length = 47216
-
-                                for i in range(0, 100):
-                                    if should_exit:
-                                        break
-                                    result = Texture.all_from_file(f, i * total_length)
-                                    texture = result[0][1]
-                                    clut = result[1][1]
-                                    if texture is None:
-                                        continue
-
-                                    if texture.bpp <= 8:
-                                        # Get next image as clut
-                                        print(f"Using clut to merge, bpp: {clut.bpp} {clut.width}x{clut.height}")
-                                        # texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}-raw.png")
-                                        if clut is None:
-                                            texture.write_texture_to_png(f"{out_folder}/{entry.name}-{i}.png")
-                                            continue
-                                        clut.write_texture_to_png(f"{out_folder}/{entry.name}-{i}-p.png")
-                                        # Set the texture's palette accordingly
-                                        unswizzled = Texture.unswizzle_bytes(clut)
-                                        texture.palette = unswizzled
-                                        texture.palette_width = clut.width
-                                        texture.palette_height = clut.height
-
-                                        texture.write_texture_to_png(f"{out_folder}/{entry.name}-{i}.png")
-                            elif extension == "E3D" and basename != "TAKARA" and basename != "ENKEI":
-                                meshes = Course.read_course_meshes(f, 0)
-                                textures = {}
-                                with open(f"{entry.path[0: entry.path.find('.E3D')]}.GSL", "rb") as ftextures:
-                                    textures_read = Texture.all_from_file(ftextures, 0)
-                                    # Convert to dict
-                                    for (address, texture) in textures_read:
-                                        textures[address] = texture
-
-                                # Need to group the meshes by the "data/material" info
-                                mesh_by_material, number_of_meshes = group_meshes_by_material(meshes)
-                                for out_type in output_formats:
-                                    if should_exit:
-                                        break
-                                    save_course_type_grouped(mesh_by_material, number_of_meshes, out_folder,
-                                                             basename, out_type, "", textures)
-                            elif extension == "BIN":
-                                process_entry(entry, out_folder, output_formats, 2)
+    source = open_source(source)
+    run_stage("SYS", list_stage_files(source, "SYS"),
+              lambda entry: process_sys_entry(source, entry, dest, output_formats))
+
+
+def process_sys_entry(source, entry, dest, output_formats):
+    basename = entry.name[0: entry.name.find('.')]
+    extension = entry.name[entry.name.find('.')+1:]
+    out_folder = f"{dest}/SYS/{entry.name}"
+    Path(out_folder).mkdir(parents=True, exist_ok=True)
+    print(f"Processing {entry}")
+    with open_entry(entry) as f:
+        if CREATE_LOG_FILES:
+            log_dest = f"{out_folder}/log.log"
+        else:
+            log_dest = os.devnull
+        prev_std_out = sys.stdout
+        with open(log_dest, "w") as sys.stdout:
+            if extension == "GSL":
+                textures = Texture.all_from_file(f, 0)
+                for i in range(0, len(textures)):
+                    if should_exit:
+                        break
+                    address, texture = textures[i]
+                    if texture is None:
+                        continue
+                    print(f"{address}: {i} bpp: {texture.bpp} {texture.width}x{texture.height}")
+                    if texture.bpp <= 8:
+                        # Get next image as clut
+                        clut_address, clut = textures[i+1]
+                        # texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}-raw.png")
+                        if clut is None:
+                            texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}.png")
+                            continue
+                        print(f"Using clut to merge, bpp: {clut.bpp} {clut.width}x{clut.height}")
+                        print(f"{clut_address}: {i}")
+                        clut.write_texture_to_png(f"{out_folder}/{entry.name}-{clut_address:x}-raw.png")
+                        # Set the texture's palette accordingly
+                        unswizzled = Texture.unswizzle_bytes(clut)
+                        texture.palette = unswizzled
+                        texture.palette_width = clut.width
+                        texture.palette_height = clut.height
 
-                        sys.stdout = prev_std_out
+                        texture.write_texture_to_png(f"{out_folder}/{entry.name}-{address:x}.png")
+            elif entry.name == "PUTI.BIN":
+                quick_pic = QuickPic.from_file(f, 0, TEXTURE_WORKERS)
+                for i, texture in enumerate(quick_pic.textures):
+                    if should_exit:
+                        break
+                    if texture is None:
+                        continue
+                    clut = quick_pic.palettes[i]
+                    if texture.bpp <= 8 and clut is not None:
+                        print(f"Using clut to merge, bpp: {clut.bpp} {clut.width}x{clut.height}")
+                        clut.write_texture_to_png(f"{out_folder}/{entry.name}-{i}-p.png")
+                    texture.write_texture_to_png(f"{out_folder}/{entry.name}-{i}.png")
+            elif extension == "E3D" and basename != "TAKARA" and basename != "ENKEI":
+                meshes = Course.read_course_meshes(f, 0)
+                textures = {}
+                with source.open(f"{entry.path[0: entry.path.find('.E3D')]}.GSL") as ftextures:
+                    textures_read = Texture.all_from_file(ftextures, 0)
+                    # Convert to dict
+                    for (address, texture) in textures_read:
+                        textures[address] = texture
+
+                # Need to group the meshes by the "data/material" info
+                mesh_by_material, number_of_meshes = group_meshes_by_material(meshes)
+                for out_type in output_formats:
+                    if should_exit:
+                        break
+                    save_course_type_grouped(mesh_by_material, number_of_meshes, out_folder,
+                                             basename, out_type, "", textures)
+            elif extension == "BIN":
+                process_entry(entry, out_folder, output_formats, 2)
+
+        sys.stdout = prev_std_out
 
 
 if __name__ == '__main__':
     colorama.init()
+    if "--no-cache" in sys.argv:
+        sys.argv.remove("--no-cache")
+        model_cache.enabled = False
+    TEXTURE_WORKERS = None
+    if "--no-parallel" in sys.argv:
+        sys.argv.remove("--no-parallel")
+        TEXTURE_WORKERS = 1
     if len(sys.argv) >= 3:
         folder_in = sys.argv[1]
         folder_out = sys.argv[2]
@@ -953,7 +1147,7 @@ if __name__ == '__main__':
         print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Failed to create or use output folder")
         exit(1)
 
-    if os.path.isfile(folder_in):
+    if os.path.isfile(folder_in) and not is_iso_path(folder_in):
         print(Fore.RED + "ERROR: " + Style.RESET_ALL + "This tool is for extracting \"all\" game data, not just a single file, see help")
         exit(1)
 
@@ -971,16 +1165,24 @@ if __name__ == '__main__':
         ply = False
         obj_colours = False
         output_formats = ["comb"]
-
-    if os.path.isdir(folder_in):
-        process_courses(folder_in, folder_out, "COURSE", output_formats)
-        process_cars(folder_in, folder_out, output_formats)
-        process_courses(folder_in, folder_out, "ACTION", output_formats)
-        process_fields(folder_in, folder_out, output_formats)
+    if len(sys.argv) == 4 and sys.argv[3] == "B":
+        obj = False
+        ply = False
+        obj_colours = False
+        output_formats = ["combb"]
+
+    if os.path.isdir(folder_in) or is_iso_path(folder_in):
+        # Either the game root folder, or the game's iso (read in place)
+        source = open_source(folder_in)
+        process_courses(source, folder_out, "COURSE", output_formats)
+        process_cars(source, folder_out, output_formats)
+        process_courses(source, folder_out, "ACTION", output_formats)
+        process_fields(source, folder_out, output_formats)
         # These are other bits from the game, might be useful for some
-        #process_items(folder_in, folder_out, output_formats)
-        #process_shops(folder_in, folder_out, output_formats)
-        #process_sys(folder_in, folder_out, output_formats)
+        #process_items(source, folder_out, output_formats)
+        #process_shops(source, folder_out, output_formats)
+        #process_sys(source, folder_out, output_formats)
+        source.close()
 
     else:
         print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Failed to read source folder")
@@ -1,23 +1,173 @@
-print("Requires raylib")
+print("Requires raylib and numpy")
 
 from raylib import *
 from pyray import Rectangle, Image
 
+import io
 import os
+import queue
+import sys
+import time
 from pathlib import Path
 from abc import abstractmethod
 import tkinter as tk
 from tkinter import filedialog
 import weakref
+import numpy as np
 
 from choroq.egame.car import CarModel as QCar
 #from choroq.egame.car_hg3 import HG3CarModel as QHG3Car
 
 from choroq.egame.course import CourseModel as QCourse
+from choroq.egame.course import Course
+from choroq.model_cache import model_cache
+from choroq.load_jobs import Loader
+from choroq.profiler import profiler, format_bytes, LOAD_STAGES, PARSE, CONVERT, UPLOAD
+from choroq.resource_catalog import ResourceCatalog, make_summary, describe
+from choroq.view_frustum import get_camera_planes, boxes_in_frustum
 
 from enum import Enum
 
 
+# Most vertices in one raylib mesh, as its indices are unsigned shorts
+MAX_BATCH_VERTICES = 65535
+
+
+# Returns the MeshBuffer's data as a numpy array (without copying)
+def buffer_array(mesh_buffer):
+    return np.frombuffer(mesh_buffer.data, dtype=mesh_buffer.data.typecode)
+
+
+# Returns the mesh's attributes as arrays for raylib, flipped on X (with the normals and faces flipped to match)
+# Only uses numpy, so can be run off the render thread
+def mesh_arrays(mesh, colours):
+    vertices = buffer_array(mesh.mesh_verts).astype(np.float32).reshape(-1, 3)
+    vertices[:, 0] *= -1
+    normals = -buffer_array(mesh.mesh_normals).astype(np.float32)
+    uvs = np.ascontiguousarray(buffer_array(mesh.mesh_uvs).reshape(-1, 3)[:, :2], dtype=np.float32)
+    uvs[:, 1] *= -1
+    # 1 based, and reversed to keep the winding after the flip
+    faces = np.ascontiguousarray(buffer_array(mesh.mesh_faces).reshape(-1, 3)[:, ::-1] - 1, dtype=np.uint16)
+    colours = buffer_array(colours).astype(np.uint8)
+    if len(colours) != len(vertices) * 4:
+        colours = np.full(len(vertices) * 4, 255, dtype=np.uint8)
+    return vertices, normals, uvs, faces, colours
+
+
+# Joins the meshes' arrays (from mesh_arrays) into as few as possible, each under MAX_BATCH_VERTICES vertices
+def merge_mesh_arrays(meshes):
+    batches = []
+    batch = []
+    vertex_count = 0
+    for arrays in meshes:
+        count = len(arrays[0])
+        if vertex_count + count > MAX_BATCH_VERTICES and len(batch) > 0:
+            batches.append(batch)
+            batch = []
+            vertex_count = 0
+        batch.append(arrays)
+        vertex_count += count
+    if len(batch) > 0:
+        batches.append(batch)
+
+    merged = []
+    for batch in batches:
+        # Each mesh's faces are moved past the vertices of the meshes before it
+        offsets = np.cumsum([0] + [len(arrays[0]) for arrays in batch[:-1]])
+        faces = np.concatenate([arrays[3] + np.uint16(offset) for arrays, offset in zip(batch, offsets)])
+        merged.append((np.concatenate([arrays[0] for arrays in batch]), np.concatenate([arrays[1] for arrays in batch]),
+                       np.concatenate([arrays[2] for arrays in batch]), faces,
+                       np.concatenate([arrays[4] for arrays in batch])))
+    return merged
+
+
+# Points the raylib mesh at the arrays (from mesh_arrays)
+# returns the arrays and their cdata, these must be kept alive as long as the raylib mesh is
+def fill_raylib_mesh(rMesh, arrays):
+    vertices, normals, uvs, faces, colours = arrays
+    buffers = (ffi.from_buffer("float[]", vertices), ffi.from_buffer("float[]", normals),
+               ffi.from_buffer("float[]", uvs), ffi.from_buffer("unsigned short[]", faces),
+               ffi.from_buffer("unsigned char[]", colours))
+    rMesh.vertices, rMesh.normals, rMesh.texcoords, rMesh.indices, rMesh.colors = buffers
+    rMesh.vertexCount = len(vertices)
+    rMesh.triangleCount = len(faces)
+    return arrays + buffers
+
+
+# Uploads the arrays (from mesh_arrays) as the raylib mesh, returns the buffers from fill_raylib_mesh
+def upload_raylib_mesh(rMesh, arrays):
+    buffers = fill_raylib_mesh(rMesh, arrays)
+    UploadMesh(rMesh, False)
+    profiler.count_upload(vertex_bytes=sum(array.nbytes for array in arrays))
+    return buffers
+
+
+# Uploads the pixels (from texture_pixels) as a raylib texture
+def load_raylib_texture(pixels, width, height, pixel_format):
+    image = Image(ffi.from_buffer("char[]", pixels), width, height, 1, pixel_format)
+    profiler.count_upload(texture_bytes=pixels.nbytes)
+    return LoadTextureFromImage(image)
+
+
+# Draws the resource catalog's info for the list entry (e.g a CarReference) next to the mouse
+def draw_reference_info(reference):
+    text = describe(reference.info).encode('ascii')
+    if len(text) == 0:
+        return
+    x = GetMouseX() + 12
+    y = GetMouseY() + 12
+    DrawRectangle(x - 4, y - 4, MeasureText(text, 10) + 8, 18, Fade(BLACK, 0.8))
+    DrawText(text, x, y, 10, WHITE)
+
+
+# DrawMesh, counted for the profiler overlay
+def draw_mesh(rMesh, rMaterial, matrix):
+    DrawMesh(rMesh, rMaterial, matrix)
+    profiler.count_draw()
+
+
+# Unloads the mesh from the GPU, without freeing its arrays (they are owned by numpy, see fill_raylib_mesh)
+def unload_raylib_mesh(rMesh):
+    rMesh.vertices = ffi.NULL
+    rMesh.normals = ffi.NULL
+    rMesh.texcoords = ffi.NULL
+    rMesh.indices = ffi.NULL
+    rMesh.colors = ffi.NULL
+    UnloadMesh(rMesh[0])
+
+
+# Returns the texture's pixels, as an array of (R,G,B) or (R,G,B,A) per pixel
+def texture_pixels(tex, channels):
+    data = np.frombuffer(tex.get_texture_as_bytes(), dtype=np.uint8).reshape(tex.width * tex.height, -1)
+    if channels == 3:
+        return np.ascontiguousarray(data[:, :3])
+    if data.shape[1] == 3:
+        # No alpha (bpp > 8)
+        return np.column_stack((data, np.full(len(data), 255, dtype=np.uint8)))
+    pixels = data.copy()
+    # PS2 alpha, 0x80 is fully opaque
+    pixels[pixels[:, 3] == 0x80, 3] = 255
+    return pixels
+
+
+# Returns (pixels, width, height) for a course material (clut address, texture address), or None if it has no texture
+def get_course_texture(material, textures):
+    cAddress = material[0]
+    tAddress = material[1]
+    tex = textures.get(tAddress)
+    clut = textures.get(cAddress)
+    if tex is None:
+        return None
+    if clut is not None:
+        tex.palette = clut.texture
+        tex.palette_width = clut.width
+        tex.palette_height = clut.height
+        if tex.bpp > clut.bpp:
+            # Invalid texture somehow?
+            return None
+    return texture_pixels(tex, 4), tex.width, tex.height
+
+
 class GameVersions(Enum):
     UNSET = 0,
     CHOROQ_HG_2 = 1,
@@ -59,6 +209,7 @@ class CarReference:
         self.name = name
         self.loaded = False
         self.models = ModelData()
+        self.info = None  # The file's info from the resource catalog
 
 
 class CourseReference:
@@ -68,6 +219,7 @@ class CourseReference:
         self.name = name
         self.loaded = False
         self.models = ModelData()
+        self.info = None  # The file's info from the resource catalog
 
 
 class FieldReference:
@@ -77,6 +229,11 @@ class FieldReference:
         self.name = name
         self.loaded = False
         self.models = ModelData()
+        self.info = None  # The file's info from the resource catalog
+
+# Width of the profiler overlay
+PROFILER_WIDTH = 300
+
 
 class ChoroQTools:
     def __init__(self):
@@ -89,6 +246,12 @@ class ChoroQTools:
 
         self.camera = ffi.new("struct Camera3D *", [[18.0, 16.0, 18.0], [0.0, 0.0, 0.0], [0.0, 1.0, 0.0], 45.0, 0])
 
+        # Files are parsed in the background by the loader, and uploaded a little each frame
+        self.loader = Loader()
+        # Files found in the game folders, so setup does not need to scan them again
+        self.catalog = ResourceCatalog.load()
+        self.show_profiler = "--profile" in sys.argv
+
     def start_ui(self):
         SetConfigFlags(FLAG_WINDOW_RESIZABLE)
         InitWindow(self.screen_width, self.screen_height, b"ChoroQ HG 2 tool")
@@ -98,6 +261,14 @@ class ChoroQTools:
         self.PushState(MenuTop())
 
         while not WindowShouldClose():
+            profiler.begin_frame()
+            self.loader.update()
+
+            if IsKeyPressed(KEY_F3):
+                self.show_profiler = not self.show_profiler
+            if IsKeyPressed(KEY_F4):
+                profiler.save_trace()
+
             BeginDrawing()
             ClearBackground(GetColor(GuiGetStyle(DEFAULT, BACKGROUND_COLOR) & 0xffffffff))
 
@@ -110,15 +281,54 @@ class ChoroQTools:
             if self.current_window is not None:
                 self.current_window.OnDraw()
 
+            self.DrawLoadProgress()
+            if self.show_profiler:
+                self.DrawProfiler()
+
             for element in self.state_stack:
                 element.OnUpdate()
 
             if self.current_window is not None:
                 self.current_window.OnUpdate()
 
+            profiler.end_frame()
             EndDrawing()
+        self.loader.close()
+        self.catalog.save()
         CloseWindow()
 
+    # Lists the files still loading, in the bottom left
+    def DrawLoadProgress(self):
+        jobs = self.loader.get_active_jobs()
+        line = GetScreenHeight() - 20 * len(jobs) - 10
+        for job in jobs:
+            DrawText(f"{job.name}: {job.state} {int(job.progress * 100)}%".encode('ascii'), 20, line, 20, DARKGRAY)
+            line += 20
+
+    # Frame and load times (see choroq/profiler.py) in the top right, shown/hidden with F3
+    def DrawProfiler(self):
+        lines = [f"FPS {GetFPS()}"]
+        percentiles = profiler.get_frame_percentiles()
+        if percentiles is not None:
+            lines.append("Frame p50 {:.2f}ms p95 {:.2f}ms p99 {:.2f}ms".format(*percentiles))
+        lines.append(f"Mesh draw calls {profiler.last_draw_calls}")
+        lines.append(f"Vertices uploaded {format_bytes(profiler.last_vertex_bytes)}, "
+                     f"total {format_bytes(profiler.total_vertex_bytes)}")
+        lines.append(f"Textures uploaded {format_bytes(profiler.last_texture_bytes)}, "
+                     f"total {format_bytes(profiler.total_texture_bytes)}")
+        model, times = profiler.get_last_load_times()
+        if model is not None:
+            lines.append(f"Load {model}")
+            lines.append(", ".join(f"{stage} {times.get(stage, 0) * 1000:.0f}ms" for stage in LOAD_STAGES))
+        lines.append("F4 to save a trace")
+
+        x = GetScreenWidth() - PROFILER_WIDTH - 10
+        y = 42
+        DrawRectangle(x - 5, y - 5, PROFILER_WIDTH + 10, 14 * len(lines) + 10, Fade(BLACK, 0.7))
+        for line in lines:
+            DrawText(line.encode('ascii'), x, y, 10, GREEN)
+            y += 14
+
     def SetWindow(self, new_window):
         if self.current_window is not None:
             self.current_window.OnClose()
@@ -252,6 +462,12 @@ class FieldResource:
     name: str
 
 
+# Files in the car folders that are not cars
+SKIPPED_CAR_FILES = {"WHEEL.BIN", "FASHION.BIN", "FROG.BIN", "STICKER.BIN"}
+# Fields are FLD/xyz.BIN, each of x, y and z from 0 to 3
+VALID_FIELD_FILES = {f"{fx}{fy}{fz}.bin" for fx in range(4) for fy in range(4) for fz in range(4)}
+
+
 class SetupDialog(RenderStackItem):
 
     def __init__(self):
@@ -388,21 +604,25 @@ class SetupDialog(RenderStackItem):
 
     def FindResources(self):
         # Find hg2 resources
-        cars, courses, fields, actions = SetupDialog._FindResources(self.owner.state.hg2_game_folder_path, GameVersions.CHOROQ_HG_2)
+        catalog = self.owner.catalog
+        cars, courses, fields, actions = SetupDialog._FindResources(catalog, self.owner.state.hg2_game_folder_path, GameVersions.CHOROQ_HG_2)
 
         self.owner.state.hg2_references.cars = cars
         self.owner.state.hg2_references.courses = courses
         self.owner.state.hg2_references.fields = fields
 
         # Find hg3 resources
-        cars, courses, fields, _ = SetupDialog._FindResources(self.owner.state.hg3_game_folder_path, GameVersions.CHOROQ_HG_3)
+        cars, courses, fields, _ = SetupDialog._FindResources(catalog, self.owner.state.hg3_game_folder_path, GameVersions.CHOROQ_HG_3)
 
         self.owner.state.hg3_references.cars = cars
         self.owner.state.hg3_references.courses = courses
         self.owner.state.hg3_references.fields = fields
 
+        catalog.save()
+
+    # Lists the files from the catalog, which only scans the folders that have changed since the last time
     @staticmethod
-    def _FindResources(folder, version):
+    def _FindResources(catalog, folder, version):
         cars = []
         courses = []
         fields = []
@@ -410,52 +630,30 @@ class SetupDialog(RenderStackItem):
         # Find all cars
         for carFolder in [f"{folder}/CAR0", f"{folder}/CAR1", f"{folder}/CAR2", f"{folder}/CAR3", f"{folder}/CAR4",
                           f"{folder}/CARS"]:
-            if Path(carFolder).is_dir():
-                with os.scandir(carFolder) as it:
-                    for entry in it:
-                        if entry.name == "WHEEL.BIN":
-                            continue
-                        if entry.name == "FASHION.BIN":
-                            continue
-                        if entry.name == "FROG.BIN":
-                            continue
-                        if entry.name == "STICKER.BIN":
-                            continue
-                        if not entry.name.startswith('.') and entry.is_file():
-                            cars.append(CarReference(entry, os.path.basename(entry.path), version))
+            for name, path, info in catalog.list_folder(carFolder):
+                if name in SKIPPED_CAR_FILES:
+                    continue
+                cars.append(SetupDialog._MakeReference(CarReference, path, name, version, info))
         # Find all courses
-        if Path(f"{folder}/COURSE").is_dir():
-            with os.scandir(f"{folder}/COURSE") as it:
-                for entry in it:
-                    if entry.name.startswith('.') or not entry.is_file():
-                        continue
-                    if entry.name.startswith('C'):
-                        courses.append(CourseReference(entry, os.path.basename(entry.path), version))
-                    else:
-                        actions.append(CourseReference(entry, os.path.basename(entry.path), version))
-        if version == GameVersions.CHOROQ_HG_2 and Path(f"{folder}/ACTION").is_dir():
-            with os.scandir(f"{folder}/ACTION") as it:
-                for entry in it:
-                    if entry.name.startswith('.') or not entry.is_file():
-                        continue
-                    actions.append(CourseReference(entry, os.path.basename(entry.path), version))
-        if Path(f"{folder}/FLD").is_dir():
-            valid_fields = []
-            for fx in [0, 1, 2, 3]:
-                for fy in [0, 1, 2, 3]:
-                    for fz in [0, 1, 2, 3]:
-                        field_number = f"{fx}{fy}{fz}"
-                        valid_fields.append(f"{field_number}.bin")
-
-                        #field_file = f"{folder}/FLD/{field_number}.BIN"
-                        #fields.append(field_file)
-            with os.scandir(f"{folder}/FLD") as it:
-                for entry in it:
-                    if entry.name.startswith('.') or not entry.is_file():
-                        continue
-                    if entry.name.lower() in valid_fields:
-                        fields.append(FieldReference(entry, os.path.basename(entry.path), version))
+        for name, path, info in catalog.list_folder(f"{folder}/COURSE"):
+            if name.startswith('C'):
+                courses.append(SetupDialog._MakeReference(CourseReference, path, name, version, info))
+            else:
+                actions.append(SetupDialog._MakeReference(CourseReference, path, name, version, info))
+        if version == GameVersions.CHOROQ_HG_2:
+            for name, path, info in catalog.list_folder(f"{folder}/ACTION"):
+                actions.append(SetupDialog._MakeReference(CourseReference, path, name, version, info))
+        for name, path, info in catalog.list_folder(f"{folder}/FLD"):
+            if name.lower() in VALID_FIELD_FILES:
+                fields.append(SetupDialog._MakeReference(FieldReference, path, name, version, info))
         return cars, courses, fields, actions
+
+    @staticmethod
+    def _MakeReference(reference_type, path, name, version, info):
+        reference = reference_type(path, name, version)
+        reference.info = info
+        return reference
+
     def OnUpdate(self):
         pass
 
@@ -511,10 +709,14 @@ class CarViewer(RenderStackItem):
 
         self.should_load_parts = True
 
-        self.loaded_tyre_hg2 = False
-        self.loaded_tyre_hg3 = False
-        self.loaded_parts_hg2 = False
-        self.loaded_parts_hg3 = False
+        # ModelData once loaded, otherwise None
+        self.loaded_tyre_hg2 = None
+        self.loaded_tyre_hg3 = None
+        self.loaded_parts_hg2 = None
+        self.loaded_parts_hg3 = None
+
+        self.car_jobs = {}  # CarReference -> the loader job loading it
+        self.jobs = []  # Every job started by the viewer, cancelled when it is closed
 
         self.rendRec = Rectangle(0, 0, int(self.renderTexture.texture.width), int(-self.renderTexture.texture.height))
         self.rendVec = [int(0), int(0)]
@@ -533,7 +735,10 @@ class CarViewer(RenderStackItem):
         pass
 
     def OnClose(self):
-        pass
+        for job in self.jobs:
+            job.cancel()
+        self.jobs = []
+        self.car_jobs = {}
 
     def OnDraw(self):
         if not self.active:
@@ -596,14 +801,16 @@ class CarViewer(RenderStackItem):
             self.LoadParts()
             self.should_load_parts = False
 
+        # The car under the mouse, its info (from the catalog) is shown next to the mouse
+        hovered = None
         for car in self.owner.state.hg2_references.cars:
             leftButtonRec = Rectangle(15, position, buttonWidth - 10, text_height - 2)
             position += text_height
             carName = car.name.encode('ascii')
+            if CheckCollisionPointRec(GetMousePosition(), leftButtonRec):
+                hovered = car
             if GuiButton(leftButtonRec, carName):
-                self.loaded_cars[self.current_slot] = car
-                if not self.loaded_cars[self.current_slot].loaded:
-                    self.LoadCar(self.current_slot)
+                self.SelectCar(car)
 
         # Set selected button colour
         GuiSetStyle(BUTTON, BASE_COLOR_NORMAL, slot1_colour)
@@ -619,10 +826,10 @@ class CarViewer(RenderStackItem):
             rightButtonRec = Rectangle(buttonWidth - 10 + 20, position, buttonWidth - 10, text_height - 2)
             position += text_height
             carName = car.name.encode('ascii')
+            if CheckCollisionPointRec(GetMousePosition(), rightButtonRec):
+                hovered = car
             if GuiButton(rightButtonRec, carName):
-                self.loaded_cars[self.current_slot] = car
-                if not self.loaded_cars[self.current_slot].loaded:
-                    self.LoadCar(self.current_slot)
+                self.SelectCar(car)
         EndScissorMode()
 
         # Draw options menu (right)
@@ -661,7 +868,7 @@ class CarViewer(RenderStackItem):
         options_line += options_height
 
         for slot in range(self.max_slots):
-            if self.loaded_cars[slot] is None:
+            if self.loaded_cars[slot] is None or not self.loaded_cars[slot].loaded:
                 continue
             for i in range(self.car_options[slot].size):
                 option[0] = self.car_options[slot].part_visible[i]
@@ -720,11 +927,12 @@ class CarViewer(RenderStackItem):
                 DrawPlane([0, -0.002, 0], [100, 100], GRAY)
 
             for slot in range(self.max_slots):
-                if self.loaded_cars[slot] is not None:
+                if self.loaded_cars[slot] is not None and self.loaded_cars[slot].loaded:
                     mat = MatrixIdentity()
                     mat = MatrixAdd(mat, MatrixTranslate(slot * 12 - 6, 0, 0))
                     car_offset = [0, 0, 0]
-                    if self.car_options[slot].tire_selection != 0:
+                    # Tyres are drawn once loaded
+                    if self.car_options[slot].tire_selection != 0 and self.loaded_tyre_hg2 is not None:
                         # Draw wheels
                         if self.loaded_cars[slot].game_version == GameVersions.CHOROQ_HG_2:
                             wheelMatrix = MatrixAdd(mat, MatrixIdentity())
@@ -746,10 +954,10 @@ class CarViewer(RenderStackItem):
                             if self.car_options[slot].tire_selection == 1:
                                 # Draw 4 normal tyres
                                 # 0/1 are Front left/right
-                                DrawMesh(self.loaded_tyre_hg2.meshes[0][0], self.loaded_tyre_hg2.materials[0], wheelFLMatrix)
-                                DrawMesh(self.loaded_tyre_hg2.meshes[1][0], self.loaded_tyre_hg2.materials[1], wheelFRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[0][0], self.loaded_tyre_hg2.materials[0], wheelFLMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[1][0], self.loaded_tyre_hg2.materials[1], wheelFRMatrix)
                                 # 2 is rear axle
-                                DrawMesh(self.loaded_tyre_hg2.meshes[2][0], self.loaded_tyre_hg2.materials[2], wheelRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[2][0], self.loaded_tyre_hg2.materials[2], wheelRMatrix)
                                 #3 is lp tyres
                                 #DrawMesh(self.loaded_tyre_hg2.meshes[3][0], self.loaded_tyre_hg2.materials[3], wheelMatrix)
 
@@ -757,14 +965,14 @@ class CarViewer(RenderStackItem):
                                 # 4/5 is left/right big
                                 # Draw 4 big tyres + axle + car
                                 #front 2
-                                DrawMesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBFLMatrix)
-                                DrawMesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBFRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBFLMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBFRMatrix)
                                 # rear 2
-                                DrawMesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBRLMatrix)
-                                DrawMesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBRRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBRLMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBRRMatrix)
                                 # Axle
                                 if self.loaded_parts_hg2 is not None:
-                                    DrawMesh(self.loaded_parts_hg2.meshes[12][0], self.loaded_parts_hg2.materials[12], axleMatrix)
+                                    draw_mesh(self.loaded_parts_hg2.meshes[12][0], self.loaded_parts_hg2.materials[12], axleMatrix)
 
                                 car_offset[1] += 2.8
 
@@ -796,10 +1004,10 @@ class CarViewer(RenderStackItem):
                             if self.car_options[slot].tire_selection == 1:
                                 # Draw 4 normal tyres
                                 # 0/1 are Front left/right
-                                DrawMesh(self.loaded_tyre_hg2.meshes[0][0], self.loaded_tyre_hg2.materials[0], wheelFLMatrix)
-                                DrawMesh(self.loaded_tyre_hg2.meshes[1][0], self.loaded_tyre_hg2.materials[1], wheelFRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[0][0], self.loaded_tyre_hg2.materials[0], wheelFLMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[1][0], self.loaded_tyre_hg2.materials[1], wheelFRMatrix)
                                 # 2 is rear axle
-                                DrawMesh(self.loaded_tyre_hg2.meshes[2][0], self.loaded_tyre_hg2.materials[2], wheelRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[2][0], self.loaded_tyre_hg2.materials[2], wheelRMatrix)
                                 # 3 is lp tyres
                                 # DrawMesh(self.loaded_tyre_hg2.meshes[3][0], self.loaded_tyre_hg2.materials[3], wheelMatrix)
 
@@ -808,24 +1016,24 @@ class CarViewer(RenderStackItem):
                                 # 4/5 is left/right big
                                 # Draw 4 big tyres + axle + car
                                 # front 2
-                                DrawMesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBFLMatrix)
-                                DrawMesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBFRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBFLMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBFRMatrix)
                                 # rear 2
-                                DrawMesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBRLMatrix)
-                                DrawMesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBRRMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[4][0], self.loaded_tyre_hg2.materials[0], wheelBRLMatrix)
+                                draw_mesh(self.loaded_tyre_hg2.meshes[5][0], self.loaded_tyre_hg2.materials[1], wheelBRRMatrix)
                                 # Axle
                                 # TODO: offset axles if the other options are on, e.g boat, hotrod
                                 axleFMatrix = MatrixMultiply(axleMatrix, MatrixTranslate(0, 0.1, 1.35))
                                 axleRMatrix = MatrixMultiply(axleMatrix, MatrixTranslate(0, 0.1, 0))
                                 if self.loaded_parts_hg3 is not None:
-                                    DrawMesh(self.loaded_parts_hg3.meshes[25][0], self.loaded_parts_hg3.materials[25], axleFMatrix)
-                                    DrawMesh(self.loaded_parts_hg3.meshes[25][0], self.loaded_parts_hg3.materials[25], axleRMatrix)
+                                    draw_mesh(self.loaded_parts_hg3.meshes[25][0], self.loaded_parts_hg3.materials[25], axleFMatrix)
+                                    draw_mesh(self.loaded_parts_hg3.meshes[25][0], self.loaded_parts_hg3.materials[25], axleRMatrix)
 
                                 car_offset[1] += 1.8
 
                             # Long wheelbase?
-                            elif self.car_options[slot].tire_selection == 3:
-                                DrawMesh(self.loaded_tyre_hg3.meshes[6][0], self.loaded_tyre_hg3.materials[6], wheelMatrix)
+                            elif self.car_options[slot].tire_selection == 3 and self.loaded_tyre_hg3 is not None:
+                                draw_mesh(self.loaded_tyre_hg3.meshes[6][0], self.loaded_tyre_hg3.materials[6], wheelMatrix)
 
 
                     # Adjust car to needed spot, usually based on part/tyre selection
@@ -833,21 +1041,21 @@ class CarViewer(RenderStackItem):
                     for i in range(self.car_options[slot].size):
                         # Check if user wants part drawing
                         if self.car_options[slot].part_visible[i]:
-                            DrawMesh(self.loaded_cars[slot].models.meshes[i][0], self.loaded_cars[slot].models.materials[i], mat)
+                            draw_mesh(self.loaded_cars[slot].models.meshes[i][0], self.loaded_cars[slot].models.materials[i], mat)
 
         EndMode3D()
         # Draw overlay
         if self.loaded_cars[0] is not None:
             DrawText(self.loaded_cars[0].name.encode('ascii'), 10, 10, 20, WHITE)
             # DrawText(self.loaded_cars[0].path.path.encode('ascii'), 10, 30, 20, WHITE)
-            if self.option_draw_texture:
+            if self.option_draw_texture and len(self.loaded_cars[0].models.materials) > 0:
                 tex0 = self.loaded_cars[0].models.materials[0].maps[0].texture
                 DrawTexture(tex0, 0, self.draw_height - tex0.height, WHITE)
         if self.loaded_cars[1] is not None:
             name = self.loaded_cars[1].name
             DrawText(name.encode('ascii'), self.draw_width - (len(name)-1) * 15, 10, 20, WHITE)
             # DrawText(self.loaded_cars[1].path.path.encode('ascii'), 10, 30, 20, WHITE)
-            if self.option_draw_texture:
+            if self.option_draw_texture and len(self.loaded_cars[1].models.materials) > 0:
                 tex1 = self.loaded_cars[1].models.materials[0].maps[0].texture
                 DrawTexture(tex1, self.draw_width - tex1.width, self.draw_height - tex1.height, WHITE)
         EndTextureMode()
@@ -856,176 +1064,317 @@ class CarViewer(RenderStackItem):
         self.rendVec = [int(carListRec.x+carListRec.width+10), int(carListRec.y)]
         DrawTextureRec(self.renderTexture.texture, self.rendRec, self.rendVec, WHITE)
 
+        # Drawn last, so it is on top of the view
+        if hovered is not None and CheckCollisionPointRec(GetMousePosition(), carListRec):
+            draw_reference_info(hovered)
+
+    # Shows the car in the current slot, the previous car stops loading if no other slot shows it
+    def SelectCar(self, car):
+        previous = self.loaded_cars[self.current_slot]
+        self.loaded_cars[self.current_slot] = car
+        if previous is not None and previous is not car and previous not in self.loaded_cars:
+            if previous in self.car_jobs:
+                self.car_jobs.pop(previous).cancel()
+        if not car.loaded:
+            self.LoadCar(self.current_slot)
+
     def LoadCar(self, slot):
         car = self.loaded_cars[slot]
-        with open(car.path, "rb") as f:
+        job = self.car_jobs.get(car)
+        if job is not None and not job.is_finished():
+            # Already loading
+            return
+
+        def on_loaded(models, part_count):
+            car.models = models
+            car.loaded = True
+            for other_slot in range(self.max_slots):
+                if self.loaded_cars[other_slot] is car:
+                    self.car_options[other_slot].set_size(part_count)
+
+        self.car_jobs[car] = self.LoadCarFile(car.name, car.path, on_loaded)
+
+    # Parses the car file (CarModel) on the loader, then uploads it, calling on_loaded(models, part count)
+    # once all of it has been uploaded
+    def LoadCarFile(self, name, path, on_loaded):
+        catalog = self.owner.catalog
+        job = self.owner.loader.submit(name, lambda job: self.ReadCarArrays(job, path, catalog),
+                                       lambda job, loaded: self.UploadCarModel(loaded, on_loaded))
+        self.jobs.append(job)
+        return job
+
+    # Runs on a loader thread
+    # Returns (part count, [arrays for each mesh (see mesh_arrays)], (pixels, width, height) or None for the texture)
+    # or None if the job was cancelled. What was found is added to the catalog, for the car list
+    @staticmethod
+    def ReadCarArrays(job, path, catalog):
+        with open(path, "rb") as f:
             f.seek(0, os.SEEK_END)
             file_size = f.tell()
             f.seek(0, os.SEEK_SET)
 
-            #if car.game_version == GameVersions.CHOROQ_HG_2:
-            car = QCar.read_car(f, 0, file_size)
-            # elif car.game_version == GameVersions.CHOROQ_HG_3:
-            #     car = QHG3Car.from_file(f, 0, file_size)
-
-            # Convert to raylib models
-            self.car_options[slot].set_size(len(car.meshes))
-            for subfile in car.meshes:
-                for mesh in subfile:
-                    rMesh, material = self.ConvertCarModel(mesh, car.textures)
-                    self.loaded_cars[slot].models.meshes.append(rMesh)
-                    self.loaded_cars[slot].models.materials.append(material)
-
-    def ConvertCarModel(self, mesh, textures):
-        # Mesh is CarMesh obj
-        # mesh.mesh_vert_count
-        # mesh.mesh_verts
-        # mesh.mesh_normals
-        # mesh.mesh_uvs
-        # mesh.mesh_faces
-        # mesh.mesh_colours
-        # Mesh
-
-        rMesh = ffi.new("struct Mesh*")
-        vertices_c = ffi.new(f"float [{mesh.mesh_vert_count * 3}]")
-        rMesh.vertices = vertices_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.vertices[i * 3] = -mesh.mesh_verts[i][0]
-            rMesh.vertices[i * 3 + 1] = mesh.mesh_verts[i][1]
-            rMesh.vertices[i * 3 + 2] = mesh.mesh_verts[i][2]
-
-        normals_c = ffi.new(f"float [{mesh.mesh_vert_count * 3}]")
-        rMesh.normals = normals_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.normals[i * 3] = -mesh.mesh_normals[i][0]
-            rMesh.normals[i * 3 + 1] = -mesh.mesh_normals[i][1]
-            rMesh.normals[i * 3 + 2] = -mesh.mesh_normals[i][2]
-
-        uvs_c = ffi.new(f"float [{mesh.mesh_vert_count * 2}]")
-        rMesh.texcoords = uvs_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.texcoords[i * 2] = mesh.mesh_uvs[i][0]
-            rMesh.texcoords[i * 2 + 1] = -mesh.mesh_uvs[i][1]
-
-        faces_c = ffi.new(f"unsigned short [{mesh.mesh_vert_count * 3}]")
-        rMesh.indices = faces_c
-        for i in range(0, len(mesh.mesh_faces)):
-            rMesh.indices[i * 3] = mesh.mesh_faces[i][2] - 1
-            rMesh.indices[i * 3 + 1] = mesh.mesh_faces[i][1] - 1
-            rMesh.indices[i * 3 + 2] = mesh.mesh_faces[i][0] - 1
-
-        colours_c = ffi.new(f"unsigned char [{mesh.mesh_vert_count * 4}]")
-        rMesh.colors = colours_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.colors[i * 4] = int(mesh.mesh_colours[i][0])
-            rMesh.colors[i * 4 + 1] = int(mesh.mesh_colours[i][1])
-            rMesh.colors[i * 4 + 2] = int(mesh.mesh_colours[i][2])
-            rMesh.colors[i * 4 + 3] = int(mesh.mesh_colours[i][3])
-
-        rMesh.vertexCount = mesh.mesh_vert_count
-        rMesh.triangleCount = len(mesh.mesh_faces)
-
-        self.global_weakkeydict[rMesh] = (vertices_c, normals_c, uvs_c, faces_c, colours_c)
-        self.global_weakkeydict[mesh] = rMesh
-
-        # Upload mesh
-        UploadMesh(rMesh, False)
-        # Set material + properties
+            with profiler.stage(job.name, PARSE):
+                #if car.game_version == GameVersions.CHOROQ_HG_2:
+                car = model_cache.load(f, QCar.read_car, 0, file_size)
+                # elif car.game_version == GameVersions.CHOROQ_HG_3:
+                #     car = QHG3Car.from_file(f, 0, file_size)
+
+        meshes = []
+        for i, subfile in enumerate(car.meshes):
+            if job.cancelled:
+                return None
+            with profiler.stage(job.name, CONVERT):
+                meshes += [mesh_arrays(mesh, mesh.mesh_colours) for mesh in subfile]
+            job.progress = (i + 1) / len(car.meshes)
 
         # Assemble texture
-        tAddress, tex = textures[0]
-        cAddress, clut = textures[1]
-        tex.palette = clut.texture
-        tex.palette_width = clut.width
-        tex.palette_height = clut.height
-        data = tex.get_texture_as_bytes()
-        texture_c = ffi.new(f"char [{tex.width * tex.height * 3}]")
-        for b in range(tex.width * tex.height):
-            texture_c[b * 3 + 0] = data[b * 4 + 0].to_bytes(1, byteorder='little')
-            texture_c[b * 3 + 1] = data[b * 4 + 1].to_bytes(1, byteorder='little')
-            texture_c[b * 3 + 2] = data[b * 4 + 2].to_bytes(1, byteorder='little')
-        # data = tex.texture
-        # texture_c = ffi.new(f"char [{tex.width * tex.height}]")
-        # for b in range(tex.width * tex.height):
-        #     texture_c[b] = data[b].to_bytes(1, byteorder='little')
-        image = Image(texture_c, tex.width, tex.height, 1, RL_PIXELFORMAT_UNCOMPRESSED_R8G8B8)
-        rTexture = LoadTextureFromImage(image)
+        texture = None
+        if len(car.textures) > 1:
+            with profiler.stage(job.name, CONVERT):
+                tAddress, tex = car.textures[0]
+                cAddress, clut = car.textures[1]
+                tex.palette = clut.texture
+                tex.palette_width = clut.width
+                tex.palette_height = clut.height
+                texture = (texture_pixels(tex, 3), tex.width, tex.height)
+
+        if len(meshes) > 0:
+            vertices = np.concatenate([arrays[0] for arrays in meshes])
+            catalog.set_summary(path, make_summary(len(meshes), len(car.textures), vertices.min(axis=0), vertices.max(axis=0)))
+        else:
+            catalog.set_summary(path, make_summary(0, len(car.textures)))
+        return len(car.meshes), meshes, texture
+
+    # Runs on the render thread (from the loader), uploading one mesh each step
+    # The meshes all share the car's texture (and material)
+    def UploadCarModel(self, loaded, on_loaded):
+        part_count, meshes, texture = loaded
         material = LoadMaterialDefault()
-        mat_ptr = ffi.new("struct Material*", material)
-        SetMaterialTexture(mat_ptr, MATERIAL_MAP_ALBEDO, rTexture)
-
-        self.global_weakkeydict[mesh] = (rMesh, texture_c, rTexture)
-        return rMesh, material
-
+        if texture is not None:
+            pixels, width, height = texture
+            rTexture = load_raylib_texture(pixels, width, height, RL_PIXELFORMAT_UNCOMPRESSED_R8G8B8)
+            mat_ptr = ffi.new("struct Material*", material)
+            SetMaterialTexture(mat_ptr, MATERIAL_MAP_ALBEDO, rTexture)
+
+        models = ModelData()
+        try:
+            for arrays in meshes:
+                yield
+                rMesh = ffi.new("struct Mesh*")
+                self.global_weakkeydict[rMesh] = upload_raylib_mesh(rMesh, arrays)
+                models.meshes.append(rMesh)
+                models.materials.append(material)
+        except GeneratorExit:
+            # Cancelled part way through, unload what was uploaded
+            for rMesh in models.meshes:
+                unload_raylib_mesh(rMesh)
+            UnloadMaterial(material)
+            raise
+        on_loaded(models, part_count)
+
+    # Loads TIRE.BIN for each game in the background, each is set once it has been uploaded
     def LoadTyres(self):
         tyrePath = f"{self.owner.state.hg2_game_folder_path}/CARS/TIRE.BIN"
-        if not Path(tyrePath).exists():
-            self.loaded_tyre_hg2 = None
-            return
+        if Path(tyrePath).exists():
+            self.LoadCarFile("HG2 tyres", tyrePath, lambda models, part_count: setattr(self, "loaded_tyre_hg2", models))
 
-        with open(tyrePath, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
-            f.seek(0, os.SEEK_SET)
+        tyrePath = f"{self.owner.state.hg3_game_folder_path}/CARS/TIRE.BIN"
+        if Path(tyrePath).exists():
+            self.LoadCarFile("HG3 tyres", tyrePath, lambda models, part_count: setattr(self, "loaded_tyre_hg3", models))
 
-            self.loaded_tyre_hg2 = ModelData()
-            tyre = QCar.read_car(f, 0, file_size)
-            for mesh in tyre.meshes:
-                rMesh, material = self.ConvertCarModel(mesh, tyre.textures)
-                self.loaded_tyre_hg2.meshes.append(rMesh)
-                self.loaded_tyre_hg2.materials.append(material)
+    # Loads PARTS.BIN for each game in the background, each is set once it has been uploaded
+    def LoadParts(self):
+        partsPath = f"{self.owner.state.hg2_game_folder_path}/CARS/PARTS.BIN"
+        if Path(partsPath).exists():
+            self.LoadCarFile("HG2 parts", partsPath, lambda models, part_count: setattr(self, "loaded_parts_hg2", models))
 
-        tyrePath = f"{self.owner.state.hg3_game_folder_path}/CARS/TIRE.BIN"
-        if not Path(tyrePath).exists():
-            self.loaded_tyre_hg3 = None
-            return
+        partsPath = f"{self.owner.state.hg3_game_folder_path}/CARS/PARTS.BIN"
+        if Path(partsPath).exists():
+            self.LoadCarFile("HG3 parts", partsPath, lambda models, part_count: setattr(self, "loaded_parts_hg3", models))
 
-        with open(tyrePath, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
-            f.seek(0, os.SEEK_SET)
 
-            self.loaded_tyre_hg3 = ModelData()
-            tyre = QCar.read_car(f, 0, file_size)
-            for mesh in tyre.meshes:
-                rMesh, material = self.ConvertCarModel(mesh, tyre.textures)
-                self.loaded_tyre_hg3.meshes.append(rMesh)
-                self.loaded_tyre_hg3.materials.append(material)
+# Chunks within this many chunk widths of the camera are uploaded, and unloaded once further than CHUNK_UNLOAD_DISTANCE
+# (a little further, so chunks on the edge are not uploaded and unloaded again every frame)
+CHUNK_LOAD_DISTANCE = 3
+CHUNK_UNLOAD_DISTANCE = 4
 
-    def LoadParts(self):
-        partsPath = f"{self.owner.state.hg2_game_folder_path}/CARS/PARTS.BIN"
-        if not Path(partsPath).exists():
-            self.loaded_parts_hg2 = None
-            return
 
-        with open(partsPath, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
-            f.seek(0, os.SEEK_SET)
+class CourseChunk:
 
-            self.loaded_parts_hg2 = ModelData()
-            parts = QCar.read_car(f, 0, file_size)
-            for mesh in parts.meshes:
-                rMesh, material = self.ConvertCarModel(mesh, parts.textures)
-                self.loaded_parts_hg2.meshes.append(rMesh)
-                self.loaded_parts_hg2.materials.append(material)
+    def __init__(self, x, z, meshes, bounds_min, bounds_max):
+        self.x = x
+        self.z = z
+        self.meshes = meshes  # [(material key, mesh arrays)], the chunk's meshes merged per material
+        self.bounds_min = bounds_min
+        self.bounds_max = bounds_max
+        self.models = None  # ModelData while uploaded
+        self.buffers = []  # Arrays the uploaded meshes point to
 
-        partsPath = f"{self.owner.state.hg3_game_folder_path}/CARS/PARTS.BIN"
-        if not Path(partsPath).exists():
-            self.loaded_parts_hg3 = None
-            return
 
-        with open(partsPath, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            file_size = f.tell()
-            f.seek(0, os.SEEK_SET)
+# Reads a course's chunks as a loader job, then uploads and draws only the chunks near the camera
+#
+# Every chunk is read (from the middle of the grid outwards) and kept as arrays, as where a chunk is
+# (its bounds) is only known once it has been read. The GPU upload has to be on the render thread, so
+# update (called each frame) uploads the nearest read chunks within the load distance, as many as fit in
+# what is left of the loader's budget for the frame, and unloads uploaded chunks past the unload distance.
+# get_visible_chunks culls the uploaded chunks' bounds against the camera's view.
+#
+# Each chunk's meshes are merged into one mesh per material (split if over MAX_BATCH_VERTICES), so a chunk
+# takes a draw call per material rather than per mesh. Each material (and its texture) is uploaded once,
+# the first time a chunk needs it, and shared by every chunk until the streamer is closed.
+class CourseChunkStreamer:
+
+    def __init__(self, path, name, loader, catalog):
+        self.path = path
+        self.catalog = catalog
+        self.name = name
+        self.loader = loader
+        self.textures = {}  # (clut, texture) -> texture (see get_course_texture), added by the loader thread
+        self.ready = queue.Queue()  # Chunks read by the loader thread, not yet seen by the render thread
+        self.chunk_count = 0
+        self.chunks_read = 0
+
+        # Only used on the render thread
+        self.chunks = []
+        self.bounds_min = np.zeros((0, 3))
+        self.bounds_max = np.zeros((0, 3))
+        self.chunk_size = 0
+        self.visible_count = 0
+        self.materials = {}  # (clut, texture) -> raylib material
+
+        self.job = loader.submit(name, self.read_chunks)
+
+    # Runs on a loader thread, the chunks are uploaded by update rather than the job
+    def read_chunks(self, job):
+        with profiler.stage(job.name, PARSE):
+            with open(self.path, "rb") as f:
+                file = io.BytesIO(f.read())
+            course = model_cache.load(file, QCourse.read_course, False)
+        mesh_count = 0
+        bounds = []
+        for mesh_offset in course.mesh_offsets:
+            with profiler.stage(job.name, PARSE):
+                x_max, z_max, hg3, chunks = Course.list_chunks(file, mesh_offset)
+            self.chunk_count += len(chunks)
+            chunks.sort(key=lambda chunk: abs(chunk[0] - (x_max - 1) / 2) + abs(chunk[1] - (z_max - 1) / 2))
+            for x, z, chunk_offset, count in chunks:
+                if job.cancelled:
+                    return None
+                with profiler.stage(job.name, PARSE):
+                    chunk_meshes = Course.read_chunk(file, chunk_offset, count, hg3)
+                meshes = []
+                with profiler.stage(job.name, CONVERT):
+                    for key, course_meshes in chunk_meshes.items():
+                        arrays = [mesh_arrays(mesh, mesh.mesh_day_colours)
+                                  for mesh in course_meshes if mesh.mesh_vert_count > 0]
+                        if len(arrays) == 0:
+                            continue
+                        mesh_count += len(arrays)
+                        # Added before the chunk is queued, so it is there when the chunk is uploaded
+                        if key not in self.textures:
+                            self.textures[key] = get_course_texture(key, course.textures)
+                        meshes += [(key, merged) for merged in merge_mesh_arrays(arrays)]
+                self.chunks_read += 1
+                job.progress = self.chunks_read / self.chunk_count
+                if len(meshes) == 0:
+                    continue
+                vertices = np.concatenate([arrays[0] for key, arrays in meshes])
+                chunk = CourseChunk(x, z, meshes, vertices.min(axis=0), vertices.max(axis=0))
+                bounds += [chunk.bounds_min, chunk.bounds_max]
+                self.ready.put(chunk)
+
+        # Every chunk has been read, so the course list can show what it has
+        if len(bounds) > 0:
+            self.catalog.set_summary(self.path, make_summary(mesh_count, len(course.textures),
+                                                             np.min(bounds, axis=0), np.max(bounds, axis=0)))
+        else:
+            self.catalog.set_summary(self.path, make_summary(0, len(course.textures)))
+        return None
+
+    # Called each frame on the render thread
+    def update(self, camera):
+        added = False
+        while not self.ready.empty():
+            self.chunks.append(self.ready.get_nowait())
+            added = True
+        if added:
+            self.bounds_min = np.array([chunk.bounds_min for chunk in self.chunks])
+            self.bounds_max = np.array([chunk.bounds_max for chunk in self.chunks])
+            # Typical chunk width, the extra chunk (trees/windows) can cover the whole course
+            extents = self.bounds_max - self.bounds_min
+            self.chunk_size = max(1.0, float(np.median(np.maximum(extents[:, 0], extents[:, 2]))))
+        if len(self.chunks) == 0:
+            return
 
-            self.loaded_parts_hg3 = ModelData()
-            parts = QCar.read_car(f, 0, file_size)
-            for mesh in parts.meshes:
-                rMesh, material = self.ConvertCarModel(mesh, parts.textures)
-                self.loaded_parts_hg3.meshes.append(rMesh)
-                self.loaded_parts_hg3.materials.append(material)
+        # Distance from the camera to the nearest point of each chunk
+        position = np.array([camera.position.x, camera.position.y, camera.position.z])
+        outside = np.maximum(np.maximum(self.bounds_min - position, 0), position - self.bounds_max)
+        distances = np.linalg.norm(outside, axis=1)
+
+        for index in np.argsort(distances):
+            chunk = self.chunks[index]
+            if chunk.models is None:
+                if self.loader.has_budget() and distances[index] <= CHUNK_LOAD_DISTANCE * self.chunk_size:
+                    start = time.perf_counter()
+                    with profiler.stage(self.name, UPLOAD):
+                        self.upload_chunk(chunk)
+                    self.loader.spend(time.perf_counter() - start)
+            elif distances[index] > CHUNK_UNLOAD_DISTANCE * self.chunk_size:
+                self.unload_chunk(chunk)
+
+    # Returns the uploaded chunks that are (at least partly) in view
+    def get_visible_chunks(self, camera, aspect):
+        indices = [i for i, chunk in enumerate(self.chunks) if chunk.models is not None]
+        if len(indices) > 0 and camera.projection == CAMERA_PERSPECTIVE:
+            planes = get_camera_planes((camera.position.x, camera.position.y, camera.position.z),
+                                       (camera.target.x, camera.target.y, camera.target.z),
+                                       (camera.up.x, camera.up.y, camera.up.z), camera.fovy, aspect)
+            visible = boxes_in_frustum(planes, self.bounds_min[indices], self.bounds_max[indices])
+            indices = [i for i, is_visible in zip(indices, visible) if is_visible]
+        self.visible_count = len(indices)
+        return [self.chunks[i] for i in indices]
+
+    def get_uploaded_count(self):
+        return sum(1 for chunk in self.chunks if chunk.models is not None)
+
+    def upload_chunk(self, chunk):
+        chunk.models = ModelData()
+        for key, arrays in chunk.meshes:
+            rMesh = ffi.new("struct Mesh*")
+            chunk.buffers.append(upload_raylib_mesh(rMesh, arrays))
+            chunk.models.meshes.append(rMesh)
+            chunk.models.materials.append(self.get_material(key))
+
+    # Unloads the chunk's meshes, the materials are kept for other chunks
+    def unload_chunk(self, chunk):
+        for rMesh in chunk.models.meshes:
+            unload_raylib_mesh(rMesh)
+        chunk.models = None
+        chunk.buffers = []
+
+    # Returns the shared material for (clut, texture), uploading its texture the first time
+    def get_material(self, key):
+        if key in self.materials:
+            return self.materials[key]
+        rMaterial = LoadMaterialDefault()
+        texture = self.textures.get(key)
+        if texture is not None:
+            pixels, width, height = texture
+            rTexture = load_raylib_texture(pixels, width, height, RL_PIXELFORMAT_UNCOMPRESSED_R8G8B8A8)
+            mat_ptr = ffi.new("struct Material*", rMaterial)
+            SetMaterialTexture(mat_ptr, MATERIAL_MAP_ALBEDO, rTexture)
+        self.materials[key] = rMaterial
+        return rMaterial
+
+    # Stops reading, and unloads everything from the GPU
+    def close(self):
+        self.job.cancel()
+        for chunk in self.chunks:
+            if chunk.models is not None:
+                self.unload_chunk(chunk)
+        for rMaterial in self.materials.values():
+            UnloadMaterial(rMaterial)
+        self.materials = {}
 
 
 class CourseViewer(RenderStackItem):
@@ -1052,8 +1401,7 @@ class CourseViewer(RenderStackItem):
         self.renderTexture = LoadRenderTexture(self.draw_width, self.draw_height)
 
         self.loaded_course = None
-
-        self.global_weakkeydict = weakref.WeakKeyDictionary()
+        self.streamer = None
 
         self.option_grid = True
         self.option_floor = True
@@ -1076,10 +1424,14 @@ class CourseViewer(RenderStackItem):
             end_y = self.rendRec.y + self.rendVec[1] - self.rendRec.height
             if start_x < mouse_x < end_x and start_y < mouse_y < end_y:
                 UpdateCamera(self.owner.camera, CAMERA_FREE)
-        pass
+
+        if self.streamer is not None:
+            self.streamer.update(self.owner.camera[0])
 
     def OnClose(self):
-        pass
+        if self.streamer is not None:
+            self.streamer.close()
+            self.streamer = None
 
     def OnDraw(self):
         if not self.active:
@@ -1123,15 +1475,18 @@ class CourseViewer(RenderStackItem):
 
         position += text_height
 
+        # The course under the mouse, its info (from the catalog) is shown next to the mouse
+        hovered = None
         # Draw HG2 course names
         for course in self.hg2_course_list:
             leftButtonRec = Rectangle(15, position, buttonWidth - 10, text_height - 2)
             position += text_height
             courseName = course.name.encode('ascii')
-            if GuiButton(leftButtonRec, courseName):
+            if CheckCollisionPointRec(GetMousePosition(), leftButtonRec):
+                hovered = course
+            if GuiButton(leftButtonRec, courseName) and course is not self.loaded_course:
                 self.loaded_course = course
-                if not self.loaded_course.loaded:
-                    self.LoadCourse()
+                self.LoadCourse()
 
         # Draw HG3 course
         rightButtonRec = Rectangle(buttonWidth - 10 + 20, position, buttonWidth - 10, text_height - 2)
@@ -1140,10 +1495,11 @@ class CourseViewer(RenderStackItem):
             rightButtonRec = Rectangle(buttonWidth - 10 + 20, position, buttonWidth - 10, text_height - 2)
             position += text_height
             courseName = course.name.encode('ascii')
-            if GuiButton(rightButtonRec, courseName):
+            if CheckCollisionPointRec(GetMousePosition(), rightButtonRec):
+                hovered = course
+            if GuiButton(rightButtonRec, courseName) and course is not self.loaded_course:
                 self.loaded_course = course
-                if not self.loaded_course.loaded:
-                    self.LoadCourse()
+                self.LoadCourse()
         EndScissorMode()
 
         # Draw options menu (right)
@@ -1175,15 +1531,21 @@ class CourseViewer(RenderStackItem):
         ClearBackground(BLACK)
         BeginMode3D(self.owner.camera[0])
         # Draw 3d model
-        if self.loaded_course is not None:
+        if self.streamer is not None:
             mat = MatrixIdentity()
-            for i in range(len(self.loaded_course.models.meshes)):
-                DrawMesh(self.loaded_course.models.meshes[i][0], self.loaded_course.models.materials[i], mat)
+            for chunk in self.streamer.get_visible_chunks(self.owner.camera[0], self.draw_width / self.draw_height):
+                for rMesh, rMaterial in zip(chunk.models.meshes, chunk.models.materials):
+                    draw_mesh(rMesh[0], rMaterial, mat)
 
         EndMode3D()
         # Draw overlay
         if self.loaded_course is not None:
             DrawText(self.loaded_course.name.encode('ascii'), 10, 10, 20, WHITE)
+            if self.streamer is not None:
+                streamer = self.streamer
+                DrawText(f"Chunks read {streamer.chunks_read}/{streamer.chunk_count}, "
+                         f"uploaded {streamer.get_uploaded_count()}, drawn {streamer.visible_count}".encode('ascii'),
+                         10, 32, 10, WHITE)
             # DrawText(self.loaded_cars[0].path.path.encode('ascii'), 10, 30, 20, WHITE)
             # if self.option_draw_texture:
             #     tex0 = self.loaded_cars[0].models.materials[0].maps[0].texture
@@ -1194,140 +1556,30 @@ class CourseViewer(RenderStackItem):
         self.rendVec = [int(courseListRec.x+courseListRec.width+10), int(courseListRec.y)]
         DrawTextureRec(self.renderTexture.texture, self.rendRec, self.rendVec, WHITE)
 
-    def group_meshes_by_material(self, meshes):
-        # Sort all meshes into meshes by type
-        number_of_meshes = 0
-        mesh_by_material = {}
-        for i, level in enumerate(meshes):
-            for z, zRow in enumerate(level.chunks):
-                for x, meshesByData in enumerate(zRow):
-                    for dataKey, mm in meshesByData.items():
-                        # Add meshes that match this material to the list of meshes
-                        if dataKey not in mesh_by_material:
-                            mesh_by_material[dataKey] = []
-                        mesh_by_material[dataKey] += mm
-                        number_of_meshes += 1
-                        print(len(mesh_by_material[dataKey]))
-
-        return mesh_by_material, number_of_meshes
+        # Drawn last, so it is on top of the view
+        if hovered is not None and CheckCollisionPointRec(GetMousePosition(), courseListRec):
+            draw_reference_info(hovered)
 
     def LoadCourse(self):
+        if self.streamer is not None:
+            self.streamer.close()
+            self.streamer = None
         course = self.loaded_course
-        with open(course.path, "rb") as f:
-            if course.game_version == GameVersions.CHOROQ_HG_2:
-                course = QCourse.read_course(f)
-            # elif course.game_version == GameVersions.CHOROQ_HG_3:
-            #     course = QCourse.from_file(f, 0, file_size)
-
-            # Convert to raylib models
-            # self.car_options.set_size(len(car.meshes))
-            mesh_by_material, number_of_meshes = self.group_meshes_by_material(course.meshes)
-
-            for material in mesh_by_material:
-                meshes = mesh_by_material[material]
-                for mesh in meshes:
-                    rMesh, rMaterial = self.ConvertCourseModel(mesh, material, course.textures)
-                    self.loaded_course.models.meshes.append(rMesh)
-                    self.loaded_course.models.materials.append(rMaterial)
-
-    def ConvertCourseModel(self, mesh, material, textures):
-        # Mesh is CourseMesh obj
-        # mesh.mesh_vert_count
-        # mesh.mesh_verts
-        # mesh.mesh_normals
-        # mesh.mesh_uvs
-        # mesh.mesh_faces
-        # mesh.mesh_day_colours
-        # mesh.mesh_night_colours
-        # mesh.mesh_extras
-
-        rMesh = ffi.new("struct Mesh*")
-        vertices_c = ffi.new(f"float [{mesh.mesh_vert_count * 3}]")
-        rMesh.vertices = vertices_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.vertices[i * 3] = -mesh.mesh_verts[i][0]
-            rMesh.vertices[i * 3 + 1] = mesh.mesh_verts[i][1]
-            rMesh.vertices[i * 3 + 2] = mesh.mesh_verts[i][2]
-
-        normals_c = ffi.new(f"float [{mesh.mesh_vert_count * 3}]")
-        rMesh.normals = normals_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.normals[i * 3] = -mesh.mesh_normals[i][0]
-            rMesh.normals[i * 3 + 1] = -mesh.mesh_normals[i][1]
-            rMesh.normals[i * 3 + 2] = -mesh.mesh_normals[i][2]
-
-        uvs_c = ffi.new(f"float [{mesh.mesh_vert_count * 2}]")
-        rMesh.texcoords = uvs_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.texcoords[i * 2] = mesh.mesh_uvs[i][0]
-            rMesh.texcoords[i * 2 + 1] = -mesh.mesh_uvs[i][1]
-
-        faces_c = ffi.new(f"unsigned short [{mesh.mesh_vert_count * 3}]")
-        rMesh.indices = faces_c
-        for i in range(0, len(mesh.mesh_faces)):
-            rMesh.indices[i * 3] = mesh.mesh_faces[i][2] - 1
-            rMesh.indices[i * 3 + 1] = mesh.mesh_faces[i][1] - 1
-            rMesh.indices[i * 3 + 2] = mesh.mesh_faces[i][0] - 1
-
-        colours_c = ffi.new(f"unsigned char [{mesh.mesh_vert_count * 4}]")
-        rMesh.colors = colours_c
-        for i in range(0, mesh.mesh_vert_count):
-            rMesh.colors[i * 4] = int(mesh.mesh_day_colours[i][0])
-            rMesh.colors[i * 4 + 1] = int(mesh.mesh_day_colours[i][1])
-            rMesh.colors[i * 4 + 2] = int(mesh.mesh_day_colours[i][2])
-            rMesh.colors[i * 4 + 3] = int(mesh.mesh_day_colours[i][3])
-
-        rMesh.vertexCount = mesh.mesh_vert_count
-        rMesh.triangleCount = len(mesh.mesh_faces)
-
-        self.global_weakkeydict[rMesh] = (vertices_c, normals_c, uvs_c, faces_c, colours_c)
-        self.global_weakkeydict[mesh] = rMesh
-
-        # Upload mesh
-        UploadMesh(rMesh, False)
-        # Set material + properties
-
-        # Assemble texture
-        cAddress = material[0]
-        tAddress = material[1]
-        tex = textures[tAddress]
-        clut = textures[cAddress]
-        rMaterial = LoadMaterialDefault()
-        if clut is not None:
-            tex.palette = clut.texture
-            tex.palette_width = clut.width
-            tex.palette_height = clut.height
-            if tex.bpp > clut.bpp:
-                # Invalid texture somehow?
-                return rMesh, rMaterial
-        if tex == None:
-            return rMesh, rMaterial
-        data = tex.get_texture_as_bytes()
-        texture_c = ffi.new(f"char [{tex.width * tex.height * 4}]")
-        for b in range(tex.width * tex.height):
-            texture_c[b * 4 + 0] = data[b * 4 + 0].to_bytes(1, byteorder='little')
-            texture_c[b * 4 + 1] = data[b * 4 + 1].to_bytes(1, byteorder='little')
-            texture_c[b * 4 + 2] = data[b * 4 + 2].to_bytes(1, byteorder='little')
-            alpha = data[b * 4 + 3].to_bytes(1, byteorder='little')
-            if alpha == 0x80:
-                alpha = 255
-            texture_c[b * 4 + 3] = alpha
-        # data = tex.texture
-        # texture_c = ffi.new(f"char [{tex.width * tex.height}]")
-        # for b in range(tex.width * tex.height):
-        #     texture_c[b] = data[b].to_bytes(1, byteorder='little')
-        image = Image(texture_c, tex.width, tex.height, 1, RL_PIXELFORMAT_UNCOMPRESSED_R8G8B8A8)
-        rTexture = LoadTextureFromImage(image)
-        mat_ptr = ffi.new("struct Material*", rMaterial)
-        SetMaterialTexture(mat_ptr, MATERIAL_MAP_ALBEDO, rTexture)
-
-        self.global_weakkeydict[mesh] = (rMesh, texture_c, rTexture)
-        return rMesh, rMaterial
-
+        if course.game_version != GameVersions.CHOROQ_HG_2:
+            # HG3 courses are not supported yet
+            return
+        # Chunks are read in the background, and uploaded as the camera gets near them
+        self.streamer = CourseChunkStreamer(course.path, course.name, self.owner.loader, self.owner.catalog)
 
 if __name__ == '__main__':
+    if "--no-cache" in sys.argv:
+        # Always parse the files, rather than using previously parsed models
+        model_cache.enabled = False
     tools = ChoroQTools()
     tools.start_ui()
+    if "--trace" in sys.argv:
+        # Save the frame and load times of the whole session (F4 saves them while running)
+        profiler.save_trace()
 
 
 
@@ -1,11 +1,128 @@
-import os
 import struct
 
-import choroq.read_utils as U
-import choroq.ps2_utils as PS2
-
 # Basic parser for cars, so will handle with quick optimisations, which will skip VIf expansion and other,
 # slower calculations
+#
+# The whole input car is read into memory, and read with struct.unpack_from. Each converted mesh part is
+# packed (struct.pack_into) into a bytearray made at its final size, and the converted parts are only joined
+# once, into the finished car (see ConvertedCarBuffer). So nothing is concatenated while converting, and no
+# temporary files are needed, the *_stream functions return the converted car as a bytearray.
+
+LONG = struct.Struct("<I")
+HG2_SUBFILE_HEADER = struct.Struct("<IIII")  # offset 1, offset 2, gif count 1, gif count 2
+HG2_STRIP_TAGS = struct.Struct("<IIIIII")  # VIF V4-32 tag, GIF tag (a, b, c, d), VIF V3-32 tag
+HG3_STRIP_TAGS = struct.Struct("<IIIIfII")  # VIF tag, GIF tag (a, b, c, d), 8 bytes of pre xyz data
+VERTEX = struct.Struct("<12f")  # xyz, normal xyz, rgb, uvw
+VERTEX_NO_NORMALS = struct.Struct("<9f")  # xyz, rgb, uvw
+
+# Empty sub mesh data, needed to make game draw nothing
+EMPTY_MESH = (b'\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00'
+              b'\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+DMA_CNT_TAG_TAIL = b'\x00\x10\x00\x00\x00\x00'
+VIF_SETUP_TAG = b'\x01\x01\x00\x01'
+END_DMA_TAG_SIZE = 16
+
+# HG3 pre xyz data
+HG3_HAS_NORMALS = 0x3136C000
+HG3_NO_NORMALS = 0x303EC000
+HG3_UNKNOWN_VALUES = [0x3136C000, 0x313EC000, 0x303EC000]
+HG3_COLOUR_SELECT_VALUES = [0, 0x20, 0x21, 0x22]
+
+# Work on the fifth subfile (HG3), which I think is the boat edge adapter/filler
+# HG2 does not have this, so I will just copy in one that works for some cars
+# Q82.BIN boat adapter:
+HG3_BOAT_ADAPTER = b"\x01\x00\x00\x00\x00\x00\x00\x00\x26\x00\x00\x00\x10\x00\x00\x00\xE6\x02\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\xBE\x33\x5B\xAF\xBD\xD6\x72\x9A\x3E\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\xBE\x33\x5B\xAF\xBD\x99\xBB\x86\x3F\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x99\xBB\x86\x3F\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\xBF\x57\xB4\x4C\x3F\x31\x49\xD8\xBE\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x57\xB4\x4C\x3F\x55\xF6\x63\xBF\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\xBB\xBC\x0D\x3F\x66\x8C\x62\xBE\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\xBB\xBC\x0D\x3F\x4F\x6A\x8D\xBF\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x66\x8C\x62\xBE\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\xBF\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x99\xBB\x86\x3F\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\xBB\xBC\x0D\x3F\xD6\x72\x9A\x3E\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x8F\x9C\x06\x3F\x99\xBB\x86\x3F\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x28\xDE\x29\x3F\x15\x5F\xDB\x3E\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x28\xDE\x29\x3F\x72\x96\x6E\x3F\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\x3E\x33\x5B\xAF\xBD\x66\x8C\x62\xBE\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\x3E\xA5\x06\x31\xBD\x75\x6B\x8D\xBF\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x66\x8C\x62\xBE\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\xBE\x33\x5B\xAF\xBD\x66\x8C\x62\xBE\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x66\x8C\x62\xBE\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\xBE\xA5\x06\x31\xBD\x75\x6B\x8D\xBF\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\x3E\x33\x5B\xAF\xBD\xD6\x72\x9A\x3E\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\x3E\x33\x5B\xAF\xBD\x99\xBB\x86\x3F\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x99\xBB\x86\x3F\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x66\x8C\x62\xBE\x00\x00\x80\x3F\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\x00\x00\x80\x3F\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\xBB\xBC\x0D\x3F\x66\x8C\x62\xBE\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\xBB\xBC\x0D\x3F\x4F\x6A\x8D\xBF\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x57\xB4\x4C\x3F\x31\x49\xD8\xBE\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x57\xB4\x4C\x3F\x55\xF6\x63\xBF\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\x3F\x28\xDE\x29\x3F\x15\x5F\xDB\x3E\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x28\xDE\x29\x3F\x72\x96\x6E\x3F\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\xBB\xBC\x0D\x3F\xD6\x72\x9A\x3E\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x8F\x9C\x06\x3F\x99\xBB\x86\x3F\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x99\xBB\x86\x3F\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x32\x68\x0C\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\xBE\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\xBF\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\xBE\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\xBF\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\xBF\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x44\x06\x4C\xBF\xFF\x8F\xE9\x3E\x0B\xB4\xCA\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\xBF\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x17\xB8\x54\xBF\xDF\x86\x04\x3F\xEE\xBC\x50\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\xBE\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x22\x03\x56\xBF\xE5\x77\x0C\x3F\x2F\x4A\xEC\xBB\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\xBF\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x5A\x89\x53\xBF\x36\xD2\x05\x3F\x87\xAB\x56\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\xBF\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\xBF\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\xBE\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x36\x68\x0D\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\xBF\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\xBF\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x23\xCC\x4F\xBF\xD8\x08\xF7\x3E\x08\x85\xA8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\xBE\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x43\xAC\x50\xBF\xD7\xD8\x12\x3F\x1D\x6C\xA5\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\xBE\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x1F\xFB\x4E\xBF\x5F\xFA\x12\x3F\x0A\x34\x04\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\xBE\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\xE9\x41\x47\xBF\x89\x5F\x03\x3F\xDD\x2F\xB9\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\xBF\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\xBF\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\xBF\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\xBF\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x27\x62\x81\xBF\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\xBF\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x2E\xE0\x4F\xBF\x1D\x0B\x60\x3E\xE8\x83\x0A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\xBF\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\xBF\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\xBF\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x68\x92\x1E\xBF\x9D\x45\x6D\x3E\x8E\x05\x40\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x32\x68\x0C\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x5F\xAA\x75\xBF\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\xBF\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\x3F\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\xBE\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\x3E\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\xBF\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\x3F\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\xBF\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\x3F\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\xBE\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\x3E\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\xBE\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\x3E\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x32\x68\x0C\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x5F\xAA\x75\xBF\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\xBF\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\x3F\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\xBE\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\x3E\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\xBE\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\x3E\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\xBE\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\x3E\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\xBF\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\x3F\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\xBF\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\x3F\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1E\x68\x07\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x5A\x89\x53\xBF\x36\xD2\x05\x3F\x87\xAB\x56\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\xBF\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\xBF\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\xBE\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\x3F\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\x3E\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\x3F\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x26\x68\x09\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\xBF\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x75\x0D\x52\xBF\x6E\xCE\x9D\x3E\x1A\x7B\xF6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\xBF\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\x6A\xE5\xE7\x3E\x99\xBB\x86\x3F\x6B\xDE\x45\xBF\x74\x86\xB5\x3E\x16\xB5\x06\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\xBF\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x97\xB0\x89\x3F\xA5\xBE\xC7\xBE\xDE\x3E\x01\x3F\x3D\x1F\x45\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\x3F\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x97\xB0\x89\x3F\xA5\xBE\xC7\x3E\xDE\x3E\x01\x3F\x3D\x1F\x45\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\x6A\xE5\xE7\x3E\x99\xBB\x86\x3F\x6B\xDE\x45\x3F\x74\x86\xB5\x3E\x16\xB5\x06\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\x3F\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x68\x92\x1E\x3F\x9D\x45\x6D\x3E\x8E\x05\x40\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\x3F\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x27\x62\x81\x3F\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\x3F\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\x3F\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x2E\xE0\x4F\x3F\x1D\x0B\x60\x3E\xE8\x83\x0A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x3E\x68\x0F\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x27\x62\x81\x3F\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\x3F\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\x3F\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\x3F\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\x3F\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\xE9\x41\x47\x3F\x89\x5F\x03\x3F\xDD\x2F\xB9\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\x3E\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x1F\xFB\x4E\x3F\x5F\xFA\x12\x3F\x0A\x34\x04\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\x3E\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x43\xAC\x50\x3F\xD7\xD8\x12\x3F\x1D\x6C\xA5\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\x3E\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x23\xCC\x4F\x3F\xD8\x08\xF7\x3E\x08\x85\xA8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\x3F\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\x3F\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\x6A\xE5\xE7\x3E\x99\xBB\x86\x3F\x6B\xDE\x45\x3F\x74\x86\xB5\x3E\x16\xB5\x06\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x75\x0D\x52\x3F\x6E\xCE\x9D\x3E\x1A\x7B\xF6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x26\x68\x09\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\xAE\x7D\x35\xBF\x90\xBD\x51\x3E\xBC\xC3\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\xD8\x0E\xE8\x3E\xFE\xCE\x5B\xBE\x93\x74\x36\xBF\x57\xC5\x4D\x3E\xAC\x0B\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\xBF\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x53\x0D\x36\xBE\x03\xE3\x00\xBF\x2F\x91\xB4\x3E\x68\xEC\x49\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\xBE\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x53\x0D\x36\xBE\x03\xE3\x00\x3F\x2F\x91\xB4\x3E\x68\xEC\x49\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\x3E\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\x3F\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\x3F\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x36\x68\x0D\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\x3F\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x5A\x89\x53\x3F\x36\xD2\x05\x3F\x87\xAB\x56\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\x3F\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x22\x03\x56\x3F\xE5\x77\x0C\x3F\x2F\x4A\xEC\xBB\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\x3E\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x17\xB8\x54\x3F\xDF\x86\x04\x3F\xEE\xBC\x50\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\x3F\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x44\x06\x4C\x3F\xFF\x8F\xE9\x3E\x0B\xB4\xCA\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\x3F\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\x3F\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\x3E\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\x3F\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\x3E\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\x3F\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x53\x0D\x36\xBE\x03\xE3\x00\x3F\x2F\x91\xB4\x3E\x68\xEC\x49\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\x3F\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\xD8\x0E\xE8\x3E\xFE\xCE\x5B\xBE\x93\x74\x36\x3F\x57\xC5\x4D\x3E\xAC\x0B\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\xAE\x7D\x35\x3F\x90\xBD\x51\x3E\xBC\xC3\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x00\x00\x00\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+# empty boat adapter
+# HG3_BOAT_ADAPTER = b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+
+# Work on the sixth subfile (HG3), which I think is the hovercraft edge adapter/filler
+# HG2 does not have this, so I will just copy in one that works for some cars
+# Q82.BIN hovercraft adapter:
+# HG3_HOVERCRAFT_ADAPTER = b"\x01\x00\x00\x00\x00\x00\x00\x00\x17\x00\x00\x00\x10\x00\x00\x00\xA1\x02\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x80\x56\x68\x15\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xC8\x62\x6A\x3F\xB9\x01\x47\x3E\x53\x44\xB4\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xB2\x54\x09\x3F\x19\x8D\x4E\x3F\x79\x63\x7D\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\xFA\x9F\x17\x3F\xF4\x78\x1A\x3F\xA0\xB0\x08\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\x3E\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\x32\x2B\x0B\x3E\x56\x21\x75\x3F\xF9\x2D\x82\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x94\x27\x3E\x3E\x81\x21\x4E\x3F\x8A\x2C\x10\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\xBE\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\xFF\xDF\x3B\xBE\x55\xBE\x72\x3F\x9D\xBF\x84\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x6B\xFA\x61\xBE\x87\x12\x4D\x3F\x1F\x71\x0E\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA0\x95\x15\xBF\xE6\xEA\x45\x3F\x4B\xA3\x7C\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\x9F\xB0\x21\xBF\x6C\xFC\x14\x3F\xBA\x21\x03\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xC8\x62\x6A\xBF\xB9\x01\x47\x3E\x53\x44\xB4\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\x1C\x74\x33\xBF\xB8\x27\xDB\x3E\x0C\x08\x12\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\x8A\x54\x82\x3E\xF5\xFF\xD0\x3F\x5F\xBF\x32\xBF\xC8\xCC\xB1\x3E\xA3\x41\x20\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x3C\x69\x44\xBE\x8E\xB5\x22\x3F\x8D\x71\x3F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\x8A\x54\x82\x3E\x04\x1D\xD2\x3F\x39\xDE\x44\xBE\x88\x73\xF3\x3E\xC8\xC3\x5B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x2E\xB3\x3D\x3E\x30\x2B\x20\x3F\xED\xFD\x41\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\x8A\x54\x82\x3E\x04\x1D\xD2\x3F\xFB\x47\x3D\x3E\x15\xCE\xF3\x3E\x46\x15\x5C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x8A\x54\x82\x3E\xF5\xFF\xD0\x3F\x20\x5C\x31\x3F\x6B\x1A\xB3\x3E\x5B\x6E\x21\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xC8\x62\x6A\x3F\xB9\x01\x47\x3E\x53\x44\xB4\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x22\x68\x08\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xCF\xD5\xA3\xBE\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\x9F\xB0\x21\xBF\x6C\xFC\x14\x3F\xBA\x21\x03\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\x1C\x74\x33\xBF\xB8\x27\xDB\x3E\x0C\x08\x12\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x6B\xFA\x61\xBE\x87\x12\x4D\x3F\x1F\x71\x0E\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x3C\x69\x44\xBE\x8E\xB5\x22\x3F\x8D\x71\x3F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x94\x27\x3E\x3E\x81\x21\x4E\x3F\x8A\x2C\x10\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x2E\xB3\x3D\x3E\x30\x2B\x20\x3F\xED\xFD\x41\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\xFA\x9F\x17\x3F\xF4\x78\x1A\x3F\xA0\xB0\x08\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xAC\xC9\xB6\x3E\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xB2\x54\x09\x3F\x19\x8D\x4E\x3F\x79\x63\x7D\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA0\x95\x15\xBF\xE6\xEA\x45\x3F\x4B\xA3\x7C\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\x3E\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\x32\x2B\x0B\x3E\x56\x21\x75\x3F\xF9\x2D\x82\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\xBE\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\xFF\xDF\x3B\xBE\x55\xBE\x72\x3F\x9D\xBF\x84\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x2E\x68\x0B\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xEC\xEC\x63\x3F\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xEE\x09\x5E\x3F\x6F\x27\x90\x3E\xC7\x23\xD2\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\x3F\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x78\x12\x5D\x3F\x96\xB5\x8F\x3E\xEB\x79\xD6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xEC\xEC\x63\x3F\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xEE\x09\x5E\x3F\x6F\x27\x90\x3E\xC7\x23\xD2\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x72\xF0\x52\x3F\x6B\x3D\x0F\x3F\x0C\xCC\x8F\x3F\xE1\xAE\x5B\x3F\xB6\x78\x94\x3E\x6D\xED\xD8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x17\x62\x58\x3F\x1E\x14\x82\x3E\xCB\x5E\xA5\x3F\xB3\xC1\x52\x3F\x9F\xC7\x9B\x3E\x0C\x5D\xF5\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\x3F\xA1\x5D\x0F\x3F\x25\x3C\x9B\x3F\x50\xB7\x31\x3F\x13\xD3\xB9\x3E\xA3\x1F\x1F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\x3F\x8A\x54\x82\x3E\xE4\xCE\xB0\x3F\x9F\x2E\x1B\x3F\x9E\xB7\xC4\x3E\x0C\x45\x32\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\x3F\x69\x89\x0F\x3F\x5C\xBF\xA0\x3F\x2A\x04\xB8\x3E\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\x3F\x8A\x54\x82\x3E\x1B\x52\xB6\x3F\x2A\x04\xB8\x3E\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA8\x63\x8D\x3E\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xA8\x63\x8D\x3E\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x2A\x68\x0A\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xAC\xC9\xB6\xBE\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xA8\x63\x8D\xBE\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA8\x63\x8D\xBE\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\xBF\x8A\x54\x82\x3E\x1B\x52\xB6\x3F\x2A\x04\xB8\xBE\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\xBF\x69\x89\x0F\x3F\x5C\xBF\xA0\x3F\x2A\x04\xB8\xBE\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\xBF\x8A\x54\x82\x3E\xE4\xCE\xB0\x3F\x9F\x2E\x1B\xBF\x9E\xB7\xC4\x3E\x0C\x45\x32\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\xBF\xA1\x5D\x0F\x3F\x25\x3C\x9B\x3F\x50\xB7\x31\xBF\x13\xD3\xB9\x3E\xA3\x1F\x1F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x17\x62\x58\xBF\x1E\x14\x82\x3E\xCB\x5E\xA5\x3F\xB3\xC1\x52\xBF\x9F\xC7\x9B\x3E\x0C\x5D\xF5\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x72\xF0\x52\xBF\x6B\x3D\x0F\x3F\x0C\xCC\x8F\x3F\xE1\xAE\x5B\xBF\xB6\x78\x94\x3E\x6D\xED\xD8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xEC\xEC\x63\xBF\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xEE\x09\x5E\xBF\x6F\x27\x90\x3E\xC7\x23\xD2\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\xBF\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x78\x12\x5D\xBF\x96\xB5\x8F\x3E\xEB\x79\xD6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x52\x68\x14\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xEC\xEC\x63\x3F\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xF0\xAB\x29\x3F\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xF0\xAB\x29\x3F\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\x3F\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x06\x50\x21\x3F\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x94\x04\x09\x3F\x8E\x2D\x71\x3F\x06\x50\x21\x3F\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\x22\x5F\x3F\x58\x75\x29\x3F\xB2\x64\x78\x3F\xB8\xD8\x1E\x3F\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xEF\x56\x16\x3F\x73\x68\x67\x3F\xB8\xD8\x1E\x3F\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\x3F\x83\xD3\x3E\x3F\x0E\x5C\x59\x3F\x12\xA3\x26\x3F\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x12\xA3\x26\x3F\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\x3F\x11\xB3\x44\x3F\x97\x66\x2A\x3F\xD6\x0A\x27\x3F\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xD6\x0A\x27\x3F\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\x3F\x31\x5A\x3D\x3F\x92\xFA\xF4\x3E\xE7\x26\x2C\x3F\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x75\x25\x3F\x93\xB8\x07\x3F\xE7\x26\x2C\x3F\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD7\xA3\x60\x3F\x5E\x46\x29\x3F\x5F\xD1\xBB\x3E\x8B\x8A\x2D\x3F\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x8B\x8A\x2D\x3F\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x2D\x1C\x60\x3F\x5C\x6C\x12\x3F\xCF\xC4\x98\x3E\xD9\x4A\x2B\x3F\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xD9\x4A\x2B\x3F\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xAB\x5E\x3F\xD8\x08\xEF\x3E\x56\xBD\x85\x3E\xC2\xD9\x20\x3F\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xC2\xD9\x20\x3F\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x99\x59\x3F\x7E\x3A\xB0\x3E\xF3\x74\x83\x3E\x55\x6B\x16\x3F\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\x55\x6B\x16\x3F\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xEB\x0F\x7B\x3F\x9C\xFD\xA0\x3D\x46\x40\x37\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\x3F\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x94\x04\x09\x3F\x8E\x2D\x71\x3F\xF2\x4E\x7C\x3F\xED\x0B\xC4\x3D\xA1\xE1\x0E\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\x3F\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xEF\x56\x16\x3F\x73\x68\x67\x3F\x21\x15\x7D\x3F\x58\xBC\xE6\x3D\x18\x7D\xCC\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1E\x68\x07\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\x3F\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\x3F\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xAD\xCC\x7E\x3F\x2A\x18\xC6\x3D\x4F\xE4\x81\xBA\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\x3F\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x75\x25\x3F\x93\xB8\x07\x3F\xDD\x23\x7E\x3F\x48\xF3\xD6\x3D\x65\x00\x71\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\x3F\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x26\x1A\x7D\x3F\xBA\xE2\xE0\x3D\xF3\x64\xD1\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\x3F\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\xFF\x85\x79\x3F\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\x3F\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xFF\x85\x79\x3F\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x5A\x68\x16\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xC8\x9F\x57\x3F\x7E\x3A\xB0\x3E\x30\x43\x3F\xBE\xDF\x64\x26\x3F\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\xDF\x64\x26\x3F\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x68\x7C\x5B\x3F\x68\x9E\xF0\x3E\x6D\xF6\x43\xBE\x33\xAC\x2C\x3F\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x33\xAC\x2C\x3F\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xC6\xD3\x5E\x3F\x38\x90\x1D\x3F\xC8\x10\x63\xBE\x2A\x57\x3B\x3F\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\x2A\x57\x3B\x3F\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF7\x3E\x61\x3F\xCF\xE1\x42\x3F\x71\x1B\xA2\xBE\x37\x40\x47\x3F\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\x37\x40\x47\x3F\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x94\x8F\x65\x3F\x6F\xB1\x5B\x3F\xE1\x4F\xED\xBE\xB3\x0F\x53\x3F\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xB3\x0F\x53\x3F\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x4F\x57\x65\x3F\x7F\x97\x65\x3F\x85\xC1\x38\xBF\xD7\x2D\x55\x3F\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x2D\x05\x3F\x3F\x29\x12\x35\xBF\xD7\x2D\x55\x3F\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x45\x67\x63\x3F\xB1\xAB\x4E\x3F\xF3\x3D\x74\xBF\x74\x54\x4E\x3F\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x74\x54\x4E\x3F\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x37\xE3\x61\x3F\x54\x2C\x27\x3F\x26\xC2\x89\xBF\x2E\xDE\x45\x3F\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x61\x74\x11\x3F\x8C\x53\x77\xBF\x2E\xDE\x45\x3F\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x07\xED\x60\x3F\x88\xD8\x1B\x3F\x9A\xC5\x8C\xBF\x3F\x2C\x3E\x3F\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\x3F\x2C\x3E\x3F\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xDA\x22\x5E\x3F\x34\x0F\xCA\x3E\x33\x33\x93\xBF\x5E\xF2\x32\x3F\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\x5E\xF2\x32\x3F\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD3\xEE\x59\x3F\x7E\x3A\xB0\x3E\x33\x33\x93\xBF\x07\x70\x28\x3F\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\x07\x70\x28\x3F\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\xC4\xC3\x7B\x3F\x00\x00\x00\x00\xD0\x7E\x39\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\xA4\xE9\x7B\x3F\x1A\xAF\xA5\x3C\x8D\x12\x35\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\x3F\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\xEA\xF3\x7B\x3F\x06\xA6\x25\x3D\x73\x92\x30\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\x3F\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x22\x68\x08\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\x3F\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x2D\x05\x3F\x3F\x29\x12\x35\xBF\x79\x33\x7F\x3F\x41\xFC\x9F\x3D\xD7\x73\x3A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\x3F\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xBB\xF3\x7E\x3F\xC2\x33\xA9\x3D\x83\x2E\x16\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\x3F\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\xAF\x8B\x7D\x3F\x1A\x50\xBF\x3D\x11\x6B\xD0\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\x3F\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\xE7\x5F\x7C\x3F\x41\x56\xBB\x3D\x55\xED\x0F\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\x3F\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\x9A\x85\x76\x3F\x70\xB0\x23\x3C\x01\xEF\x89\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\x3F\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\x3F\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\x3F\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\x3F\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x52\x68\x14\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x9E\x99\x59\xBF\x7E\x3A\xB0\x3E\xF3\x74\x83\x3E\x55\x6B\x16\xBF\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\x55\x6B\x16\xBF\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xAB\x5E\xBF\xD8\x08\xEF\x3E\x56\xBD\x85\x3E\xC2\xD9\x20\xBF\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xC2\xD9\x20\xBF\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x2D\x1C\x60\xBF\x5C\x6C\x12\x3F\xCF\xC4\x98\x3E\xD9\x4A\x2B\xBF\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xD9\x4A\x2B\xBF\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD7\xA3\x60\xBF\x5E\x46\x29\x3F\x5F\xD1\xBB\x3E\x8B\x8A\x2D\xBF\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x8B\x8A\x2D\xBF\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\xBF\x31\x5A\x3D\x3F\x92\xFA\xF4\x3E\xE7\x26\x2C\xBF\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x75\x25\x3F\x93\xB8\x07\x3F\xE7\x26\x2C\xBF\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\xBF\x11\xB3\x44\x3F\x97\x66\x2A\x3F\xD6\x0A\x27\xBF\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xD6\x0A\x27\xBF\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\xBF\x83\xD3\x3E\x3F\x0E\x5C\x59\x3F\x12\xA3\x26\xBF\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x12\xA3\x26\xBF\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\x22\x5F\xBF\x58\x75\x29\x3F\xB2\x64\x78\x3F\xB8\xD8\x1E\xBF\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xEF\x56\x16\x3F\x73\x68\x67\x3F\xB8\xD8\x1E\xBF\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\xBF\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x06\x50\x21\xBF\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x94\x04\x09\x3F\x8E\x2D\x71\x3F\x06\x50\x21\xBF\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xEC\xEC\x63\xBF\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xF0\xAB\x29\xBF\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xF0\xAB\x29\xBF\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xEB\x0F\x7B\xBF\x9C\xFD\xA0\x3D\x46\x40\x37\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x94\x04\x09\x3F\x8E\x2D\x71\x3F\xF2\x4E\x7C\xBF\xED\x0B\xC4\x3D\xA1\xE1\x0E\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\xBF\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xEF\x56\x16\x3F\x73\x68\x67\x3F\x21\x15\x7D\xBF\x58\xBC\xE6\x3D\x18\x7D\xCC\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\xBF\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1E\x68\x07\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x26\x1A\x7D\xBF\xBA\xE2\xE0\x3D\xF3\x64\xD1\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\xBF\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x75\x25\x3F\x93\xB8\x07\x3F\xDD\x23\x7E\xBF\x48\xF3\xD6\x3D\x65\x00\x71\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\xBF\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xAD\xCC\x7E\xBF\x2A\x18\xC6\x3D\x4F\xE4\x81\xBA\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\xBF\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\xBF\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\xBF\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\xBF\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\xFF\x85\x79\xBF\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xFF\x85\x79\xBF\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x5A\x68\x16\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD3\xEE\x59\xBF\x7E\x3A\xB0\x3E\x33\x33\x93\xBF\x07\x70\x28\xBF\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\x07\x70\x28\xBF\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xDA\x22\x5E\xBF\x34\x0F\xCA\x3E\x33\x33\x93\xBF\x5E\xF2\x32\xBF\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\x5E\xF2\x32\xBF\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x07\xED\x60\xBF\x88\xD8\x1B\x3F\x9A\xC5\x8C\xBF\x3F\x2C\x3E\xBF\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\x3F\x2C\x3E\xBF\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x37\xE3\x61\xBF\x54\x2C\x27\x3F\x26\xC2\x89\xBF\x2E\xDE\x45\xBF\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x61\x74\x11\x3F\x8C\x53\x77\xBF\x2E\xDE\x45\xBF\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x45\x67\x63\xBF\xB1\xAB\x4E\x3F\xF3\x3D\x74\xBF\x74\x54\x4E\xBF\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x74\x54\x4E\xBF\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x4F\x57\x65\xBF\x7F\x97\x65\x3F\x85\xC1\x38\xBF\xD7\x2D\x55\xBF\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x2D\x05\x3F\x3F\x29\x12\x35\xBF\xD7\x2D\x55\xBF\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x94\x8F\x65\xBF\x6F\xB1\x5B\x3F\xE1\x4F\xED\xBE\xB3\x0F\x53\xBF\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xB3\x0F\x53\xBF\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF7\x3E\x61\xBF\xCF\xE1\x42\x3F\x71\x1B\xA2\xBE\x37\x40\x47\xBF\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\x37\x40\x47\xBF\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xC6\xD3\x5E\xBF\x38\x90\x1D\x3F\xC8\x10\x63\xBE\x2A\x57\x3B\xBF\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\x2A\x57\x3B\xBF\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x68\x7C\x5B\xBF\x68\x9E\xF0\x3E\x6D\xF6\x43\xBE\x33\xAC\x2C\xBF\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x33\xAC\x2C\xBF\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xC8\x9F\x57\xBF\x7E\x3A\xB0\x3E\x30\x43\x3F\xBE\xDF\x64\x26\xBF\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\xDF\x64\x26\xBF\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\xC4\xC3\x7B\xBF\x00\x00\x00\x00\xD0\x7E\x39\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\xBF\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\xA4\xE9\x7B\xBF\x1A\xAF\xA5\x3C\x8D\x12\x35\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\xBF\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\xEA\xF3\x7B\xBF\x06\xA6\x25\x3D\x73\x92\x30\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x26\x68\x09\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\xBF\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\xE7\x5F\x7C\xBF\x41\x56\xBB\x3D\x55\xED\x0F\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\xBF\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\xAF\x8B\x7D\xBF\x1A\x50\xBF\x3D\x11\x6B\xD0\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\xBF\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xBB\xF3\x7E\xBF\xC2\x33\xA9\x3D\x83\x2E\x16\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\xBF\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x2D\x05\x3F\x3F\x29\x12\x35\xBF\x79\x33\x7F\xBF\x41\xFC\x9F\x3D\xD7\x73\x3A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\xBF\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\xBF\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\xBF\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\x9A\x85\x76\xBF\x70\xB0\x23\x3C\x01\xEF\x89\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\xBF\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\xBF\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\xBF\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x00\x00\x00\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+# empty boat adapter, using the empty one to save space
+HG3_HOVERCRAFT_ADAPTER = (b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00"
+                          b"\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00"
+                          b"\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00")
+
+# Texture transfer tags
+# problem with this is that the texture addresses, are probably manually/specially picked
+# to prevent overlap in memory, I do not have this ability,
+# and so textures need to be given an address;
+# Other option would be to only copy the texture, and on replacement overwrite this default
+# but that requires the knowledge of which file we are replacing so we can copy that bit
+
+# HG3, I have chosen the  Q88.BIN / Q89's texture addresses
+HG3_TEXTURE_HEADER = \
+    (b"\x06\x04\x40\x10\x00\x00\x00\x00\x71\x00\x00\x00\xF0\xF9\x12\x00\x04\x00\x40\x00\x50\x00"
+     b"\x00\x10\x5E\x2A\x87\x00\x00\x02\x00\x00\x74\xF9\x12\x00\x00\x00\x02\x13\x50\x00\x00\x00"
+     b"\xA4\xF9\x12\x00\x93\x5D\x40\x00\x00\x00\x00\x00\x51\x00\x00\x00\x00\x02\x00\x00\x80\x40"
+     b"\x00\x00\x80\x00\x00\x00\x52\x00\x00\x00\x00\x42\x00\x00\xC8\xF9\x12\x00\x93\x5D\x40\x00"
+     b"\x53\x00\x00\x00\x87\x6C\x40\x00\x00\x04\x00\x00\x50\x2A\x87\x08\x00\x02\x00\x00\x72\x00"
+     b"\x00\x00")
+HG3_PALETTE_HEADER = \
+    (b"\x46\x00\x40\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x00\x02\x13\x50\x00"
+     b"\x00\x10\xAE\xF9\x12\x00\x93\x5D\x40\x00\x00\x00\x00\x00\x40\xC0\xC1\xC0\x50\x00\x00\x00"
+     b"\x0A\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x51\x00\x00\x00\x40\x00\x00\x00\x10\x00"
+     b"\x00\x00\x10\x00\x00\x00\x52\x00\x00\x00\x0F\xF9\x12\x00\x94\xE7\x40\x00\x00\x00\x00\x00"
+     b"\x53\x00\x00\x00\xFF\xFF\xFF\xFF\x40\x00\xFF\xFF\xE4\xF9\x12\x08\xE5\x64\x40\x00\xEC\x64"
+     b"\x40\x00")
+HG3_TEXTURE_END = \
+    (b"\x02\x00\x00\x70\x00\x00\x00\x00\x4C\xED\x40\x00\x50\xFA\x12\x00\x01\x80\x12\x00\x01\x00"
+     b"\x00\x10\x2E\xFA\x12\x00\xE4\x42\x40\x00\xCC\x6E\x87\x00\x38\xFA\x12\x00\x3F\x00\x00\x00"
+     b"\x00\x00\x00\x00")
+
+# HG2, I have chosen the  Q85.BIN / Q86's texture addresses
+HG2_TEXTURE_HEADER = (b"\x06\x04\x12\x10\x00\x00\x00\x00\x44\x6E\x87\x00\xEC\xF9\x12\x00\x04\x00"
+                      b"\x00\x00\xA4\xB9\x12\x10\xCE\x4D\x40\x00\x04\x00\x00\x00\x44\x2A\x87\x00"
+                      b"\x00\x00\x02\x13\x50\x00\x00\x00\xF6\x01\x00\x00\x44\xDC\x40\x00\x00\x40"
+                      b"\x00\x00\x51\x00\x00\x00\xCF\x4D\x40\x00\x80\xF0\x12\x00\x80\x50\x40\x00"
+                      b"\x52\x00\x00\x00\x44\x2A\x87\x00\x00\x02\x00\x00\xF6\x01\x00\x00\x53\x00"
+                      b"\x00\x00\xF5\x01\x00\x00\x00\x04\x00\x00\xF0\xF9\x12\x08\x50\xFA\x12\x00"
+                      b"\x50\xFA\x12\x00")
+HG2_PALETTE_HEADER = (b"\x46\x00\xFF\x10\x00\x00\x00\x00\xFC\xF9\x12\x00\x1D\x55\x40\x00\x04\x00"
+                      b"\x00\x00\xA4\xB9\x12\x10\xCE\x4D\x40\x00\x04\x00\x00\x00\x44\x2A\x87\x00"
+                      b"\x40\x00\x01\x00\x50\x00\x00\x00\xF6\x01\x00\x00\x44\xDC\x40\x00\x00\x40"
+                      b"\x00\x00\x51\x00\x00\x00\xCF\x4D\x40\x00\x10\x00\x00\x00\x10\x50\x40\x00"
+                      b"\x52\x00\x00\x00\x44\x2A\x87\x00\x40\x00\x00\x00\x00\x00\x00\x00\x53\x00"
+                      b"\x00\x00\x00\x00\x00\x00\x40\x00\x12\x00\x2A\xD6\x40\x08\x00\x00\x00\x00"
+                      b"\x80\x00\x00\x00")
+HG2_TEXTURE_END = (b"\x02\x00\x40\x70\x00\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x01\x80\x87\x00\x00"
+                   b"\x00\x00\x10\x2E\xFA\x12\x00\x24\x33\x40\x00\x48\x2C\x87\x00\x38\xFA\x12\x00\x3F\x00"
+                   b"\x00\x00\x00\x00\x00\x00")
+
+
+# Holds the parts of the converted car, at their positions in the file, like a file opened for writing.
+# Parts are kept as they are (not copied) until getbuffer, which makes the whole car in one bytearray
+class ConvertedCarBuffer:
+
+    def __init__(self):
+        self.parts = []
+        self.position = 0
+        self.size = 0
+
+    def seek(self, position):
+        self.position = position
+
+    def tell(self):
+        return self.position
+
+    def write(self, data):
+        self.parts.append((self.position, data))
+        self.position += len(data)
+        self.size = max(self.size, self.position)
+
+    # Moves to the next 16 byte aligned position (for the next subfile)
+    def align(self):
+        if self.position % 16 != 0:
+            self.position += 16 - (self.position % 16)
+        return self.position
+
+    def getbuffer(self):
+        out = bytearray(self.size)
+        # Later writes replace earlier ones, the same as writing to a file
+        for position, data in self.parts:
+            out[position:position + len(data)] = data
+        return out
 
 
 class EGameConverter:
@@ -16,22 +133,14 @@ class EGameConverter:
             with open(out_path, "wb") as car_out:
                 EGameConverter.convert_hg2_to_hg3_stream(car_in, car_out)
 
+    # car_in can be a file (or BytesIO) or bytes like (bytes, bytearray, memoryview)
+    # Returns the converted car as a bytearray, this is also written to car_out if given
     @staticmethod
-    def convert_hg2_to_hg3_stream(car_in, car_out):
+    def convert_hg2_to_hg3_stream(car_in, car_out=None):
+        data = EGameConverter.read_input(car_in)
         # Need to parse the bits of the HG2 car,
         # then convert them on the fly to HG3 car format
-        in_subfile_offsets = [U.readLong(car_in)]
-        while in_subfile_offsets[-1] != 0 and car_in.tell() < in_subfile_offsets[0]:
-            o = U.readLong(car_in)
-            if o == 0:
-                break
-            in_subfile_offsets.append(o)
-        in_eof_offset = in_subfile_offsets[-1]
-        in_texture_offset = in_subfile_offsets[-2]
-        in_subfile_offsets = in_subfile_offsets[:-2]
-
-        in_subfile_index = 0
-        in_submesh_index = 0
+        in_subfile_offsets, in_texture_offset, in_eof_offset = EGameConverter.read_subfile_offsets(data)
 
         # Each HG2 subfile (mesh) has multiple meshes (max 3)
         # Subfile 0 has [Body, front/back-lights, brake-lights]
@@ -51,316 +160,118 @@ class EGameConverter:
         # Subfile 5 has [Unsure possibly boat bits]
         # Subfile 6 has [Stickers]
 
+        car_out_buffer = ConvertedCarBuffer()
+
         # Setup subfile offset table
         subfile_indices = []
-        subfile_lengths = []
         # first offset is 48 to give us 8 * 4 + 4 for offsets, and then pad to 16 aligned
         subfile_indices.append(48)
 
-        # Empty sub mesh data, needed to make game draw nothing
-        empty_mesh = (b'\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00\x00'
-                      b'\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
-
         # Work on the first subfile (HG3), which is the main body/lights/brake lights
         # HG3 subfile:index
         # Body 0:0
         body_mesh_out_bytes, body_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 0, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
+            data, 0, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
         lights_mesh_out_bytes, lights_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 0, 1, in_subfile_offsets, gif_tag_b_override=0x313E4000,
+            data, 0, 1, in_subfile_offsets, gif_tag_b_override=0x313E4000,
             skip_normals=True, xyz_scale=(1, 1, 1.01))
         lights_mesh_out_bytes2, lights_gif_tags2 = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 0, 1, in_subfile_offsets, gif_tag_b_override=0x303E4000,
+            data, 0, 1, in_subfile_offsets, gif_tag_b_override=0x303E4000,
             skip_normals=True, xyz_scale=(1, 1, 1.01))
         brake_mesh_out_bytes, brake_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 0, 2, in_subfile_offsets, gif_tag_b_override=0x303E4000,
+            data, 0, 2, in_subfile_offsets, gif_tag_b_override=0x303E4000,
             skip_normals=True, xyz_scale=(1, 1, 1.01))
 
-        car_out.seek(subfile_indices[0], os.SEEK_SET)
-        main_sub_size = 5
-        header_length = main_sub_size * 16
-        _zero = 0
-        main_subfile_header = bytes()
-        current_offset = header_length
-        # count, 2 are not used but that's fine
-        main_subfile_header += main_sub_size.to_bytes(4, byteorder='little')
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        # 0 mesh, count + offset, main body
-        main_subfile_header += body_gif_tags.to_bytes(4, byteorder='little')
-        main_subfile_header += current_offset.to_bytes(4, byteorder='little')
-        # 1 mesh, count + offset, nothing
-        # tbd if this is anything useful, this might be spoiler0
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # gif count
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # offset
-        # 2 mesh, count + offset, brake lights
-        current_offset += len(body_mesh_out_bytes)
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += brake_gif_tags.to_bytes(4, byteorder='little')
-        main_subfile_header += current_offset.to_bytes(4, byteorder='little')
-        # 3 mesh, count + offset, lights
-        current_offset += len(brake_mesh_out_bytes)
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += lights_gif_tags.to_bytes(4, byteorder='little')
-        main_subfile_header += current_offset.to_bytes(4, byteorder='little')
-        # 4 mesh, count + offset, don't have/understand the difference between 3/4 so just same for now
-        current_offset += len(lights_mesh_out_bytes)
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        main_subfile_header += lights_gif_tags2.to_bytes(4, byteorder='little')
-        main_subfile_header += current_offset.to_bytes(4, byteorder='little')
-
-        car_out.write(main_subfile_header)
-        car_out.write(body_mesh_out_bytes)
-        car_out.write(brake_mesh_out_bytes)
-        car_out.write(lights_mesh_out_bytes)
-        car_out.seek(16, os.SEEK_CUR)
-        car_out.seek(-16, os.SEEK_CUR)
-        car_out.write(lights_mesh_out_bytes2)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[0])
-
-        next_position = car_out.tell()
-        # 16 byte alignment, probably not needed, due to dma alignment
-        if next_position % 16 != 0:
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+        car_out_buffer.seek(subfile_indices[0])
+        # 5 mesh entries, count + offset for each
+        # 0 main body
+        # 1 nothing, tbd if this is anything useful, this might be spoiler0
+        # 2 brake lights
+        # 3 lights
+        # 4 lights, don't have/understand the difference between 3/4 so just same for now
+        main_meshes = [body_mesh_out_bytes, None, brake_mesh_out_bytes, lights_mesh_out_bytes, lights_mesh_out_bytes2]
+        main_gif_counts = [body_gif_tags, 0, brake_gif_tags, lights_gif_tags, lights_gif_tags2]
+        car_out_buffer.write(EGameConverter.make_hg3_subfile_header(main_meshes, main_gif_counts))
+        for mesh in main_meshes:
+            if mesh is not None:
+                car_out_buffer.write(mesh)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the second subfile (HG3), which is the lp body/lights/brake lights
         # HG3 subfile:index
         # LP Body 1:0
         lp_body_mesh_out_bytes, lp_body_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 1, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
+            data, 1, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
         lp_lights_mesh_out_bytes, lp_lights_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 1, 1, in_subfile_offsets, gif_tag_b_override=0x313E4000,
-            skip_normals=True, xyz_scale=(1, 1, 1.01))
-        lp_lights_mesh_out_bytes2, lp_lights_gif_tags2 = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 1, 1, in_subfile_offsets, gif_tag_b_override=0x303E4000,
+            data, 1, 1, in_subfile_offsets, gif_tag_b_override=0x313E4000,
             skip_normals=True, xyz_scale=(1, 1, 1.01))
 
-        car_out.seek(subfile_indices[-1], os.SEEK_SET)
-        lp_sub_size = 5
-        lp_header_length = lp_sub_size * 16
-        _zero = 0
-        lp_subfile_header = bytes()
-        current_offset = lp_header_length
-        # count, 2 are not used but that's fine
-        lp_subfile_header += lp_sub_size.to_bytes(4, byteorder='little')
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        # 0 mesh, count + offset, main body
-        lp_subfile_header += lp_body_gif_tags.to_bytes(4, byteorder='little')
-        lp_subfile_header += current_offset.to_bytes(4, byteorder='little')
-        # 1 mesh, count + offset, nothing
-        # tbd if this is anything useful, this might be spoiler0
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # gif count
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # offset
-        # 2 mesh, count + offset, nothing
-        # tbd if this is anything useful, this might be spoiler0
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # gif count
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # offset
-        # 3 mesh, count + offset, brake lights
-        current_offset += len(lp_body_mesh_out_bytes)
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += brake_gif_tags.to_bytes(4, byteorder='little')
-        lp_subfile_header += current_offset.to_bytes(4, byteorder='little')
-        # 4 mesh, count + offset, don't have/understand the difference between 3/4 so just same for now
-        current_offset += len(lp_lights_mesh_out_bytes)
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        lp_subfile_header += lights_gif_tags2.to_bytes(4, byteorder='little')
-        lp_subfile_header += current_offset.to_bytes(4, byteorder='little')
-
-        car_out.write(lp_subfile_header)
-        car_out.write(lp_body_mesh_out_bytes)
-        car_out.write(lp_lights_mesh_out_bytes)
-        car_out.seek(16, os.SEEK_CUR)
-        car_out.seek(-16, os.SEEK_CUR)
-        car_out.write(lights_mesh_out_bytes2)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[1])
-
-        next_position = car_out.tell()
-        # 16 byte alignment, probably not needed, due to dma alignment
-        if next_position % 16 != 0:
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+        car_out_buffer.seek(subfile_indices[-1])
+        # 0 main body
+        # 1, 2 nothing, tbd if this is anything useful
+        # 3 lights, using the count of the brake lights
+        # 4 lights, using the high quality lights
+        lp_meshes = [lp_body_mesh_out_bytes, None, None, lp_lights_mesh_out_bytes, lights_mesh_out_bytes2]
+        lp_gif_counts = [lp_body_gif_tags, 0, 0, brake_gif_tags, lights_gif_tags2]
+        car_out_buffer.write(EGameConverter.make_hg3_subfile_header(lp_meshes, lp_gif_counts))
+        for mesh in lp_meshes:
+            if mesh is not None:
+                car_out_buffer.write(mesh)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the third subfile (HG3), which is the spoiler
         # HG3 subfile:index
         # spoiler 2:0
         spoiler_bytes, spoiler_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 2, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
-
-        car_out.seek(subfile_indices[-1], os.SEEK_SET)
-        spoiler_sub_size = 1
-        spoiler_header_length = spoiler_sub_size * 16
-        _zero = 0
-        spoiler_subfile_header = bytes()
-        current_offset = spoiler_header_length
-        spoiler_subfile_header += spoiler_sub_size.to_bytes(4, byteorder='little')
-        spoiler_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        spoiler_subfile_header += spoiler_gif_tags.to_bytes(4, byteorder='little')
-        spoiler_subfile_header += current_offset.to_bytes(4, byteorder='little')  # padding
-
-        car_out.write(spoiler_subfile_header)
-        car_out.write(spoiler_bytes)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[2])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            # 16 byte alignment, probably not needed, due to dma alignment
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+            data, 2, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
+
+        car_out_buffer.seek(subfile_indices[-1])
+        car_out_buffer.write(EGameConverter.make_hg3_subfile_header([spoiler_bytes], [spoiler_gif_tags]))
+        car_out_buffer.write(spoiler_bytes)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the fourth subfile (HG3), which is the spoiler f1
         # HG3 subfile:index
         # spoiler f1 2:0
         f1_spoiler_bytes, f1_spoiler_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 3, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
+            data, 3, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
 
-        car_out.seek(subfile_indices[-1], os.SEEK_SET)
-        f1_spoiler_sub_size = 1
-        f1_spoiler_header_length = f1_spoiler_sub_size * 16
-        _zero = 0
-        f1_spoiler_subfile_header = bytes()
-
-        current_offset = f1_spoiler_header_length
-        f1_spoiler_subfile_header += f1_spoiler_sub_size.to_bytes(4, byteorder='little')
-        f1_spoiler_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        f1_spoiler_subfile_header += f1_spoiler_gif_tags.to_bytes(4, byteorder='little')
-        f1_spoiler_subfile_header += current_offset.to_bytes(4, byteorder='little')  # padding
-
-        car_out.write(f1_spoiler_subfile_header)
-        car_out.write(f1_spoiler_bytes)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[3])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            # 16 byte alignment, probably not needed, due to dma alignment
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+        car_out_buffer.seek(subfile_indices[-1])
+        car_out_buffer.write(EGameConverter.make_hg3_subfile_header([f1_spoiler_bytes], [f1_spoiler_gif_tags]))
+        car_out_buffer.write(f1_spoiler_bytes)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the fifth subfile (HG3), which I think is the boat edge adapter/filler
-        # HG2 does not have this, so I will just copy in one that works for some cars
-        # Q82.BIN boat adapter:
-        boat_adapter = b"\x01\x00\x00\x00\x00\x00\x00\x00\x26\x00\x00\x00\x10\x00\x00\x00\xE6\x02\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\x5A\x4E\x7C\xBF\xCD\x53\x2D\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\xF6\xCC\x55\xBF\x65\xCD\x0C\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x1B\x39\x03\xBF\x67\xCF\x5B\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\x00\x00\x00\x00\x03\x95\x94\xBE\xBD\xFB\x74\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x00\x00\x00\x00\xD3\x03\x7B\xBF\xD5\x18\x49\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x00\x00\x00\x00\x05\xA6\x5A\xBF\x50\x26\x05\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x00\x00\x00\x00\xB1\x28\x0F\xBF\xD8\x3A\x54\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\x00\x00\x00\x00\xF4\x06\x97\xBE\xFA\x9B\x74\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xC3\xAD\x7F\xBF\xB5\x21\x4D\x3D\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\xB8\x70\x72\xBF\x2E\x6C\xA4\xBE\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\x69\x33\x33\xBF\xDC\xD1\x36\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x24\x7D\x77\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x00\x00\x00\x00\xBC\x08\x0A\xBF\x23\x99\x57\xBF\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x00\x00\x00\x00\xDD\x3A\x6D\xBF\xC1\x6F\xC0\x3E\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\x00\x00\x00\x00\x45\x61\x2E\xBF\x76\x6C\x3B\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\x00\x00\x00\x00\xEC\xEF\xBF\xBE\xC0\x54\x6D\x3F\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\xBE\x33\x5B\xAF\xBD\xD6\x72\x9A\x3E\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\xBE\x33\x5B\xAF\xBD\x99\xBB\x86\x3F\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x99\xBB\x86\x3F\xA7\x51\x09\xBF\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\xBF\x57\xB4\x4C\x3F\x31\x49\xD8\xBE\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x57\xB4\x4C\x3F\x55\xF6\x63\xBF\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\xBB\xBC\x0D\x3F\x66\x8C\x62\xBE\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\xBB\xBC\x0D\x3F\x4F\x6A\x8D\xBF\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x66\x8C\x62\xBE\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\xBF\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x99\xBB\x86\x3F\x00\x00\x80\xBF\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\xBB\xBC\x0D\x3F\xD6\x72\x9A\x3E\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x8F\x9C\x06\x3F\x99\xBB\x86\x3F\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x28\xDE\x29\x3F\x15\x5F\xDB\x3E\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x28\xDE\x29\x3F\x72\x96\x6E\x3F\x00\x00\x80\xBF\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\x3E\x33\x5B\xAF\xBD\x66\x8C\x62\xBE\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\x3E\xA5\x06\x31\xBD\x75\x6B\x8D\xBF\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x66\x8C\x62\xBE\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\xDB\x34\x09\x3F\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\xBE\x33\x5B\xAF\xBD\x66\x8C\x62\xBE\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x66\x8C\x62\xBE\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\xBE\xA5\x06\x31\xBD\x75\x6B\x8D\xBF\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\xBF\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\xDB\x34\x09\xBF\x9E\xE0\x57\xBF\x36\xC2\x25\xBD\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x40\x78\xC0\x3E\x33\x5B\xAF\xBD\xD6\x72\x9A\x3E\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x40\x78\xC0\x3E\x33\x5B\xAF\xBD\x99\xBB\x86\x3F\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x99\xBB\x86\x3F\xA7\x51\x09\x3F\xED\x0D\x58\xBF\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x66\x8C\x62\xBE\x00\x00\x80\x3F\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x08\x6B\x8D\xBF\x00\x00\x80\x3F\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\xBB\xBC\x0D\x3F\x66\x8C\x62\xBE\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\xBB\xBC\x0D\x3F\x4F\x6A\x8D\xBF\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x57\xB4\x4C\x3F\x31\x49\xD8\xBE\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x57\xB4\x4C\x3F\x55\xF6\x63\xBF\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1A\x68\x06\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x00\x00\x00\x00\xC0\x36\x31\x20\x00\x00\x00\x74\x43\x3D\x3F\x28\xDE\x29\x3F\x15\x5F\xDB\x3E\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x28\xDE\x29\x3F\x72\x96\x6E\x3F\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\xBB\xBC\x0D\x3F\xD6\x72\x9A\x3E\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x8F\x9C\x06\x3F\x99\xBB\x86\x3F\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x80\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\xD6\x72\x9A\x3E\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x74\x43\x3D\x3F\x30\xD4\x14\x3E\x99\xBB\x86\x3F\x00\x00\x80\x3F\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x20\x41\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x32\x68\x0C\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\xBE\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\xBF\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\xBE\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\xBF\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\xBF\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x44\x06\x4C\xBF\xFF\x8F\xE9\x3E\x0B\xB4\xCA\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\xBF\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x17\xB8\x54\xBF\xDF\x86\x04\x3F\xEE\xBC\x50\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\xBE\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x22\x03\x56\xBF\xE5\x77\x0C\x3F\x2F\x4A\xEC\xBB\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\xBF\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x5A\x89\x53\xBF\x36\xD2\x05\x3F\x87\xAB\x56\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\xBF\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\xBF\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\xBE\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x36\x68\x0D\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\xBF\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\xBF\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x23\xCC\x4F\xBF\xD8\x08\xF7\x3E\x08\x85\xA8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\xBE\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x43\xAC\x50\xBF\xD7\xD8\x12\x3F\x1D\x6C\xA5\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\xBE\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x1F\xFB\x4E\xBF\x5F\xFA\x12\x3F\x0A\x34\x04\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\xBE\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\xE9\x41\x47\xBF\x89\x5F\x03\x3F\xDD\x2F\xB9\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\xBF\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\xBF\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\xBF\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\xBF\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x27\x62\x81\xBF\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\xBF\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x2E\xE0\x4F\xBF\x1D\x0B\x60\x3E\xE8\x83\x0A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\xBF\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\xBF\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\xBF\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x68\x92\x1E\xBF\x9D\x45\x6D\x3E\x8E\x05\x40\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x32\x68\x0C\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x5F\xAA\x75\xBF\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\xBF\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\x3F\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\xBE\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\x3E\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\xBF\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\x3F\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\xBF\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\x3F\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\xBE\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\x3E\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\xBE\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\x3E\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x32\x68\x0C\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x5F\xAA\x75\xBF\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\xBF\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\x3F\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\xBE\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\x3E\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\xBE\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\x3E\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\xBE\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\x3E\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\xBF\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\x3F\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\xBF\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\x3F\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1E\x68\x07\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x5A\x89\x53\xBF\x36\xD2\x05\x3F\x87\xAB\x56\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\xBF\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\xBF\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\xBE\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\x3F\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\x3E\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\x3F\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x26\x68\x09\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\xBF\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x75\x0D\x52\xBF\x6E\xCE\x9D\x3E\x1A\x7B\xF6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\xBF\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\x6A\xE5\xE7\x3E\x99\xBB\x86\x3F\x6B\xDE\x45\xBF\x74\x86\xB5\x3E\x16\xB5\x06\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\xBF\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x97\xB0\x89\x3F\xA5\xBE\xC7\xBE\xDE\x3E\x01\x3F\x3D\x1F\x45\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\x3F\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x97\xB0\x89\x3F\xA5\xBE\xC7\x3E\xDE\x3E\x01\x3F\x3D\x1F\x45\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\x6A\xE5\xE7\x3E\x99\xBB\x86\x3F\x6B\xDE\x45\x3F\x74\x86\xB5\x3E\x16\xB5\x06\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\x3F\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x75\x6B\x8D\xBF\x68\x92\x1E\x3F\x9D\x45\x6D\x3E\x8E\x05\x40\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\x3F\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x27\x62\x81\x3F\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\x3F\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\x3F\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\xD6\x72\x9A\x3E\x2E\xE0\x4F\x3F\x1D\x0B\x60\x3E\xE8\x83\x0A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x3E\x68\x0F\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x27\x62\x81\x3F\x36\xEC\xE7\x3E\x5B\x82\x94\x3E\x5F\x18\x4C\x3F\x8B\x36\x75\x3E\x13\xDB\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\xF3\x6C\x7D\x3E\xFA\x1F\x0C\x3F\x48\xBF\xFF\x3E\x36\xE6\x2B\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x86\x35\xB6\x3E\xE6\x36\x45\x3F\x1D\xE3\xB2\x3E\x6E\x89\x08\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x9C\xF6\x34\x3F\x01\xA4\xD4\x3E\x11\x5B\x01\x3F\x42\xDA\x2E\x3F\x6F\x04\x07\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x9D\xA0\x1A\x3F\x30\x0C\xE1\x3E\xE9\x41\x47\x3F\x89\x5F\x03\x3F\xDD\x2F\xB9\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x6B\x56\x43\x3F\x6A\xA8\x0E\x3F\xDD\xFF\xE8\x3E\x6F\x45\x5E\x3F\xD3\x5B\x4A\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xB1\x6A\x28\x3F\xA4\x85\x12\x3F\x1F\xFB\x4E\x3F\x5F\xFA\x12\x3F\x0A\x34\x04\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xC3\x97\x46\x3F\xD9\x94\x3A\x3F\xE2\xE3\xEB\x3E\x9C\xC1\x61\x3F\x5F\x60\xCD\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x0D\x51\x2A\x3F\xEA\x68\x38\x3F\x43\xAC\x50\x3F\xD7\xD8\x12\x3F\x1D\x6C\xA5\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x91\x69\x3B\x3F\xE0\x17\x63\x3F\x02\x07\xE9\x3E\x42\xDD\x49\x3F\x7A\xC4\xD3\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xCF\x8C\x1D\x3F\xEE\x0E\x5E\x3F\x23\xCC\x4F\x3F\xD8\x08\xF7\x3E\x08\x85\xA8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xB9\xD2\x27\x3F\x26\xA2\x7B\x3F\xFD\x18\x12\x3F\xDA\x57\x0B\x3F\x92\x66\x1D\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x24\x7D\x77\x3F\xCC\x0F\x4E\x3F\xDA\x8D\xB9\x3E\xC0\x8E\xF0\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\x6A\xE5\xE7\x3E\x99\xBB\x86\x3F\x6B\xDE\x45\x3F\x74\x86\xB5\x3E\x16\xB5\x06\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x5C\x8F\xC2\x3E\x99\xBB\x86\x3F\x75\x0D\x52\x3F\x6E\xCE\x9D\x3E\x1A\x7B\xF6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x26\x68\x09\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD0\xE4\x84\xBF\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\xAE\x7D\x35\xBF\x90\xBD\x51\x3E\xBC\xC3\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\xBF\xD8\x0E\xE8\x3E\xFE\xCE\x5B\xBE\x93\x74\x36\xBF\x57\xC5\x4D\x3E\xAC\x0B\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\xBF\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\xBF\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\x24\x9B\x03\x3F\x53\x0D\x36\xBE\x03\xE3\x00\xBF\x2F\x91\xB4\x3E\x68\xEC\x49\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\xBF\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\xBE\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x53\x0D\x36\xBE\x03\xE3\x00\x3F\x2F\x91\xB4\x3E\x68\xEC\x49\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x86\x3A\x3F\x31\x74\x93\xBE\xBF\x8F\xF9\x3E\xFA\xF4\x09\x3F\x30\xE1\x2F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\x3F\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\x3F\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x36\x68\x0D\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\x3F\x74\x71\x27\x3F\x9F\xE1\xB0\xBE\x9B\xF7\x47\x3F\x92\xD2\xE6\x3E\x3E\x2C\xDD\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x62\x57\x3F\x3F\x1B\x75\xF9\xBE\x5A\x89\x53\x3F\x36\xD2\x05\x3F\x87\xAB\x56\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xCA\xAF\x5B\x3F\x75\x44\xEA\xBE\x02\xFD\x0B\x3F\x8F\x3F\x41\x3F\x68\x69\xB9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x3C\x17\x47\x3F\xD3\xD9\x29\xBF\x22\x03\x56\x3F\xE5\x77\x0C\x3F\x2F\x4A\xEC\xBB\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xFD\xB7\x65\x3F\x8A\x1B\x2B\xBF\x8C\xF9\xF4\x3E\xDD\xC5\x60\x3F\x94\x2F\x4A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x4E\x0E\x3F\x3F\xE5\xF7\x51\xBF\x17\xB8\x54\x3F\xDF\x86\x04\x3F\xEE\xBC\x50\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x5F\x58\x5B\x3F\x4F\x18\x5B\xBF\x1F\x82\x0E\x3F\x04\xEE\x41\x3F\xD7\x91\xAE\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\xEC\x23\x28\x3F\x3C\x99\x77\xBF\x44\x06\x4C\x3F\xFF\x8F\xE9\x3E\x0B\xB4\xCA\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\xA7\x72\x41\x3F\x77\x02\x81\xBF\xA3\x54\x03\x3F\x8E\x3C\x16\x3F\xB2\x5D\x20\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\x11\x1F\x88\xBF\xF0\x84\x31\x3F\x9C\xB7\x9A\x3E\x79\x72\x27\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x38\x36\x20\x3F\xFC\x40\x8C\xBF\x4D\xB7\xDD\x3E\x99\xBA\xB8\x3E\xBF\x75\x53\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\xB0\x18\xE8\x3E\x76\x6B\x8D\xBF\xA2\xD8\x1F\x3F\xD3\xED\x68\x3E\xCC\x4B\x3F\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x1A\x93\x90\xBF\x9F\x20\xAA\x3E\x32\xA6\x8B\x3E\x48\x23\x67\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\x3F\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x5F\xAA\x75\x3F\x24\x9B\x03\x3F\x53\x0D\x36\xBE\x03\xE3\x00\x3F\x2F\x91\xB4\x3E\x68\xEC\x49\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xBD\xE3\x84\x3F\x20\x9B\x03\x3F\xC6\x17\x86\xBE\x35\x9B\x37\x3F\xDF\x13\x8A\x3E\x8B\x7E\x24\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x27\x62\x81\x3F\xD8\x0E\xE8\x3E\xFE\xCE\x5B\xBE\x93\x74\x36\x3F\x57\xC5\x4D\x3E\xAC\x0B\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD0\xE4\x84\x3F\x5C\x8F\xC2\x3E\x66\x8C\x62\xBE\xAE\x7D\x35\x3F\x90\xBD\x51\x3E\xBC\xC3\x2C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x00\x00\x00\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
-        # empty boat adapter
-        # boat_adapter = b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
         # HG3 subfile:index
-        # boat adatper
-        car_out.write(boat_adapter)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[3])
-
-        next_position = car_out.tell()
-        # 16 byte alignment, probably not needed, due to dma alignment
-        if next_position % 16 != 0:
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+        # boat adapter
+        car_out_buffer.seek(subfile_indices[-1])
+        car_out_buffer.write(HG3_BOAT_ADAPTER)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the sixth subfile (HG3), which I think is the hovercraft edge adapter/filler
-        # HG2 does not have this, so I will just copy in one that works for some cars
-        # Q82.BIN hovercraft adapter:
-        # hovercraft_adapter = b"\x01\x00\x00\x00\x00\x00\x00\x00\x17\x00\x00\x00\x10\x00\x00\x00\xA1\x02\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x80\x56\x68\x15\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xC8\x62\x6A\x3F\xB9\x01\x47\x3E\x53\x44\xB4\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xB2\x54\x09\x3F\x19\x8D\x4E\x3F\x79\x63\x7D\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\xFA\x9F\x17\x3F\xF4\x78\x1A\x3F\xA0\xB0\x08\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\x3E\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\x32\x2B\x0B\x3E\x56\x21\x75\x3F\xF9\x2D\x82\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x94\x27\x3E\x3E\x81\x21\x4E\x3F\x8A\x2C\x10\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\xBE\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\xFF\xDF\x3B\xBE\x55\xBE\x72\x3F\x9D\xBF\x84\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x6B\xFA\x61\xBE\x87\x12\x4D\x3F\x1F\x71\x0E\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA0\x95\x15\xBF\xE6\xEA\x45\x3F\x4B\xA3\x7C\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\x9F\xB0\x21\xBF\x6C\xFC\x14\x3F\xBA\x21\x03\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xC8\x62\x6A\xBF\xB9\x01\x47\x3E\x53\x44\xB4\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\x1C\x74\x33\xBF\xB8\x27\xDB\x3E\x0C\x08\x12\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\x8A\x54\x82\x3E\xF5\xFF\xD0\x3F\x5F\xBF\x32\xBF\xC8\xCC\xB1\x3E\xA3\x41\x20\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x3C\x69\x44\xBE\x8E\xB5\x22\x3F\x8D\x71\x3F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\x8A\x54\x82\x3E\x04\x1D\xD2\x3F\x39\xDE\x44\xBE\x88\x73\xF3\x3E\xC8\xC3\x5B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x2E\xB3\x3D\x3E\x30\x2B\x20\x3F\xED\xFD\x41\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\x8A\x54\x82\x3E\x04\x1D\xD2\x3F\xFB\x47\x3D\x3E\x15\xCE\xF3\x3E\x46\x15\x5C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x8A\x54\x82\x3E\xF5\xFF\xD0\x3F\x20\x5C\x31\x3F\x6B\x1A\xB3\x3E\x5B\x6E\x21\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xC8\x62\x6A\x3F\xB9\x01\x47\x3E\x53\x44\xB4\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x22\x68\x08\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xCF\xD5\xA3\xBE\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\x9F\xB0\x21\xBF\x6C\xFC\x14\x3F\xBA\x21\x03\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\xBE\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\x1C\x74\x33\xBF\xB8\x27\xDB\x3E\x0C\x08\x12\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x6B\xFA\x61\xBE\x87\x12\x4D\x3F\x1F\x71\x0E\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\xBE\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x3C\x69\x44\xBE\x8E\xB5\x22\x3F\x8D\x71\x3F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\xD7\x39\x02\x3F\xB6\xCD\xBE\x3F\x94\x27\x3E\x3E\x81\x21\x4E\x3F\x8A\x2C\x10\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xD8\x99\x3E\x2B\x11\xFD\x3E\x43\x24\xC1\x3F\x2E\xB3\x3D\x3E\x30\x2B\x20\x3F\xED\xFD\x41\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\xCB\x2B\x00\x3F\x56\x8A\xBE\x3F\xFA\x9F\x17\x3F\xF4\x78\x1A\x3F\xA0\xB0\x08\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCF\xD5\xA3\x3E\x35\x71\xF9\x3E\x1D\x7B\xC0\x3F\xF5\xE1\x31\x3F\x5D\x07\xD7\x3E\x72\x72\x15\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xAC\xC9\xB6\x3E\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xB2\x54\x09\x3F\x19\x8D\x4E\x3F\x79\x63\x7D\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA0\x95\x15\xBF\xE6\xEA\x45\x3F\x4B\xA3\x7C\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\x3E\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\x32\x2B\x0B\x3E\x56\x21\x75\x3F\xF9\x2D\x82\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD1\xCC\xAC\xBE\x69\xB0\x10\x3F\x0F\xCB\xB0\x3F\xFF\xDF\x3B\xBE\x55\xBE\x72\x3F\x9D\xBF\x84\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x2E\x68\x0B\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xEC\xEC\x63\x3F\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xEE\x09\x5E\x3F\x6F\x27\x90\x3E\xC7\x23\xD2\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\x3F\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x78\x12\x5D\x3F\x96\xB5\x8F\x3E\xEB\x79\xD6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xEC\xEC\x63\x3F\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xEE\x09\x5E\x3F\x6F\x27\x90\x3E\xC7\x23\xD2\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x72\xF0\x52\x3F\x6B\x3D\x0F\x3F\x0C\xCC\x8F\x3F\xE1\xAE\x5B\x3F\xB6\x78\x94\x3E\x6D\xED\xD8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x17\x62\x58\x3F\x1E\x14\x82\x3E\xCB\x5E\xA5\x3F\xB3\xC1\x52\x3F\x9F\xC7\x9B\x3E\x0C\x5D\xF5\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\x3F\xA1\x5D\x0F\x3F\x25\x3C\x9B\x3F\x50\xB7\x31\x3F\x13\xD3\xB9\x3E\xA3\x1F\x1F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\x3F\x8A\x54\x82\x3E\xE4\xCE\xB0\x3F\x9F\x2E\x1B\x3F\x9E\xB7\xC4\x3E\x0C\x45\x32\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\x3F\x69\x89\x0F\x3F\x5C\xBF\xA0\x3F\x2A\x04\xB8\x3E\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\x3F\x8A\x54\x82\x3E\x1B\x52\xB6\x3F\x2A\x04\xB8\x3E\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA8\x63\x8D\x3E\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\x3E\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xA8\x63\x8D\x3E\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x2A\x68\x0A\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xAC\xC9\xB6\xBE\x8A\x54\x82\x3E\xB3\x98\xC4\x3F\xA8\x63\x8D\xBE\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xAC\xC9\xB6\xBE\x58\xB8\x0F\x3F\xF4\x05\xAF\x3F\xA8\x63\x8D\xBE\x40\x53\xED\x3E\x38\x8A\x57\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\xBF\x8A\x54\x82\x3E\x1B\x52\xB6\x3F\x2A\x04\xB8\xBE\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x7F\xC0\x32\xBF\x69\x89\x0F\x3F\x5C\xBF\xA0\x3F\x2A\x04\xB8\xBE\x49\x9D\xE6\x3E\x63\x39\x51\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\xBF\x8A\x54\x82\x3E\xE4\xCE\xB0\x3F\x9F\x2E\x1B\xBF\x9E\xB7\xC4\x3E\x0C\x45\x32\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xCA\xA0\x46\xBF\xA1\x5D\x0F\x3F\x25\x3C\x9B\x3F\x50\xB7\x31\xBF\x13\xD3\xB9\x3E\xA3\x1F\x1F\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x17\x62\x58\xBF\x1E\x14\x82\x3E\xCB\x5E\xA5\x3F\xB3\xC1\x52\xBF\x9F\xC7\x9B\x3E\x0C\x5D\xF5\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x72\xF0\x52\xBF\x6B\x3D\x0F\x3F\x0C\xCC\x8F\x3F\xE1\xAE\x5B\xBF\xB6\x78\x94\x3E\x6D\xED\xD8\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xEC\xEC\x63\xBF\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xEE\x09\x5E\xBF\x6F\x27\x90\x3E\xC7\x23\xD2\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\xBF\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x78\x12\x5D\xBF\x96\xB5\x8F\x3E\xEB\x79\xD6\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x52\x68\x14\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xEC\xEC\x63\x3F\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xF0\xAB\x29\x3F\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xF0\xAB\x29\x3F\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\x3F\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x06\x50\x21\x3F\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x94\x04\x09\x3F\x8E\x2D\x71\x3F\x06\x50\x21\x3F\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\x22\x5F\x3F\x58\x75\x29\x3F\xB2\x64\x78\x3F\xB8\xD8\x1E\x3F\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xEF\x56\x16\x3F\x73\x68\x67\x3F\xB8\xD8\x1E\x3F\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\x3F\x83\xD3\x3E\x3F\x0E\x5C\x59\x3F\x12\xA3\x26\x3F\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x12\xA3\x26\x3F\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\x3F\x11\xB3\x44\x3F\x97\x66\x2A\x3F\xD6\x0A\x27\x3F\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xD6\x0A\x27\x3F\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\x3F\x31\x5A\x3D\x3F\x92\xFA\xF4\x3E\xE7\x26\x2C\x3F\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x75\x25\x3F\x93\xB8\x07\x3F\xE7\x26\x2C\x3F\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD7\xA3\x60\x3F\x5E\x46\x29\x3F\x5F\xD1\xBB\x3E\x8B\x8A\x2D\x3F\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x8B\x8A\x2D\x3F\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x2D\x1C\x60\x3F\x5C\x6C\x12\x3F\xCF\xC4\x98\x3E\xD9\x4A\x2B\x3F\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xD9\x4A\x2B\x3F\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xAB\x5E\x3F\xD8\x08\xEF\x3E\x56\xBD\x85\x3E\xC2\xD9\x20\x3F\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xC2\xD9\x20\x3F\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x99\x59\x3F\x7E\x3A\xB0\x3E\xF3\x74\x83\x3E\x55\x6B\x16\x3F\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\x55\x6B\x16\x3F\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xEB\x0F\x7B\x3F\x9C\xFD\xA0\x3D\x46\x40\x37\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\x3F\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x94\x04\x09\x3F\x8E\x2D\x71\x3F\xF2\x4E\x7C\x3F\xED\x0B\xC4\x3D\xA1\xE1\x0E\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\x3F\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xEF\x56\x16\x3F\x73\x68\x67\x3F\x21\x15\x7D\x3F\x58\xBC\xE6\x3D\x18\x7D\xCC\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1E\x68\x07\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\x3F\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\x3F\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xAD\xCC\x7E\x3F\x2A\x18\xC6\x3D\x4F\xE4\x81\xBA\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\x3F\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x75\x25\x3F\x93\xB8\x07\x3F\xDD\x23\x7E\x3F\x48\xF3\xD6\x3D\x65\x00\x71\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\x3F\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x26\x1A\x7D\x3F\xBA\xE2\xE0\x3D\xF3\x64\xD1\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\x3F\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\xFF\x85\x79\x3F\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\x3F\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xFF\x85\x79\x3F\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x5A\x68\x16\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xC8\x9F\x57\x3F\x7E\x3A\xB0\x3E\x30\x43\x3F\xBE\xDF\x64\x26\x3F\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\xDF\x64\x26\x3F\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x68\x7C\x5B\x3F\x68\x9E\xF0\x3E\x6D\xF6\x43\xBE\x33\xAC\x2C\x3F\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x33\xAC\x2C\x3F\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xC6\xD3\x5E\x3F\x38\x90\x1D\x3F\xC8\x10\x63\xBE\x2A\x57\x3B\x3F\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\x2A\x57\x3B\x3F\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF7\x3E\x61\x3F\xCF\xE1\x42\x3F\x71\x1B\xA2\xBE\x37\x40\x47\x3F\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\x37\x40\x47\x3F\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x94\x8F\x65\x3F\x6F\xB1\x5B\x3F\xE1\x4F\xED\xBE\xB3\x0F\x53\x3F\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xB3\x0F\x53\x3F\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x4F\x57\x65\x3F\x7F\x97\x65\x3F\x85\xC1\x38\xBF\xD7\x2D\x55\x3F\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x2D\x05\x3F\x3F\x29\x12\x35\xBF\xD7\x2D\x55\x3F\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x45\x67\x63\x3F\xB1\xAB\x4E\x3F\xF3\x3D\x74\xBF\x74\x54\x4E\x3F\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x74\x54\x4E\x3F\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x37\xE3\x61\x3F\x54\x2C\x27\x3F\x26\xC2\x89\xBF\x2E\xDE\x45\x3F\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x61\x74\x11\x3F\x8C\x53\x77\xBF\x2E\xDE\x45\x3F\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x07\xED\x60\x3F\x88\xD8\x1B\x3F\x9A\xC5\x8C\xBF\x3F\x2C\x3E\x3F\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\x3F\x2C\x3E\x3F\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xDA\x22\x5E\x3F\x34\x0F\xCA\x3E\x33\x33\x93\xBF\x5E\xF2\x32\x3F\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\x5E\xF2\x32\x3F\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD3\xEE\x59\x3F\x7E\x3A\xB0\x3E\x33\x33\x93\xBF\x07\x70\x28\x3F\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\x07\x70\x28\x3F\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\xC4\xC3\x7B\x3F\x00\x00\x00\x00\xD0\x7E\x39\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\xA4\xE9\x7B\x3F\x1A\xAF\xA5\x3C\x8D\x12\x35\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\x3F\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\xEA\xF3\x7B\x3F\x06\xA6\x25\x3D\x73\x92\x30\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\x3F\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x22\x68\x08\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\x3F\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x2D\x05\x3F\x3F\x29\x12\x35\xBF\x79\x33\x7F\x3F\x41\xFC\x9F\x3D\xD7\x73\x3A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\x3F\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xBB\xF3\x7E\x3F\xC2\x33\xA9\x3D\x83\x2E\x16\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\x3F\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\xAF\x8B\x7D\x3F\x1A\x50\xBF\x3D\x11\x6B\xD0\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\x3F\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\xE7\x5F\x7C\x3F\x41\x56\xBB\x3D\x55\xED\x0F\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\x3F\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\x9A\x85\x76\x3F\x70\xB0\x23\x3C\x01\xEF\x89\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\x3F\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\x3F\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\x3F\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\x3F\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\x3F\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\x3F\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\x3F\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x52\x68\x14\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x9E\x99\x59\xBF\x7E\x3A\xB0\x3E\xF3\x74\x83\x3E\x55\x6B\x16\xBF\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\x55\x6B\x16\xBF\x1E\x4F\x86\xBD\x48\x77\x4E\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF4\xAB\x5E\xBF\xD8\x08\xEF\x3E\x56\xBD\x85\x3E\xC2\xD9\x20\xBF\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xC2\xD9\x20\xBF\x15\xD2\xA0\x3D\x85\x23\x46\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x2D\x1C\x60\xBF\x5C\x6C\x12\x3F\xCF\xC4\x98\x3E\xD9\x4A\x2B\xBF\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xD9\x4A\x2B\xBF\x48\x9D\xAA\x3E\x41\x0D\x2A\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD7\xA3\x60\xBF\x5E\x46\x29\x3F\x5F\xD1\xBB\x3E\x8B\x8A\x2D\xBF\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x8B\x8A\x2D\xBF\x54\xBB\x06\x3F\x3C\x67\x03\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\xBF\x31\x5A\x3D\x3F\x92\xFA\xF4\x3E\xE7\x26\x2C\xBF\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x75\x25\x3F\x93\xB8\x07\x3F\xE7\x26\x2C\xBF\x8C\x01\x30\x3F\xD0\x4E\x8C\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\xBF\x11\xB3\x44\x3F\x97\x66\x2A\x3F\xD6\x0A\x27\xBF\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xD6\x0A\x27\xBF\x73\xF9\x41\x3F\x55\xC0\x26\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD8\xA3\x60\xBF\x83\xD3\x3E\x3F\x0E\x5C\x59\x3F\x12\xA3\x26\xBF\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x12\xA3\x26\xBF\xC9\x52\x34\x3F\x8C\xEF\x90\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\x22\x5F\xBF\x58\x75\x29\x3F\xB2\x64\x78\x3F\xB8\xD8\x1E\xBF\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xEF\x56\x16\x3F\x73\x68\x67\x3F\xB8\xD8\x1E\xBF\xE8\xBC\x07\x3F\x5D\xEA\x13\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x01\xE5\x5C\xBF\x08\xEE\x17\x3F\xD0\x9F\x82\x3F\x06\x50\x21\xBF\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x94\x04\x09\x3F\x8E\x2D\x71\x3F\x06\x50\x21\xBF\x7E\xB5\xC9\x3E\x01\x4C\x2B\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xEC\xEC\x63\xBF\x7E\x3A\xB0\x3E\xC1\xC1\x90\x3F\xF0\xAB\x29\xBF\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xF0\xAB\x29\xBF\xC6\xE6\xB9\x3E\x4C\xA7\x27\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x6A\x54\x83\x3F\xEB\x0F\x7B\xBF\x9C\xFD\xA0\x3D\x46\x40\x37\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x94\x04\x09\x3F\x8E\x2D\x71\x3F\xF2\x4E\x7C\xBF\xED\x0B\xC4\x3D\xA1\xE1\x0E\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\xBF\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xEF\x56\x16\x3F\x73\x68\x67\x3F\x21\x15\x7D\xBF\x58\xBC\xE6\x3D\x18\x7D\xCC\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\xBF\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x1E\x68\x07\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x3C\x33\x16\x3F\xEB\xFF\xE3\x3E\x26\x1A\x7D\xBF\xBA\xE2\xE0\x3D\xF3\x64\xD1\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\xBF\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x75\x25\x3F\x93\xB8\x07\x3F\xDD\x23\x7E\xBF\x48\xF3\xD6\x3D\x65\x00\x71\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\xBF\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x0A\x2B\x3F\x35\x22\x2C\x3F\xAD\xCC\x7E\xBF\x2A\x18\xC6\x3D\x4F\xE4\x81\xBA\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\xCB\xE2\x5C\x3F\xFA\x23\x7E\xBF\xAC\xDF\xC3\x3D\xC4\x79\x95\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x44\x94\x26\x3F\x85\xD2\x4F\x3F\x35\x28\x7E\xBF\x12\xAC\xD8\x3D\xB7\x00\x66\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x12\x68\x04\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x92\xBA\xFC\x3E\xB8\x22\x7E\xBF\x31\x5F\xAF\x3D\xBC\x88\xAD\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x3A\xD5\x04\x3F\xC6\x5C\xC9\x3E\xF6\xE8\x7B\xBF\xDE\x97\x99\x3D\x09\x59\x25\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x52\x2A\xB9\x3E\xFF\x85\x79\xBF\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xCA\xC4\xE0\x3E\x74\xE6\xBA\x3E\xFF\x85\x79\xBF\x25\x25\x23\x3D\xE3\x36\x61\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x5A\x68\x16\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD3\xEE\x59\xBF\x7E\x3A\xB0\x3E\x33\x33\x93\xBF\x07\x70\x28\xBF\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\x07\x70\x28\xBF\x4B\x44\x5B\xBE\xF1\xD2\x38\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xDA\x22\x5E\xBF\x34\x0F\xCA\x3E\x33\x33\x93\xBF\x5E\xF2\x32\xBF\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\x5E\xF2\x32\xBF\xDC\xD4\x3B\xBD\x11\xB1\x36\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x07\xED\x60\xBF\x88\xD8\x1B\x3F\x9A\xC5\x8C\xBF\x3F\x2C\x3E\xBF\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\x3F\x2C\x3E\xBF\x05\x63\x41\x3E\xB5\x6A\x24\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x37\xE3\x61\xBF\x54\x2C\x27\x3F\x26\xC2\x89\xBF\x2E\xDE\x45\xBF\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x61\x74\x11\x3F\x8C\x53\x77\xBF\x2E\xDE\x45\xBF\xED\xDE\x9F\x3E\x02\x67\x0D\xBF\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x45\x67\x63\xBF\xB1\xAB\x4E\x3F\xF3\x3D\x74\xBF\x74\x54\x4E\xBF\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x74\x54\x4E\xBF\x90\xF9\xEA\x3E\x42\x6C\xBF\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x4F\x57\x65\xBF\x7F\x97\x65\x3F\x85\xC1\x38\xBF\xD7\x2D\x55\xBF\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x2D\x05\x3F\x3F\x29\x12\x35\xBF\xD7\x2D\x55\xBF\x30\x55\x0C\x3F\x05\x7B\x9F\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x94\x8F\x65\xBF\x6F\xB1\x5B\x3F\xE1\x4F\xED\xBE\xB3\x0F\x53\xBF\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xB3\x0F\x53\xBF\xA3\x11\x03\x3F\x22\xE7\x76\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xF7\x3E\x61\xBF\xCF\xE1\x42\x3F\x71\x1B\xA2\xBE\x37\x40\x47\xBF\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\x37\x40\x47\xBF\xDA\xA3\xCA\x3E\xEF\x8D\xF9\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xC6\xD3\x5E\xBF\x38\x90\x1D\x3F\xC8\x10\x63\xBE\x2A\x57\x3B\xBF\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\x2A\x57\x3B\xBF\xC8\x0B\x54\x3E\x80\x38\x26\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x68\x7C\x5B\xBF\x68\x9E\xF0\x3E\x6D\xF6\x43\xBE\x33\xAC\x2C\xBF\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x33\xAC\x2C\xBF\xC7\x20\x95\x3C\xB7\xF0\x3C\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xC8\x9F\x57\xBF\x7E\x3A\xB0\x3E\x30\x43\x3F\xBE\xDF\x64\x26\xBF\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\xDF\x64\x26\xBF\x39\xFC\x4D\xBD\x30\x1F\x42\x3F\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x16\x68\x05\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x39\x8E\x82\xBF\xC4\xC3\x7B\xBF\x00\x00\x00\x00\xD0\x7E\x39\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\xBF\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xFA\x56\xC2\x3E\x39\x8E\x82\xBF\xA4\xE9\x7B\xBF\x1A\xAF\xA5\x3C\x8D\x12\x35\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\xBF\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x87\x2F\x09\x3F\xDF\xB9\x7B\xBF\xEA\xF3\x7B\xBF\x06\xA6\x25\x3D\x73\x92\x30\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x26\x68\x09\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\xBF\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x80\x70\x0A\x3F\xF3\x46\xAF\xBE\xE7\x5F\x7C\xBF\x41\x56\xBB\x3D\x55\xED\x0F\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\xBF\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x9F\xAE\x25\x3F\x89\xBC\xD2\xBE\xAF\x8B\x7D\xBF\x1A\x50\xBF\x3D\x11\x6B\xD0\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\xBF\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x4F\xCB\x37\x3F\x68\xD1\x04\xBF\xBB\xF3\x7E\xBF\xC2\x33\xA9\x3D\x83\x2E\x16\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\xBF\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x2D\x05\x3F\x3F\x29\x12\x35\xBF\x79\x33\x7F\xBF\x41\xFC\x9F\x3D\xD7\x73\x3A\xBC\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\xBF\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\xF6\x7C\xDE\x3E\xB0\xEC\xA3\xBE\x4B\x31\x7A\xBF\x09\x6B\x50\x3D\xFF\x85\x52\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x16\xB4\xD8\xBE\x38\x86\x7D\xBF\xCA\x42\x89\x3D\x71\xC7\xF8\x3D\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\x7E\x3A\xB0\x3E\x82\x35\xA2\xBE\x9A\x85\x76\xBF\x70\xB0\x23\x3C\x01\xEF\x89\x3E\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x80\x0E\x68\x03\x80\x00\x00\x00\x40\x36\x31\x12\x04\x00\x00\x00\x40\x8C\x43\x00\xC0\x36\x31\x22\x00\x00\x00\xD5\x75\x7E\xBF\x61\x74\x11\x3F\x8C\x53\x77\xBF\xFE\x0F\x7D\xBF\xC8\xDF\x7A\x3D\x26\x65\x0D\xBE\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x9E\x0A\x83\xBF\x7E\x3A\xB0\x3E\x3C\xBA\x5B\xBF\x7A\x68\x7E\xBF\xD5\xFE\x64\x3D\x73\x35\xC5\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\xD5\x75\x7E\xBF\xAD\x49\x2E\x3F\xEA\x7E\x60\xBF\x79\x7D\x7E\xBF\xE4\x56\xAC\x3D\x1C\x1A\x8C\xBD\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x66\x43\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x3F\x04\x00\x00\x15\x00\x00\x00\x00\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
-        # empty boat adapter, using the empty one to save space
-        hovercraft_adapter = (b"\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00"
-                              b"\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00"
-                              b"\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00")
         # HG3 subfile:index
-        # boat adapter
-        car_out.write(hovercraft_adapter)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[3])
-
-        next_position = car_out.tell()
-        # 16 byte alignment, probably not needed, due to dma alignment
-        if next_position % 16 != 0:
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+        # hovercraft adapter
+        car_out_buffer.seek(subfile_indices[-1])
+        car_out_buffer.write(HG3_HOVERCRAFT_ADAPTER)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the seventh subfile (HG3), which is the stickers
         # HG3 subfile:index
         # stickers 2:0
         sticker_bytes, sticker_gif_tags = EGameConverter.read_and_convert_hg2_mesh_part(
-            car_in, 5, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
-
-        car_out.seek(subfile_indices[-1], os.SEEK_SET)
-        sticker_sub_size = 1
-        sticker_header_length = sticker_sub_size * 16
-        _zero = 0
-        sticker_subfile_header = bytes()
-        current_offset = sticker_header_length
-        sticker_subfile_header += sticker_sub_size.to_bytes(4, byteorder='little')
-        sticker_subfile_header += _zero.to_bytes(4, byteorder='little')  # padding
-        sticker_subfile_header += sticker_gif_tags.to_bytes(4, byteorder='little')
-        sticker_subfile_header += current_offset.to_bytes(4, byteorder='little')  # padding
-
-        car_out.write(sticker_subfile_header)
-        car_out.write(sticker_bytes)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[3])
-
-        next_position = car_out.tell()
-        # 16 byte alignment, probably not needed, due to dma alignment
-        if next_position % 16 != 0:
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
-
-        # Work on the eight subfile (HG2), texture
-        # HG3 subfile:index
-        # problem with this is that the texture addresses, are probably manually/specially picked
-        # to prevent overlap in memory, I do not have this ability,
-        # and so textures need to be given an address;
-        # so I have chosen the  Q88.BIN / Q89's texture addresses
-        # Other option would be to only copy the texture, and on replacement overwrite this default
-        # but that requires the knowledge of which file we are replacing so we can copy that bit
-        texture_header_bytes = \
-            (b"\x06\x04\x40\x10\x00\x00\x00\x00\x71\x00\x00\x00\xF0\xF9\x12\x00\x04\x00\x40\x00\x50\x00"
-             b"\x00\x10\x5E\x2A\x87\x00\x00\x02\x00\x00\x74\xF9\x12\x00\x00\x00\x02\x13\x50\x00\x00\x00"
-             b"\xA4\xF9\x12\x00\x93\x5D\x40\x00\x00\x00\x00\x00\x51\x00\x00\x00\x00\x02\x00\x00\x80\x40"
-             b"\x00\x00\x80\x00\x00\x00\x52\x00\x00\x00\x00\x42\x00\x00\xC8\xF9\x12\x00\x93\x5D\x40\x00"
-             b"\x53\x00\x00\x00\x87\x6C\x40\x00\x00\x04\x00\x00\x50\x2A\x87\x08\x00\x02\x00\x00\x72\x00"
-             b"\x00\x00")
-        palette_header_bytes = \
-            (b"\x46\x00\x40\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x04\x00\x02\x13\x50\x00"
-             b"\x00\x10\xAE\xF9\x12\x00\x93\x5D\x40\x00\x00\x00\x00\x00\x40\xC0\xC1\xC0\x50\x00\x00\x00"
-             b"\x0A\x00\x00\x00\x80\x00\x00\x00\x00\x00\x00\x00\x51\x00\x00\x00\x40\x00\x00\x00\x10\x00"
-             b"\x00\x00\x10\x00\x00\x00\x52\x00\x00\x00\x0F\xF9\x12\x00\x94\xE7\x40\x00\x00\x00\x00\x00"
-             b"\x53\x00\x00\x00\xFF\xFF\xFF\xFF\x40\x00\xFF\xFF\xE4\xF9\x12\x08\xE5\x64\x40\x00\xEC\x64"
-             b"\x40\x00")
-        end_bytes = \
-            (b"\x02\x00\x00\x70\x00\x00\x00\x00\x4C\xED\x40\x00\x50\xFA\x12\x00\x01\x80\x12\x00\x01\x00"
-             b"\x00\x10\x2E\xFA\x12\x00\xE4\x42\x40\x00\xCC\x6E\x87\x00\x38\xFA\x12\x00\x3F\x00\x00\x00"
-             b"\x00\x00\x00\x00")
-
-        car_in.seek(in_texture_offset + 112, os.SEEK_SET)
-        texture_bytes = car_in.read(128 * 128)
-        car_in.seek(112, os.SEEK_CUR)
-        palette_bytes = car_in.read(1024)
-
-        car_out.seek(subfile_indices[-1])
-        car_out.write(texture_header_bytes)
-        car_out.write(texture_bytes)
-        car_out.write(palette_header_bytes)
-        car_out.write(palette_bytes)
-        car_out.write(end_bytes)  # Tex flush?
-
-        car_out.seek(0, os.SEEK_END)
-        eof = car_out.tell()
-        subfile_indices.append(eof)
-        car_out.seek(0)
-        for i in subfile_indices:
-            car_out.write(i.to_bytes(4, byteorder='little'))
+            data, 5, 0, in_subfile_offsets, gif_tag_b_override=0x31364000)
+
+        car_out_buffer.seek(subfile_indices[-1])
+        car_out_buffer.write(EGameConverter.make_hg3_subfile_header([sticker_bytes], [sticker_gif_tags]))
+        car_out_buffer.write(sticker_bytes)
+        subfile_indices.append(car_out_buffer.align())
+
+        # Work on the eight subfile (HG3), texture
+        car_out_buffer.seek(subfile_indices[-1])
+        EGameConverter.write_texture(car_out_buffer, data, in_texture_offset,
+                                     HG3_TEXTURE_HEADER, HG3_PALETTE_HEADER, HG3_TEXTURE_END)
+
+        return EGameConverter.finish_car(car_out_buffer, subfile_indices, car_out)
 
     @staticmethod
     def convert_hg3_to_hg2(in_path: str, out_path: str):
@@ -368,22 +279,14 @@ class EGameConverter:
             with open(out_path, "wb") as car_out:
                 EGameConverter.convert_hg3_to_hg2_stream(car_in, car_out)
 
+    # car_in can be a file (or BytesIO) or bytes like (bytes, bytearray, memoryview)
+    # Returns the converted car as a bytearray, this is also written to car_out if given
     @staticmethod
-    def convert_hg3_to_hg2_stream(car_in, car_out):
+    def convert_hg3_to_hg2_stream(car_in, car_out=None):
+        data = EGameConverter.read_input(car_in)
         # Need to parse the bits of the HG3 car,
         # then convert them on the fly to HG2 car format
-        in_subfile_offsets = [U.readLong(car_in)]
-        while in_subfile_offsets[-1] != 0 and car_in.tell() < in_subfile_offsets[0]:
-            o = U.readLong(car_in)
-            if o == 0:
-                break
-            in_subfile_offsets.append(o)
-        in_eof_offset = in_subfile_offsets[-1]
-        in_texture_offset = in_subfile_offsets[-2]
-        in_subfile_offsets = in_subfile_offsets[:-2]
-
-        in_subfile_index = 0
-        in_submesh_index = 0
+        in_subfile_offsets, in_texture_offset, in_eof_offset = EGameConverter.read_subfile_offsets(data)
 
         # Each HG3 subfile (mesh) has multiple meshes,
         # we need to pick the correct bits for each car,
@@ -406,66 +309,43 @@ class EGameConverter:
         # Now we need to work through each required piece of the HG3 car, translate that mesh, and write it into
         # the hg2 output subfile. This works on one mesh, (e.g 1/3 of a subfile)
 
+        car_out_buffer = ConvertedCarBuffer()
+
         # Setup subfile offset table
         subfile_indices = []
-        subfile_lengths = []
         min_table_size = (len(in_subfile_offsets) + 2) * 4
         if min_table_size % 16 != 0:
             min_table_size += 16 - (min_table_size % 16)
         subfile_indices.append(min_table_size)
 
-        # Empty sub mesh data, needed to make game draw nothing
-        empty_mesh = (b'\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00'
-                      b'\x00\x00\x00\x60\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
-
         # Work on the first subfile (HG2), which is the main body/lights/brake lights
         # HG3 subfile:index
         # Body 0:0
-        car_out.seek(subfile_indices[0])
         body_mesh_out_bytes, _ = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 0, 0, in_subfile_offsets)
+            data, 0, 0, in_subfile_offsets)
         # front/back lights (night use) 0:3
         lights_mesh_out_bytes, lights_gif_count = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 0, 3, in_subfile_offsets, (1, 1, 1.01))
+            data, 0, 3, in_subfile_offsets, (1, 1, 1.01))
         # brake light 0:2
-
         brake_mesh_out_bytes, brake_gif_count = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 0, 2, in_subfile_offsets,
+            data, 0, 2, in_subfile_offsets,
             (1, 1, 1.01), nxyz_offsets=(0, 0, 1), tuvw_offsets=(0, 0, 1),
             # This makes it render as a brake light correctly, otherwise very see through
             gif_tag_b_override=0x313E4002)
-        main_subfile_header = [
-            16,  # Rel offset from header to 1st mesh
-            16+len(body_mesh_out_bytes),  # Rel offset from header to 2nd mesh
-            16 + len(body_mesh_out_bytes) + len(lights_mesh_out_bytes),  # Rel offset from header to 3rd mesh
-            lights_gif_count,  # GIF count
-            brake_gif_count]  # GIF count
-
-        car_out.write(main_subfile_header[1].to_bytes(4, byteorder='little'))
-        car_out.write(main_subfile_header[2].to_bytes(4, byteorder='little'))
-        car_out.write(main_subfile_header[3].to_bytes(4, byteorder='little'))
-        car_out.write(main_subfile_header[4].to_bytes(4, byteorder='little'))
-        car_out.write(body_mesh_out_bytes)
-        car_out.write(lights_mesh_out_bytes)
-        car_out.write(brake_mesh_out_bytes)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[0])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            # 16 byte alignment, probably not needed, due to dma alignment
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+
+        car_out_buffer.seek(subfile_indices[0])
+        EGameConverter.write_hg2_subfile(car_out_buffer, [body_mesh_out_bytes, lights_mesh_out_bytes,
+                                                          brake_mesh_out_bytes], lights_gif_count, brake_gif_count)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the second subfile (HG2), which is the lp body/lights
         # HG3 subfile:index
         # Body 1:0
-        car_out.seek(subfile_indices[1])
         lp_body_mesh_out_bytes, _ = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 1, 0, in_subfile_offsets)
+            data, 1, 0, in_subfile_offsets)
         # front/back lights dual use 1:3
         lp_lights_mesh_out_bytes, lp_lights_gif_count = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 1, 3, in_subfile_offsets, (1, 1, 1.01))
+            data, 1, 3, in_subfile_offsets, (1, 1, 1.01))
 
         if lp_lights_gif_count == 0:
             # This occurs in some hg3 cars, Q71, and Q64, they do not have
@@ -475,191 +355,146 @@ class EGameConverter:
             lp_lights_mesh_out_bytes = lights_mesh_out_bytes
             lp_lights_gif_count = lights_gif_count
 
-        lp_subfile_header = [
-            16,  # Rel offset from header to 1st mesh
-            16 + len(lp_body_mesh_out_bytes),  # Rel offset from header to 2nd mesh
-            16 + len(lp_body_mesh_out_bytes) + len(lp_lights_mesh_out_bytes),
-            lp_lights_gif_count,  # GIF count
-            0]  # GIF count
-
-        car_out.write(lp_subfile_header[1].to_bytes(4, byteorder='little'))
-        car_out.write(lp_subfile_header[2].to_bytes(4, byteorder='little'))
-        car_out.write(lp_subfile_header[3].to_bytes(4, byteorder='little'))
-        car_out.write(lp_subfile_header[4].to_bytes(4, byteorder='little'))
-        car_out.write(lp_body_mesh_out_bytes)
-        car_out.write(lp_lights_mesh_out_bytes)
-        car_out.write(empty_mesh)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[1])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            # 16 byte alignment, probably not needed, due to dma alignment
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+        car_out_buffer.seek(subfile_indices[1])
+        EGameConverter.write_hg2_subfile(car_out_buffer, [lp_body_mesh_out_bytes, lp_lights_mesh_out_bytes,
+                                                          EMPTY_MESH], lp_lights_gif_count, 0)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the third subfile (HG2), which is the spoiler
         # HG3 subfile:index
         # Spoiler1 2:0
-        car_out.seek(subfile_indices[2])
         spoiler1_mesh_out_bytes, _ = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 2, 0, in_subfile_offsets)
-
-        spoiler1_subfile_header = [
-            16,  # Rel offset from header to 1st mesh
-            16 + len(spoiler1_mesh_out_bytes),  # Rel offset from header to 2nd mesh
-            16 + len(spoiler1_mesh_out_bytes) + len(empty_mesh),
-            0,  # GIF count
-            0]  # GIF count
-
-        car_out.write(spoiler1_subfile_header[1].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler1_subfile_header[2].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler1_subfile_header[3].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler1_subfile_header[4].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler1_mesh_out_bytes)
-        car_out.write(empty_mesh)
-        car_out.write(empty_mesh)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[2])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            next_position += 16 - (
-                        next_position % 16)  # 16 byte alignment, probably not needed, due to dma alignment
-        subfile_indices.append(next_position)
+            data, 2, 0, in_subfile_offsets)
+
+        car_out_buffer.seek(subfile_indices[2])
+        EGameConverter.write_hg2_subfile(car_out_buffer, [spoiler1_mesh_out_bytes, EMPTY_MESH, EMPTY_MESH], 0, 0)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the forth subfile (HG2), which is the spoiler2 (f1 style now)
         # HG3 subfile:index
         # Spoiler F1 3:0
-        car_out.seek(subfile_indices[3])
         spoiler_f1_mesh_out_bytes, _ = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 3, 0, in_subfile_offsets)
-
-        spoiler_f1_subfile_header = [
-            16,  # Rel offset from header to 1st mesh
-            16 + len(spoiler_f1_mesh_out_bytes),  # Rel offset from header to 2nd mesh
-            16 + len(spoiler_f1_mesh_out_bytes) + len(empty_mesh),
-            0,  # GIF count
-            0]  # GIF count
-
-        car_out.write(spoiler_f1_subfile_header[1].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler_f1_subfile_header[2].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler_f1_subfile_header[3].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler_f1_subfile_header[4].to_bytes(4, byteorder='little'))
-        car_out.write(spoiler_f1_mesh_out_bytes)
-        car_out.write(empty_mesh)
-        car_out.write(empty_mesh)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[3])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            # 16 byte alignment, probably not needed, due to dma alignment
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+            data, 3, 0, in_subfile_offsets)
+
+        car_out_buffer.seek(subfile_indices[3])
+        EGameConverter.write_hg2_subfile(car_out_buffer, [spoiler_f1_mesh_out_bytes, EMPTY_MESH, EMPTY_MESH], 0, 0)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the fifth subfile (HG2), should be jets
         # HG3 subfile:index
         # HG3 does not have jets in the same way, so just make it empty till I think of a better option
-        car_out.seek(subfile_indices[4])
-        jets_subfile_header = [
-            16,  # Rel offset from header to 1st mesh
-            16 + len(empty_mesh),  # Rel offset from header to 2nd mesh
-            16 + len(empty_mesh) + len(empty_mesh),
-            0,  # GIF count
-            0]  # GIF count
-
-        car_out.write(jets_subfile_header[1].to_bytes(4, byteorder='little'))
-        car_out.write(jets_subfile_header[2].to_bytes(4, byteorder='little'))
-        car_out.write(jets_subfile_header[3].to_bytes(4, byteorder='little'))
-        car_out.write(jets_subfile_header[4].to_bytes(4, byteorder='little'))
-        car_out.write(empty_mesh)
-        car_out.write(empty_mesh)
-        car_out.write(empty_mesh)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[4])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            # 16 byte alignment, probably not needed, due to dma alignment
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+        car_out_buffer.seek(subfile_indices[4])
+        EGameConverter.write_hg2_subfile(car_out_buffer, [EMPTY_MESH, EMPTY_MESH, EMPTY_MESH], 0, 0)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the sixth subfile (HG2), stickers
         # HG3 subfile:index
         # 6:0
-        car_out.seek(subfile_indices[5])
         stickers_mesh_out_bytes, _ = EGameConverter.read_and_convert_hg3_mesh_part(
-            car_in, 6, 0, in_subfile_offsets)
-        stickers_subfile_header = [
-            16,  # Rel offset from header to 1st mesh
-            16 + len(stickers_mesh_out_bytes),  # Rel offset from header to 2nd mesh
-            16 + len(stickers_mesh_out_bytes) + len(empty_mesh),
-            0,  # GIF count
-            0]  # GIF count
-
-        car_out.write(stickers_subfile_header[1].to_bytes(4, byteorder='little'))
-        car_out.write(stickers_subfile_header[2].to_bytes(4, byteorder='little'))
-        car_out.write(stickers_subfile_header[3].to_bytes(4, byteorder='little'))
-        car_out.write(stickers_subfile_header[4].to_bytes(4, byteorder='little'))
-        car_out.write(stickers_mesh_out_bytes)
-        car_out.write(empty_mesh)
-        car_out.write(empty_mesh)
-
-        subfile_lengths.append(car_out.tell() - subfile_indices[5])
-
-        next_position = car_out.tell()
-        if next_position % 16 != 0:
-            # 16 byte alignment, probably not needed, due to dma alignment
-            next_position += 16 - (next_position % 16)
-        subfile_indices.append(next_position)
+            data, 6, 0, in_subfile_offsets)
+
+        car_out_buffer.seek(subfile_indices[5])
+        EGameConverter.write_hg2_subfile(car_out_buffer, [stickers_mesh_out_bytes, EMPTY_MESH, EMPTY_MESH], 0, 0)
+        subfile_indices.append(car_out_buffer.align())
 
         # Work on the seventh subfile (HG2), texture
-        # HG3 subfile:index
-        # problem with this is that the texture addresses, are probably manually/specially picked
-        # to prevent overlap in memory, I do not have this ability, and so textures need to be given an address
-        # so I have chosen the  Q85.BIN / Q86's texture addresses
-        # Other option would be to only copy the texture, and on replacement overwrite this default
-        # but that requires the knowledge of which file we are replacing so we can copy that bit
-        texture_header_bytes = (b"\x06\x04\x12\x10\x00\x00\x00\x00\x44\x6E\x87\x00\xEC\xF9\x12\x00\x04\x00"
-                                b"\x00\x00\xA4\xB9\x12\x10\xCE\x4D\x40\x00\x04\x00\x00\x00\x44\x2A\x87\x00"
-                                b"\x00\x00\x02\x13\x50\x00\x00\x00\xF6\x01\x00\x00\x44\xDC\x40\x00\x00\x40"
-                                b"\x00\x00\x51\x00\x00\x00\xCF\x4D\x40\x00\x80\xF0\x12\x00\x80\x50\x40\x00"
-                                b"\x52\x00\x00\x00\x44\x2A\x87\x00\x00\x02\x00\x00\xF6\x01\x00\x00\x53\x00"
-                                b"\x00\x00\xF5\x01\x00\x00\x00\x04\x00\x00\xF0\xF9\x12\x08\x50\xFA\x12\x00"
-                                b"\x50\xFA\x12\x00")
-        palette_header_bytes = (b"\x46\x00\xFF\x10\x00\x00\x00\x00\xFC\xF9\x12\x00\x1D\x55\x40\x00\x04\x00"
-                                b"\x00\x00\xA4\xB9\x12\x10\xCE\x4D\x40\x00\x04\x00\x00\x00\x44\x2A\x87\x00"
-                                b"\x40\x00\x01\x00\x50\x00\x00\x00\xF6\x01\x00\x00\x44\xDC\x40\x00\x00\x40"
-                                b"\x00\x00\x51\x00\x00\x00\xCF\x4D\x40\x00\x10\x00\x00\x00\x10\x50\x40\x00"
-                                b"\x52\x00\x00\x00\x44\x2A\x87\x00\x40\x00\x00\x00\x00\x00\x00\x00\x53\x00"
-                                b"\x00\x00\x00\x00\x00\x00\x40\x00\x12\x00\x2A\xD6\x40\x08\x00\x00\x00\x00"
-                                b"\x80\x00\x00\x00")
-        end_bytes = (b"\x02\x00\x40\x70\x00\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x01\x80\x87\x00\x00"
-                     b"\x00\x00\x10\x2E\xFA\x12\x00\x24\x33\x40\x00\x48\x2C\x87\x00\x38\xFA\x12\x00\x3F\x00"
-                     b"\x00\x00\x00\x00\x00\x00")
-
-        car_in.seek(in_texture_offset + 112, os.SEEK_SET)
-        texture_bytes = car_in.read(128 * 128)
-        car_in.seek(112, os.SEEK_CUR)
-        palette_bytes = car_in.read(1024)
-
-        car_out.seek(subfile_indices[6])
-        car_out.write(texture_header_bytes)
-        car_out.write(texture_bytes)
-        car_out.write(palette_header_bytes)
-        car_out.write(palette_bytes)
-        car_out.write(end_bytes)  # Tex flush?
-
-        car_out.seek(0, os.SEEK_END)
-        eof = car_out.tell()
-        subfile_indices.append(eof)
-        car_out.seek(0)
-        for i in subfile_indices:
-            car_out.write(i.to_bytes(4, byteorder='little'))
+        car_out_buffer.seek(subfile_indices[6])
+        EGameConverter.write_texture(car_out_buffer, data, in_texture_offset,
+                                     HG2_TEXTURE_HEADER, HG2_PALETTE_HEADER, HG2_TEXTURE_END)
+
+        return EGameConverter.finish_car(car_out_buffer, subfile_indices, car_out)
+
+    @staticmethod
+    def read_input(car_in):
+        if isinstance(car_in, (bytes, bytearray, memoryview)):
+            return memoryview(car_in)
+        return memoryview(car_in.read())
+
+    # Returns ([subfile offsets], texture offset, eof offset)
+    @staticmethod
+    def read_subfile_offsets(data):
+        in_subfile_offsets = [LONG.unpack_from(data, 0)[0]]
+        position = 4
+        while in_subfile_offsets[-1] != 0 and position < in_subfile_offsets[0]:
+            o = LONG.unpack_from(data, position)[0]
+            position += 4
+            if o == 0:
+                break
+            in_subfile_offsets.append(o)
+        return in_subfile_offsets[:-2], in_subfile_offsets[-2], in_subfile_offsets[-1]
+
+    # HG3 subfile header, 16 bytes per mesh, the count of meshes, then (gif count, offset) for each mesh
+    # meshes that are None are left empty (0 count, 0 offset)
+    @staticmethod
+    def make_hg3_subfile_header(meshes, gif_counts):
+        header = bytearray(len(meshes) * 16)
+        LONG.pack_into(header, 0, len(meshes))
+        current_offset = len(header)
+        for i, mesh in enumerate(meshes):
+            if mesh is None:
+                continue
+            struct.pack_into("<II", header, i * 16 + 8, gif_counts[i], current_offset)
+            current_offset += len(mesh)
+        return header
+
+    # HG2 subfile, offsets of the 2nd and 3rd meshes (1st is straight after), their gif counts, and then the meshes
+    @staticmethod
+    def write_hg2_subfile(car_out_buffer, meshes, gif_count1, gif_count2):
+        header = bytearray(16)
+        HG2_SUBFILE_HEADER.pack_into(header, 0, 16 + len(meshes[0]), 16 + len(meshes[0]) + len(meshes[1]),
+                                     gif_count1, gif_count2)
+        car_out_buffer.write(header)
+        for mesh in meshes:
+            car_out_buffer.write(mesh)
+
+    @staticmethod
+    def write_texture(car_out_buffer, data, in_texture_offset, texture_header, palette_header, end_bytes):
+        texture_start = in_texture_offset + 112
+        palette_start = texture_start + 128 * 128 + 112
+        car_out_buffer.write(texture_header)
+        car_out_buffer.write(data[texture_start:texture_start + 128 * 128])
+        car_out_buffer.write(palette_header)
+        car_out_buffer.write(data[palette_start:palette_start + 1024])
+        car_out_buffer.write(end_bytes)  # Tex flush?
+
+    # Writes the subfile offset table (with the eof offset), then makes the finished car
+    @staticmethod
+    def finish_car(car_out_buffer, subfile_indices, car_out):
+        subfile_indices.append(car_out_buffer.size)
+        table = bytearray(len(subfile_indices) * 4)
+        struct.pack_into(f"<{len(subfile_indices)}I", table, 0, *subfile_indices)
+        car_out_buffer.seek(0)
+        car_out_buffer.write(table)
+
+        converted = car_out_buffer.getbuffer()
+        if car_out is not None:
+            car_out.write(converted)
+        return converted
+
+    # Returns (qword count, tag id) of the DMA tag at position
+    @staticmethod
+    def read_dma_tag(data, position):
+        qword_count, part2 = struct.unpack_from("<HH", data, position)
+        return qword_count, (part2 & 0x7000) >> 12
+
+    # Makes the converted mesh part buffer, with the DMA/VIF tags around blocks_size bytes of VIF data
+    @staticmethod
+    def make_mesh_part_buffer(blocks_size):
+        # remove 4 for the vif tag in the dma data section (and vif)
+        data_offset = blocks_size - 4
+        padding = 16 - (data_offset % 16)
+        quadword_count = (blocks_size + padding) // 16
+
+        # now we know the size of the block to transfer, add the send dma tag (cnt) and end dma tag
+        out = bytearray(12 + blocks_size + padding + END_DMA_TAG_SIZE)
+        struct.pack_into("<H", out, 0, quadword_count)
+        out[2:8] = DMA_CNT_TAG_TAIL
+        out[8:12] = VIF_SETUP_TAG
+        out[len(out) - END_DMA_TAG_SIZE + 3] = 0x60
+        return out
 
     @staticmethod
-    def read_and_convert_hg3_mesh_part(file, subfile_index, mesh_index, offsets,
+    def read_and_convert_hg3_mesh_part(data, subfile_index, mesh_index, offsets,
                                        xyz_scale=(1, 1, 1),
                                        xyz_offset=(0, 0, 0),
                                        nxyz_offsets=(0, 0, 0),
@@ -668,276 +503,178 @@ class EGameConverter:
                                        gif_tag_b_override=None,
                                        reverse_faces=False):
         base_position = offsets[subfile_index]
-        file.seek(base_position, os.SEEK_SET)
 
         # Read the subfile's mesh entries
-        subfile_size = U.readLong(file)
-        file.seek(-4, os.SEEK_CUR)  # skip back which makes the code cleaner
-
+        # count, padding, then (gif count, offset) per mesh, every 16 bytes
+        subfile_size = LONG.unpack_from(data, base_position)[0]
         mesh_entries = []
         for i in range(subfile_size):
-            file.seek(8, os.SEEK_CUR)
-            size = U.readLong(file)
-            offset = base_position + U.readLong(file)  # Convert relative to absolute file position
-            mesh_entries.append((offset, size))
+            size, offset = struct.unpack_from("<II", data, base_position + i * 16 + 8)
+            mesh_entries.append((base_position + offset, size))  # Convert relative to absolute file position
 
         # Move to the requested mesh position, and then read in all the data, converting it as needed
-        if mesh_index > len(mesh_entries) or len(mesh_entries[mesh_index]) == 0:
+        if mesh_index >= len(mesh_entries):
             print(f"Issue with mesh offsets, part missing {subfile_index} {mesh_index}")
-            return (b'\x00\x00\x00\x10\x00\x00\x00\x00\x01\x01\x00\x01\x00\x00\x00\x00\x00\x00\x00\x60'
-                    b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'), 0
+            return EMPTY_MESH, 0
 
-        file.seek(mesh_entries[mesh_index][0], os.SEEK_SET)
-        print(f"Reading mesh part from {file.tell()}")
-        gif_count_in = mesh_entries[mesh_index][1]
+        dma_start, gif_count_in = mesh_entries[mesh_index]
+        print(f"Reading mesh part from {dma_start}")
 
         # Read starting dma tag
-        dma_start = file.tell()
-        dma_tag = PS2.decode_DMATag(file)
-        tag_id = PS2.decode_DMATagID_source(dma_tag)
-        print(dma_tag)
-        print(tag_id)
-
-        if dma_tag['tagId'] != 1:
-            print(f"Tag not as expected, not an cnt tag @ {file.tell()}")
-            raise Exception(f"Tag not as expected, not an cnt tag @ {file.tell()}")
+        qword_count, tag_id = EGameConverter.read_dma_tag(data, dma_start)
+        if tag_id != 1:
+            print(f"Tag not as expected, not an cnt tag @ {dma_start + 16}")
+            raise Exception(f"Tag not as expected, not an cnt tag @ {dma_start + 16}")
 
-        file.seek(-8, os.SEEK_CUR)
         # We will recreate/add/calculate the DMA tag after we have read and restructured the data,
         # as we do not know the size
+        # Skip the DMA tag, and the VIF tag, for setup
+        position = dma_start + 12
 
-        # Read the mesh data in
-        # VIF tag, for setup
-        vif_setup_tag = U.readLong(file)
+        # HG2 has DMA, VIF, VIF, GIF, VIF, DATA
+        # HG3 has DMA, VIF, VIF, GIF, <8 bytes>, DATA
 
+        # Find all the strips first, to know the size of the converted data
+        strips = []
         has_normals = None
         colour_select = None
-
-        blocks = []
-        current_block = bytes()
         for i in range(gif_count_in):
+            (vif_expand_tag, gif_tag_a, gif_tag_b, gif_tag_c, org_gif_tag_d,
+             unknown_value1, unknown_value2) = HG3_STRIP_TAGS.unpack_from(data, position)
             # VIF tag for expanding/packing
-            vif_expand_tag = U.readLong(file)
             if vif_expand_tag & 0xFF00FFFF != 0x68008000:
                 # Data might not be as we want it, assume issue with tags and give up
                 print("Unknown/Unexpected VIF pack tag, at start of data"
-                      f", @ {dma_start} {file.tell() - 4}")
+                      f", @ {dma_start} {position}")
                 raise Exception("Unknown/Unexpected VIF pack tag, at start of data,"
-                                f" @ {dma_start} {file.tell() - 4}")
-            # HG2 has DMA, VIF, VIF, GIF, VIF, DATA
-            # HG3 has DMA, VIF, VIF, GIF, <8 bytes>, DATA
-
-            # Add GIF "packed" tag V4-32
-            current_block += b'\x00\x80\x01\x6C'  # 1 count of V4-32 (16 bytes) as is for the GIF tag
-
-            # Read GIF tag
+                                f" @ {dma_start} {position}")
             # Read size, to cheat
-            vert_count = U.readByte(file)
-            file.seek(-1, os.SEEK_CUR)
-            gif_tag_a = U.readLong(file)
-            gif_tag_b = U.readLong(file)
-            if gif_tag_b_override is not None:
-                gif_tag_b = gif_tag_b_override
-            gif_tag_c = U.readLong(file)
-            org_gif_tag_d = U.readFloat(file)
-            gif_tag_d = 0  # org_gif_tag_d
-
-            # if org_gif_tag_d == 51:
-            #     cr, cg, cb = 0.0, 255.0, 0.0  # Colour 2
-            # elif org_gif_tag_d == 280.5:
-            #     cr, cg, cb = 255.0, 0.0, 0.0  # Colour 1/body
-            # elif org_gif_tag_d == 357:
-            #     cr, cg, cb = 0.0, 0.0, 255.0  # Glass surfaces
-            # elif org_gif_tag_d == 255:
-            #     cr, cg, cb = 255.0, 255.0, 255.0
-            # else:
-            #     cr, cg, cb = 0.0, 255.0, 128.0
-
-            # if org_gif_tag_d != 0:
-            #     # 255 or 357 or 280.5 or 51 or
-            #     if org_gif_tag_d == 51:
-            #         # assume second colour group?
-            #         gif_tag_d = 2
-            #     elif org_gif_tag_d == 280.5:
-            #         gif_tag_d = 1
-            #     elif org_gif_tag_d == 357:
-            #         # Glass
-            #         pass
-            #     elif org_gif_tag_d == 255:
-            #         # Other, fixed colour maybe?
-            #         pass
-            #     elif org_gif_tag_d == 382.5:
-            #         # Fixed at white, shiny?
-            #         pass
-            #     else:
-            #         print(f"new vert colour @ {file.tell()} val: {org_gif_tag_d}")
-            #         exit(5)
-
-            # The gif tag can be used as is between HG2 and HG3
-            current_block += gif_tag_a.to_bytes(4, 'little')
-            current_block += gif_tag_b.to_bytes(4, 'little')
-            current_block += gif_tag_c.to_bytes(4, 'little')
+            vert_count = gif_tag_a & 0xFF
 
-            # file.seek(8, os.SEEK_CUR)  # Skip the unknown data (always 8 bytes)
-            unknown_value1 = U.readLong(file)
             # TODO investigate this first value
-            if unknown_value1 not in [0x3136C000, 0x313EC000, 0x303EC000]:
-                print(f"New unknown value: {unknown_value1:x} @ {file.tell()}")
-                raise Exception(f"New unknown value: {unknown_value1:x} @ {file.tell()}")
+            if unknown_value1 not in HG3_UNKNOWN_VALUES:
+                print(f"New unknown value: {unknown_value1:x} @ {position + 24}")
+                raise Exception(f"New unknown value: {unknown_value1:x} @ {position + 24}")
 
-            has_normals = True
-            if unknown_value1 == 0x303EC000:  # no normals
-                has_normals = False
+            has_normals = unknown_value1 != HG3_NO_NORMALS
 
-            unknown_value2 = U.readLong(file)
             colour_select = unknown_value2 & 0xF
-            if unknown_value2 not in [0, 0x20, 0x21, 0x22]:
-                print(f"New colour select val: {unknown_value2:x} @ {file.tell()}")
-                raise Exception(f"New colour select val: {unknown_value2:x} @ {file.tell()}")
+            if unknown_value2 not in HG3_COLOUR_SELECT_VALUES:
+                print(f"New colour select val: {unknown_value2:x} @ {position + 28}")
+                raise Exception(f"New colour select val: {unknown_value2:x} @ {position + 28}")
 
-            gif_tag_d = colour_select
+            position += HG3_STRIP_TAGS.size
+            vertex_struct = VERTEX if has_normals else VERTEX_NO_NORMALS
+            vert_position = position
+            position += vert_count * vertex_struct.size
 
-            current_block += gif_tag_d.to_bytes(4, 'little')
+            # Read exec call (vif code)
+            value = data[position]
+            cmd = data[position + 3]
+            position += 4
 
-            # Add data packed tag V3-32
+            # Lookup hg3 exec -> hg2 exec required
+            if value not in [0x04, 0x0A]:
+                print(f"Unmatched Exec call {value}")
+                raise Exception(f"Unmatched Exec call {value}")
+
+            strips.append((vert_position, vert_count, vertex_struct, gif_tag_a, gif_tag_b, gif_tag_c,
+                           org_gif_tag_d, colour_select, value, cmd))
+
+        # Read end DMAtag, but this has to be 16 byte aligned, so move to 16 byte alignment
+        if position % 16 != 0:
+            position += 16 - (position % 16)
+        end_qword_count, end_tag_id = EGameConverter.read_dma_tag(data, position)
+        if end_tag_id != 6:
+            print(f"Tag not as expected, not an end tag @ {position + 16} started at {dma_start}\n"
+                  f"normals?: {has_normals} colour select: {colour_select}")
+            raise Exception(f"Tag not as expected, not an end tag @ "
+                            f"{position + 16} started at {dma_start}")
+
+        # Each strip is, VIF tag, GIF tag, VIF tag, verts, exec
+        blocks_size = sum(4 + 16 + 4 + strip[1] * VERTEX.size + 4 for strip in strips)
+        out = EGameConverter.make_mesh_part_buffer(blocks_size)
+        out_position = 12
 
-            current_block += b'\x01\x80'  # 00 vs 01?  # 0x680C8001, seems like 1 is used often
+        brake_fix = tuvw_offsets != (0, 0, 0)
+        body = (subfile_index == 0 or subfile_index == 1) and mesh_index == 0
+        for (vert_position, vert_count, vertex_struct, gif_tag_a, gif_tag_b, gif_tag_c,
+             org_gif_tag_d, colour_select, value, cmd) in strips:
+            # Add GIF "packed" tag V4-32
+            out[out_position:out_position + 4] = b'\x00\x80\x01\x6C'  # 1 count of V4-32 (16 bytes) as is for the GIF tag
+
+            # The gif tag can be used as is between HG2 and HG3
+            if gif_tag_b_override is not None:
+                gif_tag_b = gif_tag_b_override
+            gif_tag_d = colour_select
+            struct.pack_into("<IIII", out, out_position + 4, gif_tag_a, gif_tag_b, gif_tag_c, gif_tag_d)
+
+            # Add data packed tag V3-32
             vif_size = 4 * vert_count
             if vif_size == 256:
                 vif_size = 0
             vif_size = vif_size & 0xFF
-            current_block += vif_size.to_bytes(1, byteorder='little')  # Count
-            current_block += b'\x68'
+            out[out_position + 20:out_position + 24] = bytes([0x01, 0x80, vif_size, 0x68])  # 00 vs 01?
+            out_position += 24
+
+            # org_gif_tag_d values
+            # 0 - not reflective
+            # 1 - unsure
+            # 51 - side panel reflections
+            # 280.5 - Top panel reflections
+            # 357 - Glass reflections
+            # 382.5 - unsure
+            # 255 - unsure, might be unlit
+            # 204? HG2 only perhaps, unsure
+            tw_body = 0
+            if body:
+                # main body of the car, so lets make it shiny
+                if org_gif_tag_d in [280.5, 357, 382.5]:
+                    tw_body = 280.5
+                elif org_gif_tag_d == 51:
+                    tw_body = 51
 
             # Read data (xyz etc)
-            vert_data = bytes()
-            vert_data_reversed = bytes()
             for v in range(vert_count):
-                x, y, z = U.readXYZ(file)
-                x *= xyz_scale[0]
-                y *= xyz_scale[1]
-                z *= xyz_scale[2]
-                x += xyz_offset[0]
-                y += xyz_offset[1]
-                z += xyz_offset[2]
-                if has_normals:
-                    nx, ny, nz = U.readXYZ(file)
+                values = vertex_struct.unpack_from(data, vert_position + v * vertex_struct.size)
+                if vertex_struct is VERTEX:
+                    x, y, z, nx, ny, nz, cr, cg, cb, tu, tv, tw = values
                 else:
+                    x, y, z, cr, cg, cb, tu, tv, tw = values
                     nx, ny, nz = 0, 0, 0
+                x = x * xyz_scale[0] + xyz_offset[0]
+                y = y * xyz_scale[1] + xyz_offset[1]
+                z = z * xyz_scale[2] + xyz_offset[2]
                 # Used to fix brake lights
                 nx += nxyz_offsets[0]
                 ny += nxyz_offsets[1]
                 nz += nxyz_offsets[2]
 
-                cr, cg, cb = U.readXYZ(file)
-
                 if colour_override != (0, 0, 0):
                     cr, cg, cb = colour_override
 
-                tu, tv, tw = U.readXYZ(file)
-
-                if tuvw_offsets != (0, 0, 0):
+                if brake_fix:
                     # Used to fix brake lights
                     tu += tuvw_offsets[0]
                     tv += tuvw_offsets[1]
                     tw = tuvw_offsets[2]
                 else:
-                    tw = 0
-                    if (subfile_index == 0 or subfile_index == 1) and mesh_index == 0:
-                        # main body of the car, so lets make it shiny
-                        if org_gif_tag_d in [280.5, 357, 382.5]:
-                            tw = 280.5
-                        elif org_gif_tag_d == 51:
-                            tw = 51
-
-                # org_gif_tag_d values
-                # 0 - not reflective
-                # 1 - unsure
-                # 51 - side panel reflections
-                # 280.5 - Top panel reflections
-                # 357 - Glass reflections
-                # 382.5 - unsure
-                # 255 - unsure, might be unlit
-                # 204? HG2 only perhaps, unsure
-
-                # if org_gif_tag_d == 51:
-                #     cr, cg, cb = 0.0, 255.0, 0.0  # Side reflections
-                # elif org_gif_tag_d == 280.5:
-                #     cr, cg, cb = 255.0, 0.0, 0.0  # Top reflections
-                # elif org_gif_tag_d == 357:
-                #     cr, cg, cb = 0.0, 0.0, 255.0  # Glass surfaces
-                # elif org_gif_tag_d == 255:
-                #     cr, cg, cb = 255.0, 255.0, 255.0
-                # else:
-                #     cr, cg, cb = 0.0, 255.0, 128.0
-                # if org_gif_tag_d == 382.5:
-                #     cr, cg, cb = 255.0, 0.0, 255.0 # white?
-
-                vert = struct.pack("ffffffffffff", x, y, z, nx, ny, nz, cr, cg, cb, tu, tv, tw)
-                vert_data += vert
-                vert_data_reversed = vert + vert_data_reversed
-
-            if reverse_faces:
-                current_block += vert_data_reversed
-            else:
-                current_block += vert_data
-            # Read exec call (vif code)
-            value = U.readByte(file)
-            file.seek(2, os.SEEK_CUR)  # skip 0000
-            cmd = U.readByte(file)
-            print(f"end of gif @ {file.tell()}")
-
-            # Lookup hg3 exec -> hg2 exec required
-            if value not in [0x04, 0x0A]:
-                print(f"Unmatched Exec call {value}")
-                raise Exception(f"Unmatched Exec call {value}")
-
-            current_block += bytes([value, 00, 00, cmd])
-            blocks.append(current_block)
-            current_block = bytes()
+                    tw = tw_body
 
-        # Read end DMAtag, but this has to be 16 byte aligned, so move to 16 byte alignment
-        end_pos = file.tell()
-        adjust = 16 - (end_pos % 16)
-        if adjust != 16:
-            file.seek(adjust, os.SEEK_CUR)
-
-        dma_end = file.tell()
-        end_dma_tag = PS2.decode_DMATag(file)
-        end_tag_id = PS2.decode_DMATagID_source(end_dma_tag)
-        print(end_dma_tag)
-        print(end_tag_id)
-        if end_dma_tag['tagId'] != 6:
-            print(f"Tag not as expected, not an end tag @ {file.tell()} started at {dma_start}\n"
-                  f"normals?: {has_normals} colour select: {colour_select}")
-            raise Exception(f"Tag not as expected, not an end tag @ "
-                            f"{file.tell()} started at {dma_start}")
-
-        # Calculate dma tag for this block
-        combined_block = bytes()
-        for block in blocks:
-            combined_block += block
-        data_offset = len(combined_block) - 4  # remove 4 for the vif tag in the dma data section (and vif)
-        combined_block += bytes([0] * (16 - (data_offset % 16)))
-        dma_block_size = len(combined_block)
-        quadword_count = int(dma_block_size / 16)
-
-        # now we know the size of the block to transfer, add the send dma tag (cnt) and end dma tag
-        new_dma_tag = bytes()
-        new_dma_tag += quadword_count.to_bytes(2, 'little')
-        new_dma_tag += b'\x00\x10\x00\x00\x00\x00'
-        new_end_dma_tag = bytes([0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00, 0x00,
-                                 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
-        new_vif_setup_tag = b'\x01\x01\x00\x01'
-        combined_block = new_dma_tag + new_vif_setup_tag + combined_block + new_end_dma_tag
+                if reverse_faces:
+                    vert_out = out_position + (vert_count - 1 - v) * VERTEX.size
+                else:
+                    vert_out = out_position + v * VERTEX.size
+                VERTEX.pack_into(out, vert_out, x, y, z, nx, ny, nz, cr, cg, cb, tu, tv, tw)
+            out_position += vert_count * VERTEX.size
 
-        # with open(path_out+"tmp", "wb") as f:
-        #     f.write(combined_block)
+            out[out_position:out_position + 4] = bytes([value, 0, 0, cmd])
+            out_position += 4
 
-        return combined_block, gif_count_in
+        return out, gif_count_in
 
     @staticmethod
-    def read_and_convert_hg2_mesh_part(file, subfile_index, mesh_index, offsets,
+    def read_and_convert_hg2_mesh_part(data, subfile_index, mesh_index, offsets,
                                        xyz_scale=(1, 1, 1),
                                        xyz_offset=(0, 0, 0),
                                        nxyz_offsets=(0, 0, 0),
@@ -947,76 +684,88 @@ class EGameConverter:
                                        reverse_faces=False,
                                        skip_normals=False):
         base_position = offsets[subfile_index]
-        file.seek(base_position, os.SEEK_SET)
 
         # Read the subfile's mesh entries
-        mesh_entries = [
-            base_position + 16,
-            base_position + U.readLong(file),
-            base_position + U.readLong(file)]
-        mesh_sizes = [65535, U.readLong(file), U.readLong(file)]
+        offset1, offset2, size1, size2 = HG2_SUBFILE_HEADER.unpack_from(data, base_position)
+        mesh_entries = [base_position + 16, base_position + offset1, base_position + offset2]
+        mesh_sizes = [65535, size1, size2]
 
         # Move to the requested mesh position, and then read in all the data, converting it as needed
-        file.seek(mesh_entries[mesh_index], os.SEEK_SET)
-        print(f"Reading mesh part from {file.tell()}")
+        dma_start = mesh_entries[mesh_index]
+        print(f"Reading mesh part from {dma_start}")
         gif_count_in = mesh_sizes[mesh_index]
-        gif_count = 0
 
         # Read starting dma tag
-        dma_start = file.tell()
-        dma_tag = PS2.decode_DMATag(file)
-        tag_id = PS2.decode_DMATagID_source(dma_tag)
-        print(dma_tag)
-        print(tag_id)
-
-        if dma_tag['tagId'] != 1:
-            print(f"Tag not as expected, not an cnt tag @ {file.tell()}")
-            raise Exception(f"Tag not as expected, not an cnt tag @ {file.tell()}")
+        qword_count, tag_id = EGameConverter.read_dma_tag(data, dma_start)
+        if tag_id != 1:
+            print(f"Tag not as expected, not an cnt tag @ {dma_start + 16}")
+            raise Exception(f"Tag not as expected, not an cnt tag @ {dma_start + 16}")
 
-        file.seek(-8, os.SEEK_CUR)
         # We will recreate/add/calculate the DMA tag after we have read and restructured the data,
         # as we do not know the size
+        # Skip the DMA tag, and the VIF tag, for setup
+        position = dma_start + 12
 
-        # Read the mesh data in
-        # VIF tag, for setup
-        vif_setup_tag = U.readLong(file)
+        # HG2 has DMA, VIF, VIF, GIF, VIF, DATA
+        # HG3 has DMA, VIF, VIF, GIF, <8 bytes>, DATA
 
-        blocks = []
-        current_block = bytes()
+        # Find all the strips first, to know the size of the converted data
+        strips = []
         for i in range(gif_count_in):
-            if file.tell() >= (dma_start + dma_tag['qwordCount'] * 16):
+            if position >= (dma_start + qword_count * 16):
                 break
+            (vif_expand_tag1, gif_tag_a, gif_tag_b, gif_tag_c, gif_tag_d,
+             vif_expand_tag2) = HG2_STRIP_TAGS.unpack_from(data, position)
             # VIF tag for expanding/packing
-            vif_expand_tag1 = U.readLong(file)
             # V4-32
             if vif_expand_tag1 & 0xFF00FFFF != 0x6C008000:
                 # Data might not be as we want it, assume issue with tags and give up
                 print("Unknown/Unexpected VIF pack tag, at start of data, "
-                      f"@ {dma_start} {file.tell() - 4}")
+                      f"@ {dma_start} {position}")
                 raise Exception("Unknown/Unexpected VIF pack tag, at start of data, "
-                                f"@ {dma_start} {file.tell() - 4}")
-            # HG2 has DMA, VIF, VIF, GIF, VIF, DATA
-            # HG3 has DMA, VIF, VIF, GIF, <8 bytes>, DATA
-
-            # Read GIF tag
-            # Read size, to cheat
-            vert_count = U.readByte(file)
-            file.seek(-1, os.SEEK_CUR)
-            gif_tag_a = U.readLong(file)
-            gif_tag_b = U.readLong(file)
-            if gif_tag_b_override is not None:
-                gif_tag_b = gif_tag_b_override
-            gif_tag_c = U.readLong(file)
-            gif_tag_d = U.readLong(file)
-
+                                f"@ {dma_start} {position}")
             # VIF tag for expanding/packing
             # V3-32
-            vif_expand_tag2 = U.readLong(file)
             if vif_expand_tag2 & 0xFF00FFFF != 0x68008001:
                 # Data might not be as we want it, assume issue with tags and give up
-                print(f"Unknown/Unexpected VIF pack tag, @ {dma_start} {file.tell() - 4}")
-                raise Exception(f"Unknown/Unexpected VIF pack tag, @ {dma_start} {file.tell() - 4}")
+                print(f"Unknown/Unexpected VIF pack tag, @ {dma_start} {position + 20}")
+                raise Exception(f"Unknown/Unexpected VIF pack tag, @ {dma_start} {position + 20}")
+
+            # Read size, to cheat
+            vert_count = gif_tag_a & 0xFF
+            position += HG2_STRIP_TAGS.size
+            vert_position = position
+            position += vert_count * VERTEX.size
+
+            # Read exec call (vif code)
+            value = data[position]
+            cmd = data[position + 3]
+            position += 4
 
+            # Lookup hg2 exec -> hg3 exec required
+            if value not in [0x04, 0x0A]:
+                print(f"Unmatched Exec call {value}")
+                raise Exception(f"Unmatched Exec call {value}")
+
+            strips.append((vert_position, vert_count, gif_tag_a, gif_tag_b, gif_tag_c, gif_tag_d,
+                           vif_expand_tag2, value, cmd))
+
+        # Read end DMAtag, but this has to be 16 byte aligned, so move to 16 byte alignment
+        if position % 16 != 0:
+            position += 16 - (position % 16)
+        end_qword_count, end_tag_id = EGameConverter.read_dma_tag(data, position)
+        if end_tag_id != 6:
+            print(f"Tag not as expected, not an end tag @ {position + 16}")
+            raise Exception(f"Tag not as expected, not an end tag @ {position + 16}")
+
+        vertex_out_struct = VERTEX_NO_NORMALS if skip_normals else VERTEX
+        # Each strip is VIF tag, GIF tag (without d), pre xyz data, verts, exec
+        blocks_size = sum(4 + 12 + 12 + strip[1] * vertex_out_struct.size + 4 for strip in strips)
+        out = EGameConverter.make_mesh_part_buffer(blocks_size)
+        out_position = 12
+
+        for (vert_position, vert_count, gif_tag_a, gif_tag_b, gif_tag_c, gif_tag_d,
+             vif_expand_tag2, value, cmd) in strips:
             # hg3 uses 1 vif expand tag, not 2, so I need the size of the data to expand
             # calculate the size
             size = (vif_expand_tag2 & 0x00FF0000) >> 16
@@ -1026,13 +775,13 @@ class EGameConverter:
             size += 2  # add the extra required for the gif tag, and the extra data before xyz
 
             # Add the single VIF tag (combined for HG3) V3-32
-            current_block += b'\x00\x80' + size.to_bytes(1, byteorder='little') + b'\x68'
+            out[out_position:out_position + 4] = bytes([0x00, 0x80, size, 0x68])
 
             # Write out the gif tag, dropping part d, as that needs converting to the pre-xyz data
             # HG2 has a different bit for part b for transparent meshes (brake lights) 0x313E4002
-            current_block += gif_tag_a.to_bytes(4, 'little')
-            current_block += gif_tag_b.to_bytes(4, 'little')
-            current_block += gif_tag_c.to_bytes(4, 'little')
+            if gif_tag_b_override is not None:
+                gif_tag_b = gif_tag_b_override
+            struct.pack_into("<III", out, out_position + 4, gif_tag_a, gif_tag_b, gif_tag_c)
 
             # HG3 has a pre-xyz data, first 4 are the same as tw of HG2,
             # unsure on the next 4 bytes, but the third is a colour part selection
@@ -1040,59 +789,42 @@ class EGameConverter:
             # has normals: [0x3136C000, 0x313EC000, 0x303EC000]
             # does not: [0x303EC000]
             unknown_value1 = None  # need to find the first value
-            unknown_value2 = b'\x00\xC0\x36\x31'
-            colour_select = (0x20 | (gif_tag_d & 0xF)).to_bytes(4, byteorder='little')
-
-            # Leave this ^ as is until we know its value after reading all vert data
+            unknown_value2 = HG3_HAS_NORMALS
+            colour_select = 0x20 | (gif_tag_d & 0xF)
+            # Leave the first value until we know its value after reading all vert data
+            pre_data_position = out_position + 16
+            out_position += 28
 
             # Read data (xyz etc)
-            vert_data = bytes()
-            vert_data_reversed = bytes()
             for v in range(vert_count):
-                x, y, z = U.readXYZ(file)
-                x *= xyz_scale[0]
-                y *= xyz_scale[1]
-                z *= xyz_scale[2]
-                x += xyz_offset[0]
-                y += xyz_offset[1]
-                z += xyz_offset[2]
-                nx, ny, nz = U.readXYZ(file)
+                x, y, z, nx, ny, nz, cr, cg, cb, tu, tv, tw = VERTEX.unpack_from(data, vert_position + v * VERTEX.size)
+                x = x * xyz_scale[0] + xyz_offset[0]
+                y = y * xyz_scale[1] + xyz_offset[1]
+                z = z * xyz_scale[2] + xyz_offset[2]
                 # Used to fix brake lights
                 nx += nxyz_offsets[0]
                 ny += nxyz_offsets[1]
                 nz += nxyz_offsets[2]
 
-                cr, cg, cb = U.readXYZ(file)
-
                 if colour_override != (0, 0, 0):
                     cr, cg, cb = colour_override
 
-                tu, tv, tw = U.readXYZ(file)
                 # tw has the smoothness (shiny) value usually 280.05
                 # we need this to be placed before all vert data before
                 # We need to convert 51 and 280.5 into all values (280.5, 357, 382.5, 51)
-                # unknown_value1 = struct.pack("f", 0)
                 if unknown_value1 is None:
                     if tw == 51:
                         # side reflections
-                        unknown_value1 = struct.pack("f", 51.0)
+                        unknown_value1 = 51.0
                     elif tw == 280.5:
                         # try and Check for glass surface
                         if cr < 10 and cg < 10 and cb < 10:
                             # Probably black window (glass : 357)
-                            unknown_value1 = struct.pack("f", 357)
+                            unknown_value1 = 357
                         else:
                             # unsure on method for 255 or 382.5
                             # Cant check for non-shiny, so just assume normal top surface (280.5)
-                            unknown_value1 = struct.pack("f", 280.5)
-
-                # # fix any >1 or < 1 issues
-                # if tu < 0:
-                #     tu = -tu
-                # tu = divmod(tu, 1)[1]
-                # if tv < 0:
-                #     tv = -tv
-                # tv = divmod(tv, 1)[1]
+                            unknown_value1 = 280.5
 
                 tw = 1  # seems like this is always 1 for hg3
                 if tuvw_offsets != (0, 0, 0):
@@ -1100,79 +832,27 @@ class EGameConverter:
                     tu += tuvw_offsets[0]
                     tv += tuvw_offsets[1]
                     tw = tuvw_offsets[2]
+
+                if reverse_faces:
+                    vert_out = out_position + (vert_count - 1 - v) * vertex_out_struct.size
+                else:
+                    vert_out = out_position + v * vertex_out_struct.size
                 if skip_normals:
-                    vert = struct.pack("fffffffff", x, y, z, cr, cg, cb, tu, tv, tw)
+                    VERTEX_NO_NORMALS.pack_into(out, vert_out, x, y, z, cr, cg, cb, tu, tv, tw)
                 else:
-                    vert = struct.pack("ffffffffffff", x, y, z, nx, ny, nz, cr, cg, cb, tu, tv, tw)
-                vert_data += vert
-                vert_data_reversed = vert + vert_data_reversed
+                    VERTEX.pack_into(out, vert_out, x, y, z, nx, ny, nz, cr, cg, cb, tu, tv, tw)
+            out_position += vert_count * vertex_out_struct.size
 
             if unknown_value1 is None:
                 if skip_normals:
-                    unknown_value1 = struct.pack("f", 1)
+                    unknown_value1 = 1
                 else:
-                    unknown_value1 = struct.pack("f", 0)
+                    unknown_value1 = 0
 
-            # Write out pre-data first
-            current_block += unknown_value1
-            current_block += unknown_value2
-            current_block += colour_select
-            if reverse_faces:
-                current_block += vert_data_reversed
-            else:
-                current_block += vert_data
+            # Write out pre-data
+            struct.pack_into("<fII", out, pre_data_position, unknown_value1, unknown_value2, colour_select)
 
-            # Read exec call (vif code)
-            value = U.readByte(file)
-            file.seek(2, os.SEEK_CUR)  # skip 0000
-            cmd = U.readByte(file)
-            print(f"end of gif @ {file.tell()}")
-            gif_count += 1
+            out[out_position:out_position + 4] = bytes([value, 0, 0, cmd])
+            out_position += 4
 
-            # Lookup hg2 exec -> hg3 exec required
-            if value not in [0x04, 0x0A]:
-                print(f"Unmatched Exec call {value}")
-                raise Exception(f"Unmatched Exec call {value}")
-
-            current_block += bytes([value, 00, 00, cmd])
-            blocks.append(current_block)
-            current_block = bytes()
-
-        # Read end DMAtag, but this has to be 16 byte aligned, so move to 16 byte alignment
-        end_pos = file.tell()
-        adjust = 16 - (end_pos % 16)
-        if adjust != 16:
-            file.seek(adjust, os.SEEK_CUR)
-
-        dma_end = file.tell()
-        end_dma_tag = PS2.decode_DMATag(file)
-        end_tag_id = PS2.decode_DMATagID_source(end_dma_tag)
-        print(end_dma_tag)
-        print(end_tag_id)
-        if end_dma_tag['tagId'] != 6:
-            print(f"Tag not as expected, not an end tag @ {file.tell()}")
-            raise Exception(f"Tag not as expected, not an end tag @ {file.tell()}")
-
-        # Calculate dma tag for this block
-        combined_block = bytes()
-        for block in blocks:
-            combined_block += block
-        # remove 4 for the vif tag in the dma data section (and vif)
-        data_offset = len(combined_block) - 4
-        combined_block += bytes([0] * (16 - (data_offset % 16)))
-        dma_block_size = len(combined_block)
-        quadword_count = int(dma_block_size / 16)
-
-        # now we know the size of the block to transfer, add the send dma tag (cnt) and end dma tag
-        new_dma_tag = bytes()
-        new_dma_tag += quadword_count.to_bytes(2, 'little')
-        new_dma_tag += b'\x00\x10\x00\x00\x00\x00'
-        new_end_dma_tag = bytes(
-            [0x00, 0x00, 0x00, 0x60, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
-        new_vif_setup_tag = b'\x01\x01\x00\x01'
-        combined_block = new_dma_tag + new_vif_setup_tag + combined_block + new_end_dma_tag
-
-        # with open(path_out+"tmp", "wb") as f:
-        #     f.write(combined_block)
-
-        return combined_block, gif_count
+        return out, len(strips)
@@ -7,6 +7,14 @@ import customtkinter
 from tkinter import filedialog
 
 import choroq_extractor as extractor
+from choroq import progress as progress_events
+from choroq.progress import ProgressQueue
+
+# How often the progress queue is read, and the most events shown each time
+PROGRESS_POLL_MS = 100
+PROGRESS_MAX_EVENTS = 500
+# Stages in the order they are extracted
+STAGES = ["courses", "cars", "actions", "fields", "items", "shops", "sys"]
 
 
 class MessageBox(customtkinter.CTkToplevel):
@@ -177,32 +185,6 @@ class OptionsFrame(customtkinter.CTkFrame):
             self.items_checkbox.configure(state=customtkinter.NORMAL)
 
 
-class StdHandler:
-    def __init__(self, destination, progress_bar, max_progress):
-        self.destination = destination
-        self.progress_bar = progress_bar
-        self.max_progress = max_progress
-        self.progress = 0
-
-    def __enter__(self):
-        import sys
-        self._sys = sys
-        self._stdout = sys.stdout
-        sys.stdout = self
-        return self
-
-    def __exit__(self, type, value, traceback):
-        self._sys.stdout = self._stdout
-
-    def write(self, txt):
-        self.destination.insert("end", str(txt))
-        self.destination.see("end")
-        if self.progress_bar is not None and "\n" in txt:
-            self.progress += self.max_progress
-            self.progress_bar.set(self.progress)
-
-
-
 class ChoroQHGExtractorApp(customtkinter.CTk):
     def __init__(self):
         super().__init__()
@@ -210,6 +192,13 @@ class ChoroQHGExtractorApp(customtkinter.CTk):
         self.game_version = GameVersions.UNSET
         self.thread = None
         self.cancel_thread = None
+        self.progress = None
+        self.stage_count = 1
+        self.stages_done = 0
+        self.stage_total = 0
+        self.stage_files_done = 0
+        self.bytes_done = 0
+        self.failed_count = 0
 
         self.title("Choroq HG 2/3 Extractor")
         self.geometry("400x825")
@@ -243,30 +232,8 @@ class ChoroQHGExtractorApp(customtkinter.CTk):
         self.options_frame.setup_checkboxes(self.game_version)
 
     def extract_callback(self):
-        extractor.should_exit = False
-        self.progress_label.delete("0.0", "end")
-        self.progress_label.insert("0.0", "Starting")
-        t = threading.Thread(target=self.start_extract, args=(), kwargs={})
-        self.thread = t
-        t.start()
-
-    def cancel_callback(self):
-        extractor.should_exit = True
-        t = threading.Thread(target=self.await_cancel, args=(), kwargs={})
-        self.cancel_thread = t
-        t.start()
-
-
-    def await_cancel(self):
-        if self.thread is not None:
-            self.thread.join()
-
-    def attempt_close(self):
-        extractor.should_exit = True
-        self.await_cancel()
-        self.destroy()
-
-    def start_extract(self):
+        if self.thread is not None and self.thread.is_alive():
+            return
         selected_options = self.options_frame.get()
 
         obj = True if "obj" in selected_options else False
@@ -279,7 +246,6 @@ class ChoroQHGExtractorApp(customtkinter.CTk):
 
         folder_in = self.path_frame.game_path.get()
         folder_out = self.path_frame.export_path.get()
-        game_version = self.game_version
 
         os.makedirs(folder_out, exist_ok=True)
         if not os.path.isdir(folder_out):
@@ -291,6 +257,11 @@ class ChoroQHGExtractorApp(customtkinter.CTk):
                        callback=None)
             return
 
+        if not os.path.isdir(folder_in):
+            MessageBox(self, ["Close"], "Failed to read source folder", "Error",
+                       callback=None)
+            return
+
         output_formats = []
         if obj:
             output_formats.append("obj")
@@ -302,66 +273,109 @@ class ChoroQHGExtractorApp(customtkinter.CTk):
                        "Warning, PLY files are broken, they can be manually fixed, but for now please use OBJ/OBJ+Colours",
                        "Error", callback=None)
 
-        if os.path.isdir(folder_in):
-            max_progress = 0
-            if "courses" in selected_options:
-                max_progress += 1
-                if game_version == GameVersions.CHOROQ_HG_3:
-                    max_progress += 58
-                else:
-                    max_progress += 19
-            if "cars" in selected_options:
-                max_progress += 1
-                max_progress += 154
-            if "actions" in selected_options:
-                max_progress += 1
-                max_progress += 21
-            if "fields" in selected_options:
-                max_progress += 1
-                max_progress += 64
-            if "items" in selected_options:
-                max_progress += 1
-                if game_version == GameVersions.CHOROQ_HG_3:
-                    max_progress += 11
-                else:
-                    max_progress += 12
-            if "shops" in selected_options:
-                max_progress += 1
-                max_progress += 22
-            if "sys" in selected_options:
-                max_progress += 1
-                if game_version == GameVersions.CHOROQ_HG_3:
-                    max_progress += 30
-                else:
-                    max_progress += 42
-            progress_step = 1 / max_progress
-            print(max_progress)
-            progress = 0
-            out = StdHandler(self.progress_label, self.progress_bar, progress_step)
-            errout = StdHandler(self.progress_label, None, None)
-            with errout as sys.stderr:
-                with out as sys.stdout:
-                    if "courses" in selected_options:
+        stages = [stage for stage in STAGES if stage in selected_options]
+        self.stage_count = max(1, len(stages))
+        self.stages_done = 0
+        self.stage_total = 0
+        self.stage_files_done = 0
+        self.bytes_done = 0
+        self.failed_count = 0
+
+        extractor.should_exit = False
+        self.progress = ProgressQueue()
+        extractor.progress_callback = self.progress.put
+        self.progress_label.delete("0.0", "end")
+        self.progress_label.insert("0.0", "Starting\n")
+        self.progress_bar.set(0)
+        t = threading.Thread(target=self.run_extract, args=(folder_in, folder_out, stages, output_formats, self.progress),
+                             kwargs={})
+        self.thread = t
+        t.start()
+        self.after(PROGRESS_POLL_MS, self.poll_progress)
+
+    def cancel_callback(self):
+        extractor.should_exit = True
+        t = threading.Thread(target=self.await_cancel, args=(), kwargs={})
+        self.cancel_thread = t
+        t.start()
+
+
+    def await_cancel(self):
+        if self.thread is not None:
+            self.thread.join()
+
+    def attempt_close(self):
+        extractor.should_exit = True
+        self.await_cancel()
+        self.destroy()
+
+    # Runs on the worker thread, so must not touch any widgets, progress is only sent through the queue
+    @staticmethod
+    def run_extract(folder_in, folder_out, stages, output_formats, progress):
+        try:
+            for stage in stages:
+                if extractor.should_exit:
+                    break
+                try:
+                    if stage == "courses":
                         extractor.process_courses(folder_in, folder_out, "COURSE", output_formats)
-                    if "cars" in selected_options:
+                    elif stage == "cars":
                         extractor.process_cars(folder_in, folder_out, output_formats)
-                    if "actions" in selected_options:
+                    elif stage == "actions":
                         extractor.process_courses(folder_in, folder_out, "ACTION", output_formats)
-                    if "fields" in selected_options:
+                    elif stage == "fields":
                         extractor.process_fields(folder_in, folder_out, output_formats)
                     # These are other bits from the game, might be useful for some
-                    if "items" in selected_options:
+                    elif stage == "items":
                         extractor.process_items(folder_in, folder_out, output_formats)
-                    if "shops" in selected_options:
+                    elif stage == "shops":
                         extractor.process_shops(folder_in, folder_out, output_formats)
-                    if "sys" in selected_options:
+                    elif stage == "sys":
                         extractor.process_sys(folder_in, folder_out, output_formats)
-                    print("Done")
-            self.progress_bar.set(1.0)
-
-        else:
-            MessageBox(self, ["Close"], "Failed to read source folder", "Error",
-                       callback=None)
+                except Exception as e:
+                    progress.emit(progress_events.ERROR, stage, message=str(e))
+                finally:
+                    # The parsers swap stdout for their log files, put it back if a stage stopped part way
+                    sys.stdout = sys.__stdout__
+        finally:
+            progress.emit(progress_events.DONE)
+
+    # Runs on the ui thread, on a timer while extracting
+    def poll_progress(self):
+        lines = []
+        done = False
+        for event in self.progress.drain(PROGRESS_MAX_EVENTS):
+            if event.kind == progress_events.STAGE_STARTED:
+                self.stage_total = event.total
+                self.stage_files_done = 0
+            elif event.kind == progress_events.FILE_FINISHED:
+                self.stage_files_done += 1
+                self.bytes_done += event.size
+                # Each file start is shown, no need to show it finishing as well
+                continue
+            elif event.kind == progress_events.STAGE_FINISHED:
+                self.stages_done += 1
+                self.stage_total = 0
+                self.stage_files_done = 0
+            elif event.kind in [progress_events.FILE_FAILED, progress_events.ERROR]:
+                self.failed_count += 1
+            elif event.kind == progress_events.DONE:
+                done = True
+                continue
+            lines.append(str(event))
+
+        if done:
+            if extractor.should_exit:
+                lines.append("Cancelled")
+            lines.append(f"Done, read {self.bytes_done / (1024 * 1024):.1f} MB, {self.failed_count} errors")
+        if len(lines) > 0:
+            self.progress_label.insert("end", "\n".join(lines) + "\n")
+            self.progress_label.see("end")
+
+        stage_progress = self.stage_files_done / self.stage_total if self.stage_total > 0 else 0
+        self.progress_bar.set(1.0 if done else min(1.0, (self.stages_done + stage_progress) / self.stage_count))
+        if not done:
+            self.after(PROGRESS_POLL_MS, self.poll_progress)
 
 
 app = ChoroQHGExtractorApp()
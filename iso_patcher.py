@@ -0,0 +1,118 @@
+from choroq.iso_diff import IsoDiffPatch
+from choroq.iso_patch import IsoPatchSession
+from choroq.game_source import IsoSource
+
+import os
+import posixpath
+import sys
+import colorama
+from colorama import Fore, Style
+
+
+def show_help():
+    print("##############################################################################################")
+    print("ChoroQ iso patcher by Matthew Holey")
+    print("##############################################################################################")
+    print("")
+    print("Makes a small patch file, holding the changes made to a game's iso (e.g with the modding UI)")
+    print("so mods can be shared without sharing the whole iso, and applies them to an original iso")
+    print("Only files that were changed in place can be patched (as the modding UI does)")
+    print("")
+    print("replace writes every file in a folder (e.g a mod pack of Qxx.BIN cars) over the file with the same")
+    print("name in the iso, in place and all in one pass, nothing is written unless every file fits")
+    print("")
+    print("Options: <REQUIRED> [OPTIONAL]")
+    print("create <original iso> <modified iso> <patch file>")
+    print("apply <patch file> <original iso> [output iso]   : without an output iso, the original is changed")
+    print("info <patch file>")
+    print("replace <iso> <folder> [iso folder]             : iso folder (e.g CAR0) is where the files are replaced,")
+    print("                                                  otherwise each name must be in only one iso folder")
+
+
+def show_info(patch_path):
+    with open(patch_path, "rb") as patch_in:
+        patch = IsoDiffPatch.read(patch_in)
+    print(f"Patch for an iso of {patch.original_size} bytes, "
+          f"{len(patch.runs)} runs, {patch.get_changed_size()} bytes changed")
+    for patch_file in patch.files:
+        changed = sum(run.get_size() for run in patch_file.runs)
+        print(f"{patch_file.get_name()}: {changed} bytes changed")
+
+
+# Queues every file in folder_in to replace the file with the same name in the iso, then writes them all at once
+def replace_files(iso_path, folder_in, iso_folder=None):
+    names = sorted(name for name in os.listdir(folder_in)
+                   if not name.startswith('.') and os.path.isfile(os.path.join(folder_in, name)))
+    if len(names) == 0:
+        raise Exception(f"No files to replace with in {folder_in}")
+
+    IsoPatchSession.recover(iso_path)
+    source = IsoSource(iso_path)
+    try:
+        # name -> [(path, (offset, size))] of the files in the iso
+        by_name = {}
+        for path, extent in source.files.items():
+            folder, name = posixpath.split(path)
+            if iso_folder is None or folder.upper() == iso_folder.strip('/').upper():
+                by_name.setdefault(name.upper(), []).append((path, extent))
+    finally:
+        source.close()
+
+    session = IsoPatchSession(iso_path)
+    problems = []
+    for name in names:
+        matches = by_name.get(name.upper(), [])
+        if len(matches) != 1:
+            found = "not found" if len(matches) == 0 else "found in " + ", ".join(path for path, extent in matches)
+            problems.append(f"{name} {found}")
+            continue
+        path, (offset, size) = matches[0]
+        with open(os.path.join(folder_in, name), "rb") as file_in:
+            session.add(offset, file_in.read(), offset, size, path)
+        print(f"Queued {name} -> {path}")
+    if len(problems) > 0:
+        raise Exception("Cannot replace:\n" + "\n".join(problems))
+
+    session.check_writable()
+    return session.commit()
+
+
+if __name__ == '__main__':
+    colorama.init()
+    commands = {"create": (3, 3), "apply": (2, 3), "info": (1, 1), "replace": (2, 3)}
+    if len(sys.argv) < 2 or sys.argv[1] not in commands:
+        show_help()
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Unknown command, \"create\", \"apply\", \"info\" or \"replace\"")
+        exit(1)
+
+    command = sys.argv[1]
+    args = sys.argv[2:]
+    min_args, max_args = commands[command]
+    if not (min_args <= len(args) <= max_args):
+        show_help()
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + f"Wrong number of args for {command}")
+        exit(1)
+
+    paths_in = args[:2] if command not in ["info", "replace"] else args[:1]
+    if command == "replace" and not os.path.isdir(args[1]):
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Failed to read folder " + args[1])
+        exit(1)
+    for path in paths_in:
+        if not os.path.isfile(path):
+            print(Fore.RED + "ERROR: " + Style.RESET_ALL + "Failed to read file " + path)
+            exit(1)
+
+    try:
+        if command == "create":
+            IsoDiffPatch.create(args[0], args[1], args[2])
+        elif command == "apply":
+            IsoDiffPatch.apply(args[0], args[1], args[2] if len(args) == 3 else None)
+            print("Patch applied")
+        elif command == "replace":
+            count = replace_files(args[0], args[1], args[2] if len(args) == 3 else None)
+            print(f"Replaced {count} files")
+        else:
+            show_info(args[0])
+    except Exception as e:
+        print(Fore.RED + "ERROR: " + Style.RESET_ALL + str(e))
+        exit(1)